@@ -1,10 +1,10 @@
 """Kaizen - AI-powered test automation and fixing."""
 
-from .autofix.main import AutoFix
-from .autofix.file.dependency import collect_referenced_files, analyze_failure_dependencies
-from .autofix.code.fixer import fix_common_syntax_issues, fix_aggressive_syntax_issues, apply_code_changes
-from .autofix.test.runner import TestRunner
-from .autofix.pr.manager import PRManager
+import importlib
+from typing import Any, List
+
+# The CLI is imported eagerly: its modules defer their heavy imports, and a
+# lazy attribute would be shadowed by the kaizen.cli subpackage once loaded
 from .cli import cli
 
 __version__ = "0.1.2"
@@ -19,4 +19,33 @@ __all__ = [
     'TestRunner',
     'PRManager',
     'cli'
-] 
\ No newline at end of file
+]
+
+# Public names and the modules defining them. They are imported on first
+# access so that importing kaizen (and starting the CLI) does not load the
+# LLM, GitHub and code analysis dependencies.
+_LAZY_ATTRIBUTES = {
+    'AutoFix': '.autofix.main',
+    'collect_referenced_files': '.autofix.file.dependency',
+    'analyze_failure_dependencies': '.autofix.file.dependency',
+    'fix_common_syntax_issues': '.autofix.code.fixer',
+    'fix_aggressive_syntax_issues': '.autofix.code.fixer',
+    'apply_code_changes': '.autofix.code.fixer',
+    'TestRunner': '.autofix.test.runner',
+    'PRManager': '.autofix.pr.manager',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name on first access (PEP 562)."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes including the lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -1,8 +1,5 @@
-from .main import AutoFix
-from .file.dependency import collect_referenced_files, analyze_failure_dependencies
-from .code.fixer import fix_common_syntax_issues, fix_aggressive_syntax_issues, apply_code_changes
-from .test.runner import TestRunner
-from .pr.manager import PRManager
+import importlib
+from typing import Any, List
 
 __version__ = '0.1.0'
 __all__ = [
@@ -15,4 +12,32 @@ __all__ = [
     'apply_code_changes',
     'TestRunner',
     'PRManager'
-] 
\ No newline at end of file
+]
+
+# Public names and the modules defining them, imported on first access so that
+# importing a single autofix submodule does not load the whole package
+_LAZY_ATTRIBUTES = {
+    'AutoFix': '.main',
+    'collect_referenced_files': '.file.dependency',
+    'analyze_failure_dependencies': '.file.dependency',
+    'fix_common_syntax_issues': '.code.fixer',
+    'fix_aggressive_syntax_issues': '.code.fixer',
+    'apply_code_changes': '.code.fixer',
+    'TestRunner': '.test.runner',
+    'PRManager': '.pr.manager',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name on first access (PEP 562)."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes including the lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -2,8 +2,11 @@ import os
 import re
 import logging
 import importlib
+import shutil
 import sys
+import tempfile
 from datetime import datetime
+from typing import Dict, Optional
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -427,4 +430,66 @@ def apply_code_changes(current_file_path: str, fixed_codes: str) -> None:
         
     except Exception as e:
         logger.error(f"Failed to apply code changes: {str(e)}")
-        raise 
\ No newline at end of file
+        raise
+
+
+def apply_code_changes_atomically(changes: Dict[str, str]) -> None:
+    """
+    Apply code changes to several files so that either all of them or none of them are written.
+    
+    The current content of every target is backed up and every file is written to a
+    temporary file next to it before any target is touched; the temporary files then
+    replace the targets. If a replacement fails, files already replaced are restored
+    from their backups, and files the changes created are removed.
+    
+    Args:
+        changes (Dict[str, str]): Mapping of file path to the fixed code content
+        
+    Raises:
+        OSError: If the changes could not be written; no file is left modified
+    """
+    # file path -> content before the changes, or None for a new file
+    backups: Dict[str, Optional[bytes]] = {}
+    staged: Dict[str, str] = {}
+    try:
+        for file_path, fixed_code in changes.items():
+            if os.path.exists(file_path):
+                with open(file_path, 'rb') as f:
+                    backups[file_path] = f.read()
+            else:
+                backups[file_path] = None
+            directory = os.path.dirname(os.path.abspath(file_path))
+            fd, temp_path = tempfile.mkstemp(prefix='.kaizen-fix-', dir=directory)
+            staged[file_path] = temp_path
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(fixed_code)
+            if backups[file_path] is not None:
+                shutil.copymode(file_path, temp_path)
+    except Exception as e:
+        logger.error(f"Failed to stage code changes: {str(e)}")
+        for temp_path in staged.values():
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        raise
+    
+    replaced = []
+    try:
+        for file_path, temp_path in staged.items():
+            os.replace(temp_path, file_path)
+            replaced.append(file_path)
+            logger.info(f"Written changes to {file_path}")
+    except Exception as e:
+        logger.error(f"Failed to apply code changes, restoring {len(replaced)} file(s): {str(e)}")
+        for file_path in replaced:
+            try:
+                if backups[file_path] is None:
+                    os.remove(file_path)
+                else:
+                    with open(file_path, 'wb') as f:
+                        f.write(backups[file_path])
+            except OSError as restore_error:
+                logger.error(f"Failed to restore {file_path}: {str(restore_error)}")
+        for temp_path in staged.values():
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        raise
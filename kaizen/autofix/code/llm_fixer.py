@@ -7,6 +7,7 @@ import google.generativeai as genai
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 if TYPE_CHECKING:
     from kaizen.cli.commands.models import TestConfiguration
@@ -15,6 +16,29 @@ from ..types import FixStatus
 
 logger = logging.getLogger(__name__)
 
+# Sampling temperature of a single fix request
+DEFAULT_TEMPERATURE = 0.1
+# Highest temperature used when generating several candidate fixes
+MAX_CANDIDATE_TEMPERATURE = 1.0
+
+
+def candidate_temperatures(count: int) -> List[float]:
+    """Spread the temperatures of candidate fixes evenly.
+
+    The first candidate always uses the default temperature, so a single
+    candidate matches a regular fix request.
+
+    Args:
+        count: Number of candidates
+
+    Returns:
+        List of count temperatures, lowest first
+    """
+    if count <= 1:
+        return [DEFAULT_TEMPERATURE]
+    step = (MAX_CANDIDATE_TEMPERATURE - DEFAULT_TEMPERATURE) / (count - 1)
+    return [round(DEFAULT_TEMPERATURE + i * step, 2) for i in range(count)]
+
 class LLMError(Exception):
     """Base exception for LLM-related errors."""
 
@@ -1197,7 +1221,8 @@ class LLMCodeFixer:
     
     def fix_code(self, content: str, file_path: str, learning_context: Optional[Dict] = None,
                 targeting_context: Optional[Dict] = None, config: Optional['TestConfiguration'] = None, 
-                context_files: Optional[Dict[str, str]] = None) -> FixResult:
+                context_files: Optional[Dict[str, str]] = None,
+                temperature: float = DEFAULT_TEMPERATURE) -> FixResult:
         """
         Fix code using LLM.
         
@@ -1208,6 +1233,7 @@ class LLMCodeFixer:
             targeting_context: Optional targeting context for failure analysis
             config: Optional test configuration
             context_files: Optional dictionary of related files
+            temperature: Sampling temperature of the request
             
         Returns:
             FixResult object containing fix results
@@ -1219,7 +1245,7 @@ class LLMCodeFixer:
             )
             # logger.info(f"Prompt: {prompt}")
             # Get fix from LLM
-            response = self._get_llm_response(prompt)
+            response = self._get_llm_response(prompt, temperature=temperature)
             # logger.info(f"Response: {response}")
             # Process the response
             fixed_code = self.response_processor.clean_markdown_notations(response)
@@ -1326,6 +1352,37 @@ class LLMCodeFixer:
             })
             return FixResult(status=FixStatus.ERROR, error=str(e))
     
+    def fix_code_candidates(self, content: str, file_path: str, count: int,
+                            learning_context: Optional[Dict] = None,
+                            targeting_context: Optional[Dict] = None,
+                            config: Optional['TestConfiguration'] = None,
+                            context_files: Optional[Dict[str, str]] = None) -> List[FixResult]:
+        """
+        Generate several candidate fixes concurrently at different temperatures.
+        
+        Args:
+            content: Content to fix
+            file_path: Path to the file
+            count: Number of candidates to generate
+            learning_context: Optional learning context from previous attempts
+            targeting_context: Optional targeting context for failure analysis
+            config: Optional test configuration
+            context_files: Optional dictionary of related files
+            
+        Returns:
+            List of count FixResult objects, ordered by increasing temperature
+        """
+        temperatures = candidate_temperatures(count)
+        with ThreadPoolExecutor(max_workers=len(temperatures)) as executor:
+            futures = [
+                executor.submit(
+                    self.fix_code, content, file_path, learning_context, targeting_context,
+                    config, context_files, temperature
+                )
+                for temperature in temperatures
+            ]
+            return [future.result() for future in futures]
+    
     def fix_compatibility_issues(self, content: str, file_path: str,
                                compatibility_issues: List[str],
                                context_files: Dict[str, str]) -> FixResult:
@@ -1382,12 +1439,13 @@ class LLMCodeFixer:
             })
             return FixResult(status=FixStatus.ERROR, error=str(e))
     
-    def _get_llm_response(self, prompt: str) -> str:
+    def _get_llm_response(self, prompt: str, temperature: float = DEFAULT_TEMPERATURE) -> str:
         """
         Get response from LLM.
         
         Args:
             prompt: The prompt to send to the LLM
+            temperature: Sampling temperature of the request
             
         Returns:
             The LLM's response
@@ -1400,7 +1458,7 @@ class LLMCodeFixer:
             response = self.model.generate_content(
                 prompt,
                 generation_config=genai.types.GenerationConfig(
-                    temperature=0.1,  # Low temperature for more focused results
+                    temperature=temperature,  # Low by default for more focused results
                     max_output_tokens=20000,
                     top_p=0.8,
                     top_k=40,
@@ -4,8 +4,11 @@ from .dependency import (
     analyze_failure_dependencies,
     collect_referenced_files,
 )
+from .index import ProjectIndex, get_project_index
 
 __all__ = [
     "analyze_failure_dependencies",
     "collect_referenced_files",
-] 
\ No newline at end of file
+    "ProjectIndex",
+    "get_project_index",
+]
\ No newline at end of file
@@ -1,18 +1,31 @@
 import os
-import ast
 import logging
-import importlib
 import json
+import hashlib
 from typing import Any, Set, Dict, List, Optional, Union, Tuple, Iterator
 from pathlib import Path
 from dataclasses import dataclass
-from difflib import SequenceMatcher
-import google.generativeai as genai
 from enum import Enum
 
+from .index import ProjectIndex, get_project_index
+from .matching import AhoCorasick, StemSimilarityIndex
+from .relevance import (
+    LLM_RELEVANCE_BATCHED,
+    LLM_RELEVANCE_MODES,
+    LLM_RELEVANCE_OFF,
+    LLM_RELEVANCE_PER_FILE,
+    RelevanceCache,
+    generate_relevance_response,
+    parse_suggested_files,
+    suggest_relevant_files_batched,
+)
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# SequenceMatcher ratio above which two module stems count as similar
+SIMILAR_STEM_THRESHOLD = 0.7
+
 @dataclass
 class ImportError:
     """Represents an error during import processing."""
@@ -172,7 +185,11 @@ def collect_referenced_files(
     base_dir: Optional[Union[str, Path]] = None,
     failure_data: Optional[List[Dict[str, Any]]] = None,
     llm_checked_files: Optional[Set[Path]] = None,
-    patterns: Optional[Dict] = None
+    patterns: Optional[Dict] = None,
+    index: Optional[ProjectIndex] = None,
+    llm_mode: str = LLM_RELEVANCE_BATCHED,
+    relevance_cache: Optional[RelevanceCache] = None,
+    llm_deferred: bool = False
 ) -> Set[Path]:
     """
     Recursively collect all Python files referenced by imports in the given file.
@@ -185,6 +202,16 @@ def collect_referenced_files(
         failure_data: List of test failures to check relevance against
         llm_checked_files: Set of files that have already been checked by LLM
         patterns: Configuration for file pattern matching
+        index: Project index used to look up imports; built for the base
+            directory of the first file if not given
+        llm_mode: How the LLM is asked for relevant files: 'batched' sends
+            one request summarising all collected files once the traversal
+            is done, 'per_file' sends one request per visited file and 'off'
+            skips the LLM
+        relevance_cache: Cache of LLM suggestions; the default on-disk cache
+            is used if not given
+        llm_deferred: Whether the caller makes the batched LLM request, set
+            for recursive calls
         
     Returns:
         Set of all referenced file paths as Path objects
@@ -198,6 +225,9 @@ def collect_referenced_files(
     logger.info(f"Base directory: {base_dir}")
     logger.info(f"Current working directory: {Path.cwd()}")
     
+    if llm_mode not in LLM_RELEVANCE_MODES:
+        raise ValueError(f"Invalid LLM relevance mode: {llm_mode}. Must be one of: {', '.join(LLM_RELEVANCE_MODES)}")
+
     # Initialize sets if None
     processed_files = processed_files or set()
     llm_checked_files = llm_checked_files or set()
@@ -221,74 +251,15 @@ def collect_referenced_files(
     processed_files.add(file_path)
     logger.info(f"Processed files: {processed_files}")
     try:
-        logger.info(f"Reading and parsing file {file_path}")
-        # Read and parse file
-        content = file_path.read_text(encoding='utf-8')
-        tree = ast.parse(content)
-        
-        # Collect Python files in the same directory
-        dir_python_files = {
-            f.resolve() for f in file_path.parent.glob('*.py')
-            if f != file_path
-        }
-        
-        # Find all imports
-        imported_files: Set[Path] = set()
-        import_errors: List[ImportError] = []
-        logger.info(f"Finding all imports in {file_path}")
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.Import, ast.ImportFrom)):
-                try:
-                    if isinstance(node, ast.Import):
-                        for name in node.names:
-                            module_name = name.name
-                            spec = importlib.util.find_spec(module_name)
-                            if spec and spec.origin and spec.origin.endswith('.py'):
-                                imported_files.add(Path(spec.origin).resolve())
-                    else:  # ImportFrom
-                        if node.module:
-                            if node.level > 0:
-                                # Handle relative imports properly
-                                # Build the correct module path based on the level
-                                base_path = file_path.parent
-                                for _ in range(node.level):
-                                    base_path = base_path.parent
-                                
-                                # Create the module name
-                                if base_path.name:
-                                    module_name = f"{base_path.name}.{node.module}"
-                                else:
-                                    module_name = node.module
-                            else:
-                                module_name = node.module
-                            
-                            spec = importlib.util.find_spec(module_name)
-                            if spec and spec.origin and spec.origin.endswith('.py'):
-                                imported_files.add(Path(spec.origin).resolve())
-                except (ImportError, ValueError) as e:
-                    import_errors.append(ImportError(
-                        module_name=module_name,
-                        error_message=str(e),
-                        file_path=file_path
-                    ))
-                    logger.warning(
-                        "Failed to find module",
-                        extra={
-                            'module_name': module_name,
-                            'error': str(e),
-                            'file_path': str(file_path)
-                        }
-                    )
-        
-        # Log import errors if any
-        if import_errors:
-            logger.warning(
-                "Import errors encountered",
-                extra={
-                    'file_path': str(file_path),
-                    'errors': [vars(e) for e in import_errors]
-                }
-            )
+        # The index is refreshed once per collection; recursive calls reuse it
+        if index is None:
+            index = get_project_index(base_dir)
+        if relevance_cache is None and llm_mode != LLM_RELEVANCE_OFF:
+            relevance_cache = RelevanceCache()
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        logger.info(f"Looking up imports of {file_path}")
+        imported_files = index.get_imported_files(file_path)
         logger.info(f"Imported files: {imported_files}")
         logger.info(f"Heuristic: Finding relevant files for {file_path}")
         # Heuristic: Add relevant files based on filename similarity and failure data
@@ -298,8 +269,10 @@ def collect_referenced_files(
                 logger.info(f"Heuristic: Adding relevant file {hf}")
                 processed_files.add(hf)
         # LLM: Add relevant files suggested by LLM
-        if file_path not in llm_checked_files:
-            llm_files = find_llm_relevant_files(file_path, base_dir, processed_files, llm_checked_files, failure_data, patterns)
+        if llm_mode == LLM_RELEVANCE_PER_FILE and file_path not in llm_checked_files:
+            llm_files = find_llm_relevant_files(
+                file_path, base_dir, processed_files, llm_checked_files, failure_data, patterns, relevance_cache
+            )
             for lf in llm_files:
                 if lf not in processed_files:
                     logger.info(f"LLM: Adding relevant file {lf}")
@@ -316,7 +289,11 @@ def collect_referenced_files(
                         base_dir,
                         failure_data,
                         llm_checked_files,
-                        patterns
+                        patterns,
+                        index,
+                        llm_mode,
+                        relevance_cache,
+                        llm_deferred=True
                     )
                 except (FileNotFoundError, PermissionError) as e:
                     logger.error(
@@ -327,6 +304,19 @@ def collect_referenced_files(
                             'error_type': type(e).__name__
                         }
                     )
+
+        # LLM: One request covering everything collected by the traversal
+        if llm_mode == LLM_RELEVANCE_BATCHED and not llm_deferred:
+            unchecked = processed_files - llm_checked_files
+            if unchecked:
+                llm_files = suggest_relevant_files_batched(
+                    processed_files, base_dir, index, failure_data, patterns, relevance_cache
+                )
+                for lf in llm_files:
+                    if lf not in processed_files:
+                        logger.info(f"LLM: Adding relevant file {lf}")
+                        processed_files.add(lf)
+                llm_checked_files.update(unchecked)
     
     except FileNotFoundError as e:
         logger.error(
@@ -508,45 +498,64 @@ def find_heuristic_relevant_files(file_path: Path, base_dir: Path, processed_fil
     - Looks for files with similar names or common suffixes (e.g., _utils, _helper).
     - Looks for files mentioned in failure data (by name or module).
     - Searches subdirectories if project is larger.
+
+    Each directory is listed once. Similar stems are looked up in a
+    StemSimilarityIndex and mentions are found with one Aho-Corasick pass per
+    failure value, instead of comparing every file against every value.
     """
     relevant_files = set()
     common_suffixes = ['_utils', '_helper', '_helpers', '_base', '_core']
+    candidates = [f for f in base_dir.glob('*.py') if f not in processed_files and f != file_path]
+    by_stem: Dict[str, List[Path]] = {}
+    for f in candidates:
+        by_stem.setdefault(f.stem, []).append(f)
     # 1. Filename similarity and common suffixes in the same directory
-    for f in base_dir.glob('*.py'):
-        if f not in processed_files and f != file_path:
-            ratio = SequenceMatcher(None, file_path.stem, f.stem).ratio()
-            if ratio > 0.7:
-                relevant_files.add(f.resolve())
-            for suffix in common_suffixes:
-                if file_path.stem + suffix == f.stem or f.stem + suffix == file_path.stem:
-                    relevant_files.add(f.resolve())
+    similar_stems = StemSimilarityIndex(by_stem).similar(file_path.stem, SIMILAR_STEM_THRESHOLD)
+    for suffix in common_suffixes:
+        similar_stems.add(file_path.stem + suffix)
+        if file_path.stem.endswith(suffix):
+            similar_stems.add(file_path.stem[:-len(suffix)])
+    for stem in similar_stems:
+        for f in by_stem.get(stem, ()):
+            relevant_files.add(f.resolve())
     # 2. Failure data matching (file/module names)
     if failure_data:
+        # A file's name contains its stem, so a mention of either is a mention of the stem
+        mentionable = list(candidates)
+        for subdir in base_dir.iterdir():
+            if subdir.is_dir():
+                mentionable.extend(f for f in subdir.glob('*.py') if f not in processed_files and f != file_path)
+        mentionable_by_stem: Dict[str, List[Path]] = {}
+        for f in mentionable:
+            mentionable_by_stem.setdefault(f.stem, []).append(f)
+        automaton = AhoCorasick(mentionable_by_stem)
         for failure in failure_data:
             for key in ['error_message', 'test_name', 'output', 'details', 'region']:
                 val = failure.get(key, '')
                 if not val:
                     continue
-                # Check for file/module names in the value
-                for f in base_dir.glob('*.py'):
-                    if f not in processed_files and f != file_path:
-                        if f.stem in val or f.name in val:
-                            relevant_files.add(f.resolve())
-                # Also check subdirectories (one level deep)
-                for subdir in base_dir.iterdir():
-                    if subdir.is_dir():
-                        for f in subdir.glob('*.py'):
-                            if f not in processed_files and f != file_path:
-                                if f.stem in val or f.name in val:
-                                    relevant_files.add(f.resolve())
+                if isinstance(val, str):
+                    mentioned = automaton.find(val)
+                else:
+                    mentioned = {stem for stem in mentionable_by_stem if stem in val or f"{stem}.py" in val}
+                for stem in mentioned:
+                    for f in mentionable_by_stem[stem]:
+                        relevant_files.add(f.resolve())
     # 3. Neighbor files in the same package (if __init__.py exists)
     if (base_dir / '__init__.py').exists():
-        for f in base_dir.glob('*.py'):
-            if f not in processed_files and f != file_path:
-                relevant_files.add(f.resolve())
+        for f in candidates:
+            relevant_files.add(f.resolve())
     return relevant_files
 
-def find_llm_relevant_files(file_path: Path, base_dir: Path, processed_files: Set[Path], llm_checked_files: Set[Path], failure_data: Optional[List[Dict]], patterns: Optional[Dict]) -> Set[Path]:
+def find_llm_relevant_files(
+    file_path: Path,
+    base_dir: Path,
+    processed_files: Set[Path],
+    llm_checked_files: Set[Path],
+    failure_data: Optional[List[Dict]],
+    patterns: Optional[Dict],
+    cache: Optional[RelevanceCache] = None
+) -> Set[Path]:
     """
     Use an LLM to suggest additional relevant files for fixes.
     
@@ -557,6 +566,8 @@ def find_llm_relevant_files(file_path: Path, base_dir: Path, processed_files: Se
         llm_checked_files: Set of files that have already been checked by LLM
         failure_data: List of test failures to check relevance against
         patterns: Configuration for file pattern matching
+        cache: Optional cache of previous suggestions, keyed by the file's
+            content hash and the failure signature
         
     Returns:
         Set of Path objects for relevant files that exist in the project
@@ -570,9 +581,15 @@ def find_llm_relevant_files(file_path: Path, base_dir: Path, processed_files: Se
         # Read the file content
         content = file_path.read_text(encoding='utf-8')
         logger.debug(f"Successfully read file content ({len(content)} characters)")
-        
-        # Prepare the prompt for the LLM
-        prompt = f"""Analyze the following Python file and suggest other relevant files that might need to be modified together.
+
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        key = RelevanceCache.make_key(LLM_RELEVANCE_PER_FILE, [(str(file_path), digest)], failure_data, patterns)
+        suggested_files = cache.get(key) if cache is not None else None
+        if suggested_files is not None:
+            logger.info(f"Using cached LLM file suggestions for {file_path}")
+        else:
+            # Prepare the prompt for the LLM
+            prompt = f"""Analyze the following Python file and suggest other relevant files that might need to be modified together.
         Consider:
         1. Related functionality
         2. Common dependencies
@@ -586,65 +603,39 @@ def find_llm_relevant_files(file_path: Path, base_dir: Path, processed_files: Se
         ```
         
         """
-        
-        if failure_data:
-            prompt += f"\nTest failures:\n{json.dumps(failure_data, indent=2)}\n"
-            logger.debug(f"Included {len(failure_data)} test failures in prompt")
-        
-        if patterns:
-            prompt += f"\nCode patterns:\n{json.dumps(patterns, indent=2)}\n"
-            logger.debug("Included code patterns in prompt")
-        
-        prompt += """
+
+            if failure_data:
+                prompt += f"\nTest failures:\n{json.dumps(failure_data, indent=2)}\n"
+                logger.debug(f"Included {len(failure_data)} test failures in prompt")
+
+            if patterns:
+                prompt += f"\nCode patterns:\n{json.dumps(patterns, indent=2)}\n"
+                logger.debug("Included code patterns in prompt")
+
+            prompt += """
         Return ONLY a JSON array of file paths that are relevant for fixes, relative to the base directory.
         Example format:
         ["path/to/file1.py", "path/to/file2.py"]
         """
-        
-        # Initialize Gemini model
-        api_key = os.environ.get("GOOGLE_API_KEY")
-        if not api_key:
-            logger.warning("GOOGLE_API_KEY not found, skipping LLM file suggestion")
-            return set()
-            
-        logger.info("Initializing Gemini model")
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash-preview-05-20')
-        
-        # Get response from Gemini
-        logger.info("Sending prompt to Gemini model")
-        response = model.generate_content(
-            prompt,
-            generation_config=genai.types.GenerationConfig(
-                temperature=0.1,  # Low temperature for more focused results
-                max_output_tokens=1024,
-                top_p=0.8,
-                top_k=40,
-            )
-        )
-        logger.debug("Received response from Gemini model")
-        
-        # Parse the response
-        try:
-            suggested_files = json.loads(response.text)
-            logger.info(f"Successfully parsed LLM response: {len(suggested_files)} files suggested")
-            logger.debug(f"Suggested files: {suggested_files}")
-            
-            # Convert to absolute paths and filter for existing files
-            relevant_files = {
-                (base_dir / Path(f)).resolve()
-                for f in suggested_files
-                if (base_dir / Path(f)).exists()
-            }
-            
-            logger.info(f"Found {len(relevant_files)} existing relevant files")
-            logger.debug(f"Relevant files: {[str(f) for f in relevant_files]}")
-            return relevant_files
-            
-        except json.JSONDecodeError:
-            logger.warning(f"Failed to parse LLM response as JSON: {response.text}")
-            return set()
+
+            response_text = generate_relevance_response(prompt)
+            if response_text is None:
+                return set()
+            suggested_files = parse_suggested_files(response_text, base_dir)
+            if cache is not None:
+                cache.put(key, suggested_files)
+
+        # Convert to absolute paths and filter for existing files
+        relevant_files = {
+            (base_dir / Path(f)).resolve()
+            for f in suggested_files
+            if (base_dir / Path(f)).exists()
+        }
+
+        logger.info(f"Found {len(relevant_files)} existing relevant files")
+        logger.debug(f"Relevant files: {[str(f) for f in relevant_files]}")
+        return relevant_files
             
     except Exception as e:
         logger.error(f"Error in LLM file suggestion: {str(e)}", exc_info=True)
-        return set() 
\ No newline at end of file
+        return set()
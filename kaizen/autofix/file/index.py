@@ -0,0 +1,441 @@
+"""Project-wide import and symbol index.
+
+Collecting the files referenced by a failing file used to parse every file
+and resolve every import with ``importlib.util.find_spec`` on each run. The
+index scans a project once, records the imports and top-level symbols of
+every Python file, and persists the result so later runs only re-parse files
+whose contents changed. Import resolution then becomes a lookup in the
+index's module map.
+"""
+
+import ast
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default location of persisted indexes
+DEFAULT_INDEX_DIR = Path.home() / '.kaizen' / 'index'
+
+# Bump when the persisted format or the parsing rules change
+INDEX_FORMAT_VERSION = 1
+
+# Directories never scanned
+INDEX_IGNORED_DIRS = frozenset({
+    '.git', '.hg', '.svn', '__pycache__', '.mypy_cache', '.pytest_cache', '.tox', '.nox',
+    'node_modules', '.venv', 'venv', 'env', 'build', 'dist', '.eggs', 'site-packages'
+})
+
+# Number of files to parse before a process pool is worth starting
+PARALLEL_PARSE_THRESHOLD = 200
+
+
+@dataclass
+class FileEntry:
+    """Indexed facts about one Python file.
+
+    Attributes:
+        mtime_ns: Modification time when indexed
+        size: Size in bytes when indexed
+        digest: SHA-256 of the contents when indexed
+        imports: (module, level) pairs of the file's import statements;
+            ``import a.b`` records 'a.b', and ``from a.b import c`` records
+            'a.b' and 'a.b.c' since c may be a submodule
+        symbols: Names of top-level functions, classes and assignments
+        parse_error: Whether the file could not be parsed
+    """
+    mtime_ns: int
+    size: int
+    digest: str
+    imports: List[Tuple[str, int]] = field(default_factory=list)
+    symbols: List[str] = field(default_factory=list)
+    parse_error: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'FileEntry':
+        """Create a FileEntry from its persisted form."""
+        return cls(
+            mtime_ns=data['mtime_ns'],
+            size=data['size'],
+            digest=data['digest'],
+            imports=[(module, level) for module, level in data.get('imports', [])],
+            symbols=list(data.get('symbols', [])),
+            parse_error=data.get('parse_error', False)
+        )
+
+    def to_dict(self) -> Dict:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            'mtime_ns': self.mtime_ns,
+            'size': self.size,
+            'digest': self.digest,
+            'imports': [list(item) for item in self.imports],
+            'symbols': self.symbols,
+            'parse_error': self.parse_error
+        }
+
+
+def _index_file(path: str) -> Optional[FileEntry]:
+    """Read and parse one file. Runs in worker processes for large scans."""
+    try:
+        stat = os.stat(path)
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+    entry = FileEntry(
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        digest=hashlib.sha256(data).hexdigest()
+    )
+    try:
+        tree = ast.parse(data)
+    except (SyntaxError, ValueError):
+        entry.parse_error = True
+        return entry
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            entry.imports.extend((alias.name, 0) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ''
+            entry.imports.append((module, node.level))
+            # Imported names may be submodules ("from . import util")
+            entry.imports.extend(
+                (f"{module}.{alias.name}" if module else alias.name, node.level)
+                for alias in node.names if alias.name != '*'
+            )
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            entry.symbols.append(node.name)
+        elif isinstance(node, ast.Assign):
+            entry.symbols.extend(target.id for target in node.targets if isinstance(target, ast.Name))
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            entry.symbols.append(node.target.id)
+    return entry
+
+
+class ProjectIndex:
+    """Import and symbol index of the Python files under a directory.
+
+    Files outside the root (for example modules of parent packages or
+    installed libraries reached through imports) are indexed on demand.
+    """
+
+    def __init__(self, root: Path, index_dir: Optional[Path] = None, persist: bool = True):
+        """Initialize the index and load its persisted state.
+
+        Args:
+            root: Directory to index
+            index_dir: Directory persisted indexes are stored in
+            persist: Whether to load and save the index on disk
+        """
+        self.root = Path(root).resolve()
+        self.persist = persist
+        root_key = hashlib.sha256(str(self.root).encode('utf-8')).hexdigest()[:16]
+        self.index_path = Path(index_dir or DEFAULT_INDEX_DIR) / f"{root_key}.json"
+        self._entries: Dict[str, FileEntry] = {}
+        self._modules: Dict[str, str] = {}
+        self._spec_cache: Dict[str, Optional[str]] = {}
+        self._package_cache: Dict[str, List[str]] = {}
+        self._lock = threading.RLock()
+        self._dirty = False
+        if persist:
+            self._load()
+
+    def refresh(self) -> None:
+        """Scan the root for added and removed files and index new ones.
+
+        Changed files are re-indexed lazily, when they are looked up, so a
+        refresh costs a directory walk rather than a stat of every file.
+        """
+        with self._lock:
+            paths = set(self._scan())
+            added = [path for path in paths if path not in self._entries]
+            # On-demand entries outside the root are checked when used
+            removed = [path for path in self._entries if path not in paths and self._is_under_root(path)]
+            for path in removed:
+                del self._entries[path]
+
+            if added:
+                logger.info(f"Indexing {len(added)} of {len(paths)} Python file(s) under {self.root}")
+                for path, entry in zip(added, self._parse(added)):
+                    if entry is not None:
+                        self._entries[path] = entry
+
+            if added or removed:
+                self._dirty = True
+            if self._dirty or not self._modules:
+                self._build_module_map()
+            if self._dirty:
+                self._save()
+
+    def files(self) -> List[Path]:
+        """Get the indexed files under the root."""
+        with self._lock:
+            return [Path(path) for path in self._entries if self._is_under_root(path)]
+
+    def get_imported_files(self, file_path: Path) -> Set[Path]:
+        """Get the Python files a file imports.
+
+        Args:
+            file_path: File to look up
+
+        Returns:
+            Resolved paths of the imported modules that are Python source files
+        """
+        file_path = Path(file_path).resolve()
+        entry = self._get_entry(str(file_path))
+        if entry is None:
+            return set()
+        imported = set()
+        for module, level in entry.imports:
+            if level:
+                origin = self._resolve_relative(file_path, module, level)
+            else:
+                origin = self.resolve_module(module)
+            if origin is not None:
+                imported.add(Path(origin))
+        return imported
+
+    def get_entry(self, file_path: Path) -> Optional[FileEntry]:
+        """Get the up-to-date index entry of a file.
+
+        Args:
+            file_path: File to look up
+
+        Returns:
+            The file's entry, or None if it cannot be read
+        """
+        return self._get_entry(str(Path(file_path).resolve()))
+
+    def find_symbol(self, name: str) -> Set[Path]:
+        """Get the files under the root defining a top-level symbol.
+
+        Args:
+            name: Function, class or variable name
+
+        Returns:
+            Paths of the files defining it
+        """
+        with self._lock:
+            paths = [path for path in self._entries if self._is_under_root(path)]
+            return {
+                Path(path) for path in paths
+                if name in getattr(self._get_entry(path), 'symbols', ())
+            }
+
+    def resolve_module(self, module_name: str) -> Optional[str]:
+        """Find the source file of a module.
+
+        Modules of the project are resolved through the index; others fall
+        back to ``importlib.util.find_spec``, memoized per index.
+
+        Args:
+            module_name: Absolute dotted module name
+
+        Returns:
+            Path of the module's .py file, or None if it has none
+        """
+        with self._lock:
+            origin = self._modules.get(module_name)
+            if origin is not None:
+                return origin
+            if module_name in self._spec_cache:
+                return self._spec_cache[module_name]
+
+        origin = None
+        try:
+            spec = importlib.util.find_spec(module_name)
+            if spec and spec.origin and spec.origin.endswith('.py'):
+                origin = str(Path(spec.origin).resolve())
+        except (ImportError, ValueError) as e:
+            logger.debug(f"Failed to find module {module_name}: {str(e)}")
+        except Exception as e:
+            # find_spec imports parent packages, which may fail in any way
+            logger.debug(f"Error finding module {module_name}: {str(e)}")
+        with self._lock:
+            self._spec_cache[module_name] = origin
+        return origin
+
+    def _get_entry(self, path: str) -> Optional[FileEntry]:
+        """Get an up-to-date entry for a file, indexing it if needed."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and self._is_current(path, entry):
+                return entry
+            entry = _index_file(path)
+            if entry is None:
+                self._entries.pop(path, None)
+            else:
+                self._entries[path] = entry
+                if self._is_under_root(path):
+                    self._register_module(path)
+            self._dirty = True
+            return entry
+
+    def _is_current(self, path: str, entry: FileEntry) -> bool:
+        """Check whether an entry still matches its file, re-hashing only on stat changes."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if (stat.st_mtime_ns, stat.st_size) == (entry.mtime_ns, entry.size):
+            return True
+        try:
+            digest = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        except OSError:
+            return False
+        if digest != entry.digest:
+            return False
+        # Touched but not edited
+        entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+        self._dirty = True
+        return True
+
+    def _scan(self) -> Iterator[str]:
+        """Walk the root for Python files."""
+        for current, dirs, files in os.walk(self.root):
+            dirs[:] = [d for d in dirs if d not in INDEX_IGNORED_DIRS and not d.endswith('.egg-info')]
+            for name in files:
+                if name.endswith('.py'):
+                    yield os.path.join(current, name)
+
+    @staticmethod
+    def _parse(paths: List[str]) -> List[Optional[FileEntry]]:
+        """Index files, in worker processes when there are many."""
+        workers = os.cpu_count() or 1
+        if workers > 1 and len(paths) >= PARALLEL_PARSE_THRESHOLD:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    return list(executor.map(_index_file, paths, chunksize=max(1, len(paths) // (workers * 4))))
+            except Exception as e:
+                logger.debug(f"Parallel indexing failed, indexing serially: {str(e)}")
+        return [_index_file(path) for path in paths]
+
+    def _build_module_map(self) -> None:
+        """Map the dotted names of the files under the root to their paths."""
+        self._modules = {}
+        self._package_cache = {}
+        for path in self._entries:
+            if self._is_under_root(path):
+                self._register_module(path)
+
+    def _register_module(self, path: str) -> None:
+        """Add a file's importable names to the module map.
+
+        A file is importable relative to the root and, inside packages, by its
+        fully qualified name starting at the outermost package.
+        """
+        file_path = Path(path)
+        parts = list(file_path.relative_to(self.root).with_suffix('').parts)
+        if parts and parts[-1] == '__init__':
+            parts = parts[:-1]
+        if parts:
+            self._modules.setdefault('.'.join(parts), path)
+        qualified = self._qualified_name(file_path)
+        if qualified:
+            self._modules.setdefault(qualified, path)
+
+    def _qualified_name(self, file_path: Path) -> Optional[str]:
+        """Get a file's dotted name from the outermost package containing it."""
+        parts = list(self._package_parts(file_path.parent))
+        if file_path.name != '__init__.py':
+            parts.append(file_path.stem)
+        return '.'.join(parts) if parts else None
+
+    def _package_parts(self, directory: Path) -> List[str]:
+        """Get the dotted name parts of a package directory, memoized per refresh."""
+        key = str(directory)
+        parts = self._package_cache.get(key)
+        if parts is None:
+            if directory.parent != directory and (directory / '__init__.py').exists():
+                parts = self._package_parts(directory.parent) + [directory.name]
+            else:
+                parts = []
+            self._package_cache[key] = parts
+        return parts
+
+    @staticmethod
+    def _resolve_relative(file_path: Path, module: str, level: int) -> Optional[str]:
+        """Find the file a relative import refers to."""
+        base = file_path.parent
+        for _ in range(level - 1):
+            base = base.parent
+        target = base.joinpath(*module.split('.')) if module else base
+        candidates = [target / '__init__.py']
+        if module:
+            candidates.insert(0, target.with_suffix('.py'))
+        for candidate in candidates:
+            if candidate.is_file():
+                return str(candidate.resolve())
+        return None
+
+    def _is_under_root(self, path: str) -> bool:
+        """Check whether a path lies under the indexed root."""
+        return path.startswith(str(self.root) + os.sep)
+
+    def _load(self) -> None:
+        """Load the persisted index, ignoring missing or outdated files."""
+        try:
+            data = json.loads(self.index_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if data.get('version') != INDEX_FORMAT_VERSION or data.get('root') != str(self.root):
+            return
+        try:
+            self._entries = {path: FileEntry.from_dict(entry) for path, entry in data.get('files', {}).items()}
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Ignoring corrupt index {self.index_path}: {str(e)}")
+            self._entries = {}
+
+    def _save(self) -> None:
+        """Persist the index atomically."""
+        self._dirty = False
+        if not self.persist:
+            return
+        data = {
+            'version': INDEX_FORMAT_VERSION,
+            'root': str(self.root),
+            'files': {path: entry.to_dict() for path, entry in self._entries.items()}
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.index_path.with_suffix(f'.{os.getpid()}.tmp')
+            temp_path.write_text(json.dumps(data), encoding='utf-8')
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            logger.debug(f"Could not save index {self.index_path}: {str(e)}")
+
+
+_indexes: Dict[str, ProjectIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_project_index(root: Path, refresh: bool = True) -> ProjectIndex:
+    """Get the shared index of a directory.
+
+    Args:
+        root: Directory to index
+        refresh: Whether to pick up files changed since the last refresh
+
+    Returns:
+        The directory's ProjectIndex
+    """
+    key = str(Path(root).resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        created = index is None
+        if created:
+            index = ProjectIndex(Path(key))
+            _indexes[key] = index
+    if created or refresh:
+        index.refresh()
+    return index
@@ -0,0 +1,127 @@
+"""String matching indexes for the file relevance heuristics.
+
+The heuristics compare a file's stem against every other module stem and
+look for every module name in every failure message. These indexes answer
+both questions in one pass per query instead of one comparison per pair.
+"""
+
+from collections import Counter, deque
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class AhoCorasick:
+    """Finds which of a set of patterns occur in a text in a single pass."""
+
+    def __init__(self, patterns: Iterable[str]):
+        """Build the automaton.
+
+        Args:
+            patterns: Strings to search for
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Set[str]] = [set()]
+        self._always: Set[str] = set()
+        for pattern in set(patterns):
+            if pattern:
+                self._add(pattern)
+            else:
+                # The empty string occurs in every text
+                self._always.add(pattern)
+        self._link()
+
+    def find(self, text: str) -> Set[str]:
+        """Get the patterns occurring in a text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Patterns that are substrings of the text
+        """
+        found = set(self._always)
+        state = 0
+        for char in text:
+            while char not in self._goto[state] and state:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._output[state]:
+                found |= self._output[state]
+        return found
+
+    def _add(self, pattern: str) -> None:
+        """Add a pattern to the trie."""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+            state = next_state
+        self._output[state].add(pattern)
+
+    def _link(self) -> None:
+        """Compute failure links breadth-first."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while char not in self._goto[fail] and fail:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                if self._fail[next_state] == next_state:
+                    self._fail[next_state] = 0
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+
+class StemSimilarityIndex:
+    """Finds the stems whose SequenceMatcher ratio to a query exceeds a threshold.
+
+    Stems are bucketed by length and carry their character counts. Both give
+    upper bounds on the ratio (the same bounds as ``real_quick_ratio`` and
+    ``quick_ratio``), so whole buckets and most stems are ruled out without
+    running the matcher, and the result is exactly the set a full pairwise
+    comparison would return.
+    """
+
+    def __init__(self, stems: Iterable[str]):
+        """Build the index.
+
+        Args:
+            stems: Strings to index
+        """
+        self._by_length: Dict[int, List[Tuple[str, Counter]]] = {}
+        for stem in set(stems):
+            self._by_length.setdefault(len(stem), []).append((stem, Counter(stem)))
+
+    def similar(self, query: str, threshold: float) -> Set[str]:
+        """Get the stems similar to a query.
+
+        Args:
+            query: String to compare against
+            threshold: Ratio a stem must exceed
+
+        Returns:
+            Stems with SequenceMatcher(None, query, stem).ratio() > threshold
+        """
+        query_length = len(query)
+        query_counts = Counter(query)
+        matches = set()
+        for length, entries in self._by_length.items():
+            total = query_length + length
+            if total and 2.0 * min(query_length, length) / total <= threshold:
+                continue
+            for stem, counts in entries:
+                if total:
+                    common = sum((query_counts & counts).values())
+                    if 2.0 * common / total <= threshold:
+                        continue
+                if SequenceMatcher(None, query, stem).ratio() > threshold:
+                    matches.add(stem)
+        return matches
@@ -0,0 +1,304 @@
+"""LLM suggestions of files relevant to a fix.
+
+Asking the LLM once per visited file sends the full content of every file
+and the same failure data over and over. The batched request here sends one
+compact summary of the candidate set (paths, imports and top-level symbols
+taken from the project index) instead. Suggestions are cached on disk keyed
+by the content hashes of the summarised files and a signature of the
+failures, so repeated auto-fix runs over unchanged code reuse them.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import google.generativeai as genai
+
+from ..test.disk_cache import DiskCache
+from .index import ProjectIndex
+
+logger = logging.getLogger(__name__)
+
+# How collect_referenced_files asks the LLM for relevant files
+LLM_RELEVANCE_BATCHED = 'batched'
+LLM_RELEVANCE_PER_FILE = 'per_file'
+LLM_RELEVANCE_OFF = 'off'
+LLM_RELEVANCE_MODES = (LLM_RELEVANCE_BATCHED, LLM_RELEVANCE_PER_FILE, LLM_RELEVANCE_OFF)
+
+# Model and generation settings for relevance suggestions
+RELEVANCE_MODEL_NAME = 'gemini-2.5-flash-preview-05-20'
+RELEVANCE_MAX_OUTPUT_TOKENS = 1024
+
+# Bounds on the size of a batched request
+MAX_BATCH_CANDIDATES = 400
+MAX_SUMMARY_SYMBOLS = 15
+MAX_SUMMARY_IMPORTS = 10
+
+# Default cache location and bounds
+DEFAULT_RELEVANCE_CACHE_DIR = Path.home() / '.kaizen' / 'relevance-cache'
+DEFAULT_RELEVANCE_CACHE_MAX_ENTRIES = 1000
+DEFAULT_RELEVANCE_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Bump when the cached entry format or prompt semantics change
+RELEVANCE_CACHE_FORMAT_VERSION = 1
+
+_model = None
+_model_key: Optional[str] = None
+_model_lock = threading.Lock()
+
+
+def failure_signature(failure_data: Optional[List[Dict[str, Any]]]) -> str:
+    """Hash test failures into a stable signature.
+
+    Args:
+        failure_data: List of test failures
+
+    Returns:
+        Hex digest identifying the failures
+    """
+    payload = json.dumps(failure_data or [], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class RelevanceCache(DiskCache):
+    """Size-bounded, TTL-limited on-disk cache of relevant-file suggestions."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_entries: int = DEFAULT_RELEVANCE_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_RELEVANCE_CACHE_TTL_SECONDS
+    ):
+        """Initialize the relevance cache.
+
+        Args:
+            cache_dir: Directory to store cache entries in
+            max_entries: Maximum number of entries kept on disk
+            ttl_seconds: Age after which an entry is considered stale
+        """
+        super().__init__(cache_dir or DEFAULT_RELEVANCE_CACHE_DIR, max_entries, ttl_seconds)
+
+    @staticmethod
+    def make_key(
+        mode: str,
+        file_hashes: Iterable[Tuple[str, str]],
+        failure_data: Optional[List[Dict[str, Any]]],
+        patterns: Optional[Dict] = None
+    ) -> str:
+        """Build a cache key for a suggestion request.
+
+        Args:
+            mode: LLM_RELEVANCE_BATCHED or LLM_RELEVANCE_PER_FILE
+            file_hashes: (path, content hash) pairs of the files in the request
+            failure_data: Test failures included in the request
+            patterns: Code patterns included in the request
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps(
+            {
+                'version': RELEVANCE_CACHE_FORMAT_VERSION,
+                'mode': mode,
+                'model': RELEVANCE_MODEL_NAME,
+                'files': sorted(file_hashes),
+                'failures': failure_signature(failure_data),
+                'patterns': patterns or {}
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """Look up cached suggestions.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Suggested paths relative to the base directory, or None if absent
+            or expired
+        """
+        return super().get(key)
+
+
+def generate_relevance_response(prompt: str) -> Optional[str]:
+    """Send a relevance prompt to the LLM.
+
+    The model is created once per API key and shared by all requests.
+
+    Args:
+        prompt: Prompt to send
+
+    Returns:
+        Response text, or None if no API key is configured
+    """
+    global _model, _model_key
+
+    api_key = os.environ.get("GOOGLE_API_KEY")
+    if not api_key:
+        logger.warning("GOOGLE_API_KEY not found, skipping LLM file suggestion")
+        return None
+
+    with _model_lock:
+        if _model is None or _model_key != api_key:
+            logger.info("Initializing Gemini model")
+            genai.configure(api_key=api_key)
+            _model = genai.GenerativeModel(RELEVANCE_MODEL_NAME)
+            _model_key = api_key
+        model = _model
+
+    logger.info("Sending prompt to Gemini model")
+    response = model.generate_content(
+        prompt,
+        generation_config=genai.types.GenerationConfig(
+            temperature=0.1,  # Low temperature for more focused results
+            max_output_tokens=RELEVANCE_MAX_OUTPUT_TOKENS,
+            top_p=0.8,
+            top_k=40,
+        )
+    )
+    logger.debug("Received response from Gemini model")
+    return response.text
+
+
+def parse_suggested_files(response_text: str, base_dir: Path) -> List[str]:
+    """Parse an LLM response into suggested paths that exist.
+
+    Args:
+        response_text: Response expected to hold a JSON array of paths
+        base_dir: Directory the paths are relative to
+
+    Returns:
+        Suggested paths that exist, as given by the LLM
+    """
+    try:
+        suggested_files = json.loads(response_text)
+    except json.JSONDecodeError:
+        logger.warning(f"Failed to parse LLM response as JSON: {response_text}")
+        return []
+    if not isinstance(suggested_files, list):
+        logger.warning(f"LLM response is not a JSON array: {response_text}")
+        return []
+    logger.info(f"Successfully parsed LLM response: {len(suggested_files)} files suggested")
+    logger.debug(f"Suggested files: {suggested_files}")
+    return [f for f in suggested_files if isinstance(f, str) and (base_dir / Path(f)).exists()]
+
+
+def suggest_relevant_files_batched(
+    collected_files: Iterable[Path],
+    base_dir: Path,
+    index: ProjectIndex,
+    failure_data: Optional[List[Dict[str, Any]]],
+    patterns: Optional[Dict],
+    cache: Optional[RelevanceCache] = None
+) -> Set[Path]:
+    """Ask the LLM once which project files are relevant for fixing a set of files.
+
+    The request summarises the collected files and the rest of the project by
+    path, imports and top-level symbols rather than sending file contents.
+
+    Args:
+        collected_files: Files already collected for the fix
+        base_dir: Base directory paths in the request are relative to
+        index: Project index providing the file summaries
+        failure_data: List of test failures to check relevance against
+        patterns: Configuration for file pattern matching
+        cache: Optional cache of previous suggestions
+
+    Returns:
+        Set of Path objects for relevant files that exist in the project
+    """
+    base_dir = Path(base_dir).resolve()
+    collected = sorted({Path(f).resolve() for f in collected_files})
+    collected_set = set(collected)
+    others = sorted(f for f in index.files() if f not in collected_set)
+    candidates = collected + others[:max(0, MAX_BATCH_CANDIDATES - len(collected))]
+    if len(others) + len(collected) > len(candidates):
+        logger.info(f"Summarising {len(candidates)} of {len(others) + len(collected)} project files for LLM suggestion")
+
+    summaries = []
+    file_hashes = []
+    for path in candidates:
+        entry = index.get_entry(path)
+        if entry is None:
+            continue
+        relative = _relative_path(path, base_dir)
+        file_hashes.append((relative, entry.digest))
+        summaries.append({
+            'path': relative,
+            'collected': path in collected_set,
+            'imports': [module for module, _ in entry.imports[:MAX_SUMMARY_IMPORTS]],
+            'symbols': entry.symbols[:MAX_SUMMARY_SYMBOLS]
+        })
+
+    key = RelevanceCache.make_key(LLM_RELEVANCE_BATCHED, file_hashes, failure_data, patterns)
+    suggested = cache.get(key) if cache is not None else None
+    if suggested is not None:
+        logger.info(f"Using cached LLM file suggestions ({len(suggested)} files)")
+    else:
+        prompt = _build_batched_prompt(summaries, failure_data, patterns)
+        try:
+            response_text = generate_relevance_response(prompt)
+        except Exception as e:
+            logger.error(f"Error in LLM file suggestion: {str(e)}", exc_info=True)
+            return set()
+        if response_text is None:
+            return set()
+        suggested = parse_suggested_files(response_text, base_dir)
+        if cache is not None:
+            cache.put(key, suggested)
+
+    relevant_files = {(base_dir / Path(f)).resolve() for f in suggested if (base_dir / Path(f)).exists()}
+    logger.info(f"Found {len(relevant_files)} existing relevant files")
+    logger.debug(f"Relevant files: {[str(f) for f in relevant_files]}")
+    return relevant_files
+
+
+def _relative_path(path: Path, base_dir: Path) -> str:
+    """Express a path relative to the base directory where possible."""
+    try:
+        return os.path.relpath(path, base_dir)
+    except ValueError:
+        # Different drive on Windows
+        return str(path)
+
+
+def _build_batched_prompt(
+    summaries: List[Dict[str, Any]],
+    failure_data: Optional[List[Dict[str, Any]]],
+    patterns: Optional[Dict]
+) -> str:
+    """Build the prompt for a batched suggestion request."""
+    prompt = f"""The files marked "collected": true are being modified to fix failing tests.
+        Suggest other files from the list that might need to be modified together.
+        Consider:
+        1. Related functionality
+        2. Common dependencies
+        3. Test failures if provided
+        4. Code patterns and conventions
+
+        Project files (path, imports and top-level symbols):
+        {json.dumps(summaries)}
+
+        """
+
+    if failure_data:
+        prompt += f"\nTest failures:\n{json.dumps(failure_data, indent=2, default=str)}\n"
+        logger.debug(f"Included {len(failure_data)} test failures in prompt")
+
+    if patterns:
+        prompt += f"\nCode patterns:\n{json.dumps(patterns, indent=2)}\n"
+        logger.debug("Included code patterns in prompt")
+
+    prompt += """
+        Return ONLY a JSON array of file paths from the list that are relevant for fixes.
+        Example format:
+        ["path/to/file1.py", "path/to/file2.py"]
+        """
+    return prompt
@@ -0,0 +1,264 @@
+"""Reuse of agent modules and instances across test steps.
+
+Loading an agent module and constructing the agent can be expensive when the
+agent builds LLM clients, vector indexes or prompts in ``__init__``. This
+cache keeps loaded modules keyed on the source file's fingerprint and hands
+out agent instances according to the configured lifecycle. A module is
+reloaded, and its instances discarded, as soon as its file changes on disk,
+for example after auto-fix rewrites it.
+"""
+
+import hashlib
+import importlib
+import logging
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Agent lifecycles, mirroring kaizen.cli.commands.types.AgentLifecycle
+LIFECYCLE_PER_STEP = 'per-step'
+LIFECYCLE_PER_RUN = 'per-run'
+LIFECYCLE_PER_WORKER = 'per-worker'
+
+
+@dataclass
+class _CachedModule:
+    """A loaded agent module and the state of its source file when loaded.
+
+    Attributes:
+        module: The loaded module
+        file_path: Source file the module was loaded from, if known
+        stat_key: (mtime_ns, size) of the source file
+        digest: SHA-256 of the source file contents
+        stale: Whether the module must be reloaded before its next use
+    """
+    module: ModuleType
+    file_path: Optional[Path]
+    stat_key: Optional[Tuple[int, int]]
+    digest: Optional[str]
+    stale: bool = False
+
+
+class AgentCache:
+    """Caches agent modules by file fingerprint and instances by lifecycle.
+
+    A cheap (mtime, size) check runs on every lookup; the file is only hashed
+    when that changes, so touching a file without editing it does not force a
+    reload.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._modules: Dict[str, _CachedModule] = {}
+        self._instances: Dict[Tuple[str, str], Any] = {}
+        self._worker_local = threading.local()
+        self._lock = threading.RLock()
+        self.module_loads = 0
+        self.instance_creations = 0
+
+    def get_module(
+        self,
+        module_name: str,
+        file_path: Optional[Path],
+        loader: Callable[[], ModuleType]
+    ) -> ModuleType:
+        """Get a loaded agent module, reloading it if its source changed.
+
+        Args:
+            module_name: Import name of the module
+            file_path: Source file of the module, if known
+            loader: Function that imports the module
+
+        Returns:
+            The loaded module
+        """
+        with self._lock:
+            cached = self._modules.get(module_name)
+            if cached is not None and self._is_current(cached):
+                return cached.module
+
+            if cached is not None:
+                logger.info(f"Agent module '{module_name}' changed on disk, reloading")
+                self._discard_locked(module_name)
+                module = self._reload(cached.module, loader)
+            else:
+                module = loader()
+            self.module_loads += 1
+
+            source_path = self._resolve_source_path(module, file_path)
+            stat_key = self._stat_key(source_path)
+            self._modules[module_name] = _CachedModule(
+                module=module,
+                file_path=source_path,
+                stat_key=stat_key,
+                digest=self._digest(source_path) if stat_key else None
+            )
+            return module
+
+    def get_instance(self, module_name: str, class_obj: type, lifecycle: str) -> Any:
+        """Get an agent instance according to the lifecycle.
+
+        Args:
+            module_name: Import name of the module defining the class
+            class_obj: Agent class to instantiate
+            lifecycle: One of 'per-step', 'per-run' or 'per-worker'
+
+        Returns:
+            An instance of class_obj
+        """
+        if lifecycle == LIFECYCLE_PER_RUN:
+            key = (module_name, class_obj.__qualname__)
+            with self._lock:
+                instance = self._instances.get(key)
+                if instance is None or type(instance) is not class_obj:
+                    instance = self._create_instance(class_obj)
+                    self._instances[key] = instance
+                return instance
+
+        if lifecycle == LIFECYCLE_PER_WORKER:
+            key = (module_name, class_obj.__qualname__)
+            instances = self._worker_instances()
+            instance = instances.get(key)
+            if instance is None or type(instance) is not class_obj:
+                instance = self._create_instance(class_obj)
+                instances[key] = instance
+            return instance
+
+        return self._create_instance(class_obj)
+
+    def invalidate(self, file_path: Optional[Path] = None) -> None:
+        """Mark cached modules for reload and drop agent instances.
+
+        Every cached agent module is reloaded on its next use, since any of
+        them may import the changed file.
+
+        Args:
+            file_path: Optional file that was rewritten. Modules imported from
+                it are removed from sys.modules so agents re-import the new code.
+        """
+        with self._lock:
+            for cached in self._modules.values():
+                cached.stale = True
+            self._instances.clear()
+            self._worker_local = threading.local()
+
+            if file_path is not None:
+                self._unload_from_sys_modules(Path(file_path))
+
+    def release_instances(self) -> None:
+        """Drop agent instances but keep loaded modules.
+
+        Called at the end of a test run so per-run and per-worker instances do
+        not outlive the run.
+        """
+        with self._lock:
+            self._instances.clear()
+            self._worker_local = threading.local()
+
+    @staticmethod
+    def _reload(module: ModuleType, loader: Callable[[], ModuleType]) -> ModuleType:
+        """Re-execute a changed module.
+
+        Modules registered in sys.modules are reloaded in place, so packages
+        that expose them as attributes see the new code. Modules loaded
+        directly from a file are loaded again.
+        """
+        if sys.modules.get(module.__name__) is module:
+            return importlib.reload(module)
+        return loader()
+
+    def _discard_locked(self, module_name: str) -> None:
+        """Forget a module and its instances. Caller must hold the lock."""
+        self._modules.pop(module_name, None)
+        for key in [key for key in self._instances if key[0] == module_name]:
+            del self._instances[key]
+        # Worker threads keep instances in thread-local storage; replacing it
+        # ensures none of them keeps using an instance of the old class
+        self._worker_local = threading.local()
+
+    def _create_instance(self, class_obj: type) -> Any:
+        """Instantiate an agent class."""
+        self.instance_creations += 1
+        return class_obj()
+
+    def _worker_instances(self) -> Dict[Tuple[str, str], Any]:
+        """Get the calling thread's instance store."""
+        local = self._worker_local
+        instances = getattr(local, 'instances', None)
+        if instances is None:
+            instances = {}
+            local.instances = instances
+        return instances
+
+    def _is_current(self, cached: _CachedModule) -> bool:
+        """Check whether a cached module still matches its source file."""
+        if cached.stale:
+            return False
+        if cached.file_path is None:
+            return True
+
+        stat_key = self._stat_key(cached.file_path)
+        if stat_key == cached.stat_key:
+            return True
+        if stat_key is None:
+            return False
+
+        digest = self._digest(cached.file_path)
+        if digest == cached.digest:
+            # Touched but not edited
+            cached.stat_key = stat_key
+            return True
+        return False
+
+    @staticmethod
+    def _resolve_source_path(module: ModuleType, file_path: Optional[Path]) -> Optional[Path]:
+        """Find the source file a module was loaded from."""
+        module_file = getattr(module, '__file__', None)
+        if module_file:
+            return Path(module_file)
+        return Path(file_path) if file_path else None
+
+    @staticmethod
+    def _stat_key(file_path: Optional[Path]) -> Optional[Tuple[int, int]]:
+        """Get the (mtime_ns, size) of a file."""
+        if file_path is None:
+            return None
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _digest(file_path: Path) -> Optional[str]:
+        """Hash the contents of a file."""
+        try:
+            return hashlib.sha256(Path(file_path).read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    @staticmethod
+    def _normalize(file_path: Path) -> str:
+        """Normalize a path for comparison."""
+        return os.path.normcase(os.path.realpath(str(file_path)))
+
+    def _unload_from_sys_modules(self, file_path: Path) -> None:
+        """Remove modules imported from a file so the next import re-executes it.
+
+        Cached agent modules are left in place; they are reloaded in place on
+        their next use instead. Caller must hold the lock.
+        """
+        agent_modules = {id(cached.module) for cached in self._modules.values()}
+        target = self._normalize(file_path)
+        for name, module in list(sys.modules.items()):
+            if id(module) in agent_modules:
+                continue
+            module_file = getattr(module, '__file__', None)
+            if module_file and self._normalize(Path(module_file)) == target:
+                sys.modules.pop(name, None)
@@ -0,0 +1,605 @@
+"""Deterministic assertions on step outputs.
+
+Each assertion in a step's ``assertions`` list is compiled once into a
+callable: regular expressions are compiled, JSONPath expressions are parsed
+and type names are resolved up front, so running a step only evaluates the
+checks. Compiled lists are memoized by their configuration, so compiling the
+same assertions again (for every auto-fix attempt, say) is a lookup.
+
+An assertion is a mapping with a ``type`` and type-specific keys. Every type
+accepts an optional ``path`` selecting the value to check from structured
+output, e.g. ``$.result.items[0].status``; JSON strings are decoded before the
+path is applied. New types are added with ``register_assertion``.
+"""
+
+import json
+import logging
+import math
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Number of distinct assertion lists kept compiled
+COMPILED_ASSERTIONS_CACHE_SIZE = 256
+
+# Type names accepted by the 'type' assertion, in Python and JSON spelling
+TYPE_NAMES: Dict[str, Tuple[type, ...]] = {
+    'str': (str,),
+    'string': (str,),
+    'int': (int,),
+    'integer': (int,),
+    'float': (float,),
+    'number': (int, float),
+    'bool': (bool,),
+    'boolean': (bool,),
+    'list': (list,),
+    'array': (list, tuple),
+    'tuple': (tuple,),
+    'dict': (dict,),
+    'object': (dict,),
+    'None': (type(None),),
+    'NoneType': (type(None),),
+    'null': (type(None),),
+}
+
+# JSON Schema type keywords understood by the 'schema' assertion
+_SCHEMA_TYPES: Dict[str, Callable[[Any], bool]] = {
+    'string': lambda value: isinstance(value, str),
+    'integer': lambda value: isinstance(value, int) and not isinstance(value, bool),
+    'number': lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    'boolean': lambda value: isinstance(value, bool),
+    'array': lambda value: isinstance(value, (list, tuple)),
+    'object': lambda value: isinstance(value, dict),
+    'null': lambda value: value is None,
+}
+
+# Check compiled from one assertion: returns (passed, failure message)
+Check = Callable[[Any], Tuple[bool, Optional[str]]]
+
+# Builds a check from an assertion's configuration
+AssertionFactory = Callable[[Dict[str, Any]], Check]
+
+
+class AssertionSpecError(ValueError):
+    """Raised when an assertion's configuration is invalid."""
+
+
+class _Missing:
+    """Marks a JSONPath that selects nothing."""
+
+    def __repr__(self) -> str:
+        return '<missing>'
+
+
+MISSING = _Missing()
+
+_registry: Dict[str, AssertionFactory] = {}
+_registry_lock = threading.Lock()
+
+
+def register_assertion(type_name: str, factory: AssertionFactory) -> None:
+    """Register an assertion type.
+
+    Args:
+        type_name: Value of the assertion's 'type' key
+        factory: Function taking the assertion's configuration and returning
+            a check. A check takes the value under test and returns
+            (passed, failure message or None). The factory should raise
+            AssertionSpecError for invalid configuration.
+    """
+    with _registry_lock:
+        _registry[type_name] = factory
+        _compiled_cache.clear()
+
+
+def assertion_type(type_name: str) -> Callable[[AssertionFactory], AssertionFactory]:
+    """Decorator form of register_assertion."""
+    def decorator(factory: AssertionFactory) -> AssertionFactory:
+        register_assertion(type_name, factory)
+        return factory
+    return decorator
+
+
+def get_assertion_types() -> List[str]:
+    """Get the names of all registered assertion types."""
+    with _registry_lock:
+        return sorted(_registry)
+
+
+# JSONPath
+
+_PATH_TOKEN_RE = re.compile(r'''
+    \.(?P<field>[^.\[\]]+)
+  | \[\s*(?P<index>-?\d+)\s*\]
+  | \[\s*(?P<wildcard>\*)\s*\]
+  | \[\s*(?P<quote>['"])(?P<key>(?:\\.|(?!(?P=quote))[^\\])*)(?P=quote)\s*\]
+''', re.VERBOSE)
+
+# Backslash escape inside a quoted key, e.g. ['it\'s']
+_PATH_ESCAPE_RE = re.compile(r'\\(.)')
+
+# Selects every element of a list or value of a mapping
+_WILDCARD = object()
+
+
+def compile_path(path: str) -> List[Any]:
+    """Parse a JSONPath expression into a list of keys.
+
+    Supports the root '$', '.field', "['field']", '[index]' and '[*]'.
+    Quoted keys may escape their quote or a backslash with a backslash.
+
+    Args:
+        path: JSONPath expression
+
+    Returns:
+        Keys to apply in order; strings are fields, ints are list indexes
+
+    Raises:
+        AssertionSpecError: If the expression is not supported
+    """
+    if not isinstance(path, str) or not path.startswith('$'):
+        raise AssertionSpecError(f"JSONPath must start with '$', got {path!r}")
+    keys: List[Any] = []
+    position = 1
+    while position < len(path):
+        match = _PATH_TOKEN_RE.match(path, position)
+        if match is None:
+            raise AssertionSpecError(f"Unsupported JSONPath syntax at {path[position:]!r} in {path!r}")
+        if match.group('field') is not None:
+            field = match.group('field')
+            keys.append(_WILDCARD if field == '*' else field)
+        elif match.group('index') is not None:
+            keys.append(int(match.group('index')))
+        elif match.group('wildcard') is not None:
+            keys.append(_WILDCARD)
+        else:
+            keys.append(_PATH_ESCAPE_RE.sub(r'\1', match.group('key')))
+        position = match.end()
+    return keys
+
+
+def select_path(value: Any, keys: Sequence[Any]) -> Any:
+    """Apply compiled JSONPath keys to a value.
+
+    JSON strings are decoded before the first key is applied. A wildcard
+    turns the result into a list of the values it selects.
+
+    Args:
+        value: Value to select from
+        keys: Keys from compile_path
+
+    Returns:
+        The selected value, or MISSING if the path does not exist
+    """
+    if keys and isinstance(value, (str, bytes)):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return MISSING
+    for position, key in enumerate(keys):
+        if key is _WILDCARD:
+            if isinstance(value, dict):
+                items = list(value.values())
+            elif isinstance(value, (list, tuple)):
+                items = value
+            else:
+                return MISSING
+            rest = keys[position + 1:]
+            selected = [select_path(item, rest) for item in items]
+            return [item for item in selected if item is not MISSING]
+        value = _select_key(value, key)
+        if value is MISSING:
+            return MISSING
+    return value
+
+
+def _select_key(value: Any, key: Any) -> Any:
+    """Select one key from a mapping, sequence or object attribute."""
+    if isinstance(key, int):
+        if isinstance(value, (list, tuple)) and -len(value) <= key < len(value):
+            return value[key]
+        return MISSING
+    if isinstance(value, dict):
+        return value.get(key, MISSING)
+    # Objects returned by agents, e.g. pydantic models or dataclasses
+    if not isinstance(value, (str, bytes, int, float, bool, list, tuple)) and value is not None:
+        return getattr(value, key, MISSING)
+    return MISSING
+
+
+# Compiled assertions
+
+@dataclass
+class CompiledAssertion:
+    """An assertion compiled into a check.
+
+    Attributes:
+        type: Assertion type name
+        spec: The assertion's configuration
+        check: Compiled check, or None if the configuration is invalid
+        path: Compiled JSONPath keys, or None to check the whole output
+        error: Why the configuration is invalid, if it is
+    """
+    type: str
+    spec: Dict[str, Any]
+    check: Optional[Check]
+    path: Optional[List[Any]] = None
+    error: Optional[str] = None
+
+    def run(self, actual_output: Any) -> Dict[str, Any]:
+        """Run the assertion against a step output.
+
+        Returns:
+            Result with 'type', 'passed' and either 'expected'/'actual' or 'error'
+        """
+        if self.check is None:
+            return {'type': self.type, 'error': self.error, 'passed': False}
+
+        actual = actual_output
+        result: Dict[str, Any] = {'type': self.type, 'expected': self.spec.get('expected')}
+        if self.path is not None:
+            actual = select_path(actual_output, self.path)
+            result['path'] = self.spec.get('path')
+        try:
+            if actual is MISSING:
+                passed, message = False, f"Path {self.spec.get('path')!r} not found in output"
+                actual = None
+            else:
+                passed, message = self.check(actual)
+        except Exception as e:
+            return {'type': self.type, 'error': str(e), 'passed': False}
+
+        result['actual'] = actual
+        result['passed'] = bool(passed)
+        if message and not passed:
+            result['message'] = message
+        return result
+
+
+class CompiledAssertions:
+    """The compiled assertions of one step."""
+
+    def __init__(self, assertions: List[CompiledAssertion]):
+        """Initialize with compiled assertions.
+
+        Args:
+            assertions: Compiled assertions in configuration order
+        """
+        self.assertions = assertions
+
+    def __len__(self) -> int:
+        return len(self.assertions)
+
+    @property
+    def errors(self) -> List[str]:
+        """Configuration errors of the assertions that failed to compile."""
+        return [assertion.error for assertion in self.assertions if assertion.error]
+
+    def run(self, actual_output: Any) -> List[Dict[str, Any]]:
+        """Run all assertions against a step output.
+
+        Args:
+            actual_output: Output of the step
+
+        Returns:
+            One result per assertion, in configuration order
+        """
+        return [assertion.run(actual_output) for assertion in self.assertions]
+
+
+_compiled_cache: Dict[str, CompiledAssertions] = {}
+
+
+def compile_assertion(spec: Dict[str, Any]) -> CompiledAssertion:
+    """Compile a single assertion.
+
+    Args:
+        spec: Assertion configuration
+
+    Returns:
+        The compiled assertion
+
+    Raises:
+        AssertionSpecError: If the configuration is invalid
+    """
+    if not isinstance(spec, dict):
+        raise AssertionSpecError(f"Assertion must be a mapping, got {type(spec).__name__}")
+    type_name = spec.get('type')
+    if not type_name:
+        raise AssertionSpecError("Assertion is missing 'type'")
+    with _registry_lock:
+        factory = _registry.get(type_name)
+    if factory is None:
+        raise AssertionSpecError(
+            f"Unknown assertion type: {type_name} (known types: {', '.join(get_assertion_types())})"
+        )
+    path = compile_path(spec['path']) if spec.get('path') is not None else None
+    return CompiledAssertion(type=type_name, spec=spec, check=factory(spec), path=path)
+
+
+def compile_assertions(specs: Optional[List[Dict[str, Any]]], strict: bool = False) -> CompiledAssertions:
+    """Compile a step's assertions, reusing earlier compilations.
+
+    Args:
+        specs: Assertion configurations
+        strict: Raise on the first invalid assertion instead of compiling it
+            into an assertion that always fails with the configuration error
+
+    Returns:
+        The compiled assertions
+
+    Raises:
+        AssertionSpecError: If strict and an assertion is invalid
+    """
+    if not specs:
+        return CompiledAssertions([])
+    try:
+        key = json.dumps(specs, sort_keys=True, default=repr)
+    except (TypeError, ValueError):
+        key = None
+
+    compiled = _compiled_cache.get(key) if key is not None else None
+    if compiled is None:
+        assertions = []
+        for index, spec in enumerate(specs):
+            try:
+                assertions.append(compile_assertion(spec))
+            except AssertionSpecError as e:
+                type_name = spec.get('type', 'unknown') if isinstance(spec, dict) else 'unknown'
+                assertions.append(CompiledAssertion(
+                    type=type_name,
+                    spec=spec if isinstance(spec, dict) else {},
+                    check=None,
+                    error=f"Assertion {index + 1}: {e}"
+                ))
+        compiled = CompiledAssertions(assertions)
+        if key is not None:
+            with _registry_lock:
+                if len(_compiled_cache) >= COMPILED_ASSERTIONS_CACHE_SIZE:
+                    _compiled_cache.pop(next(iter(_compiled_cache)))
+                _compiled_cache[key] = compiled
+
+    if strict and compiled.errors:
+        raise AssertionSpecError(compiled.errors[0])
+    return compiled
+
+
+# Built-in assertion types
+
+def _require(spec: Dict[str, Any], key: str) -> Any:
+    """Get a required configuration key."""
+    if key not in spec:
+        raise AssertionSpecError(f"'{spec.get('type')}' assertion requires '{key}'")
+    return spec[key]
+
+
+def _number(spec: Dict[str, Any], key: str, default: Optional[float] = None) -> Optional[float]:
+    """Get an optional numeric configuration key."""
+    value = spec.get(key, default)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise AssertionSpecError(f"'{key}' must be a number, got {value!r}")
+    return value
+
+
+@assertion_type('equals')
+def _equals(spec: Dict[str, Any]) -> Check:
+    """Value equals 'expected'."""
+    expected = _require(spec, 'expected')
+    return lambda actual: (actual == expected, None)
+
+
+@assertion_type('contains')
+def _contains(spec: Dict[str, Any]) -> Check:
+    """'expected' is a substring or element of the value."""
+    expected = _require(spec, 'expected')
+    return lambda actual: (expected in actual, None)
+
+
+@assertion_type('matches')
+def _matches(spec: Dict[str, Any]) -> Check:
+    """The value's string form matches the regular expression 'expected' at its start."""
+    expected = _require(spec, 'expected')
+    try:
+        pattern = re.compile(expected)
+    except (re.error, TypeError) as e:
+        raise AssertionSpecError(f"Invalid regular expression {expected!r}: {e}")
+    return lambda actual: (pattern.match(str(actual)) is not None, None)
+
+
+@assertion_type('type')
+def _type(spec: Dict[str, Any]) -> Check:
+    """Value is of a named type, e.g. 'str', 'dict' or 'int | float'."""
+    expected = _require(spec, 'expected')
+    names = expected if isinstance(expected, list) else str(expected).split('|')
+    types: Tuple[type, ...] = ()
+    for name in names:
+        name = str(name).strip()
+        if name not in TYPE_NAMES:
+            raise AssertionSpecError(f"Unknown type name {name!r} (known names: {', '.join(TYPE_NAMES)})")
+        types += TYPE_NAMES[name]
+    return lambda actual: (isinstance(actual, types), f"Got {type(actual).__name__}")
+
+
+@assertion_type('approx')
+def _approx(spec: Dict[str, Any]) -> Check:
+    """Value is within 'tolerance' (absolute) or 'rel_tolerance' of 'expected'."""
+    expected = _number(spec, 'expected')
+    if expected is None:
+        raise AssertionSpecError("'approx' assertion requires 'expected'")
+    tolerance = _number(spec, 'tolerance', 0.0)
+    rel_tolerance = _number(spec, 'rel_tolerance', 0.0)
+    if tolerance < 0 or rel_tolerance < 0:
+        raise AssertionSpecError("Tolerances must not be negative")
+    if not tolerance and not rel_tolerance:
+        rel_tolerance = 1e-9
+
+    def check(actual: Any) -> Tuple[bool, Optional[str]]:
+        try:
+            value = float(actual)
+        except (TypeError, ValueError):
+            return False, f"Not a number: {actual!r}"
+        passed = math.isclose(value, expected, rel_tol=rel_tolerance, abs_tol=tolerance)
+        return passed, f"Differs from {expected} by {abs(value - expected)}"
+    return check
+
+
+@assertion_type('range')
+def _range(spec: Dict[str, Any]) -> Check:
+    """Value lies between 'min' and 'max', inclusive."""
+    minimum = _number(spec, 'min')
+    maximum = _number(spec, 'max')
+    if minimum is None and maximum is None:
+        raise AssertionSpecError("'range' assertion requires 'min' or 'max'")
+
+    def check(actual: Any) -> Tuple[bool, Optional[str]]:
+        try:
+            value = float(actual)
+        except (TypeError, ValueError):
+            return False, f"Not a number: {actual!r}"
+        passed = (minimum is None or value >= minimum) and (maximum is None or value <= maximum)
+        return passed, f"{value} is outside [{minimum}, {maximum}]"
+    return check
+
+
+@assertion_type('length')
+def _length(spec: Dict[str, Any]) -> Check:
+    """Value's length equals 'expected' and/or lies between 'min' and 'max'."""
+    expected = spec.get('expected')
+    minimum = spec.get('min')
+    maximum = spec.get('max')
+    for key, value in (('expected', expected), ('min', minimum), ('max', maximum)):
+        if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 0):
+            raise AssertionSpecError(f"'{key}' must be a non-negative integer, got {value!r}")
+    if expected is None and minimum is None and maximum is None:
+        raise AssertionSpecError("'length' assertion requires 'expected', 'min' or 'max'")
+
+    def check(actual: Any) -> Tuple[bool, Optional[str]]:
+        length = len(actual)
+        passed = (
+            (expected is None or length == expected)
+            and (minimum is None or length >= minimum)
+            and (maximum is None or length <= maximum)
+        )
+        return passed, f"Length is {length}"
+    return check
+
+
+@assertion_type('schema')
+def _schema(spec: Dict[str, Any]) -> Check:
+    """Value conforms to the JSON Schema subset in 'expected'."""
+    schema = _compile_schema(_require(spec, 'expected'), '$')
+
+    def check(actual: Any) -> Tuple[bool, Optional[str]]:
+        if isinstance(actual, (str, bytes)) and schema.get('type') not in (None, 'string'):
+            try:
+                actual = json.loads(actual)
+            except ValueError:
+                return False, "Output is not valid JSON"
+        problem = _validate_schema(actual, schema, '$')
+        return problem is None, problem
+    return check
+
+
+# JSON Schema keywords supported by the 'schema' assertion
+_SCHEMA_KEYWORDS = frozenset({
+    'type', 'properties', 'required', 'additionalProperties', 'items', 'enum',
+    'const', 'minimum', 'maximum', 'minLength', 'maxLength', 'minItems',
+    'maxItems', 'pattern', 'title', 'description'
+})
+
+
+def _compile_schema(schema: Any, location: str) -> Dict[str, Any]:
+    """Check a schema and copy it with its patterns compiled.
+
+    Raises:
+        AssertionSpecError: If the schema uses keywords the validator does
+            not implement or is otherwise invalid
+    """
+    if not isinstance(schema, dict):
+        raise AssertionSpecError(f"Schema at {location} must be a mapping")
+    unknown = set(schema) - _SCHEMA_KEYWORDS
+    if unknown:
+        raise AssertionSpecError(f"Unsupported schema keywords at {location}: {', '.join(sorted(unknown))}")
+    types = schema.get('type')
+    for name in types if isinstance(types, list) else [types] if types else []:
+        if name not in _SCHEMA_TYPES:
+            raise AssertionSpecError(f"Unknown schema type {name!r} at {location}")
+    compiled = dict(schema)
+    if 'pattern' in schema:
+        try:
+            compiled['pattern'] = re.compile(schema['pattern'])
+        except (re.error, TypeError) as e:
+            raise AssertionSpecError(f"Invalid pattern at {location}: {e}")
+    if 'properties' in schema:
+        compiled['properties'] = {
+            name: _compile_schema(subschema, f"{location}.{name}")
+            for name, subschema in (schema['properties'] or {}).items()
+        }
+    if isinstance(schema.get('additionalProperties'), dict):
+        compiled['additionalProperties'] = _compile_schema(schema['additionalProperties'], f"{location}.*")
+    if 'items' in schema:
+        compiled['items'] = _compile_schema(schema['items'], f"{location}[*]")
+    return compiled
+
+
+def _validate_schema(value: Any, schema: Dict[str, Any], location: str) -> Optional[str]:
+    """Validate a value against a schema.
+
+    Returns:
+        Description of the first violation, or None if the value is valid
+    """
+    types = schema.get('type')
+    if types is not None:
+        names = types if isinstance(types, list) else [types]
+        if not any(_SCHEMA_TYPES[name](value) for name in names):
+            return f"{location}: expected {' or '.join(names)}, got {type(value).__name__}"
+    if 'enum' in schema and value not in schema['enum']:
+        return f"{location}: {value!r} is not one of {schema['enum']!r}"
+    if 'const' in schema and value != schema['const']:
+        return f"{location}: expected {schema['const']!r}, got {value!r}"
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if 'minimum' in schema and value < schema['minimum']:
+            return f"{location}: {value} is less than {schema['minimum']}"
+        if 'maximum' in schema and value > schema['maximum']:
+            return f"{location}: {value} is greater than {schema['maximum']}"
+    if isinstance(value, str):
+        if 'minLength' in schema and len(value) < schema['minLength']:
+            return f"{location}: shorter than {schema['minLength']} characters"
+        if 'maxLength' in schema and len(value) > schema['maxLength']:
+            return f"{location}: longer than {schema['maxLength']} characters"
+        pattern = schema.get('pattern')
+        if pattern is not None and pattern.search(value) is None:
+            return f"{location}: does not match {pattern.pattern!r}"
+    if isinstance(value, (list, tuple)):
+        if 'minItems' in schema and len(value) < schema['minItems']:
+            return f"{location}: fewer than {schema['minItems']} items"
+        if 'maxItems' in schema and len(value) > schema['maxItems']:
+            return f"{location}: more than {schema['maxItems']} items"
+        if 'items' in schema:
+            for index, item in enumerate(value):
+                problem = _validate_schema(item, schema['items'], f"{location}[{index}]")
+                if problem:
+                    return problem
+    if isinstance(value, dict):
+        for name in schema.get('required', []):
+            if name not in value:
+                return f"{location}: missing required property {name!r}"
+        properties = schema.get('properties') or {}
+        for name, item in value.items():
+            if name in properties:
+                problem = _validate_schema(item, properties[name], f"{location}.{name}")
+            elif schema.get('additionalProperties') is False:
+                problem = f"{location}: unexpected property {name!r}"
+            elif isinstance(schema.get('additionalProperties'), dict):
+                problem = _validate_schema(item, schema['additionalProperties'], f"{location}.{name}")
+            else:
+                problem = None
+            if problem:
+                return problem
+    return None
@@ -0,0 +1,228 @@
+"""Parallel evaluation of candidate fixes in isolated workspaces.
+
+When auto-fix generates several candidate fixes in one attempt, each
+candidate is written into its own sandbox copy of the workspace and the test
+suite is run there in a separate process, so candidates never see each
+other's files or imported modules and the user's checkout is never touched.
+The candidate passing the most tests is promoted, and its test result is
+reused as the attempt's result so the suite does not run again.
+"""
+
+import logging
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
+
+from .sandbox import SANDBOX_AUTO, SandboxManager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CandidateFix:
+    """A candidate fix and its test outcome.
+
+    Attributes:
+        index: Position of the candidate, 0 being the default temperature
+        temperature: Sampling temperature the candidate was generated at
+        changes: Mapping of file path to fixed code
+        passed: Number of passing tests, or None if not evaluated
+        total: Number of tests run
+        error: Error that prevented evaluation, if any
+        result: TestExecutionResult of the candidate's run, if it could be
+            sent back from the worker process
+    """
+    index: int
+    temperature: float
+    changes: Dict[str, str]
+    passed: Optional[int] = None
+    total: int = 0
+    error: Optional[str] = None
+    result: Optional[Any] = None
+
+
+def _picklable_runner_config(runner_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Prepare a runner configuration for a worker process.
+
+    Pre-imported dependencies are passed by module name and re-imported in the
+    worker; other values cannot be shared across processes and are dropped.
+    """
+    config = dict(runner_config)
+    dependencies = config.pop('imported_dependencies', None) or {}
+    config['imported_dependency_modules'] = {
+        name: value.__name__ for name, value in dependencies.items() if isinstance(value, ModuleType)
+    }
+    return config
+
+
+def _evaluate_candidate(
+    runner_config: Dict[str, Any],
+    workspace_root: str,
+    changes: Dict[str, str],
+    test_file_path: str,
+    sandbox_dir: Optional[str],
+    sandbox_strategy: str
+) -> Tuple[int, int, Optional[Any]]:
+    """Run the test suite against one candidate in a fresh sandbox.
+
+    Runs in a worker process.
+
+    Returns:
+        Tuple of (passed tests, total tests, TestExecutionResult or None if
+        the result holds outputs that cannot be pickled)
+    """
+    import importlib
+    import sys
+
+    from .resolution_cache import ModuleResolutionCache
+    from .runner import TestRunner
+
+    manager = SandboxManager(Path(sandbox_dir) if sandbox_dir else None, sandbox_strategy)
+    sandbox = manager.create(Path(workspace_root))
+    # Workers are reused across candidates; restore the process state after each
+    original_cwd = os.getcwd()
+    original_modules = set(sys.modules)
+    try:
+        for path, fixed_code in changes.items():
+            Path(sandbox.map_path(path)).write_text(fixed_code, encoding='utf-8')
+
+        config = dict(runner_config)
+        config['imported_dependencies'] = {
+            name: importlib.import_module(module_name)
+            for name, module_name in config.pop('imported_dependency_modules', {}).items()
+        }
+        config['config_file'] = sandbox.map_path(config.get('config_file'))
+        config['file_path'] = sandbox.map_path(config.get('file_path'), relative_to_cwd=False)
+
+        os.chdir(sandbox.root)
+        # Sandbox paths are never seen again, so resolutions are not persisted
+        runner = TestRunner(config, workspace_root=sandbox.root, resolution_cache=ModuleResolutionCache())
+        result = runner.run_tests(Path(sandbox.map_path(test_file_path, relative_to_cwd=False)))
+    finally:
+        os.chdir(original_cwd)
+        for name in set(sys.modules) - original_modules:
+            module_file = getattr(sys.modules.get(name), '__file__', None) or ''
+            if module_file.startswith(str(sandbox.directory)):
+                sys.modules.pop(name, None)
+        manager.remove(sandbox)
+
+    total = result.summary.total_tests
+    passed = total - result.get_failure_count()
+    try:
+        pickle.dumps(result)
+    except Exception as e:
+        logger.debug(f"Test result cannot be sent back from the worker: {str(e)}")
+        result = None
+    return passed, total, result
+
+
+class CandidateEvaluator:
+    """Tests candidate fixes in parallel, each in its own workspace copy."""
+
+    def __init__(
+        self,
+        runner_config: Dict[str, Any],
+        workspace_root: Path,
+        max_workers: Optional[int] = None,
+        sandbox_strategy: str = SANDBOX_AUTO,
+        sandbox_dir: Optional[Path] = None
+    ):
+        """Initialize the evaluator.
+
+        Args:
+            runner_config: Configuration for the test runner
+            workspace_root: Workspace the fixed files live in
+            max_workers: Maximum number of candidates tested at once
+            sandbox_strategy: How sandboxes are created: 'auto', 'worktree'
+                or 'copy'
+            sandbox_dir: Optional directory to create sandboxes in
+        """
+        self.runner_config = _picklable_runner_config(runner_config)
+        self.workspace_root = Path(workspace_root).resolve()
+        self.max_workers = max_workers
+        self.sandbox_strategy = sandbox_strategy
+        self.sandbox_dir = sandbox_dir
+        # Clean up after runs that crashed before removing their sandboxes
+        SandboxManager(sandbox_dir, sandbox_strategy).collect_garbage()
+
+    def evaluate(self, candidates: List[CandidateFix], test_file_path: Path) -> List[CandidateFix]:
+        """Test every candidate and record its pass count.
+
+        Args:
+            candidates: Candidates to test
+            test_file_path: Path to the test file, as given to the test runner
+
+        Returns:
+            The candidates, with passed/total or error filled in
+        """
+        evaluable = []
+        for candidate in candidates:
+            if not candidate.changes:
+                candidate.error = "No valid fix generated"
+            elif not all(self._in_workspace(path) for path in candidate.changes):
+                candidate.error = "Fixed files are outside the workspace"
+            else:
+                evaluable.append(candidate)
+        if not evaluable:
+            return candidates
+
+        max_workers = min(self.max_workers or os.cpu_count() or 1, len(evaluable))
+        logger.info(f"Testing {len(evaluable)} candidate fix(es) with {max_workers} worker(s)")
+        # Spawned workers start with a clean interpreter, so candidates cannot
+        # share imported agent modules
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            futures = {
+                candidate.index: executor.submit(
+                    _evaluate_candidate,
+                    self.runner_config,
+                    str(self.workspace_root),
+                    candidate.changes,
+                    str(test_file_path),
+                    str(self.sandbox_dir) if self.sandbox_dir else None,
+                    self.sandbox_strategy
+                )
+                for candidate in evaluable
+            }
+            for candidate in evaluable:
+                try:
+                    candidate.passed, candidate.total, candidate.result = futures[candidate.index].result()
+                    logger.info(
+                        f"Candidate {candidate.index} (temperature {candidate.temperature}): "
+                        f"{candidate.passed}/{candidate.total} tests passed"
+                    )
+                except Exception as e:
+                    logger.warning(f"Candidate {candidate.index} could not be tested: {str(e)}")
+                    candidate.error = str(e)
+        return candidates
+
+    @staticmethod
+    def select_best(candidates: List[CandidateFix]) -> Optional[CandidateFix]:
+        """Pick the candidate passing the most tests.
+
+        Ties go to the lower temperature. Candidates that could not be tested
+        are never chosen.
+
+        Args:
+            candidates: Evaluated candidates
+
+        Returns:
+            The winning candidate, or None if no candidate could be tested
+        """
+        tested = [candidate for candidate in candidates if candidate.changes and candidate.passed is not None]
+        if not tested:
+            return None
+        return max(tested, key=lambda candidate: (candidate.passed, -candidate.index))
+
+    def _in_workspace(self, path: str) -> bool:
+        """Check whether a file lives inside the workspace."""
+        try:
+            Path(path).resolve().relative_to(self.workspace_root)
+            return True
+        except ValueError:
+            return False
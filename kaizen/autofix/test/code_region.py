@@ -10,21 +10,30 @@ import importlib.util
 import importlib.machinery
 import traceback
 from contextlib import contextmanager
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from pathlib import Path
+from types import ModuleType
 from typing import Any, Callable, Dict, List, Optional, Tuple, Set, FrozenSet, TypeVar
 from collections import defaultdict
 import typing
 import builtins
 import tempfile
 import subprocess
+import threading
+import uuid
 
 # Third-party imports
 # (none in this file)
 
 # Local application imports
 from .variable_tracker import track_variables
+from .agent_cache import AgentCache, LIFECYCLE_PER_STEP
+from .execution_cache import ExecutionCache
+from .region_cache import RegionCache
+from .resolution_cache import ModuleResolutionCache, ResolutionTable, get_shared_resolution_cache
+from .ts_symbols import INIT_NEW, SYMBOL_FUNCTION, get_symbol_table
+from .ts_worker import TypeScriptWorker, WorkerError, WorkerStartupError
 
 # Configure colored logging
 class ColoredFormatter(logging.Formatter):
@@ -67,6 +76,51 @@ def set_log_level(level: str) -> None:
     }
     logger.setLevel(level_map.get(level.upper(), logging.INFO))
 
+# sys.path entries added for agent execution, reference counted so that
+# concurrently running test steps do not remove each other's entries
+_sys_path_lock = threading.Lock()
+_sys_path_refcounts: Dict[str, int] = {}
+
+def _add_to_sys_path(path: str) -> None:
+    """Temporarily add a directory to sys.path (thread-safe).
+    
+    Args:
+        path: Directory to add
+    """
+    with _sys_path_lock:
+        if path in _sys_path_refcounts:
+            _sys_path_refcounts[path] += 1
+        elif path not in sys.path:
+            sys.path.insert(0, path)
+            _sys_path_refcounts[path] = 1
+
+def _remove_from_sys_path(path: str) -> None:
+    """Remove a directory added by _add_to_sys_path once no longer in use.
+    
+    Args:
+        path: Directory to remove
+    """
+    with _sys_path_lock:
+        if path not in _sys_path_refcounts:
+            return
+        _sys_path_refcounts[path] -= 1
+        if _sys_path_refcounts[path] == 0:
+            del _sys_path_refcounts[path]
+            if path in sys.path:
+                sys.path.remove(path)
+
+# Project files whose contents affect TypeScript type checking results
+TYPECHECK_INPUT_FILES = (
+    'tsconfig.json',
+    'package.json',
+    'package-lock.json',
+    'yarn.lock',
+    'pnpm-lock.yaml',
+)
+
+# Marker of a compiler diagnostic in tsc output, e.g. "agent.ts(3,5): error TS2322: ..."
+TYPECHECK_DIAGNOSTIC_MARKER = 'error TS'
+
 # Type variables for generic types
 T = TypeVar('T')
 
@@ -156,11 +210,14 @@ class AgentEntryPoint:
         class_name: Class name to instantiate (optional)
         method: Method name to call (optional)
         fallback_to_function: Whether to fallback to function if class/method not found
+        lifecycle: How long an agent instance is reused ('per-step', 'per-run'
+            or 'per-worker')
     """
     module: str
     class_name: Optional[str] = None
     method: Optional[str] = None
     fallback_to_function: bool = True
+    lifecycle: str = LIFECYCLE_PER_STEP
 
 @dataclass
 class RegionInfo:
@@ -317,10 +374,18 @@ class ImportManagerConfig:
 class DependencyResolver:
     """Resolves module dependencies and handles import cycles."""
     
-    def __init__(self, workspace_root: Path) -> None:
-        """Initialize the dependency resolver."""
+    def __init__(self, workspace_root: Path, resolution_cache: Optional[ModuleResolutionCache] = None) -> None:
+        """Initialize the dependency resolver.
+        
+        Args:
+            workspace_root: Root directory workspace modules are resolved against
+            resolution_cache: Cache of module resolutions shared across
+                resolvers; defaults to the process-wide cache persisted under ~/.kaizen
+        """
         self.workspace_root = workspace_root
         self._module_cache: Dict[str, ModuleInfo] = {}
+        self._resolution_cache = resolution_cache or get_shared_resolution_cache()
+        self._resolution_table: Optional[ResolutionTable] = None
         self._import_graph: Dict[str, Set[str]] = defaultdict(set)
         self._visited: Set[str] = set()
         self._temp_visited: Set[str] = set()
@@ -381,6 +446,7 @@ class DependencyResolver:
             
             logger.debug(f"DEBUG: Resetting dependency resolver state")
             self._reset_state()
+            self._resolution_table = self._resolution_cache.table(self.workspace_root)
             
             logger.debug(f"DEBUG: Building import graph")
             self._build_import_graph(file_path.name, imports)
@@ -393,6 +459,7 @@ class DependencyResolver:
             logger.debug(f"DEBUG: Resolving all dependencies")
             dependencies = self._resolve_all_dependencies(imports)
             logger.debug(f"DEBUG: Dependency resolution completed, found {len(dependencies)} dependencies")
+            self._resolution_cache.save(self._resolution_table)
             
             logger.debug(f"✓ Dependencies resolved: {len(dependencies)} found")
             return frozenset(dependencies)
@@ -456,29 +523,125 @@ class DependencyResolver:
         if module_name in self._module_cache:
             logger.debug(f"DEBUG: Found {module_name} in cache")
             return self._module_cache[module_name]
+        found, module_info = self._lookup_resolution(module_name)
+        if found:
+            logger.debug(f"DEBUG: Found {module_name} in resolution cache")
+            return module_info
         try:
-            # Handle typing module specially
-            if module_name == 'typing':
-                logger.debug(f"DEBUG: Handling typing module specially")
-                return self._resolve_typing_module()
-            # Handle standard library modules
-            if module_name in STANDARD_MODULES:
-                logger.debug(f"DEBUG: {module_name} is a standard module")
-                module_info = self._resolve_standard_module(module_name)
-                self._module_cache[module_name] = module_info
-                return module_info
-            # Check if this is a local module that should be handled
-            if '.' in module_name:
-                logger.debug(f"DEBUG: Handling local module resolution for {module_name}")
-                return self._resolve_workspace_module(module_name)
-            # Handle third-party modules
-            logger.debug(f"DEBUG: {module_name} is a third-party module")
-            return self._resolve_third_party_module(module_name)
+            module_info = self._resolve_module_uncached(module_name)
         except Exception as e:
             logger.debug(f"Failed to resolve module {module_name}: {str(e)}")
             logger.debug(f"DEBUG: Exception details for {module_name}: {traceback.format_exc()}")
             # Be lenient: skip missing modules
             return None
+        self._record_resolution(module_name, module_info)
+        return module_info
+    
+    def _resolve_module_uncached(self, module_name: str) -> Optional[ModuleInfo]:
+        """Resolve a module without consulting the resolution cache.
+        
+        Args:
+            module_name: Name of the module to resolve
+            
+        Returns:
+            ModuleInfo if module is found, None otherwise
+        """
+        # Handle typing module specially
+        if module_name == 'typing':
+            logger.debug(f"DEBUG: Handling typing module specially")
+            return self._resolve_typing_module()
+        # Handle standard library modules
+        if module_name in STANDARD_MODULES:
+            logger.debug(f"DEBUG: {module_name} is a standard module")
+            module_info = self._resolve_standard_module(module_name)
+            self._module_cache[module_name] = module_info
+            return module_info
+        # Check if this is a local module that should be handled
+        if '.' in module_name:
+            logger.debug(f"DEBUG: Handling local module resolution for {module_name}")
+            return self._resolve_workspace_module(module_name)
+        # Handle third-party modules
+        logger.debug(f"DEBUG: {module_name} is a third-party module")
+        return self._resolve_third_party_module(module_name)
+    
+    def _lookup_resolution(self, module_name: str) -> Tuple[bool, Optional[ModuleInfo]]:
+        """Look up a module in the shared resolution cache.
+        
+        Args:
+            module_name: Name of the module
+            
+        Returns:
+            (found, module_info); module_info is None for a cached failed resolution
+        """
+        if self._resolution_table is None:
+            return False, None
+        found, data = self._resolution_table.get(module_name)
+        if not found or data is None:
+            return found, None
+        try:
+            module_info = ModuleInfo(
+                name=data['name'],
+                path=Path(data['path']),
+                is_package=bool(data['is_package']),
+                is_third_party=bool(data['is_third_party']),
+                version=data.get('version'),
+                dependencies=frozenset(data.get('dependencies', []))
+            )
+        except (KeyError, TypeError):
+            self._resolution_table.discard(module_name)
+            return False, None
+        # Workspace directory mtimes do not cover nested files; make sure
+        # a cached workspace module still exists
+        if str(module_info.path).startswith(str(self.workspace_root)) and not module_info.path.exists():
+            self._resolution_table.discard(module_name)
+            return False, None
+        return True, module_info
+    
+    def _record_resolution(self, module_name: str, module_info: Optional[ModuleInfo]) -> None:
+        """Record a module resolution in the shared resolution cache.
+        
+        Failed resolutions are only recorded when creating the module later
+        would change the cache fingerprint; see _is_negative_result_cacheable.
+        """
+        if self._resolution_table is None:
+            return
+        if module_info is None and not self._is_negative_result_cacheable(module_name):
+            self._resolution_table.discard(module_name)
+            return
+        data = None
+        if module_info is not None:
+            data = {
+                'name': module_info.name,
+                'path': str(module_info.path),
+                'is_package': module_info.is_package,
+                'is_third_party': module_info.is_third_party,
+                'version': module_info.version,
+                'dependencies': sorted(module_info.dependencies)
+            }
+        self._resolution_table.put(module_name, data)
+    
+    def _is_negative_result_cacheable(self, module_name: str) -> bool:
+        """Check whether a failed resolution can be cached safely.
+        
+        The cache fingerprint covers the modification times of sys.path
+        entries and of the workspace root and its src directory, which only
+        change when entries directly inside them are added or removed. A
+        dotted module, or a top-level name that already exists as a file or
+        directory in the workspace, can become resolvable by a change in a
+        nested directory that the fingerprint does not see.
+        
+        Args:
+            module_name: Name of the module that could not be resolved
+            
+        Returns:
+            Whether the failure may be cached
+        """
+        if '.' in module_name:
+            return False
+        for directory in (Path(self.workspace_root), Path(self.workspace_root) / 'src'):
+            if (directory / module_name).exists() or (directory / f"{module_name}.py").exists():
+                return False
+        return True
     
     def _resolve_typing_module(self) -> ModuleInfo:
         """Resolve the typing module with special handling.
@@ -645,9 +808,9 @@ class DependencyResolver:
         # Try alternative paths (common patterns)
         alternative_paths = [
             self.workspace_root / module_name.replace('.', '/') / '__init__.py',
-            self.workspace_root / module_name.replace('.', '/').with_suffix('.py'),
+            (self.workspace_root / module_name.replace('.', '/')).with_suffix('.py'),
             self.workspace_root / 'src' / module_name.replace('.', '/') / '__init__.py',
-            self.workspace_root / 'src' / module_name.replace('.', '/').with_suffix('.py'),
+            (self.workspace_root / 'src' / module_name.replace('.', '/')).with_suffix('.py'),
         ]
         
         for alt_path in alternative_paths:
@@ -1163,10 +1326,20 @@ class ImportManager:
 class CodeRegionExtractor:
     """Extracts and analyzes code regions from files using entry points and file-based analysis."""
     
-    def __init__(self, workspace_root: Optional[Path] = None):
-        """Initialize the code region extractor."""
+    def __init__(self, workspace_root: Optional[Path] = None,
+                 resolution_cache: Optional[ModuleResolutionCache] = None):
+        """Initialize the code region extractor.
+        
+        Args:
+            workspace_root: Root directory dependencies are resolved against
+                (defaults to the current directory)
+            resolution_cache: Cache of module resolutions; defaults to the
+                process-wide cache persisted under ~/.kaizen
+        """
         self.workspace_root = workspace_root or Path.cwd()
-        self.dependency_resolver = DependencyResolver(self.workspace_root)
+        self.dependency_resolver = DependencyResolver(self.workspace_root, resolution_cache)
+        # Validation and extraction results per agent file revision
+        self._region_cache = RegionCache()
         logger.debug(f"Initialized CodeRegionExtractor with workspace root: {self.workspace_root}")
     
     def extract_region(self, file_path: Path, region_name: str) -> RegionInfo:
@@ -1347,6 +1520,125 @@ class CodeRegionExtractor:
     def extract_region_by_entry_point(self, file_path: Path, entry_point: AgentEntryPoint) -> RegionInfo:
         """Extract a code region using agent entry point configuration.
         
+        The region is extracted once per revision of the file and entry point;
+        later calls get a copy of the cached region.
+        
+        Args:
+            file_path: Path to the file containing the agent
+            entry_point: Agent entry point configuration
+            
+        Returns:
+            RegionInfo object with the extracted region
+            
+        Raises:
+            RegionExtractionError: If region extraction fails
+        """
+        region_info = self._region_cache.get(
+            file_path,
+            ('region', 'python', self._entry_point_key(entry_point)),
+            lambda: self._extract_region_by_entry_point(file_path, entry_point)
+        )
+        return self._copy_region(region_info, entry_point)
+
+    def extract_region_by_entry_point_ts(self, file_path: Path, entry_point: AgentEntryPoint) -> RegionInfo:
+        """Extract a TypeScript code region using agent entry point configuration.
+        
+        The region is extracted once per revision of the file and entry point;
+        later calls get a copy of the cached region.
+        
+        Args:
+            file_path: Path to the TypeScript file containing the agent
+            entry_point: Agent entry point configuration
+            
+        Returns:
+            RegionInfo object with the extracted region
+            
+        Raises:
+            RegionExtractionError: If region extraction fails
+        """
+        region_info = self._region_cache.get(
+            file_path,
+            ('region', 'typescript', self._entry_point_key(entry_point)),
+            lambda: self._extract_region_by_entry_point_ts(file_path, entry_point)
+        )
+        return self._copy_region(region_info, entry_point)
+
+    def validate_entry_point(self, entry_point: AgentEntryPoint, file_path: Path) -> bool:
+        """Validate that the specified entry point exists and is callable.
+        
+        The result is cached per revision of the file.
+        
+        Args:
+            entry_point: Agent entry point configuration
+            file_path: Path to the file containing the agent
+            
+        Returns:
+            True if entry point is valid, False otherwise
+        """
+        return self._region_cache.get(
+            file_path,
+            ('valid', 'python', self._entry_point_key(entry_point)),
+            lambda: self._validate_entry_point(entry_point, file_path)
+        )
+
+    def validate_entry_point_ts(self, entry_point: AgentEntryPoint, file_path: Path) -> bool:
+        """Validate that the specified TypeScript entry point exists and is callable.
+        
+        The result is cached per revision of the file.
+        
+        Args:
+            entry_point: Agent entry point configuration
+            file_path: Path to the TypeScript file containing the agent
+            
+        Returns:
+            True if entry point is valid, False otherwise
+        """
+        return self._region_cache.get(
+            file_path,
+            ('valid', 'typescript', self._entry_point_key(entry_point)),
+            lambda: self._validate_entry_point_ts(entry_point, file_path)
+        )
+
+    def invalidate_region_cache(self, file_path: Optional[Path] = None) -> None:
+        """Drop cached validation and extraction results.
+        
+        Changed files are detected on lookup; this is for callers that have
+        just rewritten a file and do not want to rely on its timestamps.
+        
+        Args:
+            file_path: Optional file that was rewritten, e.g. by auto-fix;
+                all files if None
+        """
+        self._region_cache.invalidate(file_path)
+
+    def get_region_cache_stats(self) -> Dict[str, int]:
+        """Get hit and miss counts of the region cache."""
+        return self._region_cache.get_stats()
+
+    @staticmethod
+    def _entry_point_key(entry_point: AgentEntryPoint) -> Tuple[Any, ...]:
+        """Get a hashable key for an entry point configuration."""
+        return (
+            entry_point.module,
+            entry_point.class_name,
+            entry_point.method,
+            entry_point.fallback_to_function,
+            entry_point.lifecycle
+        )
+
+    @staticmethod
+    def _copy_region(region_info: RegionInfo, entry_point: AgentEntryPoint) -> RegionInfo:
+        """Copy a cached region so callers can extend its imports safely."""
+        return replace(
+            region_info,
+            imports=list(region_info.imports),
+            class_methods=list(region_info.class_methods) if region_info.class_methods is not None else None,
+            entry_point=entry_point
+        )
+
+    def _extract_region_by_entry_point(self, file_path: Path, entry_point: AgentEntryPoint) -> RegionInfo:
+        """Extract a code region using agent entry point configuration, bypassing the cache.
+        
         Args:
             file_path: Path to the file containing the agent
             entry_point: Agent entry point configuration
@@ -1383,8 +1675,8 @@ class CodeRegionExtractor:
             logger.error(f"Unexpected error extracting region with entry point: {str(e)}")
             raise RegionExtractionError(f"Failed to extract region with entry point: {str(e)}")
 
-    def validate_entry_point_ts(self, entry_point: AgentEntryPoint, file_path: Path) -> bool:
-        """Validate that the specified TypeScript entry point exists and is callable.
+    def _validate_entry_point_ts(self, entry_point: AgentEntryPoint, file_path: Path) -> bool:
+        """Validate a TypeScript entry point, bypassing the cache.
         
         Args:
             entry_point: Agent entry point configuration
@@ -1421,8 +1713,8 @@ class CodeRegionExtractor:
             logger.error(f"Unexpected error validating TypeScript entry point: {str(e)}")
             return False
 
-    def validate_entry_point(self, entry_point: AgentEntryPoint, file_path: Path) -> bool:
-        """Validate that the specified entry point exists and is callable.
+    def _validate_entry_point(self, entry_point: AgentEntryPoint, file_path: Path) -> bool:
+        """Validate an entry point, bypassing the cache.
         
         This validation is lenient and only checks basic structure, not imports.
         Missing dependencies are handled during execution, not validation.
@@ -1489,13 +1781,6 @@ class CodeRegionExtractor:
             logger.debug("Using entire TypeScript file as region")
             code = content
             
-            # Extract imports from the entire file
-            import_lines = []
-            for line in content.split('\n'):
-                line = line.strip()
-                if line.startswith(('import ', 'export ')) and not line.startswith('//'):
-                    import_lines.append(line)
-            
             logger.debug(f"Extracted TypeScript code region: {len(code)} characters")
             return self._analyze_region_ts(code, region_name, file_path)
             
@@ -1506,8 +1791,8 @@ class CodeRegionExtractor:
             logger.error(f"Unexpected error extracting TypeScript region '{region_name}': {str(e)}")
             raise ValueError(f"Unexpected error extracting TypeScript region '{region_name}': {str(e)}")
 
-    def extract_region_by_entry_point_ts(self, file_path: Path, entry_point: AgentEntryPoint) -> RegionInfo:
-        """Extract a TypeScript code region using agent entry point configuration.
+    def _extract_region_by_entry_point_ts(self, file_path: Path, entry_point: AgentEntryPoint) -> RegionInfo:
+        """Extract a TypeScript code region using agent entry point configuration, bypassing the cache.
         
         Args:
             file_path: Path to the TypeScript file containing the agent
@@ -1525,17 +1810,8 @@ class CodeRegionExtractor:
             with open(file_path, 'r') as f:
                 content = f.read()
             
-            # Extract imports from the entire file
-            import_lines = []
-            for line in content.split('\n'):
-                line = line.strip()
-                if line.startswith(('import ', 'export ')) and not line.startswith('//'):
-                    import_lines.append(line)
-            
             # Use the entire file content as the region
             code = content
-            if import_lines:
-                logger.debug(f"Found {len(import_lines)} import lines in TypeScript file")
             
             # Analyze the region to determine type and structure
             region_info = self._analyze_region_ts(code, entry_point.module, file_path)
@@ -1568,82 +1844,17 @@ class CodeRegionExtractor:
             with open(file_path, 'r') as f:
                 content = f.read()
             
-            # Simple regex to find function definitions
-            import re
-            
-            # Pattern to match function declarations (including async, export, etc.)
-            function_patterns = [
-                rf'export\s+(?:async\s+)?function\s+{re.escape(function_name)}\s*\(',
-                rf'(?:async\s+)?function\s+{re.escape(function_name)}\s*\(',
-                rf'export\s+(?:async\s+)?const\s+{re.escape(function_name)}\s*=\s*(?:async\s+)?\(',
-                rf'(?:async\s+)?const\s+{re.escape(function_name)}\s*=\s*(?:async\s+)?\(',
-                rf'export\s+(?:async\s+)?const\s+{re.escape(function_name)}\s*=\s*(?:async\s+)?function\s*\(',
-                rf'(?:async\s+)?const\s+{re.escape(function_name)}\s*=\s*(?:async\s+)?function\s*\(',
-            ]
-            
-            function_code = None
-            failed_patterns = []
-            for pattern in function_patterns:
-                match = re.search(pattern, content)
-                if match:
-                    start_pos = match.start()
-                    # Find the end of the function by counting braces, skipping those in strings
-                    brace_count = 0
-                    in_function = False
-                    end_pos = start_pos
-                    in_string = False
-                    string_char = None
-                    in_comment = False
-                    
-                    for i, char in enumerate(content[start_pos:], start_pos):
-                        # Handle string literals
-                        if char in ['"', "'"] and not in_comment:
-                            if not in_string:
-                                in_string = True
-                                string_char = char
-                            elif string_char == char:
-                                in_string = False
-                                string_char = None
-                        
-                        # Handle comments (simplified - just skip // comments)
-                        elif char == '/' and i + 1 < len(content) and content[i + 1] == '/' and not in_string:
-                            in_comment = True
-                        elif char == '\n' and in_comment:
-                            in_comment = False
-                        
-                        # Only count braces when not in string or comment
-                        elif not in_string and not in_comment:
-                            if char == '{':
-                                if not in_function:
-                                    in_function = True
-                                brace_count += 1
-                            elif char == '}':
-                                brace_count -= 1
-                                if in_function and brace_count == 0:
-                                    end_pos = i + 1
-                                    break
-                    
-                    if end_pos > start_pos:
-                        function_code = content[start_pos:end_pos]
-                        break
-                else:
-                    failed_patterns.append(pattern)
-            
-            if not function_code:
+            symbols = get_symbol_table(content)
+            symbol = symbols.find_function(function_name)
+            if symbol is None:
                 logger.error(f"Function '{function_name}' not found in TypeScript file")
-                logger.debug(f"Failed patterns: {failed_patterns}")
                 raise ValueError(f"Function '{function_name}' not found in TypeScript file")
+            function_code = content[symbol.start:symbol.end]
             
-            # Extract imports from the entire file
-            import_lines = []
-            for line in content.split('\n'):
-                line = line.strip()
-                if line.startswith(('import ', 'export ')) and not line.startswith('//'):
-                    import_lines.append(line)
-            
-            # Combine imports with function code
-            if import_lines:
-                code = '\n'.join(import_lines) + '\n\n' + function_code
+            # Combine the file's imports with the function code
+            import_code = [content[ts_import.start:ts_import.end] for ts_import in symbols.imports]
+            if import_code:
+                code = '\n'.join(import_code) + '\n\n' + function_code
             else:
                 code = function_code
             
@@ -1705,6 +1916,9 @@ class CodeRegionExtractor:
     def _extract_imports_ts(self, code: str) -> List[ImportInfo]:
         """Extract import statements from TypeScript code.
         
+        Type-only imports are skipped, as are side-effect imports of relative
+        modules.
+        
         Args:
             code: TypeScript code content
             
@@ -1712,172 +1926,69 @@ class CodeRegionExtractor:
             List of ImportInfo objects
         """
         imports = []
-        import re
-        
-        # Pattern for TypeScript imports
-        import_patterns = [
-            # import { x, y } from 'module'
-            r'import\s*\{([^}]+)\}\s*from\s*[\'"]([^\'"]+)[\'"]',
-            # import x from 'module'
-            r'import\s+(\w+)\s+from\s*[\'"]([^\'"]+)[\'"]',
-            # import * as x from 'module'
-            r'import\s*\*\s+as\s+(\w+)\s+from\s*[\'"]([^\'"]+)[\'"]',
-            # import 'module'
-            r'import\s*[\'"]([^\'"]+)[\'"]',
-        ]
-        
-        # Skip import type statements and export statements
-        lines = code.split('\n')
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('//') or line.startswith('/*'):
-                continue
-            
-            # Skip import type statements
-            if line.startswith('import type'):
-                logger.debug(f"Skipping import type statement at line {line_num}: {line}")
+        for ts_import in get_symbol_table(code).imports:
+            if ts_import.type_only:
+                logger.debug(f"Skipping import type statement: {ts_import.module}")
                 continue
-            
-            # Skip export statements (unless they're export import aliases)
-            if line.startswith('export ') and not line.startswith('export import'):
-                logger.debug(f"Skipping export statement at line {line_num}: {line}")
+            if ts_import.names:
+                import_info = ImportInfo(
+                    type=ImportType.FROM,
+                    module=ts_import.module,
+                    names=list(ts_import.names),
+                    aliases=dict(ts_import.aliases)
+                )
+            elif not ts_import.module.startswith('.'):
+                # Module-only import
+                import_info = ImportInfo(
+                    type=ImportType.SIMPLE,
+                    module=ts_import.module,
+                    names=[ts_import.module],
+                    aliases={}
+                )
+            else:
                 continue
-            
-            # Check if line matches any import pattern
-            matched = False
-            for pattern in import_patterns:
-                match = re.match(pattern, line)
-                if match:
-                    matched = True
-                    try:
-                        if len(match.groups()) >= 2:
-                            # Named imports
-                            names_str = match.group(1).strip()
-                            module = match.group(2)
-                            
-                            if names_str:
-                                names = [name.strip() for name in names_str.split(',')]
-                                aliases = {}
-                                for name in names:
-                                    if ' as ' in name:
-                                        original, alias = name.split(' as ')
-                                        aliases[original.strip()] = alias.strip()
-                                
-                                import_info = ImportInfo(
-                                    type=ImportType.FROM,
-                                    module=module,
-                                    names=names,
-                                    aliases=aliases
-                                )
-                                imports.append(import_info)
-                                logger.debug(f"Found import at line {line_num}: {import_info}")
-                        elif len(match.groups()) == 1:
-                            # Default import or module-only import
-                            if match.group(1) and not match.group(1).startswith('.'):
-                                # Default import
-                                import_info = ImportInfo(
-                                    type=ImportType.SIMPLE,
-                                    module=match.group(1),
-                                    names=[match.group(1)],
-                                    aliases={}
-                                )
-                                imports.append(import_info)
-                                logger.debug(f"Found import at line {line_num}: {import_info}")
-                    except Exception as e:
-                        logger.debug(f"Failed to parse import at line {line_num}: {line} - {str(e)}")
-                    break
-            
-            if not matched and (line.startswith('import ') or line.startswith('export import')):
-                logger.debug(f"Malformed import/export line at line {line_num}: {line}")
-        
+            imports.append(import_info)
+            logger.debug(f"Found import: {import_info}")
         return imports
 
     def _determine_region_type_ts(self, code: str) -> Tuple[RegionType, str, List[str]]:
         """Determine the type, name, and methods of a TypeScript region.
         
+        Functions take priority, then the class with the most methods, then
+        agent instances such as ``export const agent = new Agent({...})``,
+        then the default export.
+        
         Args:
             code: TypeScript code content
             
         Returns:
             Tuple of (region_type, name, methods)
         """
-        import re
-        
-        classes = []
-        
-        # Pattern for class definitions
-        class_pattern = r'(?:export\s+)?(?:abstract\s+)?class\s+(\w+)'
-        class_matches = re.finditer(class_pattern, code)
-        
-        for match in class_matches:
-            class_name = match.group(1)
-            # Find methods in this class (simplified)
-            class_start = match.start()
-            # Look for method definitions after class start
-            method_pattern = r'(?:public\s+|private\s+|protected\s+)?(?:async\s+)?(\w+)\s*\([^)]*\)\s*[:{]\s*'
-            class_methods = []
-            
-            # This is a simplified approach - in a full implementation you'd parse the AST
-            for method_match in re.finditer(method_pattern, code[class_start:]):
-                method_name = method_match.group(1)
-                if method_name not in ['constructor', 'get', 'set']:
-                    class_methods.append(method_name)
-            
-            classes.append((class_name, class_methods))
-        
-        # Check for function definitions FIRST (prioritize functions)
-        function_patterns = [
-            r'(?:export\s+)?(?:async\s+)?function\s+(\w+)',
-            r'(?:export\s+)?(?:async\s+)?const\s+(\w+)\s*=\s*(?:async\s+)?\(',
-            r'(?:export\s+)?(?:async\s+)?const\s+(\w+)\s*=\s*(?:async\s+)?function\s*\(',
-        ]
+        symbols = get_symbol_table(code)
         
-        for pattern in function_patterns:
-            match = re.search(pattern, code)
-            if match:
-                function_name = match.group(1)
-                return RegionType.FUNCTION, function_name, []
+        functions = symbols.functions()
+        if functions:
+            # Function declarations before functions assigned to variables
+            functions.sort(key=lambda symbol: symbol.kind != SYMBOL_FUNCTION)
+            return RegionType.FUNCTION, functions[0].name, []
         
-        # If we found classes, choose the best one
+        classes = symbols.classes()
         if classes:
             # Prefer classes with methods
-            classes.sort(key=lambda x: (len(x[1]), x[0]), reverse=True)
-            best_class_name, best_class_methods = classes[0]
-            return RegionType.CLASS, best_class_name, best_class_methods
-        
-        # Check for modern agent patterns (like Mastra agents)
-        agent_patterns = [
-            # export const emailFixAgent = new Agent({...})
-            r'export\s+const\s+(\w+)\s*=\s*new\s+Agent\s*\(',
-            # const emailFixAgent = new Agent({...})
-            r'const\s+(\w+)\s*=\s*new\s+Agent\s*\(',
-            # export const agent = new SomeAgent({...})
-            r'export\s+const\s+(\w+)\s*=\s*new\s+\w+Agent\s*\(',
-            # const agent = new SomeAgent({...})
-            r'const\s+(\w+)\s*=\s*new\s+\w+Agent\s*\(',
-        ]
+            best_class = max(classes, key=lambda symbol: (len(symbol.methods), symbol.name))
+            return RegionType.CLASS, best_class.name, list(best_class.methods)
         
-        for pattern in agent_patterns:
-            match = re.search(pattern, code)
-            if match:
-                agent_name = match.group(1)
-                # For agents, we'll treat them as modules since they're typically instantiated objects
-                return RegionType.MODULE, agent_name, []
-        
-        # Check for default exports
-        default_export_patterns = [
-            r'export\s+default\s+(\w+)',
-            r'export\s+default\s+function\s+(\w+)',
-            r'export\s+default\s+class\s+(\w+)',
+        # For agents, we'll treat them as modules since they're typically instantiated objects
+        agents = [
+            symbol for symbol in symbols.symbols
+            if symbol.init == INIT_NEW and symbol.new_class and symbol.new_class.endswith('Agent')
         ]
+        if agents:
+            agents.sort(key=lambda symbol: (symbol.new_class != 'Agent', not symbol.exported))
+            return RegionType.MODULE, agents[0].name, []
         
-        for pattern in default_export_patterns:
-            match = re.search(pattern, code)
-            if match:
-                export_name = match.group(1)
-                return RegionType.MODULE, export_name, []
+        if symbols.default_export:
+            return RegionType.MODULE, symbols.default_export, []
         
         # Default to module
         return RegionType.MODULE, "module", []
@@ -1885,19 +1996,34 @@ class CodeRegionExtractor:
 class CodeRegionExecutor:
     """Executes code regions with variable tracking and import management."""
     
-    def __init__(self, workspace_root: Path, imported_dependencies: Optional[Dict[str, Any]] = None):
+    def __init__(self, workspace_root: Path, imported_dependencies: Optional[Dict[str, Any]] = None,
+                 use_ts_worker: bool = True):
         """Initialize the code region executor.
         
         Args:
             workspace_root: Root directory of the workspace
             imported_dependencies: Optional pre-imported dependencies
+            use_ts_worker: Whether to run TypeScript through a persistent
+                worker process instead of one ts-node process per call
         """
         self.workspace_root = workspace_root
         self.imported_dependencies = imported_dependencies or {}
-        self._execution_cache: Dict[str, Any] = {}
         self._compiled_modules: Dict[str, str] = {}
         self._ts_node_cache_dir: Optional[Path] = None
         self._setup_ts_node_cache()
+        self._execution_cache = ExecutionCache(
+            self._ts_node_cache_dir / 'executions' if self._ts_node_cache_dir else None
+        )
+        
+        # Persistent TypeScript worker, started on first use
+        self.use_ts_worker = use_ts_worker
+        self._ts_worker: Optional[TypeScriptWorker] = None
+        self._ts_worker_lock = threading.Lock()
+        self._ts_module_files: Dict[str, Path] = {}
+        self._precompile_results: Dict[str, bool] = {}
+        
+        # Agent modules and instances reused across steps
+        self._agent_cache = AgentCache()
         
         # Initialize import manager
         self.import_manager = ImportManager(workspace_root)
@@ -1919,13 +2045,16 @@ class CodeRegionExecutor:
         except Exception as e:
             logger.warning(f"Failed to setup TypeScript cache: {str(e)}")
     
+    def _get_tracking_roots(self, region_info: RegionInfo) -> List[Path]:
+        """Get the directories whose code is instrumented for variable tracking."""
+        roots = [Path(self.workspace_root)]
+        if region_info.file_path:
+            roots.append(Path(region_info.file_path).parent)
+        return roots
+    
     def _get_cache_key(self, region_info: RegionInfo, method_name: Optional[str], input_data: List[Any]) -> str:
         """Generate a cache key for the execution."""
-        import hashlib
-        
-        # Create a hash of the code, method, and input
-        content = f"{region_info.code}:{method_name}:{str(input_data)}"
-        return hashlib.md5(content.encode()).hexdigest()
+        return ExecutionCache.make_key(region_info.code, method_name, input_data)
     
     def _is_mastra_agent(self, region_info: RegionInfo) -> bool:
         """Detect if the code contains Mastra agent patterns."""
@@ -2012,51 +2141,18 @@ class CodeRegionExecutor:
         try:
             # Add the file's directory to Python path temporarily
             file_dir = str(region_info.file_path.parent) if region_info.file_path else str(self.workspace_root)
-            if file_dir not in sys.path:
-                sys.path.insert(0, file_dir)
+            _add_to_sys_path(file_dir)
             
             try:
-                # Import the module using importlib for better control
                 module_name = entry_point.module
-                if '.' in module_name:
-                    # Handle nested modules
-                    module_parts = module_name.split('.')
-                    base_module = module_parts[0]
-                    
-                    # Try to import the base module
-                    try:
-                        module = importlib.import_module(base_module)
-                    except builtins.ImportError:
-                        logger.error(f"Base module '{base_module}' not found")
-                        raise
-                    
-                    # Navigate to the nested module
-                    for part in module_parts[1:]:
-                        if hasattr(module, part):
-                            module = getattr(module, part)
-                        else:
-                            logger.error(f"Module part '{part}' not found in {module}")
-                            raise AttributeError(f"Module part '{part}' not found")
-                else:
-                    # For simple module names, try to import directly
-                    try:
-                        module = importlib.import_module(module_name)
-                    except builtins.ImportError:
-                        # If direct import fails, try to load from file
-                        if region_info.file_path and region_info.file_path.exists():
-                            spec = importlib.util.spec_from_file_location(module_name, region_info.file_path)
-                            if spec and spec.loader:
-                                module = importlib.util.module_from_spec(spec)
-                                spec.loader.exec_module(module)
-                            else:
-                                logger.error(f"Could not load module from file: {region_info.file_path}")
-                                raise
-                        else:
-                            logger.error(f"Module '{module_name}' not found and file does not exist: {region_info.file_path}")
-                            raise
+                module = self._agent_cache.get_module(
+                    module_name,
+                    region_info.file_path,
+                    lambda: self._import_entry_point_module(region_info, module_name)
+                )
                 
                 # Execute with variable tracking
-                with track_variables(tracked_variables) as tracker:
+                with track_variables(tracked_variables, self._get_tracking_roots(region_info)) as tracker:
                     result = None
                     
                     # Class name and method are mandatory - instantiate and call method
@@ -2064,7 +2160,7 @@ class CodeRegionExecutor:
                         raise AttributeError(f"Class '{entry_point.class_name}' not found in module '{module_name}'")
                     
                     class_obj = getattr(module, entry_point.class_name)
-                    instance = class_obj()
+                    instance = self._agent_cache.get_instance(module_name, class_obj, entry_point.lifecycle)
                     
                     if not hasattr(instance, entry_point.method):
                         raise AttributeError(f"Method '{entry_point.method}' not found in class '{entry_point.class_name}'")
@@ -2090,13 +2186,61 @@ class CodeRegionExecutor:
                     
             finally:
                 # Clean up: remove the added path
-                if file_dir in sys.path:
-                    sys.path.remove(file_dir)
+                _remove_from_sys_path(file_dir)
                     
         except Exception as e:
             logger.error(f"Error executing with entry point {entry_point}: {str(e)}")
             raise
 
+    def _import_entry_point_module(self, region_info: RegionInfo, module_name: str) -> ModuleType:
+        """Import the module named by an agent entry point.
+        
+        Args:
+            region_info: Region info with the agent file path
+            module_name: Module path from the entry point
+            
+        Returns:
+            The imported module
+        """
+        if '.' in module_name:
+            # Handle nested modules
+            module_parts = module_name.split('.')
+            base_module = module_parts[0]
+            
+            # Try to import the base module
+            try:
+                module = importlib.import_module(base_module)
+            except builtins.ImportError:
+                logger.error(f"Base module '{base_module}' not found")
+                raise
+            
+            # Navigate to the nested module
+            for part in module_parts[1:]:
+                if hasattr(module, part):
+                    module = getattr(module, part)
+                else:
+                    logger.error(f"Module part '{part}' not found in {module}")
+                    raise AttributeError(f"Module part '{part}' not found")
+        else:
+            # For simple module names, try to import directly
+            try:
+                module = importlib.import_module(module_name)
+            except builtins.ImportError:
+                # If direct import fails, try to load from file
+                if region_info.file_path and region_info.file_path.exists():
+                    spec = importlib.util.spec_from_file_location(module_name, region_info.file_path)
+                    if spec and spec.loader:
+                        module = importlib.util.module_from_spec(spec)
+                        spec.loader.exec_module(module)
+                    else:
+                        logger.error(f"Could not load module from file: {region_info.file_path}")
+                        raise
+                else:
+                    logger.error(f"Module '{module_name}' not found and file does not exist: {region_info.file_path}")
+                    raise
+        
+        return module
+
     def _execute_class_region(
         self, 
         region_info: RegionInfo, 
@@ -2124,7 +2268,7 @@ class CodeRegionExecutor:
             raise ValueError(f"Method '{method_name}' not found in class '{region_info.name}'")
         
         # Execute with variable tracking
-        with track_variables(tracked_variables) as tracker:
+        with track_variables(tracked_variables, self._get_tracking_roots(region_info)) as tracker:
             # Call the method with input data
             if len(input_data) == 1:
                 result = method(input_data[0])
@@ -2162,7 +2306,7 @@ class CodeRegionExecutor:
             raise ValueError(f"Function '{region_info.name}' not found in namespace")
         
         # Execute with variable tracking
-        with track_variables(tracked_variables) as tracker:
+        with track_variables(tracked_variables, self._get_tracking_roots(region_info)) as tracker:
             # Call the function with input data
             if len(input_data) == 1:
                 result = func(input_data[0])
@@ -2195,7 +2339,7 @@ class CodeRegionExecutor:
         
         # For module regions, we don't have a specific return value
         # but we can track variables that were assigned
-        with track_variables(tracked_variables) as tracker:
+        with track_variables(tracked_variables, self._get_tracking_roots(region_info)) as tracker:
             # Get tracked values
             tracked_values = {}
             for var_name in tracked_variables:
@@ -2215,7 +2359,8 @@ class CodeRegionExecutor:
         method_name: Optional[str] = None,
         input_data: Optional[List[Any]] = None,
         tracked_variables: Optional[Set[str]] = None,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        use_cache: bool = False
     ) -> Dict[str, Any]:
         """Execute a TypeScript code region with variable tracking and optimizations.
         
@@ -2225,6 +2370,8 @@ class CodeRegionExecutor:
             input_data: Optional input data to pass to the method
             tracked_variables: Optional set of variable names to track
             timeout: Optional timeout for the TypeScript execution
+            use_cache: Whether to reuse and store results in the persistent
+                execution cache. Only safe for deterministic agents.
             
         Returns:
             Dictionary containing execution result and tracked values
@@ -2241,10 +2388,12 @@ class CodeRegionExecutor:
         logger.info(f"   Code length: {len(region_info.code)} characters")
         
         # Check cache first
-        cache_key = self._get_cache_key(region_info, method_name, input_data)
-        if cache_key in self._execution_cache:
-            logger.info(f"✅ Using cached result for TypeScript execution: {region_info.name}")
-            return self._execution_cache[cache_key]
+        cache_key = self._get_cache_key(region_info, method_name, input_data) if use_cache else None
+        if cache_key:
+            cached = self._execution_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"✅ Using cached result for TypeScript execution: {region_info.name}")
+                return {**cached, 'tracked_variables': tracked_variables}
         
         # Detect if this is a Mastra agent for optimizations
         is_mastra = self._is_mastra_agent(region_info)
@@ -2258,7 +2407,7 @@ class CodeRegionExecutor:
             logger.info(f"🤖 Using Mastra-specific execution strategy...")
             strategy_start = time.time()
             
-            result = self._execute_with_mastra_specific_handling(
+            result = self._execute_typescript(
                 region_info, method_name, input_data, tracked_variables, timeout, is_mastra
             )
             
@@ -2266,7 +2415,11 @@ class CodeRegionExecutor:
             logger.info(f"✅ Mastra-specific execution succeeded (took {strategy_time:.2f}s)")
             
             # Cache successful results
-            self._execution_cache[cache_key] = result
+            if cache_key:
+                self._execution_cache.put(cache_key, {
+                    'result': result.get('result'),
+                    'tracked_values': result.get('tracked_values', {})
+                })
             return result
             
         except subprocess.TimeoutExpired as e:
@@ -2306,7 +2459,7 @@ class CodeRegionExecutor:
             raise ValueError(f"Method '{method_name}' not found in class '{region_info.name}'")
         
         # Execute with variable tracking
-        with track_variables(tracked_variables) as tracker:
+        with track_variables(tracked_variables, self._get_tracking_roots(region_info)) as tracker:
             # Call the method with input data
             if len(input_data) == 1:
                 result = method(input_data[0])
@@ -2344,7 +2497,7 @@ class CodeRegionExecutor:
             raise ValueError(f"Function '{region_info.name}' not found in namespace")
         
         # Execute with variable tracking
-        with track_variables(tracked_variables) as tracker:
+        with track_variables(tracked_variables, self._get_tracking_roots(region_info)) as tracker:
             # Call the function with input data
             if len(input_data) == 1:
                 result = func(input_data[0])
@@ -2377,7 +2530,7 @@ class CodeRegionExecutor:
         
         # For module regions, we don't have a specific return value
         # but we can track variables that were assigned
-        with track_variables(tracked_variables) as tracker:
+        with track_variables(tracked_variables, self._get_tracking_roots(region_info)) as tracker:
             # Get tracked values
             tracked_values = {}
             for var_name in tracked_variables:
@@ -2649,16 +2802,48 @@ class CodeRegionExecutor:
         self._module_cache.clear()
         self._import_errors.clear()
 
+    def invalidate_agent_cache(self, file_path: Optional[Path] = None) -> None:
+        """Force cached agent modules to reload and drop agent instances.
+        
+        Args:
+            file_path: Optional file that was rewritten, e.g. by auto-fix
+        """
+        self._agent_cache.invalidate(file_path)
+    
+    def release_agent_instances(self) -> None:
+        """Drop agent instances kept for the per-run and per-worker lifecycles."""
+        self._agent_cache.release_instances()
+    
     def clear_cache(self):
-        """Clear the execution cache."""
+        """Clear the persistent execution and type check caches."""
         self._execution_cache.clear()
         self._compiled_modules.clear()
+        self._precompile_results.clear()
+        
+        typecheck_dir = self._ts_node_cache_dir / 'typecheck' if self._ts_node_cache_dir else None
+        if typecheck_dir and typecheck_dir.exists():
+            for entry_path in typecheck_dir.glob('*.json'):
+                try:
+                    entry_path.unlink()
+                except OSError:
+                    pass
         logger.debug("TypeScript execution cache cleared")
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
+        execution_stats = self._execution_cache.get_stats()
+        
+        typecheck_dir = self._ts_node_cache_dir / 'typecheck' if self._ts_node_cache_dir else None
+        typecheck_entries = len(list(typecheck_dir.glob('*.json'))) if typecheck_dir and typecheck_dir.exists() else 0
+        
         return {
-            'execution_cache_size': len(self._execution_cache),
+            'execution_cache_size': execution_stats['entries'],
+            'execution_cache_max_entries': execution_stats['max_entries'],
+            'execution_cache_bytes': execution_stats['size_bytes'],
+            'execution_cache_hits': execution_stats['hits'],
+            'execution_cache_misses': execution_stats['misses'],
+            'execution_cache_evictions': execution_stats['evictions'],
+            'typecheck_cache_size': typecheck_entries,
             'compiled_modules_size': len(self._compiled_modules),
             'ts_cache_directory': str(self._ts_node_cache_dir) if self._ts_node_cache_dir else None
         }
@@ -2676,63 +2861,154 @@ class CodeRegionExecutor:
             logger.debug("Not a Mastra agent, skipping precompilation")
             return False
         
+        # Type checking the same code against the same project setup cannot
+        # change the outcome, so each revision is checked only once
+        cache_key = self._get_typecheck_cache_key(region_info)
+        cached = self._load_typecheck_result(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached type check result for Mastra agent: {region_info.name}")
+            return cached
+        
+        result = self._run_precompile(region_info)
+        if result is None:
+            # The compiler could not be run; only real type check results are
+            # cached, so the check is retried once the toolchain works
+            return False
+        
+        self._save_typecheck_result(cache_key, region_info, result)
+        return result
+    
+    def _get_typecheck_cache_key(self, region_info: RegionInfo) -> str:
+        """Build a cache key from the region code and the project files that affect type checking."""
+        import hashlib
+        
+        digest = hashlib.sha256()
+        digest.update(region_info.code.encode('utf-8'))
+        for file_name in TYPECHECK_INPUT_FILES:
+            file_path = self.workspace_root / file_name
+            digest.update(f"\0{file_name}\0".encode('utf-8'))
+            try:
+                digest.update(file_path.read_bytes())
+            except OSError:
+                digest.update(b'<missing>')
+        return digest.hexdigest()
+    
+    def _typecheck_cache_path(self, cache_key: str) -> Optional[Path]:
+        """Get the on-disk location of a type check result."""
+        if not self._ts_node_cache_dir:
+            return None
+        return self._ts_node_cache_dir / 'typecheck' / f"{cache_key}.json"
+    
+    def _load_typecheck_result(self, cache_key: str) -> Optional[bool]:
+        """Look up a previous type check result in memory, then on disk."""
+        import json
+        
+        if cache_key in self._precompile_results:
+            return self._precompile_results[cache_key]
+        
+        cache_path = self._typecheck_cache_path(cache_key)
+        if cache_path is None:
+            return None
+        try:
+            with open(cache_path, 'r') as f:
+                result = bool(json.load(f)['success'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        
+        self._precompile_results[cache_key] = result
+        return result
+    
+    def _save_typecheck_result(self, cache_key: str, region_info: RegionInfo, result: bool) -> None:
+        """Record a type check result in memory and on disk."""
+        import json
+        import time
+        
+        self._precompile_results[cache_key] = result
+        
+        cache_path = self._typecheck_cache_path(cache_key)
+        if cache_path is None:
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_path.with_suffix(f".{uuid.uuid4().hex[:8]}.tmp")
+            with open(temp_path, 'w') as f:
+                json.dump({'success': result, 'region': region_info.name, 'checked_at': time.time()}, f)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Failed to persist type check result: {str(e)}")
+    
+    def _run_precompile(self, region_info: RegionInfo) -> Optional[bool]:
+        """Run the TypeScript compiler over a region to check it.
+        
+        Returns:
+            True if the code type checks, False if the compiler reported type
+            errors, or None if the check could not be run (e.g. a timeout, a
+            missing compiler, or a non-zero exit without diagnostics)
+        """
+        import time
+        temp_file_path = self.workspace_root / f"temp_precompile_{region_info.name}_{int(time.time())}_{uuid.uuid4().hex[:8]}.ts"
         try:
             logger.debug(f"Precompiling Mastra agent: {region_info.name}")
             
             # Create a temporary file for precompilation in the workspace root
-            import time
-            temp_file_path = self.workspace_root / f"temp_precompile_{region_info.name}_{int(time.time())}.ts"
             with open(temp_file_path, 'w') as temp_file:
                 temp_file.write(region_info.code)
-                
-                # Run TypeScript compiler to check syntax (not ts-node which tries to execute)
-                logger.debug(f"Running TypeScript syntax check for {region_info.name}")
-                logger.debug(f"Working directory: {self.workspace_root}")
-                logger.debug(f"Temp file: {temp_file_path}")
-                
-                # Check if node_modules exists in workspace
-                node_modules_path = self.workspace_root / 'node_modules'
-                if node_modules_path.exists():
-                    logger.debug(f"node_modules found at: {node_modules_path}")
-                else:
-                    logger.warning(f"node_modules not found at: {node_modules_path}")
-                
-                # Use tsc for syntax checking instead of ts-node for execution
-                result = subprocess.run(
-                    ['npx', 'tsc', '--noEmit', '--skipLibCheck', str(temp_file_path)],
-                    capture_output=True,
-                    text=True,
-                    timeout=60,  # Shorter timeout for precompilation
-                    cwd=str(self.workspace_root),  # Run in workspace root to find node_modules
-                    env={
-                        **os.environ,
-                        'NODE_ENV': 'production',
-                    }
-                )
-                
-                # Clean up
-                try:
-                    temp_file_path.unlink()
-                except OSError:
-                    pass
-                
-                if result.returncode == 0:
-                    logger.debug(f"Successfully precompiled Mastra agent: {region_info.name}")
-                    return True
-                else:
-                    logger.warning(f"Precompilation failed for {region_info.name}")
-                    logger.warning(f"Return code: {result.returncode}")
-                    logger.warning(f"stderr: {result.stderr}")
-                    logger.warning(f"stdout: {result.stdout}")
-                    return False
-                    
+            
+            # Run TypeScript compiler to check syntax (not ts-node which tries to execute)
+            logger.debug(f"Running TypeScript syntax check for {region_info.name}")
+            logger.debug(f"Working directory: {self.workspace_root}")
+            logger.debug(f"Temp file: {temp_file_path}")
+            
+            # Check if node_modules exists in workspace
+            node_modules_path = self.workspace_root / 'node_modules'
+            if node_modules_path.exists():
+                logger.debug(f"node_modules found at: {node_modules_path}")
+            else:
+                logger.warning(f"node_modules not found at: {node_modules_path}")
+            
+            # Use tsc for syntax checking instead of ts-node for execution
+            result = subprocess.run(
+                ['npx', 'tsc', '--noEmit', '--skipLibCheck', str(temp_file_path)],
+                capture_output=True,
+                text=True,
+                timeout=60,  # Shorter timeout for precompilation
+                cwd=str(self.workspace_root),  # Run in workspace root to find node_modules
+                env={
+                    **os.environ,
+                    'NODE_ENV': 'production',
+                }
+            )
+            
+            if result.returncode == 0:
+                logger.debug(f"Successfully precompiled Mastra agent: {region_info.name}")
+                return True
+            
+            logger.warning(f"Precompilation failed for {region_info.name}")
+            logger.warning(f"Return code: {result.returncode}")
+            logger.warning(f"stderr: {result.stderr}")
+            logger.warning(f"stdout: {result.stdout}")
+            if TYPECHECK_DIAGNOSTIC_MARKER not in f"{result.stdout}\n{result.stderr}":
+                # A missing or broken compiler (npx unable to find tsc, a crash)
+                # says nothing about the code, so the result is not cached
+                logger.warning(f"TypeScript compiler could not check {region_info.name}; not caching the result")
+                return None
+            return False
+            
+
         except Exception as e:
             logger.warning(f"Error during precompilation of {region_info.name}: {str(e)}")
-            return False
+            return None
+        finally:
+            # Clean up
+            try:
+                temp_file_path.unlink()
+            except OSError:
+                pass
     
     def cleanup(self):
         """Clean up resources and clear caches."""
         self.clear_cache()
+        self.stop_ts_worker()
         logger.debug("CodeRegionExecutor cleanup completed")
 
 
@@ -3065,7 +3341,7 @@ console.log('SUCCESS: Module imported successfully');
 console.log('Google object:', typeof google);
 """
             
-            test_file_path = self.workspace_root / f"temp_import_test_{int(time.time())}.ts"
+            test_file_path = self.workspace_root / f"temp_import_test_{int(time.time())}_{uuid.uuid4().hex[:8]}.ts"
             with open(test_file_path, 'w') as f:
                 f.write(test_script)
             
@@ -3110,6 +3386,100 @@ console.log('Google object:', typeof google);
         
         return diagnostics
 
+    def _execute_typescript(
+        self, region_info: RegionInfo, method_name: Optional[str],
+        input_data: List[Any], tracked_variables: Set[str],
+        timeout: Optional[int], is_mastra: bool
+    ) -> Dict[str, Any]:
+        """Execute TypeScript through the persistent worker, falling back to a one-shot ts-node process."""
+        if self.use_ts_worker:
+            try:
+                return self._execute_with_ts_worker(region_info, method_name, input_data, tracked_variables, timeout)
+            except WorkerStartupError as e:
+                logger.warning(f"⚠️ TypeScript worker unavailable, falling back to one-shot ts-node: {str(e)}")
+                self.use_ts_worker = False
+        
+        return self._execute_with_mastra_specific_handling(
+            region_info, method_name, input_data, tracked_variables, timeout, is_mastra
+        )
+    
+    def _execute_with_ts_worker(
+        self, region_info: RegionInfo, method_name: Optional[str],
+        input_data: List[Any], tracked_variables: Set[str], timeout: Optional[int]
+    ) -> Dict[str, Any]:
+        """Execute a TypeScript region in the persistent worker process.
+        
+        The region code is written to a file named after its content hash, so
+        the worker imports each revision once and reuses it for later calls.
+        """
+        import time
+        
+        module_path = self._get_ts_module_file(region_info)
+        rel_path = os.path.relpath(module_path, str(self.workspace_root)).replace('\\', '/')
+        if not rel_path.startswith('./') and not rel_path.startswith('../'):
+            rel_path = f"./{rel_path}"
+        
+        execution_start = time.time()
+        try:
+            output = self._get_ts_worker().invoke(rel_path, method_name, input_data, timeout=timeout or 180)
+        except WorkerStartupError:
+            raise
+        except WorkerError as e:
+            logger.error(f"❌ TypeScript worker execution failed: {str(e)}")
+            raise Exception(f"Mastra-specific execution failed: {str(e)}")
+        execution_time = time.time() - execution_start
+        logger.debug(f"✅ TypeScript worker execution completed (took {execution_time:.2f}s)")
+        
+        return {
+            'result': output.get('result'),
+            'tracked_values': output.get('tracked_values', {}),
+            'tracked_variables': tracked_variables,
+            'execution_time': execution_time
+        }
+    
+    def _get_ts_worker(self) -> TypeScriptWorker:
+        """Get the persistent TypeScript worker, creating it if needed."""
+        with self._ts_worker_lock:
+            if self._ts_worker is None:
+                self._ts_worker = TypeScriptWorker(
+                    self.workspace_root,
+                    env={
+                        'TS_NODE_CACHE': 'true',
+                        'TS_NODE_CACHE_DIRECTORY': str(self._ts_node_cache_dir) if self._ts_node_cache_dir else '',
+                    }
+                )
+            return self._ts_worker
+    
+    def _get_ts_module_file(self, region_info: RegionInfo) -> Path:
+        """Write the region code to a content-addressed file for the worker to import."""
+        import hashlib
+        
+        code_hash = hashlib.sha256(region_info.code.encode('utf-8')).hexdigest()[:16]
+        module_path = self.workspace_root / f"temp_kaizen_agent_{region_info.name}_{code_hash}.ts"
+        
+        with self._ts_worker_lock:
+            if not module_path.exists():
+                module_path.write_text(region_info.code)
+            self._ts_module_files[code_hash] = module_path
+        return module_path
+    
+    def stop_ts_worker(self) -> None:
+        """Stop the persistent TypeScript worker and remove its module files.
+        
+        Modules stay loaded in the worker for as long as it runs, so it is
+        stopped at the end of each test run to pick up source changes.
+        """
+        with self._ts_worker_lock:
+            if self._ts_worker is not None:
+                self._ts_worker.stop()
+                self._ts_worker = None
+            for module_path in self._ts_module_files.values():
+                try:
+                    module_path.unlink()
+                except OSError:
+                    pass
+            self._ts_module_files.clear()
+    
     def _execute_with_mastra_specific_handling(
         self, region_info: 'RegionInfo', method_name: 'Optional[str]', 
         input_data: 'List[Any]', tracked_variables: 'Set[str]', 
@@ -3121,7 +3491,7 @@ console.log('Google object:', typeof google);
         import time
         import os
         logger.info(f"🤖 Using Mastra-specific execution strategy...")
-        temp_file_path = self.workspace_root / f"temp_mastra_{region_info.name}_{int(time.time())}.ts"
+        temp_file_path = self.workspace_root / f"temp_mastra_{region_info.name}_{int(time.time())}_{uuid.uuid4().hex[:8]}.ts"
         with open(temp_file_path, 'w') as temp_file:
             temp_file.write(region_info.code)
             temp_file.flush()
@@ -3154,7 +3524,7 @@ console.log('Google object:', typeof google);
                 logger.debug(f"      ... (showing first 20 lines, script has {len(script_lines)} total lines)")
                 break
         logger.debug(f"      {'='*80}")
-        exec_file_path = self.workspace_root / f"temp_mastra_script_{region_info.name}_{int(time.time())}.ts"
+        exec_file_path = self.workspace_root / f"temp_mastra_script_{region_info.name}_{int(time.time())}_{uuid.uuid4().hex[:8]}.ts"
         with open(exec_file_path, 'w') as exec_file:
             exec_file.write(execution_script)
             exec_file.flush()
@@ -3388,34 +3758,23 @@ console.log('Google object:', typeof google);
         try:
             # Add the file's directory to Python path temporarily
             file_dir = str(region_info.file_path.parent) if region_info.file_path else str(self.workspace_root)
-            if file_dir not in sys.path:
-                sys.path.insert(0, file_dir)
+            _add_to_sys_path(file_dir)
             
             try:
-                # First, handle dynamic imports from the code
-                self._handle_dynamic_imports(region_info)
-                
-                # Import the module using importlib for better control
                 module_name = entry_point.module
-                
-                # First, try to execute the code dynamically to create the module
-                module = self._create_dynamic_module(region_info, module_name)
-                
-                if not module:
-                    # Simple fallback: try to import the module directly
-                    try:
-                        module = importlib.import_module(module_name)
-                    except builtins.ImportError:
-                        logger.error(f"Module '{module_name}' not found")
-                        raise
+                module = self._agent_cache.get_module(
+                    module_name,
+                    region_info.file_path,
+                    lambda: self._load_llamaindex_module(region_info, module_name)
+                )
                 
                 # Execute with variable tracking
-                with track_variables(tracked_variables) as tracker:
+                with track_variables(tracked_variables, self._get_tracking_roots(region_info)) as tracker:
                     result = None
                     
                     # Get the class and instantiate it
                     class_obj = getattr(module, entry_point.class_name)
-                    instance = class_obj()
+                    instance = self._agent_cache.get_instance(module_name, class_obj, entry_point.lifecycle)
                     
                     # Call the specified method
                     method = getattr(instance, entry_point.method)
@@ -3436,13 +3795,30 @@ console.log('Google object:', typeof google);
                     
             finally:
                 # Clean up: remove the added path
-                if file_dir in sys.path:
-                    sys.path.remove(file_dir)
+                _remove_from_sys_path(file_dir)
                     
         except Exception as e:
             logger.error(f"Error executing LlamaIndex agent {entry_point}: {str(e)}")
             raise
 
+    def _load_llamaindex_module(self, region_info: RegionInfo, module_name: str) -> ModuleType:
+        """Load a LlamaIndex agent module from its code, falling back to a plain import."""
+        # First, handle dynamic imports from the code
+        self._handle_dynamic_imports(region_info)
+        
+        # First, try to execute the code dynamically to create the module
+        module = self._create_dynamic_module(region_info, module_name)
+        
+        if not module:
+            # Simple fallback: try to import the module directly
+            try:
+                module = importlib.import_module(module_name)
+            except builtins.ImportError:
+                logger.error(f"Module '{module_name}' not found")
+                raise
+        
+        return module
+
     def _handle_dynamic_imports(self, region_info: RegionInfo) -> None:
         """Handle dynamic imports from the code region.
         
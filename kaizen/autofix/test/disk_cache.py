@@ -0,0 +1,225 @@
+"""Size-bounded on-disk cache shared by Kaizen's result caches."""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Name of the file holding cumulative statistics for persistent caches
+STATS_FILE_NAME = '.stats'
+
+
+class DiskCache:
+    """Size-bounded, TTL-limited on-disk cache of JSON-serializable values.
+
+    Each entry is stored as a JSON file named after its key. File modification
+    times record recency of use, so the least recently used entries are
+    evicted first once the cache grows beyond ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_entries: int,
+        ttl_seconds: Optional[float] = None,
+        persist_stats: bool = False
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store cache entries in
+            max_entries: Maximum number of entries kept on disk
+            ttl_seconds: Age after which an entry is considered stale
+                (None means entries do not expire)
+            persist_stats: Whether hit/miss/eviction counts are accumulated
+                on disk across processes rather than kept per instance
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.persist_stats = persist_stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entry_count: Optional[int] = None
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to create cache directory {self.cache_dir}: {str(e)}")
+
+        if self.persist_stats:
+            self._load_stats()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Look up a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if absent or expired
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self._record('misses')
+            return None
+
+        if self.ttl_seconds is not None and time.time() - entry.get('created_at', 0) > self.ttl_seconds:
+            self._remove(entry_path)
+            self._record('misses')
+            return None
+
+        # Refresh recency for LRU eviction
+        try:
+            os.utime(entry_path, None)
+        except OSError:
+            pass
+
+        self._record('hits')
+        return entry.get('value')
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value to store
+        """
+        entry_path = self._entry_path(key)
+        entry = {'created_at': time.time(), 'value': value}
+
+        try:
+            is_new = not entry_path.exists()
+            self._write_json_atomic(entry_path, entry)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write cache entry to {self.cache_dir}: {str(e)}")
+            return
+
+        if is_new:
+            self._on_entry_added()
+
+    def clear(self) -> None:
+        """Remove all cached entries and reset statistics."""
+        with self._lock:
+            for entry_path in self.cache_dir.glob('*.json'):
+                self._remove(entry_path)
+            self._entry_count = 0
+            self.hits = self.misses = self.evictions = 0
+            if self.persist_stats:
+                self._remove(self.cache_dir / STATS_FILE_NAME)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, size and hit, miss and eviction counts
+        """
+        entry_count = 0
+        size_bytes = 0
+        for entry_path in self.cache_dir.glob('*.json'):
+            try:
+                size_bytes += entry_path.stat().st_size
+                entry_count += 1
+            except OSError:
+                continue
+
+        with self._lock:
+            return {
+                'entries': entry_count,
+                'size_bytes': size_bytes,
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'cache_directory': str(self.cache_dir)
+            }
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.cache_dir / f"{key}.json"
+
+    def _record(self, counter: str, amount: int = 1) -> None:
+        """Increment a statistics counter."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+            if self.persist_stats:
+                self._save_stats()
+
+    def _on_entry_added(self) -> None:
+        """Track the entry count and evict old entries when over the bound."""
+        with self._lock:
+            if self._entry_count is None:
+                self._entry_count = sum(1 for _ in self.cache_dir.glob('*.json'))
+            else:
+                self._entry_count += 1
+
+            if self._entry_count <= self.max_entries:
+                return
+
+            entries = []
+            for entry_path in self.cache_dir.glob('*.json'):
+                try:
+                    entries.append((entry_path.stat().st_mtime, entry_path))
+                except OSError:
+                    continue
+            entries.sort()
+
+            excess = len(entries) - self.max_entries
+            for _, entry_path in entries[:max(0, excess)]:
+                self._remove(entry_path)
+                self.evictions += 1
+            self._entry_count = min(len(entries), self.max_entries)
+
+            if self.persist_stats:
+                self._save_stats()
+
+    def _load_stats(self) -> None:
+        """Load cumulative statistics from disk."""
+        try:
+            with open(self.cache_dir / STATS_FILE_NAME, 'r', encoding='utf-8') as f:
+                stats = json.load(f)
+            self.hits = int(stats.get('hits', 0))
+            self.misses = int(stats.get('misses', 0))
+            self.evictions = int(stats.get('evictions', 0))
+        except (OSError, ValueError, TypeError):
+            pass
+
+    def _save_stats(self) -> None:
+        """Write cumulative statistics to disk. Caller must hold the lock."""
+        try:
+            self._write_json_atomic(
+                self.cache_dir / STATS_FILE_NAME,
+                {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+            )
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Failed to save cache statistics: {str(e)}")
+
+    def _write_json_atomic(self, path: Path, data: Dict[str, Any]) -> None:
+        """Write JSON so concurrent readers never see a partial file."""
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, default=str)
+            os.replace(temp_path, path)
+        except BaseException:
+            self._remove(Path(temp_path))
+            raise
+
+    @staticmethod
+    def _remove(entry_path: Path) -> None:
+        """Delete a file, ignoring races with other processes."""
+        try:
+            entry_path.unlink()
+        except OSError:
+            pass
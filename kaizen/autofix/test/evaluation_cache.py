@@ -0,0 +1,75 @@
+"""On-disk cache for LLM evaluation verdicts.
+
+Auto-fix attempts rerun the whole test suite, and many steps produce the same
+output on every attempt. This cache stores evaluation results keyed by a hash
+of the evaluation prompt and model settings so repeated verdicts do not need
+another LLM round-trip.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .disk_cache import DiskCache
+
+# Default cache location and bounds
+DEFAULT_EVAL_CACHE_DIR = Path.home() / '.kaizen' / 'eval-cache'
+DEFAULT_EVAL_CACHE_MAX_ENTRIES = 2000
+DEFAULT_EVAL_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Bump when the cached entry format or prompt semantics change
+CACHE_FORMAT_VERSION = 1
+
+
+class EvaluationCache(DiskCache):
+    """Size-bounded, TTL-limited on-disk cache of evaluation results."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_entries: int = DEFAULT_EVAL_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_EVAL_CACHE_TTL_SECONDS
+    ):
+        """Initialize the evaluation cache.
+
+        Args:
+            cache_dir: Directory to store cache entries in
+            max_entries: Maximum number of entries kept on disk
+            ttl_seconds: Age after which an entry is considered stale
+        """
+        super().__init__(cache_dir or DEFAULT_EVAL_CACHE_DIR, max_entries, ttl_seconds)
+
+    @staticmethod
+    def make_key(prompt: str, model_name: str, better_ai: bool) -> str:
+        """Build a cache key for an evaluation request.
+
+        Args:
+            prompt: Evaluation prompt sent to the LLM
+            model_name: Name of the model used for evaluation
+            better_ai: Whether the enhanced model is in use
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps(
+            {
+                'version': CACHE_FORMAT_VERSION,
+                'prompt': prompt,
+                'model': model_name,
+                'better_ai': bool(better_ai)
+            },
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached evaluation result.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached evaluation result, or None if absent or expired
+        """
+        return super().get(key)
@@ -0,0 +1,255 @@
+"""Deterministic pre-screen deciding which steps need an LLM evaluation.
+
+A failed assertion fails a step whatever the LLM says, and an output that
+equals the expected output needs no judge to pass. The evaluation policy
+decides, from the assertion results and the output alone, whether a step's
+verdict is already known; only steps whose outcome an LLM evaluation can
+still change are sent to the evaluator.
+
+Steps with a failed assertion are still evaluated when auto-fix will read
+the LLM's reasoning, and outputs are only compared after normalization when
+that is enabled, so the defaults never change a verdict the LLM would have
+given.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+from .test_case import TestCase, TestStatus
+
+logger = logging.getLogger(__name__)
+
+# When steps are sent to the LLM evaluator
+EVALUATION_POLICY_ALWAYS = 'always'
+EVALUATION_POLICY_ON_ASSERTION_PASS = 'on_assertion_pass'
+EVALUATION_POLICY_SAMPLED = 'sampled'
+EVALUATION_POLICY_NEVER = 'never'
+EVALUATION_POLICIES = (
+    EVALUATION_POLICY_ALWAYS,
+    EVALUATION_POLICY_ON_ASSERTION_PASS,
+    EVALUATION_POLICY_SAMPLED,
+    EVALUATION_POLICY_NEVER
+)
+DEFAULT_EVALUATION_POLICY = EVALUATION_POLICY_ON_ASSERTION_PASS
+
+# Share of undecided steps evaluated by the sampled policy by default
+DEFAULT_EVALUATION_SAMPLE_RATE = 0.25
+
+# Reasons a step was not sent to the LLM evaluator
+SKIP_ASSERTION_FAILED = 'assertion_failed'
+SKIP_EXACT_MATCH = 'exact_match'
+SKIP_NORMALIZED_MATCH = 'normalized_match'
+SKIP_NOT_SAMPLED = 'not_sampled'
+SKIP_POLICY_NEVER = 'policy_never'
+
+_SKIP_REASONING = {
+    SKIP_ASSERTION_FAILED: "One or more assertions failed, so the step fails regardless of an LLM evaluation:",
+    SKIP_EXACT_MATCH: "The actual output is identical to the expected output.",
+    SKIP_NORMALIZED_MATCH: "The actual output matches the expected output after normalizing whitespace, case and JSON formatting.",
+    SKIP_NOT_SAMPLED: "The step was not sampled for LLM evaluation; its verdict is based on its assertions.",
+    SKIP_POLICY_NEVER: "LLM evaluation is disabled; the verdict is based on the step's assertions."
+}
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_output(value: Any) -> Any:
+    """Normalize an output for a formatting-insensitive comparison.
+
+    Strings holding JSON are decoded, remaining strings have their whitespace
+    collapsed and are case-folded, and containers are normalized recursively.
+    Dictionaries compare regardless of key order, and integers equal to
+    floats compare equal.
+
+    Args:
+        value: Output to normalize
+
+    Returns:
+        The normalized value
+    """
+    if isinstance(value, str):
+        stripped = value.strip()
+        if stripped[:1] in ('{', '[', '"'):
+            try:
+                return normalize_output(json.loads(stripped))
+            except ValueError:
+                pass
+        return _WHITESPACE.sub(' ', stripped).casefold()
+    if isinstance(value, dict):
+        return {str(key): normalize_output(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize_output(item) for item in value]
+    return value
+
+
+def _describe_assertion_failure(result: Dict[str, Any]) -> str:
+    """Describe a failed assertion result for the step's reasoning."""
+    where = f" at {result['path']}" if result.get('path') else ''
+    if result.get('error'):
+        return f"{result.get('type')}{where}: {result['error']}"
+    description = f"{result.get('type')}{where} expected {result.get('expected')!r}, got {result.get('actual')!r}"
+    if result.get('message'):
+        description += f" ({result['message']})"
+    return description
+
+
+def _outputs_equal(actual: Any, expected: Any) -> bool:
+    """Compare two outputs without letting odd __eq__ implementations raise."""
+    try:
+        return bool(actual == expected)
+    except Exception:
+        return False
+
+
+class EvaluationPolicy:
+    """Decides per step whether an LLM evaluation can change its verdict.
+
+    Policies:
+        always: every step is evaluated by the LLM, with no short-circuits
+        on_assertion_pass: steps with a failed assertion or an output matching
+            the expected output are decided without the LLM
+        sampled: like on_assertion_pass, but only a deterministic sample of
+            the remaining steps is evaluated; the rest pass on their assertions
+        never: no step is evaluated by the LLM
+    """
+
+    def __init__(
+        self,
+        policy: Optional[str] = None,
+        sample_rate: Optional[float] = None,
+        normalized_match: bool = False,
+        evaluate_failed_assertions: bool = False
+    ):
+        """Initialize the policy.
+
+        Args:
+            policy: One of EVALUATION_POLICIES (None uses the default)
+            sample_rate: Share of undecided steps the sampled policy evaluates,
+                between 0 and 1 (None uses DEFAULT_EVALUATION_SAMPLE_RATE)
+            normalized_match: Whether an output matching the expected output
+                after normalize_output passes without the LLM; by default
+                only identical outputs do
+            evaluate_failed_assertions: Whether steps with a failed assertion
+                are still evaluated, for the LLM's reasoning (auto-fix builds
+                its prompts from it); their verdict stays failed
+        """
+        policy = policy or DEFAULT_EVALUATION_POLICY
+        if policy not in EVALUATION_POLICIES:
+            logger.warning(
+                f"Unknown evaluation policy '{policy}', using '{DEFAULT_EVALUATION_POLICY}'. "
+                f"Must be one of {list(EVALUATION_POLICIES)}"
+            )
+            policy = DEFAULT_EVALUATION_POLICY
+        if sample_rate is None:
+            sample_rate = DEFAULT_EVALUATION_SAMPLE_RATE
+        self.policy = policy
+        self.sample_rate = min(1.0, max(0.0, float(sample_rate)))
+        self.normalized_match = normalized_match
+        self.evaluate_failed_assertions = evaluate_failed_assertions
+        self._lock = threading.Lock()
+        self.evaluated = 0
+        self.skipped = 0
+
+    def screen(
+        self,
+        test_case: TestCase,
+        actual_output: Any,
+        assertion_results: List[Dict]
+    ) -> Optional[Dict[str, Any]]:
+        """Decide a step without the LLM if its verdict is already known.
+
+        Args:
+            test_case: Test case configuration
+            actual_output: Actual output from the test
+            assertion_results: Results of the step's assertions
+
+        Returns:
+            An evaluation result in the LLM evaluator's format, or None if the
+            step should be evaluated by the LLM
+        """
+        reason = self._skip_reason(test_case, actual_output, assertion_results)
+        with self._lock:
+            if reason is None:
+                self.evaluated += 1
+            else:
+                self.skipped += 1
+        if reason is None:
+            return None
+
+        logger.debug(f"Skipping LLM evaluation of '{test_case.name}': {reason}")
+        passed = reason != SKIP_ASSERTION_FAILED
+        reasoning = _SKIP_REASONING[reason]
+        if not passed:
+            failures = [_describe_assertion_failure(result) for result in assertion_results if not result.get('passed')]
+            reasoning = f"{reasoning} {'; '.join(failures)}"
+        return {
+            'status': TestStatus.PASSED.value if passed else TestStatus.FAILED.value,
+            'evaluation': 'Not evaluated by LLM',
+            'reasoning': reasoning,
+            'confidence': 1.0,
+            'skipped': True,
+            'skip_reason': reason
+        }
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the number of steps sent to and kept from the LLM evaluator."""
+        with self._lock:
+            return {'evaluated': self.evaluated, 'skipped': self.skipped}
+
+    def _skip_reason(
+        self,
+        test_case: TestCase,
+        actual_output: Any,
+        assertion_results: List[Dict]
+    ) -> Optional[str]:
+        """Get why a step needs no LLM evaluation, or None if it does."""
+        if self.policy == EVALUATION_POLICY_ALWAYS:
+            return None
+        if any(not result.get('passed') for result in assertion_results):
+            if self.evaluate_failed_assertions and self.policy != EVALUATION_POLICY_NEVER:
+                return None
+            return SKIP_ASSERTION_FAILED
+
+        match = self._match_reason(test_case, actual_output)
+        if match is not None:
+            return match
+
+        if self.policy == EVALUATION_POLICY_NEVER:
+            return SKIP_POLICY_NEVER
+        if self.policy == EVALUATION_POLICY_SAMPLED and not self._is_sampled(test_case.name):
+            return SKIP_NOT_SAMPLED
+        return None
+
+    def _match_reason(self, test_case: TestCase, actual_output: Any) -> Optional[str]:
+        """Check whether the output matches the expected output."""
+        expected = test_case.expected_output
+        if expected is None or actual_output is None:
+            return None
+        if any(EvaluationPolicy._target_source(target) != 'return'
+               for target in test_case.evaluation_targets or []):
+            # Targets on tracked variables are not decided by the output
+            return None
+        if _outputs_equal(actual_output, expected):
+            return SKIP_EXACT_MATCH
+        if self.normalized_match and _outputs_equal(normalize_output(actual_output), normalize_output(expected)):
+            return SKIP_NORMALIZED_MATCH
+        return None
+
+    @staticmethod
+    def _target_source(target: Any) -> str:
+        """Get the source of an evaluation target object or dictionary."""
+        source = getattr(target, 'source', None)
+        if source is not None:
+            return getattr(source, 'value', source)
+        if isinstance(target, dict):
+            return target.get('source', 'return')
+        return 'return'
+
+    def _is_sampled(self, step_name: str) -> bool:
+        """Pick the sampled steps by name, so every run evaluates the same ones."""
+        digest = hashlib.sha256(str(step_name).encode('utf-8')).digest()
+        return int.from_bytes(digest[:8], 'big') / 2 ** 64 < self.sample_rate
@@ -0,0 +1,85 @@
+"""On-disk cache for TypeScript agent execution results.
+
+Running a TypeScript agent is slow, but an agent is often re-run with the same
+code and inputs across test runs. Agents backed by an LLM are
+non-deterministic, so results are only cached for agents that opt in with
+``cache_results: true`` in their entry point configuration.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .disk_cache import DiskCache
+
+# Default cache location and bounds
+DEFAULT_EXECUTION_CACHE_DIR = Path.home() / '.kaizen' / 'ts-cache' / 'executions'
+DEFAULT_EXECUTION_CACHE_MAX_ENTRIES = 500
+DEFAULT_EXECUTION_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Bump when the cached entry format or execution semantics change
+CACHE_FORMAT_VERSION = 1
+
+
+class ExecutionCache(DiskCache):
+    """Size-bounded on-disk cache of TypeScript execution results.
+
+    Statistics are accumulated on disk so that ``--show-cache-stats`` reports
+    the activity of previous test runs.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_entries: int = DEFAULT_EXECUTION_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_EXECUTION_CACHE_TTL_SECONDS
+    ):
+        """Initialize the execution cache.
+
+        Args:
+            cache_dir: Directory to store cache entries in
+            max_entries: Maximum number of entries kept on disk
+            ttl_seconds: Age after which an entry is considered stale
+        """
+        super().__init__(
+            cache_dir or DEFAULT_EXECUTION_CACHE_DIR,
+            max_entries,
+            ttl_seconds,
+            persist_stats=True
+        )
+
+    @staticmethod
+    def make_key(code: str, method_name: Optional[str], input_data: List[Any]) -> str:
+        """Build a cache key for an execution request.
+
+        Args:
+            code: Source code of the region being executed
+            method_name: Method or export being called
+            input_data: Positional arguments passed to the call
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps(
+            {
+                'version': CACHE_FORMAT_VERSION,
+                'code': code,
+                'method': method_name,
+                'input': input_data
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached execution result.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Dictionary with 'result' and 'tracked_values', or None if absent
+        """
+        return super().get(key)
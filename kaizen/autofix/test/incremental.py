@@ -0,0 +1,351 @@
+"""Incremental re-testing for auto-fix attempts.
+
+Rerunning the whole suite after every fix attempt repeats steps that already
+passed and whose code the fix did not touch. An incremental re-test runs the
+previously failing steps first, stops at the first step that still fails, and
+reruns previously passing steps only as a regression guard. Steps that are
+not rerun keep their result from the previous run.
+"""
+
+import ast
+import logging
+import math
+import random
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Regression guard policies for previously passing steps
+REGRESSION_GUARD_ALL = 'all'
+REGRESSION_GUARD_AFFECTED = 'affected'
+REGRESSION_GUARD_SAMPLED = 'sampled'
+REGRESSION_GUARD_NONE = 'none'
+REGRESSION_GUARDS = (
+    REGRESSION_GUARD_ALL,
+    REGRESSION_GUARD_AFFECTED,
+    REGRESSION_GUARD_SAMPLED,
+    REGRESSION_GUARD_NONE
+)
+DEFAULT_REGRESSION_GUARD = REGRESSION_GUARD_AFFECTED
+
+# Share of previously passing steps rerun by the sampled guard by default
+DEFAULT_REGRESSION_SAMPLE_FRACTION = 0.25
+
+# Metadata key marking results copied from the previous run
+CARRIED_OVER_KEY = 'carried_over'
+
+
+@dataclass
+class RetestPlan:
+    """Steps to rerun after a fix attempt.
+
+    Attributes:
+        failing_steps: Previously failing steps, run first
+        guard_steps: Previously passing steps rerun as a regression guard
+        skipped_steps: Previously passing steps whose results are carried over
+    """
+    failing_steps: List[str] = field(default_factory=list)
+    guard_steps: List[str] = field(default_factory=list)
+    skipped_steps: List[str] = field(default_factory=list)
+
+    @property
+    def step_names(self) -> List[str]:
+        """Steps to run, failing steps first."""
+        return self.failing_steps + self.guard_steps
+
+
+def find_changed_functions(old_source: str, new_source: str) -> Optional[Set[str]]:
+    """Find the functions and methods whose definition changed.
+
+    Args:
+        old_source: Python source before the change
+        new_source: Python source after the change
+
+    Returns:
+        Names of added, removed or modified functions, or None if code outside
+        function bodies changed (or the source cannot be parsed), in which
+        case any step may be affected
+    """
+    try:
+        old_tree = ast.parse(old_source)
+        new_tree = ast.parse(new_source)
+    except SyntaxError:
+        return None
+
+    old_functions, old_rest = _split_functions(old_tree)
+    new_functions, new_rest = _split_functions(new_tree)
+    if old_rest != new_rest:
+        return None
+
+    changed = set()
+    for name in set(old_functions) | set(new_functions):
+        if old_functions.get(name) != new_functions.get(name):
+            changed.add(name.rsplit('.', 1)[-1])
+    return changed
+
+
+def build_call_graph(sources: List[str]) -> Dict[str, Set[str]]:
+    """Build a name-based call graph of the functions in some Python sources.
+
+    Calls are resolved by name only (``foo()``, ``self.foo()`` and
+    ``obj.foo()`` all point at every function named ``foo``), which
+    over-approximates the real call graph and so never misses a dependency
+    within these files.
+
+    Args:
+        sources: Python sources to analyze
+
+    Returns:
+        Mapping of function name to the names it calls
+    """
+    graph: Dict[str, Set[str]] = {}
+    for source in sources:
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                callees = graph.setdefault(node.name, set())
+                for child in ast.walk(node):
+                    if isinstance(child, ast.Call):
+                        if isinstance(child.func, ast.Name):
+                            callees.add(child.func.id)
+                        elif isinstance(child.func, ast.Attribute):
+                            callees.add(child.func.attr)
+    return graph
+
+
+def _split_functions(tree: ast.Module) -> Tuple[Dict[str, str], str]:
+    """Separate function definitions from the rest of a module.
+
+    Returns:
+        Tuple of (qualified name -> dumped definition, dump of everything
+        else, with class headers but without function definitions)
+    """
+    functions: Dict[str, str] = {}
+
+    def visit(body: List[ast.stmt], prefix: str) -> List[str]:
+        remaining = []
+        for node in body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                functions[f"{prefix}{node.name}"] = ast.dump(node)
+            elif isinstance(node, ast.ClassDef):
+                header = [node.name] + [ast.dump(expr) for expr in node.bases + node.decorator_list]
+                header += [ast.dump(keyword) for keyword in node.keywords]
+                remaining.append(f"class {' '.join(header)}")
+                remaining.extend(visit(node.body, f"{prefix}{node.name}."))
+                remaining.append(f"end {node.name}")
+            else:
+                remaining.append(ast.dump(node))
+        return remaining
+
+    rest = visit(tree.body, '')
+    return functions, '\n'.join(rest)
+
+
+class IncrementalRetestPlanner:
+    """Plans incremental re-tests and merges their results with the previous run."""
+
+    def __init__(
+        self,
+        test_config: Dict[str, Any],
+        regression_guard: str = DEFAULT_REGRESSION_GUARD,
+        sample_size: Optional[int] = None,
+        seed: Optional[int] = None
+    ):
+        """Initialize the planner.
+
+        Args:
+            test_config: Runner configuration with the test steps
+            regression_guard: How previously passing steps are rerun: 'all',
+                'affected' (steps whose entry method reaches a changed
+                function), 'sampled' or 'none'
+            sample_size: Number of steps rerun by the sampled guard
+            seed: Optional random seed for the sampled guard
+        """
+        if regression_guard not in REGRESSION_GUARDS:
+            logger.warning(
+                f"Unknown regression guard '{regression_guard}', using '{DEFAULT_REGRESSION_GUARD}'. "
+                f"Must be one of {list(REGRESSION_GUARDS)}"
+            )
+            regression_guard = DEFAULT_REGRESSION_GUARD
+        self.test_config = test_config
+        self.regression_guard = regression_guard
+        self.sample_size = sample_size
+        self._random = random.Random(seed)
+
+    def plan(
+        self,
+        previous_result,
+        original_sources: Dict[str, str],
+        current_sources: Dict[str, str]
+    ) -> Optional[RetestPlan]:
+        """Plan which steps to rerun after a fix attempt.
+
+        Args:
+            previous_result: TestExecutionResult from before the fix attempt
+            original_sources: File contents before the fix attempt
+            current_sources: File contents after the fix attempt
+
+        Returns:
+            RetestPlan, or None if the whole suite should be run
+        """
+        if previous_result is None or not previous_result.test_cases:
+            return None
+
+        previous_by_name = {tc.name: tc for tc in previous_result.test_cases}
+        step_names = [step.get('name') for step in self.test_config.get('steps', [])]
+        if not step_names or len(set(step_names)) != len(step_names):
+            # Steps cannot be told apart by name
+            return None
+        if any(name not in previous_by_name for name in step_names):
+            # Steps without a previous result must run anyway
+            return None
+
+        plan = RetestPlan()
+        passing = []
+        for name in step_names:
+            if previous_by_name[name].is_passed():
+                passing.append(name)
+            else:
+                plan.failing_steps.append(name)
+
+        guard = set(self._select_guard_steps(passing, original_sources, current_sources))
+        plan.guard_steps = [name for name in passing if name in guard]
+        plan.skipped_steps = [name for name in passing if name not in guard]
+
+        logger.info(
+            f"Incremental re-test: {len(plan.failing_steps)} failing step(s) first, "
+            f"{len(plan.guard_steps)} regression guard step(s), "
+            f"{len(plan.skipped_steps)} carried over ({self.regression_guard} guard)"
+        )
+        return plan
+
+    def merge(self, previous_result, rerun_result):
+        """Combine rerun results with the carried-over results of the previous run.
+
+        Args:
+            previous_result: TestExecutionResult from before the fix attempt
+            rerun_result: TestExecutionResult of the steps that were rerun
+
+        Returns:
+            TestExecutionResult covering every step, in configuration order
+        """
+        # Import here to avoid circular import
+        from ...cli.commands.models import TestExecutionResult
+
+        rerun_by_name = {tc.name: tc for tc in rerun_result.test_cases}
+        test_cases = []
+        for previous_case in previous_result.test_cases:
+            rerun_case = rerun_by_name.get(previous_case.name)
+            if rerun_case is not None:
+                test_cases.append(rerun_case)
+            else:
+                test_cases.append(replace(
+                    previous_case,
+                    metadata={**previous_case.metadata, CARRIED_OVER_KEY: True}
+                ))
+
+        merged = TestExecutionResult(
+            name=rerun_result.name,
+            file_path=rerun_result.file_path,
+            config_path=rerun_result.config_path
+        )
+        merged.add_test_cases(test_cases)
+        if rerun_result.error_message:
+            merged.error_message = rerun_result.error_message
+            merged.error_details = rerun_result.error_details
+            merged.status = rerun_result.status
+        merged.summary.eval_cache_hits = rerun_result.summary.eval_cache_hits
+        merged.summary.eval_cache_misses = rerun_result.summary.eval_cache_misses
+        merged.summary.eval_skipped = rerun_result.summary.eval_skipped
+        return merged
+
+    @staticmethod
+    def has_carried_over(result) -> bool:
+        """Check whether a result contains steps that were not rerun."""
+        return any(tc.metadata.get(CARRIED_OVER_KEY) for tc in result.test_cases)
+
+    def _select_guard_steps(
+        self,
+        passing: List[str],
+        original_sources: Dict[str, str],
+        current_sources: Dict[str, str]
+    ) -> List[str]:
+        """Choose which previously passing steps to rerun."""
+        if not passing or self.regression_guard == REGRESSION_GUARD_NONE:
+            return []
+        if self.regression_guard == REGRESSION_GUARD_ALL:
+            return passing
+        if self.regression_guard == REGRESSION_GUARD_SAMPLED:
+            size = self.sample_size
+            if size is None:
+                size = math.ceil(len(passing) * DEFAULT_REGRESSION_SAMPLE_FRACTION)
+            return self._random.sample(passing, max(0, min(size, len(passing))))
+        return self._select_affected_steps(passing, original_sources, current_sources)
+
+    def _select_affected_steps(
+        self,
+        passing: List[str],
+        original_sources: Dict[str, str],
+        current_sources: Dict[str, str]
+    ) -> List[str]:
+        """Choose the passing steps whose entry method can reach a changed function."""
+        if self.test_config.get('language', 'python') != 'python':
+            # No dependency information for other languages
+            return passing
+
+        changed: Set[str] = set()
+        for path, new_source in current_sources.items():
+            old_source = original_sources.get(path)
+            if old_source is None:
+                return passing
+            if old_source == new_source:
+                continue
+            file_changes = find_changed_functions(old_source, new_source)
+            if file_changes is None:
+                logger.debug(f"Module-level changes in {path}, rerunning all passing steps")
+                return passing
+            changed |= file_changes
+
+        if not changed:
+            return []
+        if any(name.startswith('__') and name.endswith('__') for name in changed):
+            # Constructors and other special methods run without a call by
+            # name, e.g. when the runner instantiates the agent for each step
+            logger.debug(f"Special methods changed ({sorted(changed)}), rerunning all passing steps")
+            return passing
+
+        graph = build_call_graph(list(current_sources.values()))
+        steps_by_name = {step.get('name'): step for step in self.test_config.get('steps', [])}
+        affected = []
+        for name in passing:
+            entry = self._get_entry_method(steps_by_name.get(name, {}))
+            if entry is None or entry not in graph:
+                # Cannot tell what the step exercises
+                affected.append(name)
+            elif self._reachable(graph, entry) & changed:
+                affected.append(name)
+        return affected
+
+    def _get_entry_method(self, step: Dict[str, Any]) -> Optional[str]:
+        """Get the name of the method a step invokes."""
+        step_input = step.get('input')
+        if isinstance(step_input, dict) and step_input.get('method'):
+            return step_input['method']
+        agent = self.test_config.get('agent') or {}
+        return agent.get('method')
+
+    @staticmethod
+    def _reachable(graph: Dict[str, Set[str]], entry: str) -> Set[str]:
+        """Get the functions reachable from an entry point, including itself."""
+        seen = {entry}
+        stack = [entry]
+        while stack:
+            for callee in graph.get(stack.pop(), ()):
+                if callee in graph and callee not in seen:
+                    seen.add(callee)
+                    stack.append(callee)
+        return seen
@@ -0,0 +1,141 @@
+"""Per-revision cache of code region analysis.
+
+Every test step validates the agent entry point and extracts its code region,
+which reads the agent file, parses it and resolves all of its imports. The
+result only depends on the file contents, so this cache keeps it per file
+revision: a cheap (mtime, size) check runs on every lookup and the file is
+only hashed when that changes. Entries for a file are dropped as soon as its
+contents change, for example after auto-fix rewrites it.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _FileEntry:
+    """Cached values for one revision of a file.
+
+    Attributes:
+        stat_key: (mtime_ns, size) of the file when last checked
+        digest: SHA-256 of the file contents
+        values: Cached values keyed by the caller's key
+    """
+    stat_key: Tuple[int, int]
+    digest: str
+    values: Dict[Hashable, Any] = field(default_factory=dict)
+
+
+class RegionCache:
+    """Thread-safe cache of values derived from a file's contents."""
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._files: Dict[str, _FileEntry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, file_path: Path, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Get a value for the current revision of a file, building it on a miss.
+
+        Values are shared between callers and must not be mutated. Failures
+        are not cached; build is called again on the next lookup.
+
+        Args:
+            file_path: File the value is derived from
+            key: Key of the value within the file revision
+            build: Function computing the value from the file
+
+        Returns:
+            The cached or newly built value
+        """
+        path = self._normalize(file_path)
+        entry = self._current_entry(path)
+        if entry is None:
+            # Unreadable file; let build report the error
+            return build()
+
+        with self._lock:
+            if key in entry.values:
+                self.hits += 1
+                return entry.values[key]
+            self.misses += 1
+
+        value = build()
+        with self._lock:
+            # Only store the value if the file was not replaced meanwhile
+            if self._files.get(path) is entry:
+                entry.values.setdefault(key, value)
+        return value
+
+    def invalidate(self, file_path: Optional[Path] = None) -> None:
+        """Drop cached values.
+
+        Args:
+            file_path: File that was rewritten; all files if None
+        """
+        with self._lock:
+            if file_path is None:
+                self._files.clear()
+            else:
+                self._files.pop(self._normalize(file_path), None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache hit and miss counts and the number of cached files."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'files': len(self._files)}
+
+    def _current_entry(self, path: str) -> Optional[_FileEntry]:
+        """Get the entry for the file's current revision, replacing a stale one."""
+        stat_key = self._stat_key(path)
+        if stat_key is None:
+            return None
+        with self._lock:
+            entry = self._files.get(path)
+            if entry is not None and entry.stat_key == stat_key:
+                return entry
+
+        digest = self._digest(path)
+        if digest is None:
+            return None
+        with self._lock:
+            entry = self._files.get(path)
+            if entry is not None and entry.digest == digest:
+                # Touched but not edited
+                entry.stat_key = stat_key
+                return entry
+            if entry is not None:
+                logger.debug(f"File changed on disk, dropping cached regions: {path}")
+            entry = _FileEntry(stat_key=stat_key, digest=digest)
+            self._files[path] = entry
+            return entry
+
+    @staticmethod
+    def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+        """Get the (mtime_ns, size) of a file."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _digest(path: str) -> Optional[str]:
+        """Hash the contents of a file."""
+        try:
+            return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    @staticmethod
+    def _normalize(file_path: Path) -> str:
+        """Normalize a path for use as a cache key."""
+        return os.path.normcase(os.path.realpath(str(file_path)))
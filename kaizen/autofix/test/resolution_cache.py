@@ -0,0 +1,226 @@
+"""Process-wide, optionally persistent cache of module resolutions.
+
+Resolving an agent's dependencies calls ``importlib.util.find_spec`` and
+probes the workspace for every import. For agents built on large frameworks
+this dominates extraction time, yet the answers only change when packages
+are installed or removed or the workspace layout changes. This cache maps
+module names to resolved module data per environment and workspace. Each
+table is tagged with a fingerprint of the interpreter, ``sys.path`` and the
+modification times of those directories and of the workspace root; a table
+whose fingerprint no longer matches is discarded.
+
+Directory modification times only change when entries are added to or
+removed from that directory, so positive workspace results are checked for
+existence on every hit, and failed resolutions are only cached for top-level
+names that do not exist anywhere in the workspace root or its src directory.
+Creating such a module later always changes one of the fingerprinted
+directories.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default location of persisted resolution tables
+DEFAULT_RESOLUTION_CACHE_DIR = Path.home() / '.kaizen' / 'module-cache'
+
+# Bump when the persisted table format or resolution semantics change
+RESOLUTION_CACHE_FORMAT_VERSION = 2
+
+
+@dataclass
+class ResolutionTable:
+    """Resolved modules for one interpreter and workspace.
+
+    Values are JSON-serializable module data, or None for modules that could
+    not be resolved.
+
+    Attributes:
+        scope: Key of the interpreter and workspace the table belongs to
+        fingerprint: Fingerprint of sys.path and workspace when the table was built
+        modules: Resolved module data by module name
+        dirty: Whether the table has entries not yet persisted
+    """
+    scope: str
+    fingerprint: str
+    modules: Dict[str, Optional[Dict[str, Any]]] = field(default_factory=dict)
+    dirty: bool = False
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def get(self, module_name: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Look up a module.
+
+        Args:
+            module_name: Name of the module
+
+        Returns:
+            (found, data) where data is None for a cached failed resolution
+        """
+        with self._lock:
+            if module_name not in self.modules:
+                return False, None
+            return True, self.modules[module_name]
+
+    def put(self, module_name: str, data: Optional[Dict[str, Any]]) -> None:
+        """Record the resolution of a module.
+
+        Args:
+            module_name: Name of the module
+            data: JSON-serializable module data, or None if unresolved
+        """
+        with self._lock:
+            if module_name in self.modules and self.modules[module_name] == data:
+                return
+            self.modules[module_name] = data
+            self.dirty = True
+
+    def discard(self, module_name: str) -> None:
+        """Forget a module whose cached resolution turned out to be stale."""
+        with self._lock:
+            if module_name in self.modules:
+                del self.modules[module_name]
+                self.dirty = True
+
+
+class ModuleResolutionCache:
+    """Thread-safe cache of resolution tables, optionally persisted to disk."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to persist tables in; None keeps them in memory only
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._tables: Dict[str, ResolutionTable] = {}
+        self._lock = threading.Lock()
+
+    def table(self, workspace_root: Path) -> ResolutionTable:
+        """Get the resolution table for the current interpreter and a workspace.
+
+        The table is loaded from disk on first use and discarded if sys.path,
+        installed packages or the workspace layout changed since it was built.
+
+        Args:
+            workspace_root: Workspace the modules are resolved against
+
+        Returns:
+            The table to look up and record resolutions in
+        """
+        scope = self._scope(workspace_root)
+        fingerprint = self._fingerprint(workspace_root)
+        with self._lock:
+            table = self._tables.get(scope)
+            if table is None:
+                table = self._load(scope)
+            if table is None or table.fingerprint != fingerprint:
+                if table is not None:
+                    logger.debug("Environment or workspace changed, discarding module resolution cache")
+                table = ResolutionTable(scope=scope, fingerprint=fingerprint)
+            self._tables[scope] = table
+            return table
+
+    def save(self, table: ResolutionTable) -> None:
+        """Persist a table if it has new entries.
+
+        Args:
+            table: Table returned by table()
+        """
+        if self.cache_dir is None or not table.dirty:
+            return
+        with table._lock:
+            data = {
+                'version': RESOLUTION_CACHE_FORMAT_VERSION,
+                'fingerprint': table.fingerprint,
+                'modules': dict(table.modules)
+            }
+            table.dirty = False
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._write_json_atomic(self.cache_dir / f"{table.scope}.json", data)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to save module resolution cache to {self.cache_dir}: {str(e)}")
+
+    def clear(self) -> None:
+        """Drop all tables, in memory and on disk."""
+        with self._lock:
+            self._tables.clear()
+            if self.cache_dir is not None:
+                for table_path in self.cache_dir.glob('*.json'):
+                    try:
+                        table_path.unlink()
+                    except OSError:
+                        pass
+
+    def _load(self, scope: str) -> Optional[ResolutionTable]:
+        """Load a persisted table. Caller must hold the lock."""
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self.cache_dir / f"{scope}.json", 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('version') != RESOLUTION_CACHE_FORMAT_VERSION:
+            return None
+        modules = data.get('modules')
+        if not isinstance(modules, dict):
+            return None
+        return ResolutionTable(scope=scope, fingerprint=str(data.get('fingerprint')), modules=modules)
+
+    @staticmethod
+    def _scope(workspace_root: Path) -> str:
+        """Key a table by interpreter and workspace."""
+        payload = f"{sys.executable}\0{os.path.realpath(str(workspace_root))}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+    @staticmethod
+    def _fingerprint(workspace_root: Path) -> str:
+        """Fingerprint sys.path and the directories resolution probes."""
+        workspace_root = Path(workspace_root)
+        directories = [entry or os.getcwd() for entry in sys.path]
+        directories += [str(workspace_root), str(workspace_root / 'src')]
+        parts = [sys.version]
+        for directory in directories:
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                mtime = None
+            parts.append(f"{directory}:{mtime}")
+        return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+
+    def _write_json_atomic(self, path: Path, data: Dict[str, Any]) -> None:
+        """Write JSON so concurrent readers never see a partial file."""
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+
+_shared_cache: Optional[ModuleResolutionCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_resolution_cache() -> ModuleResolutionCache:
+    """Get the process-wide resolution cache persisted under ~/.kaizen."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ModuleResolutionCache(DEFAULT_RESOLUTION_CACHE_DIR)
+        return _shared_cache
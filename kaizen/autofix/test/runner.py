@@ -3,10 +3,14 @@
 import os
 import sys
 import logging
+import queue
 import yaml
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, Generator, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass
 import traceback
 from datetime import datetime
@@ -19,12 +23,19 @@ except ImportError:
     DOTENV_AVAILABLE = False
 
 from .test_case import TestCase, TestStatus, LLMEvaluator, AssertionRunner
+from .agent_cache import LIFECYCLE_PER_STEP
+from .evaluation_cache import EvaluationCache
+from .evaluation_policy import EvaluationPolicy
+from .resolution_cache import ModuleResolutionCache
 from .code_region import CodeRegionExtractor, CodeRegionExecutor, RegionInfo, RegionType, AgentEntryPoint
 from .input_parser import InputParser, InputParsingError
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Default number of concurrent test steps when parallel execution is enabled
+DEFAULT_MAX_WORKERS = 4
+
 @dataclass
 class TestSummary:
     """Data class for test summary statistics."""
@@ -42,20 +53,41 @@ class TestSummary:
             'error_regions': self.error_regions
         }
 
+@dataclass
+class _PendingTestCase:
+    """A test case that has been executed and is awaiting LLM evaluation."""
+    test_case: Dict
+    test_case_obj: TestCase
+    input_data: Any
+    parsed_inputs: List[Any]
+    actual_output: Any
+    tracked_values: Dict[str, Any]
+    assertion_results: List[Dict]
+    framework: Optional[str]
+    region_info: RegionInfo
+    agent_entry_point_dict: Optional[Dict]
+    evaluation_future: Future
+
 class TestRunner:
     """Runs tests using the code region execution system with support for multiple inputs."""
     
-    def __init__(self, test_config: Dict, verbose: bool = False):
+    def __init__(self, test_config: Dict, verbose: bool = False, workspace_root: Optional[Path] = None,
+                 resolution_cache: Optional[ModuleResolutionCache] = None):
         """Initialize the test runner.
         
         Args:
             test_config: Test configuration dictionary
             verbose: Whether to show detailed debug information
+            workspace_root: Optional workspace to run in, for example a
+                sandbox. Detected from the current directory if not given.
+            resolution_cache: Optional cache of module resolutions, for
+                example an in-memory one for a short-lived sandbox. Defaults
+                to the process-wide cache persisted under ~/.kaizen.
         """
         self.test_config = test_config
         self.verbose = verbose
         self._validate_config()
-        self.workspace_root = self._find_workspace_root()
+        self.workspace_root = Path(workspace_root) if workspace_root else self._find_workspace_root()
         self.config_file_path = Path(test_config.get('config_file', ''))
         
         # Load environment variables BEFORE initializing other components
@@ -64,12 +96,43 @@ class TestRunner:
         # Get imported dependencies from config
         imported_dependencies = test_config.get('imported_dependencies', {})
         
-        self.code_region_extractor = CodeRegionExtractor()
+        # Dependencies of an explicitly given workspace are resolved in it
+        self.code_region_extractor = CodeRegionExtractor(
+            self.workspace_root if workspace_root else None,
+            resolution_cache
+        )
         self.code_region_executor = CodeRegionExecutor(self.workspace_root, imported_dependencies)
-        self.llm_evaluator = LLMEvaluator(better_ai=self.test_config.get('better_ai', False))
+        settings = self.test_config.get('settings') or {}
+        self.evaluation_cache = None if self.test_config.get('no_eval_cache', False) else EvaluationCache()
+        self.llm_evaluator = LLMEvaluator(
+            better_ai=self.test_config.get('better_ai', False),
+            max_concurrency=settings.get('evaluation_concurrency'),
+            cache=self.evaluation_cache
+        )
+        self.evaluation_policy = EvaluationPolicy(
+            settings.get('evaluation_policy'),
+            settings.get('evaluation_sample_rate'),
+            normalized_match=settings.get('evaluation_normalized_match', False),
+            # Auto-fix prompts are built from the LLM's reasoning on failed steps
+            evaluate_failed_assertions=self.test_config.get('auto_fix', False)
+        )
         self.assertion_runner = AssertionRunner()
+        self._compile_assertions()
         self.input_parser = InputParser()
         
+        # Region extraction shares dependency resolver state, so it is
+        # serialized when steps run concurrently
+        self._extraction_lock = threading.Lock()
+        
+    def _compile_assertions(self) -> None:
+        """Compile every step's assertions once, before any step runs."""
+        for step in self.test_config.get('steps') or []:
+            if not isinstance(step, dict):
+                continue
+            compiled = self.assertion_runner.compile(step.get('assertions'))
+            for error in compiled.errors:
+                logger.warning(f"Invalid assertion in step '{step.get('name', 'Unknown')}': {error}")
+    
     def _validate_config(self) -> None:
         """Validate the test configuration structure."""
         required_fields = ['name', 'file_path']
@@ -150,6 +213,20 @@ class TestRunner:
         Returns:
             TestCaseResult containing test case results
         """
+        return self._complete_test_case(self._start_test_case(test_case, test_file_path))
+    
+    def _start_test_case(self, test_case: Dict, test_file_path: Path):
+        """
+        Execute a test case and submit its LLM evaluation without waiting for it.
+        
+        Args:
+            test_case: Test case configuration
+            test_file_path: Path to the test file
+            
+        Returns:
+            _PendingTestCase awaiting evaluation, or a final TestCaseResult if
+            the test case errored before evaluation
+        """
         # Import here to avoid circular import
         from ...cli.commands.models import TestCaseResult, TestStatus as UnifiedTestStatus
         
@@ -200,35 +277,38 @@ class TestRunner:
                     module=agent_entry_point_dict['module'],
                     class_name=agent_entry_point_dict.get('class'),
                     method=agent_entry_point_dict.get('method'),
-                    fallback_to_function=agent_entry_point_dict.get('fallback_to_function', True)
+                    fallback_to_function=agent_entry_point_dict.get('fallback_to_function', True),
+                    lifecycle=agent_entry_point_dict.get('lifecycle', LIFECYCLE_PER_STEP)
                 )
                 
                 # Use the new agent entry point system
                 if self.verbose:
                     logger.debug(f"DEBUG: Using agent entry point system: {agent_entry_point}")
                 
-                # Validate the entry point
-                logger.debug(f"DEBUG: About to validate entry point. Language: '{language}' (type: {type(language)})")
-                if language == "typescript":
-                    logger.debug(f"DEBUG: Using TypeScript validation")
-                    if not self.code_region_extractor.validate_entry_point_ts(agent_entry_point, test_file_path):
-                        raise ValueError(f"Invalid agent entry point(ts): {agent_entry_point}")
-                else:
-                    logger.debug(f"DEBUG: Using Python validation")
-                    if not self.code_region_extractor.validate_entry_point(agent_entry_point, test_file_path):
-                        raise ValueError(f"Invalid agent entry point(python): {agent_entry_point}")
+                # Validate and extract the entry point region
+                with self._extraction_lock:
+                    # Validate the entry point
+                    logger.debug(f"DEBUG: About to validate entry point. Language: '{language}' (type: {type(language)})")
+                    if language == "typescript":
+                        logger.debug(f"DEBUG: Using TypeScript validation")
+                        if not self.code_region_extractor.validate_entry_point_ts(agent_entry_point, test_file_path):
+                            raise ValueError(f"Invalid agent entry point(ts): {agent_entry_point}")
+                    else:
+                        logger.debug(f"DEBUG: Using Python validation")
+                        if not self.code_region_extractor.validate_entry_point(agent_entry_point, test_file_path):
+                            raise ValueError(f"Invalid agent entry point(python): {agent_entry_point}")
                 
-                # Extract region using entry point based on language
-                if language == "typescript":
-                    region_info = self.code_region_extractor.extract_region_by_entry_point_ts(
-                        test_file_path, 
-                        agent_entry_point
-                    )
-                else:
-                    region_info = self.code_region_extractor.extract_region_by_entry_point(
-                        test_file_path, 
-                        agent_entry_point
-                    )
+                    # Extract region using entry point based on language
+                    if language == "typescript":
+                        region_info = self.code_region_extractor.extract_region_by_entry_point_ts(
+                            test_file_path, 
+                            agent_entry_point
+                        )
+                    else:
+                        region_info = self.code_region_extractor.extract_region_by_entry_point(
+                            test_file_path, 
+                            agent_entry_point
+                        )
                 
             
             if self.verbose:
@@ -304,7 +384,8 @@ class TestRunner:
                     method_name=method_name,
                     input_data=parsed_inputs,
                     tracked_variables=set(),  # Empty set for no specific tracking
-                    timeout=timeout
+                    timeout=timeout,
+                    use_cache=bool((self.test_config.get('agent') or {}).get('cache_results'))
                 )
             else:
                 execution_result = self.code_region_executor.execute_region_with_tracking(
@@ -326,15 +407,69 @@ class TestRunner:
             if self.verbose:
                 logger.debug(f"DEBUG: Assertions completed")
             
-            # Run LLM evaluation
-            if self.verbose:
-                logger.debug(f"DEBUG: About to evaluate with LLM...")
-            llm_evaluation = self.llm_evaluator.evaluate_result(test_case_obj, actual_output, tracked_values)
+            # Submit LLM evaluation unless the assertions or the expected
+            # output already decide the step; it completes in the background
+            # so the caller can start executing the next step in the meantime
+            screened_evaluation = self.evaluation_policy.screen(test_case_obj, actual_output, assertion_results)
+            if screened_evaluation is not None:
+                evaluation_future = Future()
+                evaluation_future.set_result(screened_evaluation)
+            else:
+                if self.verbose:
+                    logger.debug(f"DEBUG: Submitting LLM evaluation...")
+                evaluation_future = self.llm_evaluator.submit_evaluation(test_case_obj, actual_output, tracked_values)
+            
+            return _PendingTestCase(
+                test_case=test_case,
+                test_case_obj=test_case_obj,
+                input_data=input_data,
+                parsed_inputs=parsed_inputs,
+                actual_output=actual_output,
+                tracked_values=tracked_values,
+                assertion_results=assertion_results,
+                framework=framework,
+                region_info=region_info,
+                agent_entry_point_dict=agent_entry_point_dict,
+                evaluation_future=evaluation_future
+            )
+            
+        except Exception as e:
+            logger.error(f"Error in test case {test_case.get('name', 'Unknown')}: {str(e)}")
+            logger.error(f"Full traceback: {traceback.format_exc()}")
+            return TestCaseResult(
+                name=test_case.get('name', 'Unknown'),
+                status=UnifiedTestStatus.ERROR,
+                input=test_case.get('input'),
+                expected_output=test_case.get('expected_output'),
+                error_message=str(e),
+                error_details=traceback.format_exc(),
+                timestamp=datetime.now()
+            )
+    
+    def _complete_test_case(self, pending):
+        """
+        Wait for a test case's LLM evaluation and build its final result.
+        
+        Args:
+            pending: Value returned by _start_test_case
+            
+        Returns:
+            TestCaseResult containing test case results
+        """
+        # Import here to avoid circular import
+        from ...cli.commands.models import TestCaseResult, TestStatus as UnifiedTestStatus
+        
+        if not isinstance(pending, _PendingTestCase):
+            return pending
+        
+        test_case = pending.test_case
+        try:
+            llm_evaluation = pending.evaluation_future.result()
             if self.verbose:
                 logger.debug(f"DEBUG: LLM evaluation completed")
             
             # Determine overall test status
-            status = self._determine_test_status(assertion_results, llm_evaluation)
+            status = self._determine_test_status(pending.assertion_results, llm_evaluation)
             
             # Convert to unified TestStatus
             unified_status = self._convert_to_unified_status(status)
@@ -343,21 +478,21 @@ class TestRunner:
             return TestCaseResult(
                 name=test_case.get('name', 'Unknown'),
                 status=unified_status,
-                input=input_data,
-                expected_output=test_case_obj.expected_output,
-                actual_output=actual_output,
+                input=pending.input_data,
+                expected_output=pending.test_case_obj.expected_output,
+                actual_output=pending.actual_output,
                 error_message=None if unified_status == UnifiedTestStatus.PASSED else "Test failed",
                 evaluation=llm_evaluation,
                 metadata={
-                    'parsed_inputs': parsed_inputs,
-                    'tracked_values': tracked_values,
-                    'assertions': assertion_results,
-                    'framework': framework,
+                    'parsed_inputs': pending.parsed_inputs,
+                    'tracked_values': pending.tracked_values,
+                    'assertions': pending.assertion_results,
+                    'framework': pending.framework,
                     'region_info': {
-                        'type': region_info.type.value,
-                        'name': region_info.name,
-                        'methods': region_info.class_methods,
-                        'entry_point': agent_entry_point_dict
+                        'type': pending.region_info.type.value,
+                        'name': pending.region_info.name,
+                        'methods': pending.region_info.class_methods,
+                        'entry_point': pending.agent_entry_point_dict
                     }
                 },
                 timestamp=datetime.now()
@@ -403,15 +538,113 @@ class TestRunner:
         }
         return status_mapping.get(legacy_status, UnifiedTestStatus.ERROR)
     
-    def run_tests(self, test_file_path: Path):
+    def run_tests(
+        self,
+        test_file_path: Path,
+        step_names: Optional[List[str]] = None,
+        max_failures: Optional[int] = None,
+        on_result: Optional[Callable[[Any], None]] = None
+    ):
         """
         Run tests and return unified TestExecutionResult.
         
         Args:
             test_file_path: Path to the test file
+            step_names: Optional names of the steps to run, in the order to
+                run them. All steps run in configuration order if not given.
+            max_failures: Optional number of failing steps after which no
+                further steps are started
+            on_result: Optional callback called with each TestCaseResult as
+                soon as its step is finished. With parallel execution results
+                arrive in completion order.
+            
+        Returns:
+            TestExecutionResult containing the results of the steps that ran
+        """
+        return self._run_tests(test_file_path, step_names, max_failures, on_result, threading.Event())
+    
+    def iter_results(
+        self,
+        test_file_path: Path,
+        step_names: Optional[List[str]] = None,
+        max_failures: Optional[int] = None
+    ) -> Generator[Any, None, Any]:
+        """Run tests and yield each TestCaseResult as soon as its step finishes.
+        
+        The steps run on a background thread. Closing the iterator early, for
+        example by breaking out of a for loop over it, stops any further steps
+        from starting; steps already running are finished first. Call close()
+        on an iterator kept in a variable to stop it.
+        
+        Example:
+            >>> failures = 0
+            >>> for result in runner.iter_results(Path('agent.py')):
+            ...     failures += result.is_failed()
+            ...     if failures >= 3:
+            ...         break
+        
+        Args:
+            test_file_path: Path to the test file
+            step_names: Optional names of the steps to run, in the order to
+                run them. All steps run in configuration order if not given.
+            max_failures: Optional number of failing steps after which no
+                further steps are started
+            
+        Yields:
+            TestCaseResult objects in completion order
+            
+        Returns:
+            The TestExecutionResult of the run, as the generator's return value
+        """
+        results = queue.Queue()
+        stop_event = threading.Event()
+        finished = object()
+        outcome = {}
+        
+        def run() -> None:
+            try:
+                outcome['result'] = self._run_tests(test_file_path, step_names, max_failures, results.put, stop_event)
+            except BaseException as e:
+                outcome['error'] = e
+            finally:
+                results.put(finished)
+        
+        worker = threading.Thread(target=run, name="kaizen-results", daemon=True)
+        worker.start()
+        try:
+            while True:
+                result = results.get()
+                if result is finished:
+                    break
+                yield result
+        finally:
+            stop_event.set()
+            worker.join()
+        
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome.get('result')
+    
+    def _run_tests(
+        self,
+        test_file_path: Path,
+        step_names: Optional[List[str]],
+        max_failures: Optional[int],
+        on_result: Optional[Callable[[Any], None]],
+        stop_event: threading.Event
+    ):
+        """Run tests until done or until the stop event is set.
+        
+        Args:
+            test_file_path: Path to the test file
+            step_names: Optional names of the steps to run
+            max_failures: Optional number of failing steps after which no
+                further steps are started
+            on_result: Optional callback called with each finished result
+            stop_event: Event that stops further steps from starting when set
             
         Returns:
-            TestExecutionResult containing all test results
+            TestExecutionResult containing the results of the steps that ran
         """
         # Import here to avoid circular import
         from ...cli.commands.models import TestExecutionResult, TestStatus as UnifiedTestStatus
@@ -430,6 +663,10 @@ class TestRunner:
         
         logger.info(f"Test configuration loaded: {self.test_config.get('name', 'Unknown Test')}")
         
+        # Snapshot cache and policy counters so the summary reports this run only
+        cache_stats_before = self.evaluation_cache.get_stats() if self.evaluation_cache else None
+        policy_stats_before = self.evaluation_policy.get_stats()
+        
         try:
             # Resolve the file path relative to config file location
             if self.config_file_path:
@@ -446,33 +683,27 @@ class TestRunner:
             logger.info(f"Test file found: {resolved_path}")
             
             # Use 'steps' instead of 'tests' for the new format
-            test_steps = self.test_config.get('steps', [])
+            test_steps = self._select_test_steps(self.test_config.get('steps', []), step_names)
             if self.verbose:
                 logger.debug(f"DEBUG: Found {len(test_steps)} test steps to run")
             logger.info(f"Running {len(test_steps)} test steps")
             
-            for i, test_case in enumerate(test_steps):
-                if self.verbose:
-                    logger.debug(f"DEBUG: Starting test case {i+1}/{len(test_steps)}: {test_case.get('name', 'Unknown')}")
-                test_name = test_case.get('name', 'Unknown')
-                logger.info(f"Running test case: {test_name}")
-                
-                if self.verbose:
-                    logger.debug(f"DEBUG: About to call _run_test_case for: {test_name}")
-                test_case_result = self._run_test_case(test_case, resolved_path)
-                if self.verbose:
-                    logger.debug(f"DEBUG: _run_test_case completed for: {test_name}")
-                    logger.debug(f"Test result: {test_case_result}")
-                
-                # Add the test case result to the unified result
-                test_result.add_test_case(test_case_result)
-                
-                # Show test case completion status
-                status_emoji = "✅" if test_case_result.status.value == "passed" else "❌"
-                logger.info(f"{status_emoji} Test case completed: {test_name}")
-                
-                if self.verbose:
-                    logger.debug(f"DEBUG: Completed test case {i+1}/{len(test_steps)}: {test_name}")
+            parallel, max_workers = self._get_parallel_settings(len(test_steps))
+            if parallel:
+                logger.info(f"Running test steps in parallel with {max_workers} workers")
+                test_result.add_test_cases(
+                    self._run_test_steps_parallel(test_steps, resolved_path, max_workers, max_failures, on_result, stop_event)
+                )
+            else:
+                test_result.add_test_cases(
+                    self._run_test_steps_pipelined(test_steps, resolved_path, max_failures, on_result, stop_event)
+                )
+            
+            skipped = len(test_steps) - len(test_result.test_cases)
+            if skipped and stop_event.is_set():
+                logger.info(f"⏭️ Stopped on request, skipped {skipped} remaining step(s)")
+            elif skipped:
+                logger.info(f"⏭️ Stopped after {max_failures} failing step(s), skipped {skipped} remaining step(s)")
             
             logger.info("All test cases completed")
             
@@ -487,6 +718,30 @@ class TestRunner:
             test_result.error_message = f"Test execution failed: {str(e)}"
             test_result.error_details = traceback.format_exc()
             test_result.status = UnifiedTestStatus.ERROR
+        finally:
+            # Stop the evaluator's background event loop; the next run starts
+            # a fresh one if it needs it
+            self.llm_evaluator.close()
+            # Release the TypeScript worker so the next run loads fresh sources
+            self.code_region_executor.stop_ts_worker()
+            self.code_region_executor.release_agent_instances()
+        
+        policy_stats = self.evaluation_policy.get_stats()
+        test_result.summary.eval_skipped = policy_stats['skipped'] - policy_stats_before['skipped']
+        if test_result.summary.eval_skipped:
+            logger.info(
+                f"Evaluation policy '{self.evaluation_policy.policy}': skipped "
+                f"{test_result.summary.eval_skipped} LLM evaluation(s) already decided without the LLM"
+            )
+        
+        if cache_stats_before is not None:
+            cache_stats = self.evaluation_cache.get_stats()
+            test_result.summary.eval_cache_hits = cache_stats['hits'] - cache_stats_before['hits']
+            test_result.summary.eval_cache_misses = cache_stats['misses'] - cache_stats_before['misses']
+            logger.info(
+                f"Evaluation cache: {test_result.summary.eval_cache_hits} hits, "
+                f"{test_result.summary.eval_cache_misses} misses"
+            )
         
         logger.info("Test execution completed")
         
@@ -495,6 +750,261 @@ class TestRunner:
         
         return test_result
 
+    def _select_test_steps(self, test_steps: List[Dict], step_names: Optional[List[str]]) -> List[Dict]:
+        """Pick the steps to run, in the requested order.
+        
+        Args:
+            test_steps: All configured test steps
+            step_names: Names of the steps to run, or None for all steps
+            
+        Returns:
+            List of test case configurations to run
+        """
+        if step_names is None:
+            return test_steps
+        
+        steps_by_name = {}
+        for test_case in test_steps:
+            steps_by_name.setdefault(test_case.get('name'), test_case)
+        
+        selected = []
+        for name in step_names:
+            if name in steps_by_name:
+                selected.append(steps_by_name[name])
+            else:
+                logger.warning(f"Requested test step not found in configuration: {name}")
+        return selected
+    
+    @staticmethod
+    def _is_known_failure(pending) -> bool:
+        """Check whether a started test step is already known to fail.
+        
+        A failed assertion fails the step regardless of the LLM evaluation,
+        so the outcome is known before the evaluation finishes.
+        """
+        if isinstance(pending, _PendingTestCase):
+            return any(not result['passed'] for result in pending.assertion_results)
+        return pending.is_failed()
+    
+    def _get_parallel_settings(self, step_count: int) -> Tuple[bool, int]:
+        """Resolve parallel execution settings from the test configuration.
+        
+        Args:
+            step_count: Number of test steps to run
+            
+        Returns:
+            Tuple of (whether to run in parallel, number of worker threads)
+        """
+        settings = self.test_config.get('settings') or {}
+        parallel = bool(settings.get('parallel', False))
+        max_workers = settings.get('max_workers') or DEFAULT_MAX_WORKERS
+        
+        try:
+            max_workers = int(max_workers)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid max_workers setting '{max_workers}', using default of {DEFAULT_MAX_WORKERS}")
+            max_workers = DEFAULT_MAX_WORKERS
+        
+        max_workers = max(1, min(max_workers, step_count))
+        
+        # A single worker is equivalent to sequential execution
+        if max_workers == 1:
+            parallel = False
+        
+        return parallel, max_workers
+    
+    def _run_test_step(self, index: int, total: int, test_case: Dict, resolved_path: Path):
+        """Run one test step with progress logging.
+        
+        Args:
+            index: Zero-based position of the step in the configuration
+            total: Total number of steps
+            test_case: Test case configuration
+            resolved_path: Resolved path to the test file
+            
+        Returns:
+            TestCaseResult for the step
+        """
+        pending = self._start_test_step(index, total, test_case, resolved_path)
+        return self._finish_test_step(index, total, test_case, pending)
+    
+    def _start_test_step(self, index: int, total: int, test_case: Dict, resolved_path: Path):
+        """Execute one test step, leaving its LLM evaluation in flight.
+        
+        Args:
+            index: Zero-based position of the step in the configuration
+            total: Total number of steps
+            test_case: Test case configuration
+            resolved_path: Resolved path to the test file
+            
+        Returns:
+            Value to pass to _finish_test_step
+        """
+        test_name = test_case.get('name', 'Unknown')
+        if self.verbose:
+            logger.debug(f"DEBUG: Starting test case {index+1}/{total}: {test_name}")
+        logger.info(f"Running test case: {test_name}")
+        
+        if self.verbose:
+            logger.debug(f"DEBUG: About to call _start_test_case for: {test_name}")
+        return self._start_test_case(test_case, resolved_path)
+    
+    def _finish_test_step(self, index: int, total: int, test_case: Dict, pending):
+        """Wait for a started test step to be evaluated and log its outcome.
+        
+        Args:
+            index: Zero-based position of the step in the configuration
+            total: Total number of steps
+            test_case: Test case configuration
+            pending: Value returned by _start_test_step
+            
+        Returns:
+            TestCaseResult for the step
+        """
+        test_name = test_case.get('name', 'Unknown')
+        test_case_result = self._complete_test_case(pending)
+        if self.verbose:
+            logger.debug(f"DEBUG: Test case evaluation completed for: {test_name}")
+            logger.debug(f"Test result: {test_case_result}")
+        
+        # Show test case completion status
+        status_emoji = "✅" if test_case_result.status.value == "passed" else "❌"
+        logger.info(f"{status_emoji} Test case completed: {test_name}")
+        
+        if self.verbose:
+            logger.debug(f"DEBUG: Completed test case {index+1}/{total}: {test_name}")
+        
+        return test_case_result
+    
+    def _run_test_steps_pipelined(
+        self,
+        test_steps: List[Dict],
+        resolved_path: Path,
+        max_failures: Optional[int] = None,
+        on_result: Optional[Callable[[Any], None]] = None,
+        stop_event: Optional[threading.Event] = None
+    ) -> List:
+        """Run test steps one at a time, overlapping evaluation with execution.
+        
+        Agent execution stays sequential, but each step's LLM evaluation is
+        left in flight while the following steps execute. At most the
+        evaluator's concurrency limit of evaluations are outstanding.
+        
+        Args:
+            test_steps: List of test case configurations
+            resolved_path: Resolved path to the test file
+            max_failures: Optional number of failing steps after which no
+                further steps are started
+            on_result: Optional callback called with each finished result
+            stop_event: Optional event that stops further steps from starting
+                when set
+            
+        Returns:
+            List of TestCaseResult objects in step order
+        """
+        results = []
+        in_flight = deque()
+        max_in_flight = self.llm_evaluator.max_concurrency
+        total = len(test_steps)
+        failures = 0
+        
+        for i, test_case in enumerate(test_steps):
+            if stop_event is not None and stop_event.is_set():
+                break
+            if max_failures is not None:
+                known_failures = failures + sum(1 for _, _, pending in in_flight if self._is_known_failure(pending))
+                if known_failures >= max_failures:
+                    break
+            
+            pending = self._start_test_step(i, total, test_case, resolved_path)
+            in_flight.append((i, test_case, pending))
+            
+            # Collect finished evaluations in order, and block only when
+            # too many are outstanding
+            while in_flight and (len(in_flight) > max_in_flight or self._is_ready(in_flight[0][2])):
+                index, finished_case, finished = in_flight.popleft()
+                result = self._finish_test_step(index, total, finished_case, finished)
+                failures += result.is_failed()
+                results.append(result)
+                self._notify_result(on_result, result)
+        
+        while in_flight:
+            index, test_case, pending = in_flight.popleft()
+            result = self._finish_test_step(index, total, test_case, pending)
+            results.append(result)
+            self._notify_result(on_result, result)
+        
+        return results
+    
+    @staticmethod
+    def _notify_result(on_result: Optional[Callable[[Any], None]], result) -> None:
+        """Pass a finished result to the result callback.
+        
+        A failing callback is logged and does not stop the test run.
+        """
+        if on_result is None:
+            return
+        try:
+            on_result(result)
+        except Exception as e:
+            logger.warning(f"Result callback failed for test case '{result.name}': {str(e)}")
+    
+    @staticmethod
+    def _is_ready(pending) -> bool:
+        """Check whether a started test step can be finished without blocking."""
+        return not isinstance(pending, _PendingTestCase) or pending.evaluation_future.done()
+    
+    def _run_test_steps_parallel(
+        self,
+        test_steps: List[Dict],
+        resolved_path: Path,
+        max_workers: int,
+        max_failures: Optional[int] = None,
+        on_result: Optional[Callable[[Any], None]] = None,
+        stop_event: Optional[threading.Event] = None
+    ) -> List:
+        """Run test steps concurrently on a bounded thread pool.
+        
+        Steps are dominated by agent calls and LLM evaluation, which are
+        network-bound, so threads overlap the waiting. Results are returned
+        in configuration order regardless of completion order.
+        
+        Args:
+            test_steps: List of test case configurations
+            resolved_path: Resolved path to the test file
+            max_workers: Maximum number of steps to run at once
+            max_failures: Optional number of failing steps after which steps
+                that have not started yet are cancelled
+            on_result: Optional callback called with each finished result, in
+                completion order
+            stop_event: Optional event that cancels steps that have not
+                started yet when set
+            
+        Returns:
+            List of TestCaseResult objects in step order
+        """
+        results = [None] * len(test_steps)
+        failures = 0
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="kaizen-step") as executor:
+            futures = {
+                executor.submit(self._run_test_step, i, len(test_steps), test_case, resolved_path): i
+                for i, test_case in enumerate(test_steps)
+            }
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                result = future.result()
+                results[futures[future]] = result
+                failures += result.is_failed()
+                self._notify_result(on_result, result)
+                stop = stop_event is not None and stop_event.is_set()
+                if stop or (max_failures is not None and failures >= max_failures):
+                    for other in futures:
+                        other.cancel()
+        
+        return [result for result in results if result is not None]
+
     def _execute_lifecycle_command(self, command: str, timeout: int = 30) -> bool:
         """Execute a lifecycle command with proper error handling.
         
@@ -0,0 +1,346 @@
+"""Disposable workspaces for testing fixes without touching the user's checkout.
+
+A sandbox is a private copy of the workspace that fixes can be written to and
+tested in. Inside a git repository it is a detached ``git worktree`` with the
+user's uncommitted and untracked files copied over, so only changed files are
+duplicated; elsewhere it is a plain directory copy. Large or ignored
+directories such as ``node_modules`` are linked instead of copied.
+
+Sandboxes live under a shared directory and record the process that owns
+them, so sandboxes left behind by crashed runs are garbage-collected the next
+time a manager starts.
+"""
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Sandbox strategies
+SANDBOX_AUTO = 'auto'
+SANDBOX_WORKTREE = 'worktree'
+SANDBOX_COPY = 'copy'
+SANDBOX_STRATEGIES = (SANDBOX_AUTO, SANDBOX_WORKTREE, SANDBOX_COPY)
+
+# Default location of sandboxes
+DEFAULT_SANDBOX_DIR = Path(tempfile.gettempdir()) / 'kaizen-sandboxes'
+# Sandboxes older than this are collected even if their owner looks alive
+SANDBOX_MAX_AGE_SECONDS = 24 * 60 * 60
+# Sandboxes without metadata younger than this may still be being created
+SANDBOX_CREATION_GRACE_SECONDS = 60
+# Metadata file written into every sandbox directory
+SANDBOX_METADATA_FILE = '.kaizen-sandbox.json'
+
+# Directories never copied into sandboxes
+SANDBOX_IGNORED_DIRS = ('.git', '__pycache__', '.mypy_cache', '.pytest_cache')
+# Large directories linked into sandboxes instead of copied
+SANDBOX_LINKED_DIRS = ('node_modules', '.venv', 'venv')
+
+# Timeout for git commands, in seconds
+GIT_TIMEOUT_SECONDS = 60
+
+
+class SandboxError(Exception):
+    """Raised when a sandbox cannot be created."""
+
+
+@dataclass
+class Sandbox:
+    """A disposable copy of a workspace.
+
+    Attributes:
+        directory: Directory owned by the sandbox
+        root: Copy of the workspace root inside the sandbox
+        workspace_root: Workspace the sandbox was created from
+        strategy: 'worktree' or 'copy'
+        git_root: Top level of the git repository for worktree sandboxes
+    """
+    directory: Path
+    root: Path
+    workspace_root: Path
+    strategy: str
+    git_root: Optional[Path] = None
+
+    def map_path(self, path, relative_to_cwd: bool = True):
+        """Map a path inside the workspace to the same path inside the sandbox.
+
+        Args:
+            path: Path to map
+            relative_to_cwd: Whether relative paths are resolved against the
+                current directory; otherwise they are returned unchanged
+
+        Returns:
+            The mapped path as a string, or the input unchanged if it lies
+            outside the workspace
+        """
+        if not path or (not relative_to_cwd and not os.path.isabs(str(path))):
+            return path
+        try:
+            relative = Path(path).resolve().relative_to(self.workspace_root)
+        except ValueError:
+            return path
+        return str(self.root / relative)
+
+    def contains(self, path) -> bool:
+        """Check whether a path of the workspace can be mapped into the sandbox."""
+        try:
+            Path(path).resolve().relative_to(self.workspace_root)
+            return True
+        except ValueError:
+            return False
+
+
+class SandboxManager:
+    """Creates, removes and garbage-collects sandboxes."""
+
+    def __init__(self, base_dir: Optional[Path] = None, strategy: str = SANDBOX_AUTO):
+        """Initialize the manager.
+
+        Args:
+            base_dir: Directory sandboxes are created in
+            strategy: 'auto' (worktree inside a git repository, copy
+                otherwise), 'worktree' or 'copy'
+        """
+        if strategy not in SANDBOX_STRATEGIES:
+            logger.warning(
+                f"Unknown sandbox strategy '{strategy}', using '{SANDBOX_AUTO}'. "
+                f"Must be one of {list(SANDBOX_STRATEGIES)}"
+            )
+            strategy = SANDBOX_AUTO
+        self.base_dir = Path(base_dir or DEFAULT_SANDBOX_DIR)
+        self.strategy = strategy
+
+    def create(self, workspace_root: Path) -> Sandbox:
+        """Create a sandbox of a workspace.
+
+        Args:
+            workspace_root: Workspace to copy
+
+        Returns:
+            The new sandbox
+
+        Raises:
+            SandboxError: If the sandbox cannot be created
+        """
+        workspace_root = Path(workspace_root).resolve()
+        directory = self.base_dir / f"{os.getpid()}-{uuid.uuid4().hex[:12]}"
+        directory.mkdir(parents=True)
+        git_root = self._find_git_root(workspace_root) if self.strategy != SANDBOX_COPY else None
+        if self.strategy == SANDBOX_WORKTREE and git_root is None:
+            shutil.rmtree(directory, ignore_errors=True)
+            raise SandboxError(f"{workspace_root} is not inside a git repository")
+
+        strategy = SANDBOX_WORKTREE if git_root is not None else SANDBOX_COPY
+        self._write_metadata(directory, workspace_root, strategy, git_root)
+        try:
+            if strategy == SANDBOX_WORKTREE:
+                try:
+                    root = self._create_worktree(directory, workspace_root, git_root)
+                except Exception as e:
+                    if self.strategy == SANDBOX_WORKTREE:
+                        raise
+                    # For example a repository without commits
+                    logger.debug(f"Could not create worktree of {git_root}, copying instead: {str(e)}")
+                    self._remove_directory(directory, strategy, git_root)
+                    directory.mkdir(parents=True)
+                    strategy, git_root = SANDBOX_COPY, None
+                    self._write_metadata(directory, workspace_root, strategy, git_root)
+                    root = self._create_copy(directory, workspace_root)
+            else:
+                root = self._create_copy(directory, workspace_root)
+        except Exception as e:
+            self._remove_directory(directory, strategy, git_root)
+            raise SandboxError(f"Failed to create sandbox of {workspace_root}: {str(e)}") from e
+
+        logger.debug(f"Created {strategy} sandbox of {workspace_root} in {directory}")
+        return Sandbox(
+            directory=directory,
+            root=root,
+            workspace_root=workspace_root,
+            strategy=strategy,
+            git_root=git_root
+        )
+
+    def remove(self, sandbox: Sandbox) -> None:
+        """Delete a sandbox.
+
+        Args:
+            sandbox: Sandbox to delete
+        """
+        self._remove_directory(sandbox.directory, sandbox.strategy, sandbox.git_root)
+
+    def collect_garbage(self) -> int:
+        """Delete sandboxes whose owning process has exited.
+
+        Returns:
+            Number of sandboxes deleted
+        """
+        if not self.base_dir.exists():
+            return 0
+        removed = 0
+        for directory in self.base_dir.iterdir():
+            if not directory.is_dir():
+                continue
+            metadata = self._read_metadata(directory)
+            if metadata is None:
+                try:
+                    if time.time() - directory.stat().st_mtime < SANDBOX_CREATION_GRACE_SECONDS:
+                        continue
+                except OSError:
+                    continue
+            elif not self._is_stale(metadata):
+                continue
+            metadata = metadata or {}
+            git_root = metadata.get('git_root')
+            self._remove_directory(
+                directory,
+                metadata.get('strategy', SANDBOX_COPY),
+                Path(git_root) if git_root else None
+            )
+            removed += 1
+        if removed:
+            logger.info(f"Removed {removed} stale sandbox(es) from {self.base_dir}")
+        return removed
+
+    def _create_worktree(self, directory: Path, workspace_root: Path, git_root: Path) -> Path:
+        """Create a detached worktree and copy the user's uncommitted files into it."""
+        checkout = directory / 'worktree'
+        self._git(git_root, 'worktree', 'add', '--detach', str(checkout), 'HEAD')
+
+        # Bring tracked changes, deletions and untracked files over
+        changed = self._git(git_root, 'diff', '--name-only', '--no-renames', '-z', 'HEAD')
+        untracked = self._git(git_root, 'ls-files', '--others', '--exclude-standard', '-z')
+        for name in self._split_names(changed) + self._split_names(untracked):
+            source = git_root / name
+            target = checkout / name
+            if source.is_file() or source.is_symlink():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, target, follow_symlinks=False)
+            elif target.exists() and not source.exists():
+                target.unlink()
+
+        # Ignored files (.env, build output, dependencies) are linked
+        ignored = self._git(git_root, 'ls-files', '--others', '--ignored', '--exclude-standard', '--directory', '-z')
+        for name in self._split_names(ignored):
+            name = name.rstrip('/')
+            if Path(name).name in SANDBOX_IGNORED_DIRS:
+                continue
+            target = checkout / name
+            if target.exists() or target.is_symlink() or not target.parent.exists():
+                continue
+            source = git_root / name
+            os.symlink(source, target, target_is_directory=source.is_dir())
+
+        return checkout / workspace_root.relative_to(git_root)
+
+    def _create_copy(self, directory: Path, workspace_root: Path) -> Path:
+        """Copy the workspace, linking large directories."""
+        checkout = directory / workspace_root.name
+
+        def ignore(current: str, names: List[str]) -> List[str]:
+            return [name for name in names if name in SANDBOX_IGNORED_DIRS or name in SANDBOX_LINKED_DIRS]
+
+        shutil.copytree(workspace_root, checkout, ignore=ignore, symlinks=True)
+        for current, dirs, _ in os.walk(workspace_root):
+            for name in list(dirs):
+                if name in SANDBOX_IGNORED_DIRS:
+                    dirs.remove(name)
+                elif name in SANDBOX_LINKED_DIRS:
+                    dirs.remove(name)
+                    source = Path(current) / name
+                    link = checkout / source.relative_to(workspace_root)
+                    if link.parent.exists():
+                        os.symlink(source, link, target_is_directory=True)
+        return checkout
+
+    def _remove_directory(self, directory: Path, strategy: str, git_root: Optional[Path]) -> None:
+        """Delete a sandbox directory and unregister its worktree."""
+        if strategy == SANDBOX_WORKTREE and git_root is not None:
+            try:
+                self._git(git_root, 'worktree', 'remove', '--force', str(directory / 'worktree'))
+            except Exception as e:
+                logger.debug(f"Could not remove worktree in {directory}: {str(e)}")
+        shutil.rmtree(directory, ignore_errors=True)
+        if strategy == SANDBOX_WORKTREE and git_root is not None:
+            try:
+                self._git(git_root, 'worktree', 'prune')
+            except Exception as e:
+                logger.debug(f"Could not prune worktrees of {git_root}: {str(e)}")
+
+    def _is_stale(self, metadata: dict) -> bool:
+        """Check whether a sandbox's owner is gone or the sandbox is too old."""
+        if time.time() - metadata.get('created_at', 0) > SANDBOX_MAX_AGE_SECONDS:
+            return True
+        return not self._is_process_alive(metadata.get('pid'))
+
+    @staticmethod
+    def _is_process_alive(pid: Optional[int]) -> bool:
+        """Check whether a process exists."""
+        if not pid:
+            return False
+        if os.name == 'nt':
+            # os.kill would terminate the process on Windows; rely on age
+            return True
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    @staticmethod
+    def _write_metadata(directory: Path, workspace_root: Path, strategy: str, git_root: Optional[Path]) -> None:
+        """Record the owner of a sandbox."""
+        metadata = {
+            'pid': os.getpid(),
+            'created_at': time.time(),
+            'workspace_root': str(workspace_root),
+            'strategy': strategy,
+            'git_root': str(git_root) if git_root else None
+        }
+        (directory / SANDBOX_METADATA_FILE).write_text(json.dumps(metadata), encoding='utf-8')
+
+    @staticmethod
+    def _read_metadata(directory: Path) -> Optional[dict]:
+        """Read the metadata of a sandbox, or None if missing or corrupt."""
+        try:
+            return json.loads((directory / SANDBOX_METADATA_FILE).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    def _find_git_root(self, workspace_root: Path) -> Optional[Path]:
+        """Find the top level of the git repository containing a directory."""
+        try:
+            output = self._git(workspace_root, 'rev-parse', '--show-toplevel')
+        except Exception:
+            return None
+        return Path(output.strip()).resolve() if output.strip() else None
+
+    @staticmethod
+    def _git(cwd: Path, *args: str) -> str:
+        """Run a git command and return its output."""
+        result = subprocess.run(
+            ['git', *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            timeout=GIT_TIMEOUT_SECONDS
+        )
+        if result.returncode != 0:
+            raise SandboxError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+        return result.stdout
+
+    @staticmethod
+    def _split_names(output: str) -> List[str]:
+        """Split NUL-separated git output."""
+        return [name for name in output.split('\0') if name]
@@ -0,0 +1,200 @@
+"""Test script for the compiled assertion engine.
+
+This script checks JSONPath parsing and selection, the failure messages of
+the 'schema' assertion, that the original assertion types (equals, contains,
+matches and type) behave as they did before assertions were compiled, and
+that registering an assertion type invalidates compiled assertions.
+
+Usage:
+    python -m kaizen.autofix.test.test_assertions
+"""
+
+from kaizen.autofix.test.assertions import (
+    MISSING,
+    AssertionSpecError,
+    compile_assertions,
+    compile_path,
+    register_assertion,
+    select_path,
+)
+from kaizen.autofix.test.test_case import AssertionRunner
+
+
+def expect_spec_error(function, *args) -> str:
+    """Call a function that must reject its configuration.
+
+    Returns:
+        The error message
+    """
+    try:
+        function(*args)
+    except AssertionSpecError as e:
+        return str(e)
+    raise AssertionError(f"{function.__name__}{args!r} did not raise AssertionSpecError")
+
+
+def run_one(spec, actual_output):
+    """Run a single assertion and return its result."""
+    return AssertionRunner.run_assertions([spec], actual_output)[0]
+
+
+def test_compile_path_edge_cases():
+    """Test JSONPath parsing and selection edge cases."""
+    print("🧪 Testing JSONPath edge cases")
+    data = {'items': [{'id': 1}, {'id': 2}, {'name': 'x'}], "it's": 'quote', 'a\\b': 'slash', 'x.y': 'dotted'}
+
+    # Recursive descent and filters are not supported and must say so
+    assert 'Unsupported JSONPath syntax' in expect_spec_error(compile_path, '$..x')
+    expect_spec_error(compile_path, '$.items[?(@.id)]')
+    expect_spec_error(compile_path, 'items[0]')
+
+    # Quoted keys: escaped quotes and backslashes are unescaped
+    assert compile_path("$['it\\'s']") == ["it's"]
+    assert compile_path('$["say \\"hi\\""]') == ['say "hi"']
+    assert compile_path("$['a\\\\b']") == ['a\\b']
+    assert compile_path("$[ 'x.y' ]") == ['x.y']
+    assert select_path(data, compile_path("$['it\\'s']")) == 'quote'
+    assert select_path(data, compile_path("$['a\\\\b']")) == 'slash'
+    assert select_path(data, compile_path("$['x.y']")) == 'dotted'
+
+    # Negative indexes count from the end; out-of-range indexes select nothing
+    assert compile_path('$.items[-1]') == ['items', -1]
+    assert select_path(data, compile_path('$.items[-1].name')) == 'x'
+    assert select_path(data, compile_path('$.items[-4]')) is MISSING
+    assert select_path(data, compile_path('$.items[3]')) is MISSING
+
+    # Wildcards select every element, skipping those missing the rest of the path
+    assert select_path(data, compile_path('$.items[*].id')) == [1, 2]
+    assert select_path(data, compile_path('$.items.*.id')) == [1, 2]
+    assert select_path({'a': 1, 'b': 2}, compile_path('$[*]')) == [1, 2]
+    assert select_path('not json', compile_path('$[*]')) is MISSING
+
+    # JSON strings are decoded before the path is applied
+    assert select_path('{"result": {"ok": true}}', compile_path('$.result.ok')) is True
+    print("✅ JSONPath edge cases handled")
+
+
+def test_path_assertion_results():
+    """Test that path assertions report missing paths as failures."""
+    print("🧪 Testing path assertion results")
+    result = run_one({'type': 'equals', 'path': '$.status', 'expected': 'ok'}, {'status': 'ok'})
+    assert result['passed'] and result['actual'] == 'ok' and result['path'] == '$.status'
+
+    result = run_one({'type': 'equals', 'path': '$.missing', 'expected': 'ok'}, {'status': 'ok'})
+    assert not result['passed']
+    assert result['message'] == "Path '$.missing' not found in output"
+
+    result = run_one({'type': 'equals', 'path': '$..status', 'expected': 'ok'}, {'status': 'ok'})
+    assert not result['passed'] and 'Unsupported JSONPath syntax' in result['error']
+    print("✅ Path assertion results are reported")
+
+
+def test_schema_failure_messages():
+    """Test that schema assertions say where and why the output is invalid."""
+    print("🧪 Testing schema failure messages")
+    schema = {
+        'type': 'object',
+        'required': ['name', 'tags'],
+        'additionalProperties': False,
+        'properties': {
+            'name': {'type': 'string', 'minLength': 2},
+            'age': {'type': 'integer', 'minimum': 0},
+            'tags': {'type': 'array', 'items': {'enum': ['a', 'b']}}
+        }
+    }
+    spec = {'type': 'schema', 'expected': schema}
+    cases = [
+        ({'name': 'Al', 'tags': ['a']}, None),
+        ('{"name": "Al", "tags": []}', None),
+        ({'name': 'Al'}, "$: missing required property 'tags'"),
+        ({'name': 'A', 'tags': []}, "$.name: shorter than 2 characters"),
+        ({'name': 'Al', 'tags': [], 'age': -1}, "$.age: -1 is less than 0"),
+        ({'name': 'Al', 'tags': [], 'age': True}, "$.age: expected integer, got bool"),
+        ({'name': 'Al', 'tags': ['a', 'c']}, "$.tags[1]: 'c' is not one of ['a', 'b']"),
+        ({'name': 'Al', 'tags': [], 'extra': 1}, "$: unexpected property 'extra'"),
+        (['Al'], "$: expected object, got list"),
+        ('not json', "Output is not valid JSON"),
+    ]
+    for output, message in cases:
+        result = run_one(spec, output)
+        assert result['passed'] == (message is None), (output, result)
+        assert result.get('message') == message, (output, result.get('message'))
+
+    # Keywords the validator does not implement are rejected, not ignored
+    result = run_one({'type': 'schema', 'expected': {'type': 'object', 'oneOf': []}}, {})
+    assert not result['passed']
+    assert result['error'] == "Assertion 1: Unsupported schema keywords at $: oneOf"
+    print("✅ Schema failures are described")
+
+
+def test_original_assertion_types():
+    """Test that equals, contains, matches and type keep their old results."""
+    print("🧪 Testing backward compatibility of the original assertion types")
+    cases = [
+        ({'type': 'equals', 'expected': 'hi'}, 'hi', True),
+        ({'type': 'equals', 'expected': {'a': 1}}, {'a': 1}, True),
+        ({'type': 'equals', 'expected': 1}, '1', False),
+        ({'type': 'contains', 'expected': 'ell'}, 'hello', True),
+        ({'type': 'contains', 'expected': 2}, [1, 2], True),
+        ({'type': 'contains', 'expected': 'x'}, 'hello', False),
+        ({'type': 'matches', 'expected': r'\d+'}, 42, True),
+        ({'type': 'matches', 'expected': r'\d+'}, 'id 42', False),
+        ({'type': 'type', 'expected': 'str'}, 'text', True),
+        ({'type': 'type', 'expected': 'dict'}, {'a': 1}, True),
+        ({'type': 'type', 'expected': 'dict'}, [], False),
+        ({'type': 'type', 'expected': 'list'}, [1], True),
+        ({'type': 'type', 'expected': 'int'}, True, True),
+        ({'type': 'type', 'expected': 'float'}, 1, False),
+        ({'type': 'type', 'expected': 'int | float'}, 1.5, True),
+    ]
+    for spec, output, passed in cases:
+        result = run_one(spec, output)
+        assert result['passed'] is passed, (spec, output, result)
+        assert result['type'] == spec['type']
+        assert result['expected'] == spec['expected']
+        assert result['actual'] == output
+
+    # Errors while checking are reported on the result, as before
+    result = run_one({'type': 'contains', 'expected': 'x'}, 5)
+    assert result['passed'] is False and 'error' in result
+
+    # Type names are looked up, never evaluated
+    result = run_one({'type': 'type', 'expected': '__import__("os").getcwd'}, 'x')
+    assert result['passed'] is False and 'Unknown type name' in result['error']
+    print("✅ Original assertion types are compatible")
+
+
+def test_register_assertion_invalidates_cache():
+    """Test that registering a type recompiles assertions cached before it."""
+    print("🧪 Testing compiled assertion cache invalidation")
+    specs = [{'type': 'test_even'}]
+    before = compile_assertions(specs)
+    assert before.errors and 'Unknown assertion type: test_even' in before.errors[0]
+    assert compile_assertions(specs) is before
+
+    register_assertion('test_even', lambda spec: lambda actual: (actual % 2 == 0, f"{actual} is odd"))
+    after = compile_assertions(specs)
+    assert after is not before and not after.errors
+    assert after.run(4)[0]['passed'] is True
+    assert after.run(3)[0]['message'] == "3 is odd"
+
+    # Re-registering replaces the previous implementation
+    register_assertion('test_even', lambda spec: lambda actual: (True, None))
+    assert compile_assertions(specs).run(3)[0]['passed'] is True
+    print("✅ Registering a type invalidates compiled assertions")
+
+
+def main():
+    """Run all tests."""
+    print("🚀 Testing Assertions")
+    print("=" * 60)
+    test_compile_path_edge_cases()
+    test_path_assertion_results()
+    test_schema_failure_messages()
+    test_original_assertion_types()
+    test_register_assertion_invalidates_cache()
+    print("\n🎉 All tests completed!")
+
+
+if __name__ == "__main__":
+    main()
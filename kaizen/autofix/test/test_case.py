@@ -1,21 +1,29 @@
 """Test case and evaluation implementation for Kaizen."""
 
 from dataclasses import dataclass
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Tuple
 from enum import Enum
+import asyncio
+import concurrent.futures
 import logging
 import json
 import os
+import threading
 from pathlib import Path
 import google.generativeai as genai
 from pydantic import BaseModel, Field, validator
 import yaml
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, stop_after_attempt, wait_exponential, AsyncRetrying
 
+from .assertions import CompiledAssertions, compile_assertions
 from .variable_tracker import safe_serialize_value
+from .evaluation_cache import EvaluationCache
 
 logger = logging.getLogger(__name__)
 
+# Default number of LLM evaluation requests allowed in flight at once
+DEFAULT_EVALUATION_CONCURRENCY = 4
+
 class TestStatus(Enum):
     """Enum for test status values."""
     PENDING = 'pending'
@@ -347,19 +355,35 @@ class PromptBuilder:
 class LLMEvaluator:
     """Evaluates test results using LLM."""
     
-    def __init__(self, config: Optional[LLMConfig] = None, better_ai: bool = False):
+    def __init__(self, config: Optional[LLMConfig] = None, better_ai: bool = False,
+                 max_concurrency: Optional[int] = None, cache: Optional[EvaluationCache] = None):
+        """Initialize the evaluator.
+        
+        Args:
+            config: LLM configuration
+            better_ai: Whether to use the enhanced model for evaluation
+            max_concurrency: Maximum number of evaluation requests in flight
+                at once for the async API
+            cache: Optional cache of previous evaluation verdicts
+        """
         self.config = config or LLMConfig()
         self.better_ai = better_ai
+        self.cache = cache
+        self.max_concurrency = max(1, int(max_concurrency or DEFAULT_EVALUATION_CONCURRENCY))
         self._initialize_model()
         
+        # Background event loop used by submit_evaluation, started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_semaphore: Optional[asyncio.Semaphore] = None
+        self._loop_lock = threading.Lock()
+        
     def _initialize_model(self):
         """Initialize the LLM model with proper configuration."""
         try:
             genai.configure(api_key=self.config.api_key)
-            if self.better_ai:
-                self.model = genai.GenerativeModel('gemini-2.5-pro')
-            else:
-                self.model = genai.GenerativeModel(self.config.model_name)
+            self.model_name = 'gemini-2.5-pro' if self.better_ai else self.config.model_name
+            self.model = genai.GenerativeModel(self.model_name)
         except Exception as e:
             logger.error(f"Failed to initialize LLM model: {str(e)}")
             raise RuntimeError(f"LLM initialization failed: {str(e)}")
@@ -383,10 +407,64 @@ class LLMEvaluator:
         """
         try:
             prompt = PromptBuilder.build_evaluation_prompt(test_case, actual_output, tracked_values)
+            cache_key, cached = self._lookup_cache(prompt)
+            if cached is not None:
+                return cached
+            
             response = self.model.generate_content(prompt)
             
             evaluation_result = self._parse_llm_response(response.text)
-            return self._format_evaluation_result(evaluation_result)
+            return self._store_in_cache(cache_key, self._format_evaluation_result(evaluation_result))
+            
+        except Exception as e:
+            logger.error(f"Error in LLM evaluation: {str(e)}")
+            return {
+                'status': TestStatus.ERROR.value,
+                'error': str(e)
+            }
+    
+    async def evaluate_result_async(
+        self,
+        test_case: TestCase,
+        actual_output: Any,
+        tracked_values: Optional[Dict[str, Any]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Dict[str, Any]:
+        """
+        Evaluate test result using LLM without blocking the event loop.
+        
+        Retries back off with asyncio.sleep, so other evaluations keep
+        making progress while one request is waiting to be retried.
+        
+        Args:
+            test_case: Test case configuration
+            actual_output: Actual output from the test
+            tracked_values: Dictionary of tracked variable values
+            semaphore: Optional semaphore limiting concurrent requests
+            
+        Returns:
+            Dict containing evaluation results
+        """
+        try:
+            prompt = PromptBuilder.build_evaluation_prompt(test_case, actual_output, tracked_values)
+            cache_key, cached = self._lookup_cache(prompt)
+            if cached is not None:
+                return cached
+            
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(3),
+                wait=wait_exponential(multiplier=1, min=4, max=10),
+                reraise=True
+            ):
+                with attempt:
+                    if semaphore is not None:
+                        async with semaphore:
+                            response = await self.model.generate_content_async(prompt)
+                    else:
+                        response = await self.model.generate_content_async(prompt)
+                    evaluation_result = self._parse_llm_response(response.text)
+            
+            return self._store_in_cache(cache_key, self._format_evaluation_result(evaluation_result))
             
         except Exception as e:
             logger.error(f"Error in LLM evaluation: {str(e)}")
@@ -395,6 +473,113 @@ class LLMEvaluator:
                 'error': str(e)
             }
     
+    async def evaluate_many(
+        self,
+        requests: List[Tuple[TestCase, Any, Optional[Dict[str, Any]]]],
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate several test results concurrently.
+        
+        Args:
+            requests: List of (test_case, actual_output, tracked_values) tuples
+            max_concurrency: Maximum number of requests in flight at once
+                (defaults to the evaluator's limit)
+            
+        Returns:
+            List of evaluation results in the same order as the requests
+        """
+        semaphore = asyncio.Semaphore(max(1, int(max_concurrency or self.max_concurrency)))
+        return await asyncio.gather(*(
+            self.evaluate_result_async(test_case, actual_output, tracked_values, semaphore=semaphore)
+            for test_case, actual_output, tracked_values in requests
+        ))
+    
+    def submit_evaluation(
+        self,
+        test_case: TestCase,
+        actual_output: Any,
+        tracked_values: Optional[Dict[str, Any]] = None
+    ) -> concurrent.futures.Future:
+        """
+        Schedule an evaluation on the evaluator's background event loop.
+        
+        This lets synchronous callers keep working (e.g. execute the next
+        test step) while the evaluation is in flight.
+        
+        Args:
+            test_case: Test case configuration
+            actual_output: Actual output from the test
+            tracked_values: Dictionary of tracked variable values
+            
+        Returns:
+            Future resolving to the evaluation result dictionary
+        """
+        loop = self._ensure_event_loop()
+        return asyncio.run_coroutine_threadsafe(
+            self._evaluate_on_background_loop(test_case, actual_output, tracked_values),
+            loop
+        )
+    
+    def close(self) -> None:
+        """Stop the background event loop if it was started."""
+        with self._loop_lock:
+            if self._loop is None:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
+            self._loop = None
+            self._loop_thread = None
+            self._loop_semaphore = None
+    
+    def _ensure_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop thread if it is not running."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="kaizen-llm-evaluator",
+                    daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
+    
+    async def _evaluate_on_background_loop(
+        self,
+        test_case: TestCase,
+        actual_output: Any,
+        tracked_values: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Run an evaluation on the background loop under the shared concurrency limit."""
+        # Created here so the semaphore belongs to the background loop
+        if self._loop_semaphore is None:
+            self._loop_semaphore = asyncio.Semaphore(self.max_concurrency)
+        return await self.evaluate_result_async(
+            test_case, actual_output, tracked_values, semaphore=self._loop_semaphore
+        )
+    
+    def _lookup_cache(self, prompt: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Look up a previous verdict for the prompt.
+        
+        Returns:
+            Tuple of (cache key, cached result); both None when caching is disabled
+        """
+        if self.cache is None:
+            return None, None
+        cache_key = EvaluationCache.make_key(prompt, self.model_name, self.better_ai)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Using cached LLM evaluation result")
+        return cache_key, cached
+    
+    def _store_in_cache(self, cache_key: Optional[str], result: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a verdict in the cache and return it unchanged."""
+        if self.cache is not None and cache_key is not None:
+            self.cache.put(cache_key, result)
+        return result
+    
     def _parse_llm_response(self, response_text: str) -> EvaluationResponse:
         """Parse and validate the LLM response."""
         try:
@@ -433,14 +618,30 @@ class LLMEvaluator:
         return result
 
 class AssertionRunner:
-    """Runs assertions on test results."""
+    """Runs assertions on test results.
+    
+    Assertions are compiled once per distinct configuration (see
+    kaizen.autofix.test.assertions); running them only evaluates the checks.
+    """
+    
+    @staticmethod
+    def compile(assertions: Optional[List[Dict]]) -> CompiledAssertions:
+        """Compile a step's assertions ahead of running them.
+        
+        Args:
+            assertions: List of assertions to compile
+            
+        Returns:
+            The compiled assertions; invalid ones fail with their configuration error
+        """
+        return compile_assertions(assertions)
     
     @staticmethod
-    def run_assertions(assertions: List[Dict], actual_output: Any) -> List[Dict]:
+    def run_assertions(assertions: Union[List[Dict], CompiledAssertions, None], actual_output: Any) -> List[Dict]:
         """Run assertions on the test output.
         
         Args:
-            assertions: List of assertions to run
+            assertions: List of assertions to run, or assertions from compile()
             actual_output: The actual output to test against
             
         Returns:
@@ -449,35 +650,6 @@ class AssertionRunner:
         # If no assertions provided, return empty list
         if not assertions:
             return []
-            
-        results = []
-        for assertion in assertions:
-            try:
-                assertion_type = assertion['type']
-                expected = assertion['expected']
-                
-                if assertion_type == 'equals':
-                    passed = actual_output == expected
-                elif assertion_type == 'contains':
-                    passed = expected in actual_output
-                elif assertion_type == 'matches':
-                    import re
-                    passed = bool(re.match(expected, str(actual_output)))
-                elif assertion_type == 'type':
-                    passed = isinstance(actual_output, eval(expected))
-                else:
-                    raise ValueError(f"Unknown assertion type: {assertion_type}")
-                    
-                results.append({
-                    'type': assertion_type,
-                    'expected': expected,
-                    'actual': actual_output,
-                    'passed': passed
-                })
-            except Exception as e:
-                results.append({
-                    'type': assertion_type,
-                    'error': str(e),
-                    'passed': False
-                })
-        return results 
\ No newline at end of file
+        if not isinstance(assertions, CompiledAssertions):
+            assertions = compile_assertions(assertions)
+        return assertions.run(actual_output)
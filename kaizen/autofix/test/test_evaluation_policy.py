@@ -0,0 +1,154 @@
+"""Test script for the LLM evaluation policy.
+
+This script checks every reason a step is decided without the LLM, that the
+normalized output match and the evaluation of failed-assertion steps follow
+their options, and that the sampled policy picks the same steps every run.
+
+Usage:
+    python -m kaizen.autofix.test.test_evaluation_policy
+"""
+
+from kaizen.autofix.test.evaluation_policy import (
+    DEFAULT_EVALUATION_POLICY,
+    EVALUATION_POLICY_ALWAYS,
+    EVALUATION_POLICY_NEVER,
+    EVALUATION_POLICY_ON_ASSERTION_PASS,
+    EVALUATION_POLICY_SAMPLED,
+    SKIP_ASSERTION_FAILED,
+    SKIP_EXACT_MATCH,
+    SKIP_NORMALIZED_MATCH,
+    SKIP_NOT_SAMPLED,
+    SKIP_POLICY_NEVER,
+    EvaluationPolicy,
+)
+from kaizen.autofix.test.test_case import TestCase
+
+PASSED_ASSERTION = {'type': 'contains', 'expected': 'ok', 'actual': 'ok', 'passed': True}
+FAILED_ASSERTION = {'type': 'equals', 'path': '$.status', 'expected': 'ok', 'actual': 'error', 'passed': False}
+
+
+def make_step(name: str = 'step', expected_output=None, evaluation_targets=None) -> TestCase:
+    """Create a test case with no inputs or assertions of its own."""
+    return TestCase(
+        name=name,
+        input={},
+        expected_output=expected_output,
+        assertions=[],
+        llm_evaluation={},
+        evaluation_targets=evaluation_targets
+    )
+
+
+def skip_reason(policy: EvaluationPolicy, step: TestCase, output, assertions=()):
+    """Screen a step and get why it was not sent to the LLM, or None."""
+    result = policy.screen(step, output, list(assertions))
+    return result['skip_reason'] if result else None
+
+
+def test_skip_reasons():
+    """Test each reason a step is decided without the LLM."""
+    print("🧪 Testing skip reasons")
+    policy = EvaluationPolicy()
+    assert policy.policy == DEFAULT_EVALUATION_POLICY == EVALUATION_POLICY_ON_ASSERTION_PASS
+
+    result = policy.screen(make_step(expected_output='ok'), 'ok', [FAILED_ASSERTION])
+    assert result['skip_reason'] == SKIP_ASSERTION_FAILED and result['status'] == 'failed'
+    # The failed assertion is spelled out for the report and auto-fix prompts
+    assert "equals at $.status expected 'ok', got 'error'" in result['reasoning'], result['reasoning']
+
+    result = policy.screen(make_step(expected_output={'a': [1, 2]}), {'a': [1, 2]}, [PASSED_ASSERTION])
+    assert result['skip_reason'] == SKIP_EXACT_MATCH and result['status'] == 'passed'
+
+    normalized = EvaluationPolicy(normalized_match=True)
+    assert skip_reason(normalized, make_step(expected_output='{"b": 1,  "a": "X"}'), {'a': 'x', 'b': 1}) == SKIP_NORMALIZED_MATCH
+    assert skip_reason(normalized, make_step(expected_output='Hello   World'), 'hello world\n') == SKIP_NORMALIZED_MATCH
+
+    never = EvaluationPolicy(EVALUATION_POLICY_NEVER)
+    assert skip_reason(never, make_step(expected_output='a'), 'b', [PASSED_ASSERTION]) == SKIP_POLICY_NEVER
+
+    none_sampled = EvaluationPolicy(EVALUATION_POLICY_SAMPLED, sample_rate=0)
+    assert skip_reason(none_sampled, make_step(), 'anything') == SKIP_NOT_SAMPLED
+
+    # Undecided steps go to the LLM
+    assert skip_reason(policy, make_step(expected_output='a'), 'b', [PASSED_ASSERTION]) is None
+    assert skip_reason(policy, make_step(), 'output') is None
+    assert policy.get_stats() == {'evaluated': 2, 'skipped': 2}
+    print("✅ Every skip reason is reported")
+
+
+def test_normalized_match_is_opt_in():
+    """Test that outputs differing in case or formatting go to the LLM by default."""
+    print("🧪 Testing the normalized match option")
+    policy = EvaluationPolicy()
+    assert skip_reason(policy, make_step(expected_output='Hello World'), 'hello world') is None
+    assert skip_reason(policy, make_step(expected_output='{"a": 1}'), {'a': 1}) is None
+    # Identical outputs still pass without the LLM
+    assert skip_reason(policy, make_step(expected_output='Hello World'), 'Hello World') == SKIP_EXACT_MATCH
+    print("✅ Normalized matching only applies when enabled")
+
+
+def test_always_and_tracked_targets():
+    """Test steps that are never decided without the LLM."""
+    print("🧪 Testing the always policy and tracked-variable targets")
+    always = EvaluationPolicy(EVALUATION_POLICY_ALWAYS)
+    assert skip_reason(always, make_step(expected_output='ok'), 'ok', [FAILED_ASSERTION]) is None
+    assert skip_reason(always, make_step(expected_output='ok'), 'ok') is None
+
+    # Targets on tracked variables are not decided by the return value
+    step = make_step(expected_output='ok', evaluation_targets=[{'name': 'summary', 'source': 'variable'}])
+    assert skip_reason(EvaluationPolicy(), step, 'ok') is None
+    step = make_step(expected_output='ok', evaluation_targets=[{'name': 'result', 'source': 'return'}])
+    assert skip_reason(EvaluationPolicy(), step, 'ok') == SKIP_EXACT_MATCH
+    print("✅ Steps needing the LLM are evaluated")
+
+
+def test_failed_assertions_with_auto_fix():
+    """Test that failed-assertion steps keep their LLM reasoning for auto-fix."""
+    print("🧪 Testing evaluation of failed-assertion steps")
+    policy = EvaluationPolicy(evaluate_failed_assertions=True)
+    assert skip_reason(policy, make_step(expected_output='ok'), 'ok', [FAILED_ASSERTION]) is None
+    sampled = EvaluationPolicy(EVALUATION_POLICY_SAMPLED, sample_rate=0, evaluate_failed_assertions=True)
+    assert skip_reason(sampled, make_step(), 'x', [FAILED_ASSERTION]) is None
+    # 'never' makes no LLM calls, whatever auto-fix would like
+    never = EvaluationPolicy(EVALUATION_POLICY_NEVER, evaluate_failed_assertions=True)
+    assert skip_reason(never, make_step(), 'x', [FAILED_ASSERTION]) == SKIP_ASSERTION_FAILED
+    print("✅ Failed-assertion steps are evaluated when auto-fix needs them")
+
+
+def test_sampled_determinism():
+    """Test that the sampled policy picks steps by name, the same way every run."""
+    print("🧪 Testing sampled policy determinism")
+    names = [f"step {index}" for index in range(400)]
+
+    def sampled_names(rate):
+        policy = EvaluationPolicy(EVALUATION_POLICY_SAMPLED, sample_rate=rate)
+        return {name for name in names if skip_reason(policy, make_step(name), 'output') is None}
+
+    first = sampled_names(0.25)
+    assert first == sampled_names(0.25), "Sampling changed between runs"
+    assert 60 <= len(first) <= 140, len(first)
+    # A higher rate evaluates a superset of the steps
+    assert first <= sampled_names(0.5)
+    assert sampled_names(0) == set() and sampled_names(1) == set(names)
+    # Out-of-range rates are clamped
+    assert EvaluationPolicy(EVALUATION_POLICY_SAMPLED, sample_rate=3).sample_rate == 1.0
+
+    # Unknown policies fall back to the default
+    assert EvaluationPolicy('sometimes').policy == DEFAULT_EVALUATION_POLICY
+    print("✅ Sampling is deterministic")
+
+
+def main():
+    """Run all tests."""
+    print("🚀 Testing Evaluation Policy")
+    print("=" * 60)
+    test_skip_reasons()
+    test_normalized_match_is_opt_in()
+    test_always_and_tracked_targets()
+    test_failed_assertions_with_auto_fix()
+    test_sampled_determinism()
+    print("\n🎉 All tests completed!")
+
+
+if __name__ == "__main__":
+    main()
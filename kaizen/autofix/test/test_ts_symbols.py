@@ -0,0 +1,305 @@
+"""Test script for the TypeScript symbol table.
+
+This script parses TypeScript fixtures with regular expression literals,
+template literals containing braces, generics and class members, and
+compares the extracted functions with the regex and brace-counting extractor
+the symbol table replaced. Where the old extractor was right, both must agree;
+where it was wrong, the expected output is pinned.
+
+Usage:
+    python -m kaizen.autofix.test.test_ts_symbols
+"""
+
+import re
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from kaizen.autofix.test.code_region import CodeRegionExtractor, RegionType
+from kaizen.autofix.test.ts_symbols import (
+    INIT_ARROW,
+    INIT_NEW,
+    SYMBOL_CLASS,
+    SYMBOL_FUNCTION,
+    TOKEN_REGEX,
+    TOKEN_TEMPLATE,
+    parse_symbols,
+    tokenize,
+)
+
+IMPORTS = '''import { Agent } from '@mastra/core/agent';
+import type { Config } from './config';
+import defaultThing, { helper as h,
+  other } from "./helpers";
+import * as path from 'path';
+import 'reflect-metadata';
+'''
+
+PLAIN_FUNCTION = '''export function greet(name: string): string {
+  if (!name) {
+    return "Hello, stranger }";
+  }
+  // a comment with a brace }
+  return 'Hello, ' + name;
+}'''
+
+REGEX_FUNCTION = '''export function stripTags(html: string): string {
+  const tag = /<[^>]*>|\\{[^}]*\\}/g;
+  const half = html.length / 2 / 1;
+  return html.replace(tag, '').slice(0, half);
+}'''
+
+TEMPLATE_FUNCTION = '''export async function render(name: string, items: string[]): Promise<string> {
+  const header = `Hello ${name} }`;
+  const body = `${items.map(item => `<li>${item.replace(/}/g, '')}</li>`).join('')}`;
+  return `${header}{${body}`;
+}'''
+
+GENERIC_FUNCTION = '''export function pick<T extends { id: string }>(items: Array<T>, id: string): Map<string, T> {
+  const found = new Map<string, T>();
+  for (const item of items) { if (item.id === id) { found.set(id, item); } }
+  return found;
+}'''
+
+ARROW_FUNCTION = '''export const shout = (text: string) => {
+  return text.toUpperCase() + '!';
+};'''
+
+GENERIC_ARROW = '''export const toUpper = async <T,>(value: T): Promise<string> => {
+  return String(value).toUpperCase();
+};'''
+
+AGENT_CLASS = '''export class EmailAgent<TState extends { count: number } = { count: number }> {
+  private readonly name: string;
+  static instances = 0;
+  private handler = (event: string) => { return event; };
+
+  constructor(name: string) {
+    this.name = name;
+  }
+
+  get label(): string { return this.name; }
+  set label(value: string) { }
+
+  async send(to: string, subject?: string): Promise<boolean> {
+    return to.includes('@');
+  }
+
+  static create(): EmailAgent { return new EmailAgent('x'); }
+  format<U>(value: U): string { return `${value}`; }
+}'''
+
+HELPER_CLASS = '''class Helper {
+  run() { return 1; }
+}'''
+
+AGENT_CONSTANT = "export const emailAgent = new Agent({ name: 'email', instructions: `Be brief }` });"
+
+SOURCE = '\n\n'.join([
+    IMPORTS,
+    '/* block { comment */',
+    PLAIN_FUNCTION,
+    REGEX_FUNCTION,
+    TEMPLATE_FUNCTION,
+    GENERIC_FUNCTION,
+    ARROW_FUNCTION,
+    GENERIC_ARROW,
+    'export const cache = new Map<string, number>(), size = 2;',
+    AGENT_CLASS,
+    HELPER_CLASS,
+    AGENT_CONSTANT,
+    'export default emailAgent;\n'
+])
+
+
+def legacy_extract_function(content: str, function_name: str) -> Optional[str]:
+    """Cut a function out the way the extractor did before the symbol table.
+
+    Kept as the reference the symbol table is compared against: the first
+    matching declaration pattern, then braces counted from its start,
+    skipping only quoted strings and line comments.
+    """
+    name = re.escape(function_name)
+    function_patterns = [
+        rf'export\s+(?:async\s+)?function\s+{name}\s*\(',
+        rf'(?:async\s+)?function\s+{name}\s*\(',
+        rf'export\s+(?:async\s+)?const\s+{name}\s*=\s*(?:async\s+)?\(',
+        rf'(?:async\s+)?const\s+{name}\s*=\s*(?:async\s+)?\(',
+        rf'export\s+(?:async\s+)?const\s+{name}\s*=\s*(?:async\s+)?function\s*\(',
+        rf'(?:async\s+)?const\s+{name}\s*=\s*(?:async\s+)?function\s*\(',
+    ]
+    for pattern in function_patterns:
+        match = re.search(pattern, content)
+        if not match:
+            continue
+        start_pos = match.start()
+        brace_count = 0
+        in_function = False
+        end_pos = start_pos
+        in_string = False
+        string_char = None
+        in_comment = False
+        for i, char in enumerate(content[start_pos:], start_pos):
+            if char in ['"', "'"] and not in_comment:
+                if not in_string:
+                    in_string = True
+                    string_char = char
+                elif string_char == char:
+                    in_string = False
+                    string_char = None
+            elif char == '/' and i + 1 < len(content) and content[i + 1] == '/' and not in_string:
+                in_comment = True
+            elif char == '\n' and in_comment:
+                in_comment = False
+            elif not in_string and not in_comment:
+                if char == '{':
+                    in_function = True
+                    brace_count += 1
+                elif char == '}':
+                    brace_count -= 1
+                    if in_function and brace_count == 0:
+                        end_pos = i + 1
+                        break
+        if end_pos > start_pos:
+            return content[start_pos:end_pos]
+    return None
+
+
+def extract_function(source: str, name: str) -> Optional[str]:
+    """Cut a function out using the symbol table."""
+    symbol = parse_symbols(source).find_function(name)
+    return source[symbol.start:symbol.end] if symbol else None
+
+
+def test_tokenizer_literals():
+    """Test that braces inside regex and template literals are not brackets."""
+    print("🧪 Testing regex and template literal tokens")
+    tokens = tokenize(REGEX_FUNCTION)
+    regexes = [token.value for token in tokens if token.kind == TOKEN_REGEX]
+    assert regexes == ['/<[^>]*>|\\{[^}]*\\}/g'], regexes
+    # Divisions are not regular expressions
+    assert [token.value for token in tokens if token.value == '/'] == ['/', '/']
+
+    # Template text is split around substitutions, which are tokenized as code
+    tokens = tokenize(TEMPLATE_FUNCTION)
+    templates = [token.value for token in tokens if token.kind == TOKEN_TEMPLATE]
+    assert templates == ['`Hello ${', '} }`', '`${', '`<li>${', '}</li>`', '}`', '`${', '}{${', '}`'], templates
+    assert '/}/g' in [token.value for token in tokens if token.kind == TOKEN_REGEX]
+    # Only the function body's braces are left as brackets
+    assert [token.value for token in tokens if token.value in ('{', '}')] == ['{', '}']
+    print("✅ Literal braces are not counted as brackets")
+
+
+def test_functions_match_legacy_extractor():
+    """Test that simple functions are cut out exactly as before."""
+    print("🧪 Testing agreement with the old extractor")
+    assert extract_function(SOURCE, 'greet') == PLAIN_FUNCTION
+    assert legacy_extract_function(SOURCE, 'greet') == PLAIN_FUNCTION
+    # The old extractor stopped at the arrow body and left out the ';'
+    assert extract_function(SOURCE, 'shout') == ARROW_FUNCTION
+    assert legacy_extract_function(SOURCE, 'shout') + ';' == ARROW_FUNCTION
+    print("✅ Both extractors agree on simple functions")
+
+
+def test_functions_the_legacy_extractor_got_wrong():
+    """Test functions the old extractor cut short or could not find."""
+    print("🧪 Testing regex literals, template literals and generics")
+    for fixture, name in (
+        (REGEX_FUNCTION, 'stripTags'),
+        (TEMPLATE_FUNCTION, 'render'),
+        (GENERIC_FUNCTION, 'pick'),
+        (GENERIC_ARROW, 'toUpper'),
+    ):
+        assert extract_function(SOURCE, name) == fixture, name
+
+    # Braces in regex and template literals were counted as code
+    assert legacy_extract_function(SOURCE, 'stripTags') == REGEX_FUNCTION[:REGEX_FUNCTION.index('\\}/g') + 2]
+    assert legacy_extract_function(SOURCE, 'render') == TEMPLATE_FUNCTION[:TEMPLATE_FUNCTION.index('${name} }') + 9]
+    # Type parameters between the name and '(' hid generic functions
+    assert legacy_extract_function(SOURCE, 'pick') is None
+    assert legacy_extract_function(SOURCE, 'toUpper') is None
+    print("✅ Functions are cut at their real end")
+
+
+def test_symbol_table():
+    """Test the declarations and imports recorded for the fixture file."""
+    print("🧪 Testing the symbol table")
+    table = parse_symbols(SOURCE)
+    summary = [(symbol.kind, symbol.name, symbol.exported) for symbol in table.symbols]
+    assert summary == [
+        (SYMBOL_FUNCTION, 'greet', True),
+        (SYMBOL_FUNCTION, 'stripTags', True),
+        (SYMBOL_FUNCTION, 'render', True),
+        (SYMBOL_FUNCTION, 'pick', True),
+        ('variable', 'shout', True),
+        ('variable', 'toUpper', True),
+        ('variable', 'cache', True),
+        ('variable', 'size', True),
+        (SYMBOL_CLASS, 'EmailAgent', True),
+        (SYMBOL_CLASS, 'Helper', False),
+        ('variable', 'emailAgent', True),
+    ], summary
+    assert table.get('toUpper').init == INIT_ARROW
+    assert (table.get('cache').init, table.get('cache').new_class) == (INIT_NEW, 'Map')
+    assert (table.get('emailAgent').init, table.get('emailAgent').new_class) == (INIT_NEW, 'Agent')
+    assert table.default_export == 'emailAgent'
+
+    imports = [(ts_import.module, ts_import.names, ts_import.type_only) for ts_import in table.imports]
+    assert imports == [
+        ('@mastra/core/agent', ['Agent'], False),
+        ('./config', ['Config'], True),
+        ('./helpers', ['defaultThing', 'helper as h', 'other'], False),
+        ('path', ['path'], False),
+        ('reflect-metadata', [], False),
+    ], imports
+    assert table.imports[2].aliases == {'helper': 'h'}
+    print("✅ Symbol table is complete")
+
+
+def test_class_members():
+    """Test that methods are attributed to the class declaring them."""
+    print("🧪 Testing class members")
+    table = parse_symbols(SOURCE)
+    agent = table.get('EmailAgent')
+    # Constructors, accessors and properties holding functions are not methods
+    assert agent.methods == ['send', 'create', 'format'], agent.methods
+    assert SOURCE[agent.start:agent.end] == AGENT_CLASS
+    assert table.get('Helper').methods == ['run']
+    print("✅ Class members are attributed correctly")
+
+
+def test_extractor_regions():
+    """Test the regions the code region extractor builds from the table."""
+    print("🧪 Testing TypeScript region extraction")
+    extractor = CodeRegionExtractor()
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'agent.ts'
+        path.write_text(SOURCE, encoding='utf-8')
+        region = extractor.extract_region_ts_by_name(path, 'render')
+    # Only the import declarations precede the function, not every export
+    assert region.code == IMPORTS.rstrip('\n') + '\n\n' + TEMPLATE_FUNCTION, region.code
+    assert region.type == RegionType.FUNCTION and region.name == 'render'
+    assert [info.module for info in region.imports] == ['@mastra/core/agent', './helpers', 'path', 'reflect-metadata']
+
+    region_type, name, methods = extractor._determine_region_type_ts(AGENT_CLASS + '\n\n' + HELPER_CLASS)
+    assert (region_type, name, methods) == (RegionType.CLASS, 'EmailAgent', ['send', 'create', 'format'])
+    region_type, name, _ = extractor._determine_region_type_ts(IMPORTS + AGENT_CONSTANT)
+    assert (region_type, name) == (RegionType.MODULE, 'emailAgent')
+    print("✅ Regions are built from the symbol table")
+
+
+def main():
+    """Run all tests."""
+    print("🚀 Testing TypeScript Symbols")
+    print("=" * 60)
+    test_tokenizer_literals()
+    test_functions_match_legacy_extractor()
+    test_functions_the_legacy_extractor_got_wrong()
+    test_symbol_table()
+    test_class_members()
+    test_extractor_regions()
+    print("\n🎉 All tests completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,834 @@
+"""Single-pass TypeScript lexer and top-level symbol table.
+
+The TypeScript region extraction used to run separate regex passes over the
+whole file for imports, classes, functions and agent constants, and balanced
+braces character by character to cut out a function. This module tokenizes a
+file once, skipping comments, strings, template literals and regular
+expression literals, and records the file's top-level declarations with their
+character offsets. Extraction then looks declarations up in the table instead
+of searching the text again.
+
+The parser only understands top-level structure (imports, functions, classes
+and their methods, variable declarations and default exports). Statement
+bodies are skipped by bracket matching, so unusual syntax inside a function
+cannot throw off the table.
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Number of recently parsed sources whose symbol tables are kept
+SYMBOL_TABLE_CACHE_SIZE = 32
+
+# Token kinds
+TOKEN_NAME = 'name'
+TOKEN_NUMBER = 'number'
+TOKEN_STRING = 'string'
+TOKEN_TEMPLATE = 'template'
+TOKEN_REGEX = 'regex'
+TOKEN_PUNCT = 'punct'
+
+# Kinds of top-level symbols
+SYMBOL_FUNCTION = 'function'
+SYMBOL_CLASS = 'class'
+SYMBOL_VARIABLE = 'variable'
+
+# How a variable is initialized
+INIT_FUNCTION = 'function'
+INIT_ARROW = 'arrow'
+INIT_NEW = 'new'
+INIT_VALUE = 'value'
+
+_TOKEN_RE = re.compile(r'''
+    (?P<space>[^\S\n]+)
+  | (?P<newline>\n)
+  | (?P<line_comment>//[^\n]*)
+  | (?P<block_comment>/\*.*?(?:\*/|\Z))
+  | (?P<name>(?:[^\W\d]|\$)[\w$]*)
+  | (?P<number>\.?\d[\w.]*)
+  | (?P<string>'(?:[^'\\\n]|\\.)*'?|"(?:[^"\\\n]|\\.)*"?)
+  | (?P<punct>=>|\.\.\.|.)
+''', re.VERBOSE | re.DOTALL)
+
+# Template literal text up to the closing backtick or the next substitution
+_TEMPLATE_CHUNK_RE = re.compile(r'(?:[^`\\$]|\\.|\$(?!\{))*', re.DOTALL)
+
+# Regular expression literal after its opening slash, including flags
+_REGEX_BODY_RE = re.compile(r'(?:[^\\/\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\]?)*/?[\w$]*')
+
+# Keywords after which a slash starts a regular expression, not a division
+_REGEX_PRECEDING_KEYWORDS = frozenset({
+    'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+    'throw', 'case', 'do', 'else', 'yield', 'await'
+})
+
+# Keywords that continue an expression across a line break
+_CONTINUATION_KEYWORDS = frozenset({
+    'instanceof', 'in', 'of', 'as', 'satisfies', 'extends', 'implements', 'keyof'
+})
+
+# Modifiers that may precede a class member name
+_MEMBER_MODIFIERS = frozenset({
+    'public', 'private', 'protected', 'static', 'readonly', 'abstract',
+    'override', 'declare', 'async', 'accessor'
+})
+
+# Words that may precede a class member name, including accessor keywords
+_MEMBER_PREFIXES = _MEMBER_MODIFIERS | {'get', 'set'}
+
+_OPENING = {'{': '}', '(': ')', '[': ']'}
+_CLOSING = frozenset(_OPENING.values())
+
+# Punctuation that may appear inside a type argument list such as <K, V[]>
+_TYPE_ARGUMENT_PUNCT = frozenset({',', '.', '|', '&', '?', ':', '=>'})
+
+# Marks a '{' that belongs to a template literal substitution
+_TEMPLATE_BRACE = object()
+
+
+class Token(NamedTuple):
+    """A lexical token.
+
+    Attributes:
+        kind: One of the TOKEN_* kinds
+        value: Source text of the token
+        start: Offset of the first character
+        end: Offset after the last character
+        newline_before: Whether a line break precedes the token
+    """
+    kind: str
+    value: str
+    start: int
+    end: int
+    newline_before: bool
+
+
+@dataclass
+class TsImport:
+    """A top-level import declaration.
+
+    Attributes:
+        module: Module specifier
+        names: Imported names as written, e.g. ['x', 'y as z']
+        aliases: Mapping of original names to local aliases
+        type_only: Whether this is an 'import type' declaration
+        start: Offset of the declaration
+        end: Offset after the declaration
+    """
+    module: str
+    names: List[str]
+    aliases: Dict[str, str]
+    type_only: bool
+    start: int
+    end: int
+
+
+@dataclass
+class TsSymbol:
+    """A top-level declaration.
+
+    Attributes:
+        kind: SYMBOL_FUNCTION, SYMBOL_CLASS or SYMBOL_VARIABLE
+        name: Declared name
+        start: Offset of the declaration, including 'export' and modifiers
+        end: Offset after the declaration
+        exported: Whether the declaration is exported
+        default: Whether it is the default export
+        methods: Method names of a class, in declaration order
+        init: For variables, how the variable is initialized (INIT_*)
+        new_class: For variables initialized with 'new', the class name
+    """
+    kind: str
+    name: str
+    start: int
+    end: int
+    exported: bool = False
+    default: bool = False
+    methods: List[str] = field(default_factory=list)
+    init: Optional[str] = None
+    new_class: Optional[str] = None
+
+    @property
+    def is_function(self) -> bool:
+        """Whether the symbol is a function or a variable holding one."""
+        return self.kind == SYMBOL_FUNCTION or self.init in (INIT_FUNCTION, INIT_ARROW)
+
+
+@dataclass
+class TsSymbolTable:
+    """Top-level imports and declarations of a TypeScript source.
+
+    Attributes:
+        imports: Import declarations in source order
+        symbols: Declarations in source order
+        default_export: Name of the default export, if it is a plain name
+    """
+    imports: List[TsImport] = field(default_factory=list)
+    symbols: List[TsSymbol] = field(default_factory=list)
+    default_export: Optional[str] = None
+    _by_name: Dict[str, TsSymbol] = field(default_factory=dict, init=False, repr=False)
+
+    def add(self, symbol: TsSymbol) -> None:
+        """Add a declaration; the first declaration of a name wins lookups."""
+        self.symbols.append(symbol)
+        self._by_name.setdefault(symbol.name, symbol)
+
+    def get(self, name: str) -> Optional[TsSymbol]:
+        """Look up a declaration by name."""
+        return self._by_name.get(name)
+
+    def find_function(self, name: str) -> Optional[TsSymbol]:
+        """Look up a function declaration or a variable holding a function."""
+        symbol = self._by_name.get(name)
+        if symbol is not None and symbol.is_function:
+            return symbol
+        for symbol in self.symbols:
+            if symbol.name == name and symbol.is_function:
+                return symbol
+        return None
+
+    def functions(self) -> List[TsSymbol]:
+        """Get function declarations and variables holding functions."""
+        return [symbol for symbol in self.symbols if symbol.is_function]
+
+    def classes(self) -> List[TsSymbol]:
+        """Get class declarations."""
+        return [symbol for symbol in self.symbols if symbol.kind == SYMBOL_CLASS]
+
+
+def tokenize(source: str) -> List[Token]:
+    """Split TypeScript source into tokens, dropping whitespace and comments.
+
+    Args:
+        source: TypeScript source
+
+    Returns:
+        Tokens in source order
+    """
+    tokens: List[Token] = []
+    # '{' tokens and template substitutions that are still open
+    braces: List[object] = []
+    newline = False
+    pos = 0
+    length = len(source)
+    match_token = _TOKEN_RE.match
+
+    while pos < length:
+        char = source[pos]
+
+        if char == '`' or (char == '}' and braces and braces[-1] is _TEMPLATE_BRACE):
+            if char == '}':
+                braces.pop()
+            end, substitution = _scan_template(source, pos + 1)
+            tokens.append(Token(TOKEN_TEMPLATE, source[pos:end], pos, end, newline))
+            if substitution:
+                braces.append(_TEMPLATE_BRACE)
+            newline = False
+            pos = end
+            continue
+
+        if char == '/' and _starts_regex(tokens, source, pos):
+            match = _REGEX_BODY_RE.match(source, pos + 1)
+            end = match.end()
+            tokens.append(Token(TOKEN_REGEX, source[pos:end], pos, end, newline))
+            newline = False
+            pos = end
+            continue
+
+        match = match_token(source, pos)
+        kind = match.lastgroup
+        end = match.end()
+        if kind == 'space' or kind == 'line_comment':
+            pass
+        elif kind == 'newline':
+            newline = True
+        elif kind == 'block_comment':
+            newline = newline or '\n' in match.group()
+        else:
+            value = match.group()
+            if kind == 'punct':
+                if value == '{':
+                    braces.append(value)
+                elif value == '}' and braces:
+                    braces.pop()
+            tokens.append(Token(kind, value, pos, end, newline))
+            newline = False
+        pos = end
+
+    return tokens
+
+
+def _scan_template(source: str, pos: int) -> Tuple[int, bool]:
+    """Scan template literal text.
+
+    Args:
+        source: TypeScript source
+        pos: Offset after the opening backtick or substitution's closing brace
+
+    Returns:
+        (end offset, whether the text ends at a '${' substitution)
+    """
+    end = _TEMPLATE_CHUNK_RE.match(source, pos).end()
+    if source.startswith('${', end):
+        return end + 2, True
+    # Closing backtick, or end of an unterminated template
+    return min(end + 1, len(source)), False
+
+
+def _starts_regex(tokens: List[Token], source: str, pos: int) -> bool:
+    """Decide whether a slash starts a regular expression literal."""
+    if source.startswith(('//', '/*'), pos):
+        return False
+    if not tokens:
+        return True
+    previous = tokens[-1]
+    if previous.kind == TOKEN_NAME:
+        return previous.value in _REGEX_PRECEDING_KEYWORDS
+    if previous.kind == TOKEN_PUNCT:
+        return previous.value not in (')', ']', '}')
+    return False
+
+
+def _ends_expression(token: Token) -> bool:
+    """Whether a token can end an expression."""
+    if token.kind == TOKEN_PUNCT:
+        return token.value in (')', ']', '}')
+    return True
+
+
+def _starts_new_statement(previous: Token, token: Token) -> bool:
+    """Whether automatic semicolon insertion ends a statement before a token."""
+    if not token.newline_before or not _ends_expression(previous):
+        return False
+    if token.kind == TOKEN_NAME:
+        return token.value not in _CONTINUATION_KEYWORDS
+    if token.kind == TOKEN_PUNCT:
+        return token.value in ('@', '*')
+    return True
+
+
+class _Parser:
+    """Builds a symbol table from the tokens of one source."""
+
+    def __init__(self, source: str, tokens: List[Token]):
+        self.source = source
+        self.tokens = tokens
+        self.table = TsSymbolTable()
+        self._matching = self._match_brackets(tokens)
+
+    @staticmethod
+    def _match_brackets(tokens: List[Token]) -> Dict[int, int]:
+        """Map the index of each opening bracket to its closing bracket."""
+        matching: Dict[int, int] = {}
+        stack: List[int] = []
+        for index, token in enumerate(tokens):
+            if token.kind != TOKEN_PUNCT:
+                continue
+            if token.value in _OPENING:
+                stack.append(index)
+            elif token.value in _CLOSING and stack:
+                matching[stack.pop()] = index
+        # Unbalanced brackets close at the end of the source
+        for index in stack:
+            matching[index] = len(tokens) - 1
+        return matching
+
+    def value(self, index: int) -> Optional[str]:
+        """Get the text of a token, or None past the end."""
+        if index < len(self.tokens):
+            return self.tokens[index].value
+        return None
+
+    def skip_bracket(self, index: int) -> int:
+        """Get the index after the bracket group starting at index."""
+        return self._matching[index] + 1
+
+    def skip_statement(self, index: int, stop_at_comma: bool = False) -> int:
+        """Get the index of the first token after the statement at index.
+
+        The statement ends after a ';' or before a line break that automatic
+        semicolon insertion turns into a statement end.
+        """
+        tokens = self.tokens
+        count = len(tokens)
+        start = index
+        while index < count:
+            token = tokens[index]
+            if index > start and _starts_new_statement(tokens[index - 1], token):
+                return index
+            if token.kind == TOKEN_PUNCT:
+                if token.value in _OPENING:
+                    index = self.skip_bracket(index)
+                    continue
+                if token.value == ';':
+                    return index + 1
+                if token.value == ',' and stop_at_comma:
+                    return index
+                if token.value == '<' and stop_at_comma:
+                    # Commas between type arguments, e.g. new Map<K, V>(), do
+                    # not end the declarator
+                    after = self._skip_type_arguments(index)
+                    if after is not None:
+                        index = after
+                        continue
+                if token.value in _CLOSING:
+                    # Stray closing bracket; stop rather than run past it
+                    return index + 1
+            index += 1
+        return index
+
+    def _skip_type_arguments(self, index: int) -> Optional[int]:
+        """Get the index after the type argument list opened by the '<' at index.
+
+        Returns:
+            The index after the closing '>', or None if the '<' is a
+            less-than operator
+        """
+        tokens = self.tokens
+        depth = 0
+        while index < len(tokens):
+            token = tokens[index]
+            if token.kind == TOKEN_PUNCT:
+                if token.value == '<':
+                    depth += 1
+                elif token.value == '>':
+                    depth -= 1
+                    if not depth:
+                        return index + 1
+                elif token.value in _OPENING:
+                    index = self.skip_bracket(index)
+                    continue
+                elif token.value not in _TYPE_ARGUMENT_PUNCT:
+                    return None
+            elif token.kind not in (TOKEN_NAME, TOKEN_STRING, TOKEN_NUMBER):
+                return None
+            index += 1
+        return None
+
+    def end_offset(self, index: int) -> int:
+        """Get the end offset of the token before index."""
+        return self.tokens[index - 1].end if index > 0 else 0
+
+    def parse(self) -> TsSymbolTable:
+        """Parse all top-level statements."""
+        index = 0
+        count = len(self.tokens)
+        while index < count:
+            index = self.parse_statement(index)
+        return self.table
+
+    def parse_statement(self, index: int) -> int:
+        """Parse one top-level statement and return the index after it."""
+        tokens = self.tokens
+        start = tokens[index].start
+        exported = default = False
+        cursor = index
+
+        if self.value(cursor) == 'export':
+            exported = True
+            cursor += 1
+            if self.value(cursor) == 'default':
+                default = True
+                cursor += 1
+        if self.value(cursor) == 'declare':
+            cursor += 1
+
+        keyword = self.value(cursor)
+        if cursor >= len(tokens) or tokens[cursor].kind != TOKEN_NAME:
+            # Re-exports, 'export =' and expression statements declare nothing
+            return self.skip_statement(cursor)
+
+        if keyword == 'import' and not exported and self.value(cursor + 1) not in ('(', '.', '='):
+            return self.parse_import(cursor, start)
+        if keyword == 'async' and self.value(cursor + 1) == 'function':
+            cursor += 1
+            keyword = 'function'
+        if keyword == 'function':
+            return self.parse_function(cursor, start, exported, default)
+        if keyword == 'abstract' and self.value(cursor + 1) == 'class':
+            cursor += 1
+            keyword = 'class'
+        if keyword == 'class':
+            return self.parse_class(cursor, start, exported, default)
+        if keyword in ('const', 'let', 'var') and not default:
+            if keyword == 'const' and self.value(cursor + 1) == 'enum':
+                return self.skip_statement(cursor)
+            return self.parse_variables(cursor, start, exported)
+        if default:
+            end = self.skip_statement(cursor)
+            if end == cursor + 1 or (end == cursor + 2 and self.value(cursor + 1) == ';'):
+                self.table.default_export = keyword
+            return end
+        return self.skip_statement(cursor)
+
+    def parse_import(self, index: int, start: int) -> int:
+        """Parse an import declaration starting at the 'import' keyword."""
+        end = self.skip_statement(index)
+        tokens = self.tokens[index + 1:end]
+        if len(tokens) > 1 and tokens[1].value == '=':
+            # 'import x = require("module")'; namespace aliases import nothing
+            module_tokens = [token for token in tokens if token.kind == TOKEN_STRING]
+            if tokens[0].kind == TOKEN_NAME and module_tokens and self.value(index + 3) == 'require':
+                self.table.imports.append(TsImport(
+                    module=module_tokens[0].value[1:-1],
+                    names=[tokens[0].value],
+                    aliases={},
+                    type_only=False,
+                    start=start,
+                    end=self.end_offset(end)
+                ))
+            return end
+        type_only = bool(tokens) and tokens[0].value == 'type' and (
+            len(tokens) > 1 and tokens[1].value not in (',', 'from')
+        )
+        if type_only:
+            tokens = tokens[1:]
+
+        module = None
+        names: List[str] = []
+        aliases: Dict[str, str] = {}
+        position = 0
+        while position < len(tokens):
+            token = tokens[position]
+            if token.kind == TOKEN_STRING:
+                module = token.value[1:-1] if len(token.value) > 1 else ''
+                break
+            if token.value == '{':
+                close = position + 1
+                while close < len(tokens) and tokens[close].value != '}':
+                    close += 1
+                for specifier in self._split_specifiers(tokens[position + 1:close]):
+                    names.append(specifier)
+                    if ' as ' in specifier:
+                        original, alias = specifier.split(' as ', 1)
+                        aliases[original.strip()] = alias.strip()
+                position = close + 1
+                continue
+            if token.value == '*' and position + 2 < len(tokens) and tokens[position + 1].value == 'as':
+                names.append(tokens[position + 2].value)
+                position += 3
+                continue
+            if token.kind == TOKEN_NAME and token.value != 'from':
+                names.append(token.value)
+            position += 1
+
+        if module is not None:
+            self.table.imports.append(TsImport(
+                module=module,
+                names=names,
+                aliases=aliases,
+                type_only=type_only,
+                start=start,
+                end=self.end_offset(end)
+            ))
+        return end
+
+    @staticmethod
+    def _split_specifiers(tokens: List[Token]) -> List[str]:
+        """Split the tokens between import braces into specifiers."""
+        specifiers = []
+        current: List[str] = []
+        for token in tokens + [Token(TOKEN_PUNCT, ',', 0, 0, False)]:
+            if token.value == ',':
+                if current:
+                    specifiers.append(' '.join(current))
+                current = []
+            else:
+                current.append(token.value)
+        return specifiers
+
+    def parse_function(self, index: int, start: int, exported: bool, default: bool) -> int:
+        """Parse a function declaration starting at the 'function' keyword."""
+        cursor = index + 1
+        if self.value(cursor) == '*':
+            cursor += 1
+        name = None
+        if cursor < len(self.tokens) and self.tokens[cursor].kind == TOKEN_NAME:
+            name = self.tokens[cursor].value
+        end = self._skip_to_body(cursor)
+        if name is not None:
+            self.table.add(TsSymbol(
+                kind=SYMBOL_FUNCTION,
+                name=name,
+                start=start,
+                end=self.end_offset(end),
+                exported=exported,
+                default=default
+            ))
+            if default:
+                self.table.default_export = name
+        return end
+
+    def _skip_to_body(self, index: int) -> int:
+        """Get the index after the body of a declaration whose header starts at index.
+
+        Overload signatures and ambient declarations without a body end at
+        their statement end instead.
+        """
+        tokens = self.tokens
+        count = len(tokens)
+        seen_parameters = False
+        while index < count:
+            token = tokens[index]
+            if token.kind == TOKEN_PUNCT:
+                if token.value == '{' and (seen_parameters or self._is_class_body(index)):
+                    return self.skip_bracket(index)
+                if token.value == '(':
+                    seen_parameters = True
+                    index = self.skip_bracket(index)
+                    # Return type annotations may contain object types
+                    if self.value(index) == ':':
+                        index = self._skip_type(index + 1)
+                    continue
+                if token.value in ('[', '{'):
+                    index = self.skip_bracket(index)
+                    continue
+                if token.value == ';':
+                    return index + 1
+            if index > 0 and seen_parameters and _starts_new_statement(tokens[index - 1], token):
+                return index
+            index += 1
+        return index
+
+    def _is_class_body(self, index: int) -> bool:
+        """Whether the '{' at index opens a class body rather than a type."""
+        previous = self.tokens[index - 1] if index > 0 else None
+        return previous is not None and previous.value not in ('<', ',', ':', '|', '&', '=', 'extends')
+
+    def _skip_type(self, index: int) -> int:
+        """Get the index after a type annotation, stopping at a body or '=>'."""
+        tokens = self.tokens
+        count = len(tokens)
+        angle = 0
+        expects_type = True
+        while index < count:
+            token = tokens[index]
+            value = token.value
+            if token.kind == TOKEN_PUNCT:
+                if value == '<':
+                    angle += 1
+                elif value == '>' and angle:
+                    angle -= 1
+                elif value in ('(', '['):
+                    index = self.skip_bracket(index)
+                    expects_type = False
+                    continue
+                elif value == '{':
+                    if not expects_type and not angle:
+                        return index
+                    index = self.skip_bracket(index)
+                    expects_type = False
+                    continue
+                elif value in ('=>', ';', '=', ',') and not angle:
+                    if value == '=>' and expects_type:
+                        # Function type: the return type follows
+                        index += 1
+                        continue
+                    return index
+                expects_type = value in ('|', '&', '<', ',', '?', ':', '=>', '.')
+            else:
+                expects_type = False
+            index += 1
+        return index
+
+    def parse_class(self, index: int, start: int, exported: bool, default: bool) -> int:
+        """Parse a class declaration starting at the 'class' keyword."""
+        tokens = self.tokens
+        cursor = index + 1
+        name = None
+        if cursor < len(tokens) and tokens[cursor].kind == TOKEN_NAME and tokens[cursor].value not in (
+            'extends', 'implements'
+        ):
+            name = tokens[cursor].value
+            cursor += 1
+
+        # Find the class body, skipping generics and heritage clauses
+        angle = 0
+        while cursor < len(tokens):
+            value = tokens[cursor].value
+            if value == '<':
+                angle += 1
+            elif value == '>' and angle:
+                angle -= 1
+            elif value in ('(', '['):
+                cursor = self.skip_bracket(cursor)
+                continue
+            elif value == '{':
+                if not angle:
+                    break
+                cursor = self.skip_bracket(cursor)
+                continue
+            cursor += 1
+        if cursor >= len(tokens):
+            return cursor
+
+        close = self._matching[cursor]
+        methods = self._parse_members(cursor + 1, close)
+        end = close + 1
+        if name is not None:
+            self.table.add(TsSymbol(
+                kind=SYMBOL_CLASS,
+                name=name,
+                start=start,
+                end=self.end_offset(end),
+                exported=exported,
+                default=default,
+                methods=methods
+            ))
+            if default:
+                self.table.default_export = name
+        return end
+
+    def _parse_members(self, index: int, close: int) -> List[str]:
+        """Collect method names from a class body between index and close."""
+        tokens = self.tokens
+        methods: List[str] = []
+        while index < close:
+            token = tokens[index]
+            if token.value == ';':
+                index += 1
+                continue
+            # Decorators, e.g. '@log' or '@meta.tag({...})'
+            while index < close and tokens[index].value == '@':
+                index += 2
+                while index + 1 < close and tokens[index].value == '.':
+                    index += 2
+                if index < close and tokens[index].value == '(':
+                    index = self.skip_bracket(index)
+            accessor = False
+            while index + 1 < close and tokens[index].value in _MEMBER_PREFIXES and (
+                tokens[index + 1].kind == TOKEN_NAME or tokens[index + 1].value in ('[', '*', '#')
+            ):
+                accessor = accessor or tokens[index].value in ('get', 'set')
+                index += 1
+            if index < close and tokens[index].value == '*':
+                index += 1
+
+            member_start = index
+            if index < close and tokens[index].value == '[':
+                index = self.skip_bracket(index)
+                name = None
+            elif index + 1 < close and tokens[index].value == '#':
+                # Private name
+                name = '#' + tokens[index + 1].value
+                index += 2
+            elif index < close:
+                name = tokens[index].value
+                if tokens[index].kind == TOKEN_STRING:
+                    name = name[1:-1]
+                index += 1
+            else:
+                break
+            if index < close and tokens[index].value in ('?', '!'):
+                index += 1
+            if index < close and tokens[index].value == '<':
+                while index < close and tokens[index].value != '(':
+                    index += 1
+
+            if index < close and tokens[index].value == '(':
+                if name and name != 'constructor' and not accessor and name not in methods:
+                    methods.append(name)
+                index = self._skip_to_body(index)
+            else:
+                index = self.skip_statement(member_start)
+            index = min(index, close)
+        return methods
+
+    def parse_variables(self, index: int, start: int, exported: bool) -> int:
+        """Parse a variable statement starting at the 'const', 'let' or 'var' keyword."""
+        tokens = self.tokens
+        cursor = index + 1
+        while cursor < len(tokens):
+            declarator_start = cursor
+            if tokens[cursor].kind != TOKEN_NAME:
+                # Destructuring declares no single name
+                return self.skip_statement(cursor)
+            name = tokens[cursor].value
+            cursor += 1
+            if self.value(cursor) == '!':
+                cursor += 1
+            if self.value(cursor) == ':':
+                cursor = self._skip_type(cursor + 1)
+
+            init = new_class = None
+            if self.value(cursor) == '=':
+                init, new_class = self._classify_initializer(cursor + 1)
+            end = self.skip_statement(declarator_start, stop_at_comma=True)
+            self.table.add(TsSymbol(
+                kind=SYMBOL_VARIABLE,
+                name=name,
+                start=start,
+                end=self.end_offset(end),
+                exported=exported,
+                init=init or INIT_VALUE,
+                new_class=new_class
+            ))
+            if self.value(end) != ',':
+                return end
+            cursor = end + 1
+        return cursor
+
+    def _classify_initializer(self, index: int) -> Tuple[Optional[str], Optional[str]]:
+        """Classify a variable initializer starting at index.
+
+        Returns:
+            (INIT_* kind, class name for 'new' initializers)
+        """
+        tokens = self.tokens
+        count = len(tokens)
+        if index < count and tokens[index].value == 'async':
+            index += 1
+        if index >= count:
+            return None, None
+        token = tokens[index]
+        if token.value == 'function':
+            return INIT_FUNCTION, None
+        if token.value == 'new' and index + 1 < count and tokens[index + 1].kind == TOKEN_NAME:
+            return INIT_NEW, tokens[index + 1].value
+        if token.value == '<':
+            # Generic arrow function
+            while index < count and tokens[index].value != '(':
+                index += 1
+            token = tokens[index] if index < count else token
+        if token.value == '(':
+            after = self.skip_bracket(index)
+            if self.value(after) == ':':
+                after = self._skip_type(after + 1)
+            if self.value(after) == '=>':
+                return INIT_ARROW, None
+            return INIT_VALUE, None
+        if token.kind == TOKEN_NAME and self.value(index + 1) == '=>':
+            return INIT_ARROW, None
+        return INIT_VALUE, None
+
+
+def parse_symbols(source: str) -> TsSymbolTable:
+    """Tokenize a TypeScript source and build its symbol table.
+
+    Args:
+        source: TypeScript source
+
+    Returns:
+        Symbol table of the source's top-level declarations
+    """
+    tokens = tokenize(source)
+    if not tokens:
+        return TsSymbolTable()
+    return _Parser(source, tokens).parse()
+
+
+@lru_cache(maxsize=SYMBOL_TABLE_CACHE_SIZE)
+def get_symbol_table(source: str) -> TsSymbolTable:
+    """Get the symbol table of a source, parsing each distinct source once.
+
+    The returned table is shared between callers and must not be modified.
+
+    Args:
+        source: TypeScript source
+
+    Returns:
+        Symbol table of the source's top-level declarations
+    """
+    return parse_symbols(source)
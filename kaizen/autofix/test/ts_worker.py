@@ -0,0 +1,366 @@
+"""Long-lived Node worker for executing TypeScript agents.
+
+Starting ``npx ts-node`` costs several seconds per invocation. The worker
+keeps a single ts-node process alive for the whole test run, loads each agent
+module once and serves many invocations over a JSON-lines protocol on
+stdin/stdout.
+"""
+
+import atexit
+import itertools
+import json
+import logging
+import os
+import queue
+import subprocess
+import threading
+import time
+import uuid
+import weakref
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .enhanced_code_region import WORKER_MESSAGE_PREFIX, create_typescript_worker_script
+
+logger = logging.getLogger(__name__)
+
+# Default time to wait for the worker to start and load ts-node
+DEFAULT_WORKER_STARTUP_TIMEOUT = 120
+
+# Default time to wait for a single agent invocation
+DEFAULT_WORKER_CALL_TIMEOUT = 180
+
+# Time to wait for a health check response
+DEFAULT_HEALTH_CHECK_TIMEOUT = 10
+
+# Number of stderr lines kept for error reporting
+STDERR_TAIL_LINES = 50
+
+TS_NODE_COMPILER_OPTIONS = '{"module":"commonjs","target":"es2020","esModuleInterop":true,"skipLibCheck":true,"moduleResolution":"node16","allowImportingTsExtensions":true}'
+
+# Workers still running at interpreter exit are terminated
+_live_workers: "weakref.WeakSet[TypeScriptWorker]" = weakref.WeakSet()
+
+
+class WorkerError(Exception):
+    """Raised when the TypeScript worker cannot serve a request."""
+    pass
+
+
+class WorkerStartupError(WorkerError):
+    """Raised when the worker process cannot be started."""
+    pass
+
+
+class WorkerCrashedError(WorkerError):
+    """Raised when the worker process exits while a request is in flight."""
+    pass
+
+
+class TypeScriptWorker:
+    """Manages a persistent ts-node process serving agent invocations.
+
+    Requests are matched to responses by id, so several invocations may be in
+    flight at once. The process is started lazily, restarted automatically if
+    it has exited, and killed and restarted when a call times out.
+    """
+
+    def __init__(
+        self,
+        workspace_root: Path,
+        env: Optional[Dict[str, str]] = None,
+        startup_timeout: float = DEFAULT_WORKER_STARTUP_TIMEOUT,
+        command: Optional[List[str]] = None
+    ):
+        """Initialize the worker.
+
+        Args:
+            workspace_root: Directory the worker runs in; module paths are
+                resolved relative to it
+            env: Extra environment variables for the worker process
+            startup_timeout: Seconds to wait for the worker to become ready
+            command: Command used to start the worker; the worker script path
+                is appended. Defaults to ts-node via npx.
+        """
+        self.workspace_root = Path(workspace_root)
+        self.env = env or {}
+        self.startup_timeout = startup_timeout
+        self.command = command
+
+        self._process: Optional[subprocess.Popen] = None
+        self._script_path: Optional[Path] = None
+        # Request id -> (response queue, process the request was sent to)
+        self._pending: Dict[int, Tuple["queue.Queue[Dict[str, Any]]", subprocess.Popen]] = {}
+        self._ready = threading.Event()
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._stderr_tail: deque = deque(maxlen=STDERR_TAIL_LINES)
+        self.restarts = 0
+
+        _live_workers.add(self)
+
+    def invoke(
+        self,
+        module_path: str,
+        method_name: Optional[str],
+        input_data: List[Any],
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Invoke an agent module in the worker.
+
+        Args:
+            module_path: Import path of the module, relative to the workspace root
+            method_name: Optional method or export name to call
+            input_data: Positional arguments for the call
+            timeout: Seconds to wait for the result
+
+        Returns:
+            Dictionary with 'result' and 'tracked_values'
+
+        Raises:
+            subprocess.TimeoutExpired: If the call does not finish in time
+            WorkerError: If the worker fails or the agent raises an error
+        """
+        request = {
+            'type': 'invoke',
+            'module_path': module_path,
+            'method_name': method_name,
+            'input': input_data
+        }
+
+        try:
+            response = self._request(request, timeout or DEFAULT_WORKER_CALL_TIMEOUT)
+        except WorkerCrashedError:
+            # The worker died underneath the call; retry once on a fresh process
+            logger.warning("⚠️ TypeScript worker crashed, restarting and retrying once")
+            response = self._request(request, timeout or DEFAULT_WORKER_CALL_TIMEOUT)
+
+        if not response.get('ok'):
+            raise WorkerError(f"TypeScript execution failed: {response.get('error')}")
+
+        return {
+            'result': response.get('result'),
+            'tracked_values': response.get('tracked_values', {})
+        }
+
+    def health_check(self, timeout: float = DEFAULT_HEALTH_CHECK_TIMEOUT) -> bool:
+        """Check that the worker is running and responsive.
+
+        Args:
+            timeout: Seconds to wait for the worker to answer
+
+        Returns:
+            True if the worker answered the ping, False otherwise
+        """
+        try:
+            response = self._request({'type': 'ping'}, timeout)
+            return bool(response.get('ok'))
+        except (WorkerError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"TypeScript worker health check failed: {str(e)}")
+            return False
+
+    def is_running(self) -> bool:
+        """Check whether the worker process is alive."""
+        return self._process is not None and self._is_alive(self._process)
+
+    def stop(self) -> None:
+        """Stop the worker process and remove its script."""
+        with self._lock:
+            self._stop_locked()
+
+    def _request(self, message: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Send a request and wait for its response."""
+        process = self._ensure_started()
+
+        request_id = next(self._ids)
+        response_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=1)
+        self._pending[request_id] = (response_queue, process)
+
+        try:
+            if not self._is_alive(process):
+                raise WorkerCrashedError("TypeScript worker exited before the request was sent")
+
+            line = json.dumps({**message, 'id': request_id}, default=str)
+            try:
+                with self._write_lock:
+                    process.stdin.write(line + '\n')
+                    process.stdin.flush()
+            except (OSError, ValueError, AttributeError) as e:
+                raise WorkerCrashedError(f"Failed to send request to TypeScript worker: {str(e)}")
+
+            try:
+                response = response_queue.get(timeout=timeout)
+            except queue.Empty:
+                # The call may be stuck; a fresh process is the only safe recovery
+                logger.error(f"⏰ TypeScript worker call timed out after {timeout}s, restarting worker")
+                self._restart()
+                raise subprocess.TimeoutExpired(cmd='kaizen-ts-worker', timeout=timeout)
+
+            if response.get('crashed'):
+                raise WorkerCrashedError(
+                    f"TypeScript worker exited unexpectedly. stderr: {self._stderr_text()}"
+                )
+            return response
+        finally:
+            self._pending.pop(request_id, None)
+
+    def _ensure_started(self) -> subprocess.Popen:
+        """Start the worker process if it is not running.
+        
+        Returns:
+            The running worker process
+        """
+        with self._lock:
+            if self.is_running() and self._ready.is_set():
+                return self._process
+            if self._process is not None:
+                logger.warning("⚠️ TypeScript worker is not running, restarting")
+                self.restarts += 1
+                self._stop_locked()
+            self._start_locked()
+            return self._process
+
+    def _restart(self) -> None:
+        """Kill and restart the worker process."""
+        with self._lock:
+            self.restarts += 1
+            self._stop_locked()
+            self._start_locked()
+
+    def _start_locked(self) -> None:
+        """Start the worker process. Caller must hold the lock."""
+        self._script_path = self.workspace_root / f"temp_kaizen_ts_worker_{os.getpid()}_{uuid.uuid4().hex[:8]}.ts"
+        self._script_path.write_text(create_typescript_worker_script())
+
+        command = list(self.command) if self.command else [
+            'npx', 'ts-node',
+            '--transpile-only',
+            '--skip-project',
+            '--compiler-options', TS_NODE_COMPILER_OPTIONS
+        ]
+        command.append(str(self._script_path))
+
+        logger.info(f"🚀 Starting TypeScript worker in {self.workspace_root}")
+        start_time = time.time()
+        self._ready.clear()
+        self._stderr_tail.clear()
+
+        try:
+            self._process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                cwd=str(self.workspace_root),
+                env={**os.environ, 'NODE_ENV': 'production', **self.env}
+            )
+        except OSError as e:
+            self._remove_script()
+            raise WorkerStartupError(f"Failed to start TypeScript worker: {str(e)}")
+
+        process = self._process
+        threading.Thread(target=self._read_stdout, args=(process,), name="kaizen-ts-worker-stdout", daemon=True).start()
+        threading.Thread(target=self._read_stderr, args=(process,), name="kaizen-ts-worker-stderr", daemon=True).start()
+
+        if not self._ready.wait(self.startup_timeout) or process.poll() is not None:
+            stderr_text = self._stderr_text()
+            self._stop_locked()
+            raise WorkerStartupError(f"TypeScript worker failed to start. stderr: {stderr_text}")
+
+        logger.info(f"✅ TypeScript worker ready (took {time.time() - start_time:.2f}s)")
+
+    def _stop_locked(self) -> None:
+        """Stop the worker process. Caller must hold the lock."""
+        process = self._process
+        self._process = None
+        self._ready.clear()
+
+        if process is not None and process.poll() is None:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+            try:
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                try:
+                    process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    pass
+
+        self._remove_script()
+
+    def _remove_script(self) -> None:
+        """Delete the generated worker script."""
+        if self._script_path is not None:
+            try:
+                self._script_path.unlink()
+            except OSError:
+                pass
+            self._script_path = None
+
+    def _read_stdout(self, process: subprocess.Popen) -> None:
+        """Dispatch worker responses to waiting callers."""
+        for line in process.stdout:
+            line = line.rstrip('\n')
+            if not line.startswith(WORKER_MESSAGE_PREFIX):
+                # Output printed by the agent itself
+                if line.strip():
+                    logger.debug(f"ts-worker stdout: {line}")
+                continue
+
+            try:
+                message = json.loads(line[len(WORKER_MESSAGE_PREFIX):])
+            except ValueError:
+                logger.warning(f"Malformed message from TypeScript worker: {line[:200]}")
+                continue
+
+            if message.get('type') == 'ready':
+                self._ready.set()
+                continue
+
+            pending = self._pending.get(message.get('id'))
+            if pending is not None:
+                pending[0].put(message)
+
+        # The process exited; fail any requests still waiting on it. The flag
+        # is set first so no new request is sent to this process.
+        process.kaizen_output_closed = True
+        for response_queue, request_process in list(self._pending.values()):
+            if request_process is not process:
+                continue
+            try:
+                response_queue.put_nowait({'ok': False, 'crashed': True})
+            except queue.Full:
+                pass
+
+    @staticmethod
+    def _is_alive(process: subprocess.Popen) -> bool:
+        """Check that a worker process is running and its output is still open."""
+        return process.poll() is None and not getattr(process, 'kaizen_output_closed', False)
+
+    def _read_stderr(self, process: subprocess.Popen) -> None:
+        """Keep the tail of the worker's stderr for error reporting."""
+        for line in process.stderr:
+            line = line.rstrip('\n')
+            self._stderr_tail.append(line)
+            logger.debug(f"ts-worker stderr: {line}")
+
+    def _stderr_text(self) -> str:
+        """Get the recent stderr output as a single string."""
+        return '\n'.join(self._stderr_tail)
+
+
+@atexit.register
+def _stop_live_workers() -> None:
+    """Terminate any workers still running at interpreter exit."""
+    for worker in list(_live_workers):
+        try:
+            worker.stop()
+        except Exception:
+            pass
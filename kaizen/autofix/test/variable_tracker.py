@@ -5,15 +5,28 @@ during code execution, enabling evaluation of specific variables in addition
 to return values.
 """
 
+import os
 import sys
 import logging
 import json
-from typing import Dict, Any, Optional, Set, Callable
+import site
+import sysconfig
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Set, Callable, Iterable, List, Tuple
 from dataclasses import dataclass, field
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# sys.monitoring (PEP 669) is available from Python 3.12
+_HAS_MONITORING = hasattr(sys, 'monitoring')
+
+# Tool ids tried, in order, when registering with sys.monitoring
+_MONITORING_TOOL_IDS = (4, 3, 2, 1, 0, 5)
+_MONITORING_TOOL_NAME = 'kaizen-variable-tracker'
+
 @dataclass
 class VariableSnapshot:
     """Snapshot of a variable's value at a specific point in execution."""
@@ -31,57 +44,273 @@ class ExecutionContext:
     tracked_names: Set[str] = field(default_factory=set)
     is_tracking: bool = False
 
-class VariableTracker:
-    """Tracks variable assignments and values during code execution."""
+
+def _library_paths() -> List[str]:
+    """Get directories holding the standard library, installed packages and Kaizen itself."""
+    paths = set()
+    for key in ('stdlib', 'platstdlib', 'purelib', 'platlib'):
+        try:
+            paths.add(sysconfig.get_paths()[key])
+        except KeyError:
+            pass
+    try:
+        paths.update(site.getsitepackages())
+    except AttributeError:
+        # Not available in some virtualenv implementations
+        pass
+    user_site = getattr(site, 'USER_SITE', None)
+    if user_site:
+        paths.add(user_site)
+    paths.add(str(Path(__file__).resolve().parents[2]))
+    return [os.path.normcase(os.path.realpath(path)) + os.sep for path in paths if path]
+
+
+class CodeFilter:
+    """Decides which code objects belong to the agent and should be instrumented.
     
-    def __init__(self):
-        """Initialize the variable tracker."""
-        self.context = ExecutionContext()
-        self.original_trace = None
-        self._setup_trace_function()
-    
-    def _setup_trace_function(self):
-        """Set up the trace function for monitoring variable assignments."""
-        def trace_function(frame, event, arg):
-            if not self.context.is_tracking:
-                return None
-                
+    Code from the standard library, installed packages and Kaizen itself is
+    never instrumented. If source roots are given, only code under those roots
+    is instrumented. Code compiled from a string (an exec'd region, or a
+    dataclass ``__init__``) is judged by the file of the module it runs in.
+    Decisions are cached per file name, or per code object for string code.
+    """
+    
+    def __init__(self, source_roots: Optional[Iterable[Path]] = None):
+        """Initialize the filter.
+        
+        Args:
+            source_roots: Directories containing the agent's own files
+        """
+        self.source_roots = [
+            os.path.normcase(os.path.realpath(str(root))) + os.sep for root in source_roots
+        ] if source_roots else None
+        self._library_paths = _library_paths()
+        self._decisions: Dict[str, bool] = {}
+        self._string_code_decisions: Dict[Any, bool] = {}
+    
+    def is_agent_code(self, code, frame_globals: Dict[str, Any]) -> bool:
+        """Check whether a code object should be instrumented.
+        
+        Args:
+            code: Code object about to run
+            frame_globals: Globals of the frame running it
+        """
+        filename = code.co_filename
+        if filename.startswith('<'):
+            decision = self._string_code_decisions.get(code)
+            if decision is None:
+                decision = self._decide_string_code(filename, frame_globals)
+                self._string_code_decisions[code] = decision
+            return decision
+        
+        decision = self._decisions.get(filename)
+        if decision is None:
+            decision = self._decide(filename)
+            self._decisions[filename] = decision
+        return decision
+    
+    def _decide_string_code(self, filename: str, frame_globals: Dict[str, Any]) -> bool:
+        """Classify code compiled from a string by the module it runs in."""
+        if filename.startswith('<frozen'):
+            # Interpreter internals such as importlib
+            return False
+        module_file = frame_globals.get('__file__')
+        if isinstance(module_file, str):
+            return self._decide(module_file)
+        # Exec'd in a bare namespace, as Kaizen does for extracted regions
+        return True
+    
+    def _decide(self, filename: str) -> bool:
+        """Classify a source file name."""
+        path = os.path.normcase(os.path.realpath(filename))
+        if any(path.startswith(library_path) for library_path in self._library_paths):
+            return False
+        if self.source_roots is None:
+            return True
+        return any(path.startswith(root) for root in self.source_roots)
+
+
+class _TraceBackend:
+    """Tracks variables with sys.settrace, limited to agent code objects.
+    
+    The global trace function only returns a local tracer for agent frames,
+    so library code gets no line events. Like sys.settrace itself, this only
+    tracks the calling thread.
+    """
+    
+    def __init__(self, tracker: 'VariableTracker'):
+        self.tracker = tracker
+        self._previous_trace = None
+    
+    def install(self) -> None:
+        tracker = self.tracker
+        is_agent_code = tracker.code_filter.is_agent_code
+        on_line = tracker._on_line
+        on_return = tracker._on_return
+        
+        def local_trace(frame, event, arg):
             if event == 'line':
-                # Track variable assignments on each line
-                self._track_line_variables(frame)
+                on_line(frame, frame.f_lineno)
             elif event == 'return':
-                # Track return values
-                self._track_return_value(arg)
-                
-            return trace_function
+                on_return(arg)
+            return local_trace
+        
+        def global_trace(frame, event, arg):
+            if event == 'call' and is_agent_code(frame.f_code, frame.f_globals):
+                return local_trace
+            return None
+        
+        self._previous_trace = sys.gettrace()
+        sys.settrace(global_trace)
+    
+    def uninstall(self) -> None:
+        sys.settrace(self._previous_trace)
+        self._previous_trace = None
+
+
+class _MonitoringDispatcher:
+    """Shares one sys.monitoring tool id between trackers on all threads.
+    
+    Only PY_START is enabled globally. Agent code objects get LINE and
+    PY_RETURN events enabled locally; every other code object returns DISABLE
+    on its first call and costs nothing afterwards. Events are routed to the
+    tracker active on the calling thread.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active: Dict[int, 'VariableTracker'] = {}
+        self._instrumented: Set[Any] = set()
+        self._tool_id: Optional[int] = None
+        self._has_disabled_events = False
+    
+    def register(self, tracker: 'VariableTracker') -> None:
+        with self._lock:
+            if self._tool_id is None:
+                self._acquire_tool_id()
+            self._active[threading.get_ident()] = tracker
+    
+    def unregister(self, tracker: 'VariableTracker') -> None:
+        with self._lock:
+            thread_id = threading.get_ident()
+            if self._active.get(thread_id) is tracker:
+                del self._active[thread_id]
+            if not self._active and self._tool_id is not None:
+                self._release_tool_id()
+    
+    def _acquire_tool_id(self) -> None:
+        monitoring = sys.monitoring
+        for tool_id in _MONITORING_TOOL_IDS:
+            try:
+                monitoring.use_tool_id(tool_id, _MONITORING_TOOL_NAME)
+            except ValueError:
+                continue
+            self._tool_id = tool_id
+            break
+        else:
+            raise RuntimeError("No free sys.monitoring tool id for variable tracking")
+        
+        if self._has_disabled_events:
+            # Code objects disabled for an earlier tracker must be seen again
+            monitoring.restart_events()
+            self._has_disabled_events = False
         
-        self.trace_function = trace_function
+        events = monitoring.events
+        monitoring.register_callback(self._tool_id, events.PY_START, self._on_py_start)
+        monitoring.register_callback(self._tool_id, events.LINE, self._on_line)
+        monitoring.register_callback(self._tool_id, events.PY_RETURN, self._on_py_return)
+        monitoring.set_events(self._tool_id, events.PY_START)
+    
+    def _release_tool_id(self) -> None:
+        monitoring = sys.monitoring
+        monitoring.set_events(self._tool_id, monitoring.events.NO_EVENTS)
+        for code in self._instrumented:
+            monitoring.set_local_events(self._tool_id, code, monitoring.events.NO_EVENTS)
+        self._instrumented.clear()
+        monitoring.free_tool_id(self._tool_id)
+        self._tool_id = None
+    
+    def _on_py_start(self, code, instruction_offset):
+        tracker = self._active.get(threading.get_ident())
+        if tracker is None:
+            # Another thread is tracking; this code may still matter to it later
+            return None
+        if not tracker.code_filter.is_agent_code(code, sys._getframe(1).f_globals):
+            self._has_disabled_events = True
+            return sys.monitoring.DISABLE
+        if code not in self._instrumented:
+            events = sys.monitoring.events
+            sys.monitoring.set_local_events(self._tool_id, code, events.LINE | events.PY_RETURN)
+            self._instrumented.add(code)
+        return None
     
-    def _track_line_variables(self, frame):
-        """Track variables on the current line."""
+    def _on_line(self, code, line_number):
+        tracker = self._active.get(threading.get_ident())
+        if tracker is not None:
+            tracker._on_line(sys._getframe(1), line_number)
+    
+    def _on_py_return(self, code, instruction_offset, return_value):
+        tracker = self._active.get(threading.get_ident())
+        if tracker is not None:
+            tracker._on_return(return_value)
+
+
+_monitoring_dispatcher = _MonitoringDispatcher() if _HAS_MONITORING else None
+
+
+class _MonitoringBackend:
+    """Tracks variables with sys.monitoring on Python 3.12+."""
+    
+    def __init__(self, tracker: 'VariableTracker'):
+        self.tracker = tracker
+    
+    def install(self) -> None:
+        _monitoring_dispatcher.register(self.tracker)
+    
+    def uninstall(self) -> None:
+        _monitoring_dispatcher.unregister(self.tracker)
+
+
+class VariableTracker:
+    """Tracks variable assignments and values during code execution.
+    
+    Only code objects from the agent's own files are instrumented, and nothing
+    is installed when there are no variables to track.
+    """
+    
+    def __init__(self, source_roots: Optional[Iterable[Path]] = None):
+        """Initialize the variable tracker.
+        
+        Args:
+            source_roots: Directories containing the agent's own files. If not
+                given, all code outside the standard library and installed
+                packages is instrumented.
+        """
+        self.context = ExecutionContext()
+        self.code_filter = CodeFilter(source_roots)
+        self._backend = None
+        # Latest (value, line number) per tracked name, turned into snapshots
+        # when tracking stops so the per-line cost stays minimal
+        self._latest: Dict[str, Tuple[Any, Optional[int]]] = {}
+        self._tracked_names: Tuple[str, ...] = ()
+    
+    def _on_line(self, frame, line_number: Optional[int]) -> None:
+        """Record tracked variables visible in an agent frame."""
         try:
-            # Get local variables from the frame
             local_vars = frame.f_locals
-            
-            for var_name, value in local_vars.items():
-                # Only track variables we're interested in
-                if var_name in self.context.tracked_names:
-                    self._record_variable(var_name, value, frame.f_lineno)
-                    
+            for var_name in self._tracked_names:
+                if var_name in local_vars:
+                    self._latest[var_name] = (local_vars[var_name], line_number)
         except Exception as e:
             logger.debug(f"Error tracking line variables: {str(e)}")
     
-    def _track_return_value(self, return_value):
-        """Track the return value of a function."""
-        try:
-            self.context.return_value = return_value
-        except Exception as e:
-            logger.debug(f"Error tracking return value: {str(e)}")
+    def _on_return(self, return_value: Any) -> None:
+        """Track the return value of an agent function."""
+        self.context.return_value = return_value
     
     def _record_variable(self, name: str, value: Any, line_number: Optional[int] = None):
         """Record a variable's value."""
         try:
-            import time
             snapshot = VariableSnapshot(
                 name=name,
                 value=value,
@@ -100,28 +329,38 @@ class VariableTracker:
         Args:
             variable_names: Set of variable names to track
         """
-        self.context.tracked_names = variable_names
-        self.context.is_tracking = True
+        self.context.tracked_names = set(variable_names)
         self.context.variables.clear()
         self.context.return_value = None
+        self._latest.clear()
+        self._tracked_names = tuple(variable_names)
         
-        # Install trace function
-        self.original_trace = sys.gettrace()
-        sys.settrace(self.trace_function)
+        if not self._tracked_names:
+            logger.debug("No variables to track, skipping instrumentation")
+            return
+        
+        self.context.is_tracking = True
+        self._backend = _MonitoringBackend(self) if _HAS_MONITORING else _TraceBackend(self)
+        self._backend.install()
         
         logger.debug(f"Started tracking variables: {variable_names}")
     
     def stop_tracking(self):
         """Stop tracking variables."""
+        if self._backend is not None:
+            self._backend.uninstall()
+            self._backend = None
         self.context.is_tracking = False
-        
-        # Restore original trace function
-        if self.original_trace is not None:
-            sys.settrace(self.original_trace)
-            self.original_trace = None
+        self._flush()
         
         logger.debug("Stopped tracking variables")
     
+    def _flush(self) -> None:
+        """Turn the latest recorded values into snapshots."""
+        latest, self._latest = self._latest, {}
+        for name, (value, line_number) in latest.items():
+            self._record_variable(name, value, line_number)
+    
     def get_variable_value(self, name: str) -> Optional[Any]:
         """Get the value of a tracked variable.
         
@@ -131,6 +370,7 @@ class VariableTracker:
         Returns:
             The variable's value or None if not found
         """
+        self._flush()
         if name in self.context.variables:
             return self.context.variables[name].value
         return None
@@ -149,6 +389,7 @@ class VariableTracker:
         Returns:
             Dictionary containing all tracked values
         """
+        self._flush()
         result = {}
         
         # Add variable values
@@ -169,16 +410,17 @@ class VariableTracker:
         self.context.is_tracking = False
 
 @contextmanager
-def track_variables(variable_names: Set[str]):
+def track_variables(variable_names: Set[str], source_roots: Optional[Iterable[Path]] = None):
     """Context manager for tracking variables during execution.
     
     Args:
         variable_names: Set of variable names to track
+        source_roots: Directories containing the agent's own files
         
     Yields:
         VariableTracker instance
     """
-    tracker = VariableTracker()
+    tracker = VariableTracker(source_roots)
     try:
         tracker.start_tracking(variable_names)
         yield tracker
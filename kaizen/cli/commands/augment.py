@@ -22,13 +22,11 @@ from typing import List, Dict, Any, Optional
 
 # Third-party imports
 import click
-import google.generativeai as genai
 from rich.console import Console
 from rich.logging import RichHandler
 from ruamel.yaml import YAML
 
 # Local application imports
-from .config import ConfigurationManager
 from .errors import ConfigurationError
 
 def analyze_test_structure(tests: List[Dict]) -> Dict[str, Any]:
@@ -401,6 +399,8 @@ def generate_additional_tests(existing_tests: List[Dict], target_total: int, use
     if not api_key:
         raise ValueError("GOOGLE_API_KEY environment variable not set")
     
+    # Imported here so that loading the CLI does not pay for the SDK import
+    import google.generativeai as genai
     genai.configure(api_key=api_key)
     
     # Select model based on better_ai flag
@@ -54,7 +54,9 @@ class ConfigurationManager:
         base_branch: str = 'main',
         pr_strategy: str = 'ALL_PASSING',
         framework: Optional[str] = None,
-        better_ai: bool = False
+        better_ai: bool = False,
+        no_eval_cache: bool = False,
+        max_failures: Optional[int] = None
     ) -> Result[TestConfiguration]:
         """Load and validate test configuration, allowing CLI overrides except for language.
         
@@ -67,6 +69,9 @@ class ConfigurationManager:
             pr_strategy: Strategy for when to create PRs
             framework: Framework override (if provided)
             better_ai: Whether to use enhanced AI model
+            no_eval_cache: Whether to disable the LLM evaluation cache
+            max_failures: Number of failing steps after which the test run
+                stops (if provided)
         Returns:
             Result containing the validated configuration or an error
         """
@@ -86,12 +91,17 @@ class ConfigurationManager:
                 'max_retries': max_retries,
                 'base_branch': base_branch,
                 'pr_strategy': pr_strategy,
-                'better_ai': better_ai
+                'better_ai': better_ai,
+                'no_eval_cache': no_eval_cache
             }
             
             # Add framework override if provided
             if framework is not None:
                 cli_overrides['framework'] = framework
+            
+            # Add failure limit override if provided
+            if max_failures is not None:
+                cli_overrides['max_failures'] = max_failures
 
             logger.debug(f"Original config_data language: {config_data.get('language', 'NOT_SET')}")
             logger.debug(f"CLI overrides: {cli_overrides}")
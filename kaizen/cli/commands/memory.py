@@ -39,8 +39,8 @@ ExecutionMemory stores data in a hierarchical structure:
    - attempt_number: int - Which fix attempt
    - approach_description: str - What was tried
    - code_changes_made: str - Specific changes
-   - original_code: str - Code before fix
-   - modified_code: str - Code after fix
+   - original_code_key: str - Snapshot key of the code before the fix
+   - modified_code_key: str - Snapshot key of the code after the fix
    - test_results_before: Dict - Test results before fix
    - test_results_after: Dict - Test results after fix
    - success: bool - Whether fix worked
@@ -103,6 +103,17 @@ KEY METHODS:
 - get_failure_analysis_data(): Get surgical fix targeting data
 - inspect_structure(): Debug method to see complete structure
 - get_memory_summary(): Get summary statistics
+- get_execution_history() / get_file_attempt_history(): Query history
+  stored by the storage backend across runs
+
+STORAGE:
+=======
+
+Records of the current execution are kept in process. A storage backend
+(see memory_store.py) also persists each record as it is logged; with a
+persistent backend such as SQLite, history survives across runs and only
+the most recent test runs, LLM interactions and fix attempts (and the code
+snapshots they reference) are kept in process.
 """
 
 import logging
@@ -113,7 +124,13 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, asdict
 import json
 import os
-import google.generativeai as genai
+
+from .memory_store import MemoryStore
+from .snapshots import SnapshotStore
+
+# Test runs, LLM interactions and fix attempts kept in process when a
+# persistent storage backend holds the full history
+DEFAULT_MAX_RECORDS_IN_MEMORY = 50
 
 
 @dataclass
@@ -152,8 +169,8 @@ class FixAttempt:
     file_path: str  # Add file_path field
     approach_description: str
     code_changes_made: str
-    original_code: str
-    modified_code: str
+    original_code_key: Optional[str]  # Key in ExecutionMemory.code_snapshots
+    modified_code_key: Optional[str]  # Key in ExecutionMemory.code_snapshots
     test_results_before: Dict
     test_results_after: Dict
     success: bool
@@ -211,10 +228,27 @@ class TestRun:
 class ExecutionMemory:
     """Single source of truth for ALL execution data, test logs, and LLM interactions."""
     
-    def __init__(self):
+    def __init__(self, store: Optional[MemoryStore] = None, max_records_in_memory: int = DEFAULT_MAX_RECORDS_IN_MEMORY):
+        """Initialize the memory.
+        
+        Args:
+            store: Storage backend records are persisted to; by default
+                records are only kept in process
+            max_records_in_memory: Number of test runs, LLM interactions and
+                fix attempts kept in process when the backend is persistent
+        """
         self.executions = {}  # execution_id -> execution_data
         self.current_execution = None
         self.logger = logging.getLogger(__name__)
+        self.store = store or MemoryStore()
+        self.max_records_in_memory = max(2, max_records_in_memory)
+        self._fix_attempts_by_file: Dict[str, List[FixAttempt]] = {}
+        self._indexed_fix_attempts = 0
+        self._test_run_count = 0
+        # Code before and after each fix attempt of the current execution,
+        # stored once per distinct text and as diffs against the first
+        # snapshot of each file
+        self.code_snapshots = SnapshotStore()
 
     def _serialize_config_object(self, config, _visited=None) -> Dict:
         """Serialize a TestConfiguration object to a dictionary for storage.
@@ -342,7 +376,19 @@ class ExecutionMemory:
                     'loaded_successfully': True
                 }
             }
-        self.executions[execution_id] = self.current_execution
+        # Only the current execution is kept in process; fix attempts
+        # reference code snapshots, which are released with the execution
+        self.executions = {execution_id: self.current_execution}
+        self.code_snapshots = SnapshotStore()
+        self._fix_attempts_by_file = {}
+        self._indexed_fix_attempts = 0
+        self._test_run_count = 0
+        self._persist(
+            'start_execution',
+            execution_id,
+            self.current_execution['start_time'],
+            self.current_execution.get('configuration_context', {})
+        )
         self.logger.info(f"Started execution tracking: {execution_id}")
     
     def log_test_run(self, file_path: str, test_results: Dict, run_metadata: Optional[Dict] = None) -> None:
@@ -367,9 +413,11 @@ class ExecutionMemory:
         timing_analysis = test_results.get('timing_analysis', {})
         error_analysis = test_results.get('error_analysis', {})
         
+        # Count runs rather than using the list length, which is bounded
+        self._test_run_count = max(self._test_run_count, len(self.current_execution['test_runs'])) + 1
         test_run = TestRun(
-            test_run_id=f"run_{len(self.current_execution['test_runs']) + 1}",
-            attempt_number=len(self.current_execution['test_runs']) + 1,
+            test_run_id=f"run_{self._test_run_count}",
+            attempt_number=self._test_run_count,
             timestamp=datetime.now(),
             test_inputs=test_results.get('inputs', []),
             test_outputs=test_results.get('outputs', []),
@@ -389,6 +437,12 @@ class ExecutionMemory:
         )
         
         self.current_execution['test_runs'].append(test_run)
+        self._persist('add_test_run', self.current_execution['execution_id'], file_path, test_run)
+        if self.store.persistent:
+            # Keep the baseline run, which regression analysis compares against
+            runs = self.current_execution['test_runs']
+            if len(runs) > self.max_records_in_memory:
+                del runs[1:len(runs) - self.max_records_in_memory + 1]
         
         # Log detailed information about the test run
         total_tests = len(test_cases)
@@ -432,6 +486,11 @@ class ExecutionMemory:
         )
         
         self.current_execution['llm_interactions'].append(interaction)
+        self._persist('add_llm_interaction', self.current_execution['execution_id'], file_path, interaction)
+        if self.store.persistent:
+            interactions = self.current_execution['llm_interactions']
+            if len(interactions) > self.max_records_in_memory:
+                del interactions[:len(interactions) - self.max_records_in_memory]
         self.logger.debug(f"Logged LLM interaction: {interaction_type} for {file_path}")
     
     def log_fix_attempt(self, file_path: str, attempt_number: int, 
@@ -470,8 +529,8 @@ class ExecutionMemory:
             file_path=file_path,
             approach_description=approach_description,
             code_changes_made=code_changes,
-            original_code=original_code,
-            modified_code=fixed_code,
+            original_code_key=self.code_snapshots.put(original_code, lineage=file_path),
+            modified_code_key=self.code_snapshots.put(fixed_code, lineage=file_path),
             test_results_before=test_results_before,
             test_results_after=test_results_after,
             success=success,
@@ -500,6 +559,17 @@ class ExecutionMemory:
             'agent_entry_point': complete_config.get('agent')
         }
         self.current_execution['fix_attempts'].append(fix_attempt)
+        self._persist('add_fix_attempt', self.current_execution['execution_id'], fix_attempt, original_code, fixed_code)
+        if self.store.persistent:
+            attempts = self.current_execution['fix_attempts']
+            if len(attempts) > self.max_records_in_memory:
+                del attempts[:len(attempts) - self.max_records_in_memory]
+                self._fix_attempts_by_file = {}
+                self._indexed_fix_attempts = 0
+                # Older attempts remain in the backend; drop their code
+                self.code_snapshots.retain(
+                    key for attempt in attempts for key in (attempt.original_code_key, attempt.modified_code_key)
+                )
         self.logger.info(f"Logged fix attempt {attempt_number} for {file_path}: {'SUCCESS' if success else 'FAILED'}")
     
     def save_original_relevant_code(self, file_path: str, relevant_sections: Dict) -> None:
@@ -514,8 +584,83 @@ class ExecutionMemory:
             return
         
         self.current_execution['original_code_sections'][file_path] = relevant_sections
+        self._persist('save_original_code', self.current_execution['execution_id'], file_path, relevant_sections)
         self.logger.info(f"Saved original code sections for {file_path}: {list(relevant_sections.keys())}")
     
+    def get_execution_history(self, limit: Optional[int] = None) -> List[Dict]:
+        """Get executions recorded by the storage backend, including previous runs.
+
+        Args:
+            limit: Maximum number of executions to return
+
+        Returns:
+            Execution summaries, most recent first
+        """
+        return self.store.list_executions(limit)
+
+    def get_file_attempt_history(self, file_path: str, limit: Optional[int] = None) -> List[Dict]:
+        """Get fix attempts for a file recorded by the storage backend across runs.
+
+        Code and full results are not loaded; pass the summary's ``*_blob``
+        fields to load_stored_value() to get them.
+
+        Args:
+            file_path: Path to the file
+            limit: Maximum number of attempts to return
+
+        Returns:
+            Fix attempt summaries, most recent first
+        """
+        return self.store.get_fix_attempts(file_path=file_path, limit=limit)
+
+    def load_stored_value(self, blob_id: Optional[int]) -> Any:
+        """Load a large value referenced by a stored summary.
+
+        Args:
+            blob_id: Value of a summary's ``*_blob`` field
+
+        Returns:
+            The stored value, or None if unavailable
+        """
+        return self.store.load_blob(blob_id)
+
+    def get_code_snapshot(self, key: Optional[str]) -> Optional[str]:
+        """Get the code a fix attempt recorded under a snapshot key.
+        
+        Args:
+            key: original_code_key or modified_code_key of a FixAttempt of
+                the current execution
+            
+        Returns:
+            The code, or None if the key is unknown
+        """
+        return self.code_snapshots.get(key)
+
+    def _persist(self, method: str, *args) -> None:
+        """Write a record to the storage backend without failing the run."""
+        try:
+            getattr(self.store, method)(*args)
+        except Exception as e:
+            self.logger.warning(f"Failed to persist execution memory ({method}): {str(e)}")
+
+    def _get_file_attempts(self, file_path: Optional[str]) -> List[FixAttempt]:
+        """Get the current execution's fix attempts for a file, in order.
+
+        Attempts are indexed by file as they are appended, so lookups do not
+        rescan every attempt.
+        """
+        fix_attempts = self.current_execution.get('fix_attempts', [])
+        if not file_path:
+            return fix_attempts
+        if self._indexed_fix_attempts > len(fix_attempts):
+            # The list was replaced; rebuild the index
+            self._fix_attempts_by_file = {}
+            self._indexed_fix_attempts = 0
+        for attempt in fix_attempts[self._indexed_fix_attempts:]:
+            self._fix_attempts_by_file.setdefault(attempt.file_path, []).append(attempt)
+        self._indexed_fix_attempts = len(fix_attempts)
+        return self._fix_attempts_by_file.get(file_path, [])
+
     def get_failure_analysis_data(self, file_path: str) -> Dict:
         """Extract everything needed for surgical fixing including original code.
         
@@ -646,8 +791,7 @@ class ExecutionMemory:
             return {}
         
         # First try to find best attempt from fix_attempts (more accurate)
-        fix_attempts = self.current_execution.get('fix_attempts', [])
-        file_attempts = [attempt for attempt in fix_attempts if attempt.file_path == file_path] if file_path else fix_attempts
+        file_attempts = self._get_file_attempts(file_path)
         
         best_attempt = None
         best_success_rate = 0
@@ -1279,6 +1423,8 @@ class ExecutionMemory:
                 self.logger.warning("GOOGLE_API_KEY not found, using fallback analysis")
                 return self._fallback_analysis(test_results_before, test_results_after)
             
+            # Imported here so that loading the memory module stays cheap
+            import google.generativeai as genai
             genai.configure(api_key=api_key)
             model = genai.GenerativeModel('gemini-2.5-flash-preview-05-20')
             
@@ -1444,6 +1590,120 @@ Be specific, actionable, and focus on patterns that can inform future fix attemp
         
         return lessons_learned, why_approach_failed, what_worked_partially
 
+    def get_memory_summary(self) -> Dict:
+        """Get summary statistics of the current execution.
+
+        Returns:
+            Dictionary of execution, test, fix attempt, LLM interaction,
+            configuration and learning statistics, or {'error': ...} if no
+            execution is being tracked
+        """
+        if not self.current_execution:
+            return {'error': 'No current execution found'}
+
+        execution = self.current_execution
+        statistics = self.get_comprehensive_test_analysis().get('overall_statistics', {})
+        fix_attempts = execution.get('fix_attempts', [])
+        successful_fixes = sum(1 for attempt in fix_attempts if attempt.success)
+        interactions = execution.get('llm_interactions', [])
+        interaction_types: Dict[str, int] = {}
+        for interaction in interactions:
+            interaction_types[interaction.interaction_type] = interaction_types.get(interaction.interaction_type, 0) + 1
+        prompt_chars = sum(len(interaction.prompt or '') for interaction in interactions)
+        response_chars = sum(len(interaction.response or '') for interaction in interactions)
+        config_context = execution.get('configuration_context', {})
+        config_values = config_context.get('config_values', {})
+        config_metadata = config_context.get('config_metadata', {})
+        learning_history = execution.get('learning_history', {})
+        start_time = execution.get('start_time')
+
+        return {
+            'execution_id': execution.get('execution_id'),
+            'start_time': start_time,
+            'duration': str(datetime.now() - start_time) if start_time else 'Unknown',
+            'test_execution': {
+                'total_runs': len(execution.get('test_runs', [])),
+                'total_test_cases': statistics.get('total_test_cases', 0),
+                'total_passed': statistics.get('total_passed', 0),
+                'total_failed': statistics.get('total_failed', 0),
+                'total_errors': statistics.get('total_errors', 0),
+                'average_success_rate': statistics.get('average_success_rate', 0.0),
+                'best_success_rate': statistics.get('best_success_rate', 0.0),
+                'worst_success_rate': statistics.get('worst_success_rate', 0.0) if statistics.get('total_test_cases') else 0.0
+            },
+            'fix_attempts': {
+                'total_attempts': len(fix_attempts),
+                'successful_fixes': successful_fixes,
+                'failed_fixes': len(fix_attempts) - successful_fixes,
+                'success_rate': successful_fixes / len(fix_attempts) if fix_attempts else 0.0
+            },
+            'llm_interactions': {
+                'total_interactions': len(interactions),
+                'interaction_types': interaction_types,
+                'total_prompt_chars': prompt_chars,
+                'total_response_chars': response_chars,
+                'average_prompt_length': prompt_chars / len(interactions) if interactions else 0,
+                'average_response_length': response_chars / len(interactions) if interactions else 0
+            },
+            'configuration': {
+                'config_name': config_metadata.get('config_name'),
+                'auto_fix_enabled': config_values.get('auto_fix'),
+                'better_ai_enabled': config_values.get('better_ai', False),
+                'max_retries': config_values.get('max_retries'),
+                'language': config_values.get('language'),
+                'files_to_fix': config_metadata.get('files_to_fix') or []
+            },
+            'learning_data': {
+                'original_code_sections': len(execution.get('original_code_sections', {})),
+                'failed_approaches': len(learning_history.get('failed_approaches', [])),
+                'successful_patterns': len(learning_history.get('successful_patterns', []))
+            },
+            'code_snapshots': self.code_snapshots.get_stats()
+        }
+
+    def export_memory_to_json(self, file_path: Optional[str] = None) -> Dict:
+        """Export the current execution to a JSON-serializable dictionary.
+
+        Fix attempts reference their code by snapshot key; each distinct
+        snapshot is exported once under 'code_snapshots', either in full or
+        as a line diff against its file's base snapshot, so the export does
+        not repeat every file's contents for every attempt.
+
+        Args:
+            file_path: Optional path to write the JSON to
+
+        Returns:
+            The exported data
+        """
+        if not self.current_execution:
+            data: Dict[str, Any] = {'error': 'No current execution found'}
+        else:
+            execution = self.current_execution
+            fix_attempts = []
+            snapshot_keys = []
+            for attempt in execution.get('fix_attempts', []):
+                record = asdict(attempt)
+                record['config_context'] = getattr(attempt, 'config_context', None)
+                snapshot_keys.extend([attempt.original_code_key, attempt.modified_code_key])
+                fix_attempts.append(record)
+
+            data = {
+                'execution_id': execution.get('execution_id'),
+                'start_time': execution.get('start_time'),
+                'configuration_context': execution.get('configuration_context', {}),
+                'test_runs': [asdict(run) for run in execution.get('test_runs', [])],
+                'llm_interactions': [asdict(interaction) for interaction in execution.get('llm_interactions', [])],
+                'fix_attempts': fix_attempts,
+                'code_snapshots': self.code_snapshots.export(snapshot_keys),
+                'original_code_sections': execution.get('original_code_sections', {}),
+                'learning_history': execution.get('learning_history', {})
+            }
+
+        if file_path:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, default=str)
+        return data
+
     def get_memory_schema(self) -> Dict:
         """Get the complete schema of the memory data structure.
         
@@ -1490,8 +1750,8 @@ Be specific, actionable, and focus on patterns that can inform future fix attemp
                     'attempt_number': {'type': 'int', 'description': 'Which fix attempt'},
                     'approach_description': {'type': 'str', 'description': 'What was tried'},
                     'code_changes_made': {'type': 'str', 'description': 'Specific changes'},
-                    'original_code': {'type': 'str', 'description': 'Code before fix'},
-                    'modified_code': {'type': 'str', 'description': 'Code after fix'},
+                    'original_code_key': {'type': 'str', 'description': 'Snapshot key of the code before the fix'},
+                    'modified_code_key': {'type': 'str', 'description': 'Snapshot key of the code after the fix'},
                     'test_results_before': {'type': 'Dict', 'description': 'Test results before fix'},
                     'test_results_after': {'type': 'Dict', 'description': 'Test results after fix'},
                     'success': {'type': 'bool', 'description': 'Whether fix worked'},
@@ -1563,8 +1823,7 @@ Be specific, actionable, and focus on patterns that can inform future fix attemp
             max_retries = 3  # Default fallback
         
         # Get fix attempts for this file
-        fix_attempts = self.current_execution.get('fix_attempts', [])
-        file_attempts = [attempt for attempt in fix_attempts if attempt.file_path == file_path] if file_path else fix_attempts
+        file_attempts = self._get_file_attempts(file_path)
         
         # Basic checks
         if len(file_attempts) >= max_retries:
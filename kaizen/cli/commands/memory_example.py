@@ -7,8 +7,8 @@ Usage:
     python -m kaizen.cli.commands.memory_example
 """
 
-from memory import ExecutionMemory
-from memory_inspector import MemoryInspector, quick_inspect, detailed_inspect
+from kaizen.cli.commands.memory import ExecutionMemory
+from kaizen.cli.commands.memory_inspector import MemoryInspector, quick_inspect, detailed_inspect
 
 
 def create_sample_memory():
@@ -82,7 +82,7 @@ def create_sample_memory():
     )
     
     # Add a fix attempt
-    from memory import LLMInteraction
+    from kaizen.cli.commands.memory import LLMInteraction
     
     llm_interaction = LLMInteraction(
         interaction_type="code_fixing",
@@ -0,0 +1,536 @@
+"""Storage backends for ExecutionMemory.
+
+ExecutionMemory keeps the records of the current execution in process, where
+the learning logic reads them. A storage backend additionally persists every
+record as it is logged, so history survives the process and can be queried
+across runs, and the in-process lists can be bounded on long runs.
+
+Backends:
+- 'memory': keeps nothing beyond ExecutionMemory's own lists
+- 'sqlite': local database (the CLI default) with indexed tables per
+  execution and file path; prompts, code and other large values are stored
+  compressed and deduplicated in a separate table and only loaded when
+  asked for
+
+Other backends can be added with register_memory_backend().
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import zlib
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Backend names
+MEMORY_BACKEND_MEMORY = 'memory'
+MEMORY_BACKEND_SQLITE = 'sqlite'
+
+# Default database location and retention
+DEFAULT_MEMORY_DB_PATH = Path.home() / '.kaizen' / 'memory.db'
+DEFAULT_MAX_STORED_EXECUTIONS = 50
+
+# Bump when the database schema changes
+MEMORY_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS executions (
+    execution_id TEXT PRIMARY KEY,
+    start_time TEXT NOT NULL,
+    config_name TEXT,
+    config_blob INTEGER
+);
+CREATE TABLE IF NOT EXISTS test_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    execution_id TEXT NOT NULL,
+    file_path TEXT,
+    test_run_id TEXT,
+    attempt_number INTEGER,
+    timestamp TEXT,
+    total_tests INTEGER,
+    passed_tests INTEGER,
+    failed_tests INTEGER,
+    success_rate REAL,
+    data_blob INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_test_runs_execution ON test_runs (execution_id, file_path);
+CREATE TABLE IF NOT EXISTS fix_attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    execution_id TEXT NOT NULL,
+    file_path TEXT,
+    attempt_number INTEGER,
+    timestamp TEXT,
+    success INTEGER,
+    total_tests INTEGER,
+    passed_tests INTEGER,
+    success_rate REAL,
+    approach_description TEXT,
+    lessons_learned TEXT,
+    why_approach_failed TEXT,
+    what_worked_partially TEXT,
+    original_code_blob INTEGER,
+    modified_code_blob INTEGER,
+    details_blob INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_fix_attempts_execution ON fix_attempts (execution_id, file_path);
+CREATE INDEX IF NOT EXISTS idx_fix_attempts_file ON fix_attempts (file_path, timestamp);
+CREATE TABLE IF NOT EXISTS llm_interactions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    execution_id TEXT NOT NULL,
+    file_path TEXT,
+    interaction_type TEXT,
+    timestamp TEXT,
+    prompt_blob INTEGER,
+    response_blob INTEGER,
+    reasoning TEXT,
+    metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_llm_interactions_execution ON llm_interactions (execution_id, file_path);
+CREATE TABLE IF NOT EXISTS original_code (
+    execution_id TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    sections_blob INTEGER,
+    PRIMARY KEY (execution_id, file_path)
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    execution_id TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_blobs_digest ON blobs (execution_id, digest);
+"""
+
+# Tables holding per-execution rows, deleted together when pruning
+_EXECUTION_TABLES = ('test_runs', 'fix_attempts', 'llm_interactions', 'original_code', 'blobs', 'executions')
+
+
+def _to_json(value: Any) -> str:
+    """Serialize a record value, converting dataclasses and other objects."""
+    if is_dataclass(value) and not isinstance(value, type):
+        value = asdict(value)
+    return json.dumps(value, default=str)
+
+
+def _summary_counts(results: Optional[Dict]) -> Dict[str, Any]:
+    """Pull the test counts out of a legacy-format result summary."""
+    summary = (results or {}).get('summary') or {}
+    total = summary.get('total_tests')
+    passed = summary.get('passed_tests')
+    success_rate = summary.get('success_rate')
+    if success_rate is None and total:
+        success_rate = (passed or 0) / total
+    return {
+        'total_tests': total,
+        'passed_tests': passed,
+        'failed_tests': summary.get('failed_tests'),
+        'success_rate': success_rate
+    }
+
+
+class MemoryStore:
+    """Storage backend that keeps nothing beyond ExecutionMemory's own lists.
+
+    Subclasses persist records and answer history queries.
+    """
+
+    # Whether records survive in the backend once dropped from memory
+    persistent = False
+
+    def start_execution(self, execution_id: str, start_time: datetime, configuration_context: Dict) -> None:
+        """Record the start of an execution."""
+
+    def add_test_run(self, execution_id: str, file_path: str, test_run: Any) -> None:
+        """Record a TestRun."""
+
+    def add_llm_interaction(self, execution_id: str, file_path: str, interaction: Any) -> None:
+        """Record an LLMInteraction."""
+
+    def add_fix_attempt(
+        self,
+        execution_id: str,
+        fix_attempt: Any,
+        original_code: Optional[str] = None,
+        modified_code: Optional[str] = None
+    ) -> None:
+        """Record a FixAttempt and the code before and after it."""
+
+    def save_original_code(self, execution_id: str, file_path: str, sections: Dict) -> None:
+        """Record the original code sections of a file."""
+
+    def list_executions(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get stored executions, most recent first."""
+        return []
+
+    def get_test_runs(
+        self,
+        execution_id: Optional[str] = None,
+        file_path: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get stored test run summaries, most recent first."""
+        return []
+
+    def get_fix_attempts(
+        self,
+        file_path: Optional[str] = None,
+        execution_id: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get stored fix attempt summaries, most recent first."""
+        return []
+
+    def get_llm_interactions(
+        self,
+        execution_id: Optional[str] = None,
+        file_path: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get stored LLM interaction summaries, most recent first."""
+        return []
+
+    def load_blob(self, blob_id: Optional[int]) -> Any:
+        """Load a large value referenced by a summary's ``*_blob`` field."""
+        return None
+
+    def close(self) -> None:
+        """Release the backend's resources."""
+
+
+class SQLiteMemoryStore(MemoryStore):
+    """SQLite storage backend.
+
+    Summaries (ids, file paths, attempt numbers, test counts, lessons) live
+    in indexed tables. Prompts, responses, code and full results are stored
+    zlib-compressed in a blobs table and referenced by id, so history queries
+    never read them. The database is opened on first use and keeps the most
+    recent ``max_executions`` executions.
+    """
+
+    persistent = True
+
+    def __init__(self, path: Optional[Path] = None, max_executions: int = DEFAULT_MAX_STORED_EXECUTIONS):
+        """Initialize the store.
+
+        Args:
+            path: Database file (':memory:' for a private in-memory database)
+            max_executions: Number of executions kept; older ones are deleted
+                when a new execution starts
+        """
+        self.path = str(path or DEFAULT_MEMORY_DB_PATH)
+        self.max_executions = max(1, max_executions)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    def start_execution(self, execution_id: str, start_time: datetime, configuration_context: Dict) -> None:
+        """Record the start of an execution and prune old executions."""
+        with self._lock, self._connect() as connection:
+            config_name = (configuration_context or {}).get('config_metadata', {}).get('config_name')
+            connection.execute(
+                "INSERT OR REPLACE INTO executions (execution_id, start_time, config_name, config_blob) VALUES (?, ?, ?, ?)",
+                (
+                    execution_id,
+                    start_time.isoformat(),
+                    config_name,
+                    self._put_blob(connection, execution_id, configuration_context or {})
+                )
+            )
+            self._prune(connection)
+
+    def add_test_run(self, execution_id: str, file_path: str, test_run: Any) -> None:
+        """Record a TestRun."""
+        counts = _summary_counts({'summary': test_run.summary})
+        with self._lock, self._connect() as connection:
+            connection.execute(
+                "INSERT INTO test_runs (execution_id, file_path, test_run_id, attempt_number, timestamp, "
+                "total_tests, passed_tests, failed_tests, success_rate, data_blob) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    execution_id,
+                    file_path,
+                    test_run.test_run_id,
+                    test_run.attempt_number,
+                    test_run.timestamp.isoformat() if test_run.timestamp else None,
+                    counts['total_tests'],
+                    counts['passed_tests'],
+                    counts['failed_tests'],
+                    counts['success_rate'],
+                    self._put_blob(connection, execution_id, test_run)
+                )
+            )
+
+    def add_llm_interaction(self, execution_id: str, file_path: str, interaction: Any) -> None:
+        """Record an LLMInteraction."""
+        with self._lock, self._connect() as connection:
+            connection.execute(
+                "INSERT INTO llm_interactions (execution_id, file_path, interaction_type, timestamp, "
+                "prompt_blob, response_blob, reasoning, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    execution_id,
+                    file_path,
+                    interaction.interaction_type,
+                    interaction.timestamp.isoformat() if interaction.timestamp else None,
+                    self._put_blob(connection, execution_id, interaction.prompt),
+                    self._put_blob(connection, execution_id, interaction.response),
+                    interaction.reasoning,
+                    _to_json(interaction.metadata) if interaction.metadata is not None else None
+                )
+            )
+
+    def add_fix_attempt(
+        self,
+        execution_id: str,
+        fix_attempt: Any,
+        original_code: Optional[str] = None,
+        modified_code: Optional[str] = None
+    ) -> None:
+        """Record a FixAttempt and the code before and after it."""
+        counts = _summary_counts(fix_attempt.test_results_after)
+        details = {
+            'code_changes_made': fix_attempt.code_changes_made,
+            'test_results_before': fix_attempt.test_results_before,
+            'test_results_after': fix_attempt.test_results_after,
+            'llm_interaction': fix_attempt.llm_interaction,
+            'config_context': getattr(fix_attempt, 'config_context', None)
+        }
+        with self._lock, self._connect() as connection:
+            connection.execute(
+                "INSERT INTO fix_attempts (execution_id, file_path, attempt_number, timestamp, success, "
+                "total_tests, passed_tests, success_rate, approach_description, lessons_learned, "
+                "why_approach_failed, what_worked_partially, original_code_blob, modified_code_blob, details_blob) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    execution_id,
+                    fix_attempt.file_path,
+                    fix_attempt.attempt_number,
+                    fix_attempt.timestamp.isoformat() if fix_attempt.timestamp else None,
+                    int(bool(fix_attempt.success)),
+                    counts['total_tests'],
+                    counts['passed_tests'],
+                    counts['success_rate'],
+                    fix_attempt.approach_description,
+                    fix_attempt.lessons_learned,
+                    fix_attempt.why_approach_failed,
+                    fix_attempt.what_worked_partially,
+                    self._put_blob(connection, execution_id, original_code),
+                    self._put_blob(connection, execution_id, modified_code),
+                    self._put_blob(connection, execution_id, details)
+                )
+            )
+
+    def save_original_code(self, execution_id: str, file_path: str, sections: Dict) -> None:
+        """Record the original code sections of a file."""
+        with self._lock, self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO original_code (execution_id, file_path, sections_blob) VALUES (?, ?, ?)",
+                (execution_id, file_path, self._put_blob(connection, execution_id, sections))
+            )
+
+    def list_executions(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get stored executions, most recent first.
+
+        Returns:
+            Dictionaries with execution_id, start_time, config_name and the
+            number of test runs and fix attempts
+        """
+        return self._query(
+            "SELECT e.execution_id, e.start_time, e.config_name, e.config_blob, "
+            "(SELECT COUNT(*) FROM test_runs t WHERE t.execution_id = e.execution_id) AS test_runs, "
+            "(SELECT COUNT(*) FROM fix_attempts f WHERE f.execution_id = e.execution_id) AS fix_attempts "
+            "FROM executions e ORDER BY e.start_time DESC",
+            (),
+            limit
+        )
+
+    def get_test_runs(
+        self,
+        execution_id: Optional[str] = None,
+        file_path: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get stored test run summaries, most recent first.
+
+        The full TestRun is available through ``load_blob(row['data_blob'])``.
+        """
+        return self._select('test_runs', execution_id, file_path, limit)
+
+    def get_fix_attempts(
+        self,
+        file_path: Optional[str] = None,
+        execution_id: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get stored fix attempt summaries, most recent first.
+
+        Code and full results are available through ``load_blob`` on the
+        original_code_blob, modified_code_blob and details_blob fields.
+        """
+        rows = self._select('fix_attempts', execution_id, file_path, limit)
+        for row in rows:
+            row['success'] = bool(row['success'])
+        return rows
+
+    def get_llm_interactions(
+        self,
+        execution_id: Optional[str] = None,
+        file_path: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get stored LLM interaction summaries, most recent first.
+
+        Prompts and responses are available through ``load_blob`` on the
+        prompt_blob and response_blob fields.
+        """
+        rows = self._select('llm_interactions', execution_id, file_path, limit)
+        for row in rows:
+            if row['metadata'] is not None:
+                row['metadata'] = json.loads(row['metadata'])
+        return rows
+
+    def load_blob(self, blob_id: Optional[int]) -> Any:
+        """Load a large value referenced by a summary's ``*_blob`` field.
+
+        Args:
+            blob_id: Blob reference
+
+        Returns:
+            The stored value (dataclasses come back as dictionaries), or None
+        """
+        if blob_id is None:
+            return None
+        with self._lock:
+            row = self._connect().execute("SELECT data FROM blobs WHERE id = ?", (blob_id,)).fetchone()
+        if row is None:
+            return None
+        return json.loads(zlib.decompress(row['data']).decode('utf-8'))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use."""
+        if self._connection is None:
+            if self.path != ':memory:':
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            if self.path != ':memory:':
+                # Concurrent runs read while one writes
+                connection.execute("PRAGMA journal_mode=WAL")
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, MEMORY_SCHEMA_VERSION):
+                logger.warning(f"Recreating memory database {self.path} (schema version {version})")
+                for table in _EXECUTION_TABLES:
+                    connection.execute(f"DROP TABLE IF EXISTS {table}")
+            connection.executescript(_SCHEMA)
+            connection.execute(f"PRAGMA user_version = {MEMORY_SCHEMA_VERSION}")
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    @staticmethod
+    def _put_blob(connection: sqlite3.Connection, execution_id: str, value: Any) -> Optional[int]:
+        """Store a value compressed and return its blob id.
+
+        Identical values within an execution, such as the unchanged code of
+        successive attempts, are stored once.
+        """
+        if value is None:
+            return None
+        serialized = _to_json(value).encode('utf-8')
+        digest = hashlib.sha256(serialized).hexdigest()
+        row = connection.execute(
+            "SELECT id FROM blobs WHERE execution_id = ? AND digest = ?", (execution_id, digest)
+        ).fetchone()
+        if row is not None:
+            return row['id']
+        cursor = connection.execute(
+            "INSERT INTO blobs (execution_id, digest, data) VALUES (?, ?, ?)",
+            (execution_id, digest, zlib.compress(serialized))
+        )
+        return cursor.lastrowid
+
+    def _select(
+        self,
+        table: str,
+        execution_id: Optional[str],
+        file_path: Optional[str],
+        limit: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """Select rows of a per-execution table through its indexes."""
+        conditions = []
+        params: List[Any] = []
+        if execution_id is not None:
+            conditions.append("execution_id = ?")
+            params.append(execution_id)
+        if file_path is not None:
+            conditions.append("file_path = ?")
+            params.append(file_path)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self._query(f"SELECT * FROM {table}{where} ORDER BY timestamp DESC, id DESC", tuple(params), limit)
+
+    def _query(self, sql: str, params: tuple, limit: Optional[int]) -> List[Dict[str, Any]]:
+        """Run a query and return its rows as dictionaries."""
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = params + (int(limit),)
+        with self._lock:
+            return [dict(row) for row in self._connect().execute(sql, params).fetchall()]
+
+    def _prune(self, connection: sqlite3.Connection) -> None:
+        """Delete the oldest executions beyond the retention limit."""
+        stale = [
+            row['execution_id'] for row in connection.execute(
+                "SELECT execution_id FROM executions ORDER BY start_time DESC LIMIT -1 OFFSET ?",
+                (self.max_executions,)
+            ).fetchall()
+        ]
+        for execution_id in stale:
+            for table in _EXECUTION_TABLES:
+                connection.execute(f"DELETE FROM {table} WHERE execution_id = ?", (execution_id,))
+        if stale:
+            logger.debug(f"Pruned {len(stale)} old execution(s) from {self.path}")
+
+
+_backends: Dict[str, Callable[..., MemoryStore]] = {
+    MEMORY_BACKEND_MEMORY: lambda path=None: MemoryStore(),
+    MEMORY_BACKEND_SQLITE: lambda path=None: SQLiteMemoryStore(Path(path) if path else None),
+}
+
+
+def register_memory_backend(name: str, factory: Callable[..., MemoryStore]) -> None:
+    """Register a storage backend.
+
+    Args:
+        name: Backend name used in the ``memory_backend`` setting
+        factory: Callable taking an optional location and returning a MemoryStore
+    """
+    _backends[name] = factory
+
+
+def create_memory_store(backend: str = MEMORY_BACKEND_SQLITE, path: Optional[str] = None) -> MemoryStore:
+    """Create a storage backend by name.
+
+    Args:
+        backend: Registered backend name
+        path: Backend-specific location, such as the SQLite database file
+
+    Returns:
+        The storage backend
+
+    Raises:
+        ValueError: If the backend is not registered
+    """
+    factory = _backends.get(backend)
+    if factory is None:
+        raise ValueError(f"Invalid memory backend: {backend}. Must be one of: {', '.join(sorted(_backends))}")
+    return factory(path)
@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 from kaizen.cli.commands.errors import ConfigurationError
-from ..types import PRStrategy, DEFAULT_MAX_RETRIES, Language, DEFAULT_LANGUAGE, Framework, DEFAULT_FRAMEWORK
+from ..types import PRStrategy, DEFAULT_MAX_RETRIES, Language, DEFAULT_LANGUAGE, Framework, DEFAULT_FRAMEWORK, AgentLifecycle, DEFAULT_AGENT_LIFECYCLE
 
 from .metadata import TestMetadata
 from .evaluation import TestEvaluation
@@ -21,11 +21,16 @@ class AgentEntryPoint:
         class_name: Class name to instantiate (optional)
         method: Method name to call (optional)
         fallback_to_function: Whether to fallback to function if class/method not found
+        cache_results: Whether execution results may be cached across runs
+            (only appropriate for deterministic agents)
+        lifecycle: How long an agent instance is reused across test steps
     """
     module: str
     class_name: Optional[str] = None
     method: Optional[str] = None
     fallback_to_function: bool = True
+    cache_results: bool = False
+    lifecycle: AgentLifecycle = DEFAULT_AGENT_LIFECYCLE
 
 @dataclass(frozen=True)
 class TestConfiguration:
@@ -55,6 +60,8 @@ class TestConfiguration:
         framework: Agent framework (e.g., LlamaIndex, LangChain)
         better_ai: Whether to use enhanced AI model for improved code fixing and analysis
         lifecycle: Lifecycle command configuration for test execution hooks
+        no_eval_cache: Whether to disable the on-disk LLM evaluation cache
+        max_failures: Number of failing steps after which the test run stops
     """
     # Required fields
     name: str
@@ -82,6 +89,8 @@ class TestConfiguration:
     framework: Framework = DEFAULT_FRAMEWORK
     better_ai: bool = False
     lifecycle: Dict[str, str] = field(default_factory=dict)
+    no_eval_cache: bool = False
+    max_failures: Optional[int] = None
 
     def with_cli_overrides(
         self,
@@ -92,7 +101,9 @@ class TestConfiguration:
         pr_strategy: str = 'ALL_PASSING',
         language: Optional[str] = None,
         framework: Optional[str] = None,
-        better_ai: bool = False
+        better_ai: bool = False,
+        no_eval_cache: bool = False,
+        max_failures: Optional[int] = None
     ) -> 'TestConfiguration':
         """Create a new configuration with CLI overrides applied.
         
@@ -109,6 +120,8 @@ class TestConfiguration:
             language: Language override (if provided)
             framework: Framework override (if provided)
             better_ai: Whether to use enhanced AI model
+            no_eval_cache: Whether to disable the LLM evaluation cache
+            max_failures: Failure limit override (if provided)
             
         Returns:
             New TestConfiguration instance with overrides applied
@@ -120,7 +133,8 @@ class TestConfiguration:
             'max_retries': max_retries,
             'base_branch': base_branch,
             'pr_strategy': PRStrategy.from_str(pr_strategy),
-            'better_ai': better_ai
+            'better_ai': better_ai,
+            'no_eval_cache': no_eval_cache
         }
         
         # Handle language override if provided
@@ -131,6 +145,10 @@ class TestConfiguration:
         if framework is not None and str(framework).strip() != '':
             overrides['framework'] = Framework.from_str(framework)
         
+        # Handle failure limit override if provided
+        if max_failures is not None:
+            overrides['max_failures'] = max_failures
+        
         # Use dataclass replace for efficient field updates
         return replace(self, **overrides)
 
@@ -210,13 +228,34 @@ class TestConfiguration:
         if 'agent' in data:
             agent_data = data['agent']
             if isinstance(agent_data, dict):
+                try:
+                    agent_lifecycle = AgentLifecycle.from_str(agent_data.get('lifecycle', DEFAULT_AGENT_LIFECYCLE.value))
+                except ValueError as e:
+                    raise ConfigurationError(str(e))
                 agent_entry_point = AgentEntryPoint(
                     module=agent_data['module'],
                     class_name=agent_data.get('class'),
                     method=agent_data.get('method'),
-                    fallback_to_function=agent_data.get('fallback_to_function', True)
+                    fallback_to_function=agent_data.get('fallback_to_function', True),
+                    cache_results=agent_data.get('cache_results', False),
+                    lifecycle=agent_lifecycle
                 )
         
+        # Compile step assertions so configuration errors surface before any step runs
+        steps = [TestStep.from_dict(step) for step in data.get('steps', [])]
+        if any(step.assertions for step in steps):
+            from kaizen.autofix.test.assertions import AssertionSpecError, compile_assertions
+            for step in steps:
+                try:
+                    compile_assertions(step.assertions, strict=True)
+                except AssertionSpecError as e:
+                    raise ConfigurationError(f"Invalid assertion in step '{step.name}': {str(e)}")
+        
+        # Parse failure limit
+        max_failures = data.get('max_failures')
+        if max_failures is not None and (isinstance(max_failures, bool) or not isinstance(max_failures, int) or max_failures < 1):
+            raise ConfigurationError(f"max_failures must be a positive integer, got {max_failures!r}")
+        
         return cls(
             name=data['name'],
             file_path=Path(data['file_path']),
@@ -227,7 +266,7 @@ class TestConfiguration:
             evaluation=TestEvaluation.from_dict(data.get('evaluation', {})) if 'evaluation' in data else None,
             regions=data.get('regions', []),
             agent=agent_entry_point,
-            steps=[TestStep.from_dict(step) for step in data.get('steps', [])],
+            steps=steps,
             settings=TestSettings.from_dict(data.get('settings', {})) if 'settings' in data else None,
             auto_fix=data.get('auto_fix', False),
             create_pr=data.get('create_pr', False),
@@ -240,5 +279,7 @@ class TestConfiguration:
             language=language,
             framework=framework,
             better_ai=data.get('better_ai', False),
-            lifecycle=data.get('lifecycle', {})
+            lifecycle=data.get('lifecycle', {}),
+            no_eval_cache=data.get('no_eval_cache', False),
+            max_failures=max_failures
         ) 
\ No newline at end of file
@@ -15,10 +15,58 @@ class TestSettings:
         timeout: Maximum execution time
         retry_count: Number of retry attempts
         parallel: Whether to run tests in parallel
+        max_workers: Maximum number of test steps to run concurrently when
+            parallel is enabled (None uses the runner default)
+        evaluation_concurrency: Maximum number of LLM evaluations in flight
+            at once (None uses the evaluator default)
+        evaluation_policy: When steps are sent to the LLM evaluator:
+            'always', 'on_assertion_pass' (skip steps already decided by a
+            failed assertion or an output matching the expected output),
+            'sampled' or 'never'
+        evaluation_sample_rate: Share of undecided steps the 'sampled'
+            policy evaluates (None evaluates a quarter of them)
+        evaluation_normalized_match: Whether an output equal to the expected
+            output after collapsing whitespace, ignoring case and decoding
+            JSON passes without an LLM evaluation
+        incremental_retest: Whether auto-fix attempts rerun failing steps
+            first and stop at the first step that still fails, instead of
+            rerunning the whole suite
+        regression_guard: Which previously passing steps an incremental
+            re-test reruns: 'all', 'affected', 'sampled' or 'none'
+        regression_sample_size: Number of passing steps rerun by the
+            'sampled' guard (None reruns a quarter of them)
+        fix_concurrency: Maximum number of files auto-fix requests fixes for
+            at once within an attempt (None uses the auto-fix default)
+        fix_candidates: Number of candidate fixes auto-fix generates per
+            attempt; with more than one, every candidate is tested in an
+            isolated workspace copy and the best one is kept
+        candidate_workers: Maximum number of candidates tested at once
+            (None uses the number of CPUs)
+        sandbox_strategy: How candidate workspaces are created: 'auto'
+            (git worktree inside a repository, copy otherwise), 'worktree'
+            or 'copy'
+        memory_backend: Storage backend for execution memory: 'sqlite'
+            (persisted across runs) or 'memory' (kept in process only)
+        memory_path: Location of the memory backend's storage, such as the
+            SQLite database file (None uses ~/.kaizen/memory.db)
     """
     timeout: Optional[int] = None
     retry_count: Optional[int] = None
     parallel: bool = False
+    max_workers: Optional[int] = None
+    evaluation_concurrency: Optional[int] = None
+    evaluation_policy: str = 'on_assertion_pass'
+    evaluation_sample_rate: Optional[float] = None
+    evaluation_normalized_match: bool = False
+    incremental_retest: bool = False
+    regression_guard: str = 'affected'
+    regression_sample_size: Optional[int] = None
+    fix_concurrency: Optional[int] = None
+    fix_candidates: int = 1
+    candidate_workers: Optional[int] = None
+    sandbox_strategy: str = 'auto'
+    memory_backend: str = 'sqlite'
+    memory_path: Optional[str] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TestSettings':
@@ -33,5 +81,19 @@ class TestSettings:
         return cls(
             timeout=data.get('timeout'),
             retry_count=data.get('retry_count'),
-            parallel=data.get('parallel', False)
-        ) 
\ No newline at end of file
+            parallel=data.get('parallel', False),
+            max_workers=data.get('max_workers'),
+            evaluation_concurrency=data.get('evaluation_concurrency'),
+            evaluation_policy=data.get('evaluation_policy', 'on_assertion_pass'),
+            evaluation_sample_rate=data.get('evaluation_sample_rate'),
+            evaluation_normalized_match=data.get('evaluation_normalized_match', False),
+            incremental_retest=data.get('incremental_retest', False),
+            regression_guard=data.get('regression_guard', 'affected'),
+            regression_sample_size=data.get('regression_sample_size'),
+            fix_concurrency=data.get('fix_concurrency'),
+            fix_candidates=data.get('fix_candidates', 1),
+            candidate_workers=data.get('candidate_workers'),
+            sandbox_strategy=data.get('sandbox_strategy', 'auto'),
+            memory_backend=data.get('memory_backend', 'sqlite'),
+            memory_path=data.get('memory_path')
+        )
@@ -79,6 +79,13 @@ class TestExecutionSummary:
     end_time: Optional[datetime] = None
     total_execution_time: Optional[float] = None
     
+    # LLM evaluation cache usage
+    eval_cache_hits: int = 0
+    eval_cache_misses: int = 0
+    
+    # Steps decided without an LLM evaluation by the evaluation policy
+    eval_skipped: int = 0
+    
     def update_from_test_cases(self, test_cases: List[TestCaseResult]) -> None:
         """Update summary from test cases."""
         self.total_tests = len(test_cases)
@@ -109,7 +116,10 @@ class TestExecutionSummary:
             'is_successful': self.is_successful(),
             'start_time': self.start_time.isoformat() if self.start_time else None,
             'end_time': self.end_time.isoformat() if self.end_time else None,
-            'total_execution_time': self.total_execution_time
+            'total_execution_time': self.total_execution_time,
+            'eval_cache_hits': self.eval_cache_hits,
+            'eval_cache_misses': self.eval_cache_misses,
+            'eval_skipped': self.eval_skipped
         }
 
 @dataclass
@@ -0,0 +1,437 @@
+"""Streaming JSON Lines log of test results.
+
+With --save-logs, test-all appends one JSON line per test case result as soon
+as the test runner finishes it, instead of building one document at the end
+of the run. A crash mid-run keeps every result written so far, and the log is
+never held in memory as a whole. The summary file and Markdown report are
+built by reading the log back.
+
+Each line is an object with a "type" field:
+
+- run_start: test name, paths and configuration
+- test_case: one TestCaseResult, tagged with the run it belongs to
+- auto_fix_attempt: one auto-fix attempt
+- run_end: final status and summary statistics
+
+Logs can be compressed with gzip or, if the zstandard package is installed,
+zstd. The compression is taken from the file suffix when reading.
+"""
+
+import gzip
+import io
+import json
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+from .errors import ReportGenerationError
+from .models.test_execution_result import TestCaseResult, TestExecutionResult, TestStatus
+
+logger = logging.getLogger(__name__)
+
+# Supported compressions
+RESULT_LOG_COMPRESSION_NONE = 'none'
+RESULT_LOG_COMPRESSION_GZIP = 'gzip'
+RESULT_LOG_COMPRESSION_ZSTD = 'zstd'
+RESULT_LOG_COMPRESSIONS = (
+    RESULT_LOG_COMPRESSION_NONE,
+    RESULT_LOG_COMPRESSION_GZIP,
+    RESULT_LOG_COMPRESSION_ZSTD
+)
+
+# File suffix for each compression
+RESULT_LOG_SUFFIXES = {
+    RESULT_LOG_COMPRESSION_NONE: '.jsonl',
+    RESULT_LOG_COMPRESSION_GZIP: '.jsonl.gz',
+    RESULT_LOG_COMPRESSION_ZSTD: '.jsonl.zst'
+}
+
+# Record types
+RECORD_RUN_START = 'run_start'
+RECORD_TEST_CASE = 'test_case'
+RECORD_AUTO_FIX_ATTEMPT = 'auto_fix_attempt'
+RECORD_RUN_END = 'run_end'
+
+# Runs that test case records belong to, in the order they happen
+RUN_BASELINE = 'baseline'
+RUN_CURRENT = 'current'
+RUN_FINAL = 'final'
+
+# Bump when the record layout changes
+RESULT_LOG_FORMAT_VERSION = 1
+
+
+def result_log_path(logs_dir: Path, test_name: str, timestamp: str, compression: str = RESULT_LOG_COMPRESSION_NONE) -> Path:
+    """Build the path of a result log.
+
+    Args:
+        logs_dir: Directory the log is written to
+        test_name: Name of the test configuration
+        timestamp: Timestamp distinguishing this run
+        compression: One of RESULT_LOG_COMPRESSIONS
+
+    Returns:
+        Path of the log file
+    """
+    return Path(logs_dir) / f"{test_name}_{timestamp}_results{RESULT_LOG_SUFFIXES[compression]}"
+
+
+def result_summary_path(log_path: Path) -> Path:
+    """Build the path of the summary file written next to a result log."""
+    log_path = Path(log_path)
+    stem = log_path.name[:-len(RESULT_LOG_SUFFIXES[compression_for_path(log_path)])]
+    if stem.endswith('_results'):
+        stem = stem[:-len('_results')]
+    return log_path.with_name(f"{stem}_summary.json")
+
+
+def compression_for_path(path: Path) -> str:
+    """Get the compression of a result log from its suffix."""
+    name = Path(path).name
+    if name.endswith(RESULT_LOG_SUFFIXES[RESULT_LOG_COMPRESSION_GZIP]):
+        return RESULT_LOG_COMPRESSION_GZIP
+    if name.endswith(RESULT_LOG_SUFFIXES[RESULT_LOG_COMPRESSION_ZSTD]):
+        return RESULT_LOG_COMPRESSION_ZSTD
+    return RESULT_LOG_COMPRESSION_NONE
+
+
+def open_result_log(path: Path, mode: str = 'r', compression: Optional[str] = None) -> TextIO:
+    """Open a result log as a text stream.
+
+    Args:
+        path: Path of the log
+        mode: 'r' to read or 'w' to write
+        compression: One of RESULT_LOG_COMPRESSIONS; taken from the suffix if not given
+
+    Returns:
+        Text stream over the decompressed log
+
+    Raises:
+        ReportGenerationError: If the compression is unknown or unavailable
+    """
+    compression = compression or compression_for_path(path)
+    if compression == RESULT_LOG_COMPRESSION_NONE:
+        return open(path, mode, encoding='utf-8')
+    if compression == RESULT_LOG_COMPRESSION_GZIP:
+        return gzip.open(path, f'{mode}t', encoding='utf-8')
+    if compression == RESULT_LOG_COMPRESSION_ZSTD:
+        try:
+            import zstandard
+        except ImportError:
+            raise ReportGenerationError(
+                "zstd compression requires the 'zstandard' package (pip install zstandard)"
+            )
+        if mode == 'w':
+            stream = zstandard.ZstdCompressor().stream_writer(open(path, 'wb'), closefd=True)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+        return io.TextIOWrapper(stream, encoding='utf-8')
+    raise ReportGenerationError(
+        f"Unknown result log compression '{compression}', expected one of {', '.join(RESULT_LOG_COMPRESSIONS)}"
+    )
+
+
+def test_case_record(test_case: TestCaseResult, run: str) -> Dict[str, Any]:
+    """Convert a test case result into a log record.
+
+    Args:
+        test_case: Test case result
+        run: Run the result belongs to (RUN_BASELINE, RUN_CURRENT or RUN_FINAL)
+
+    Returns:
+        Record ready to be written
+    """
+    status = test_case.status.value
+    return {
+        "type": RECORD_TEST_CASE,
+        "run": run,
+        "name": test_case.name,
+        "status": status,
+        "input": test_case.input,
+        "expected_output": test_case.expected_output,
+        "actual_output": test_case.actual_output,
+        "error_message": test_case.error_message,
+        "error_details": test_case.error_details,
+        "evaluation": test_case.evaluation,
+        "evaluation_score": test_case.evaluation_score,
+        "execution_time": test_case.execution_time,
+        "timestamp": test_case.timestamp.isoformat() if test_case.timestamp else None,
+        "metadata": test_case.metadata,
+        # Human-readable summary for quick scanning
+        "summary": {
+            "passed": status == 'passed',
+            "failed": status in ['failed', 'error'],
+            "has_error": test_case.error_message is not None,
+            "has_evaluation": test_case.evaluation is not None,
+            "input_type": type(test_case.input).__name__ if test_case.input is not None else None,
+            "output_type": type(test_case.actual_output).__name__ if test_case.actual_output is not None else None,
+            "expected_type": type(test_case.expected_output).__name__ if test_case.expected_output is not None else None
+        }
+    }
+
+
+def test_case_from_record(record: Dict[str, Any]) -> TestCaseResult:
+    """Rebuild a test case result from a log record."""
+    try:
+        status = TestStatus(record.get('status'))
+    except ValueError:
+        status = TestStatus.ERROR
+    timestamp = record.get('timestamp')
+    return TestCaseResult(
+        name=record.get('name', 'Unknown'),
+        status=status,
+        input=record.get('input'),
+        expected_output=record.get('expected_output'),
+        actual_output=record.get('actual_output'),
+        error_message=record.get('error_message'),
+        error_details=record.get('error_details'),
+        evaluation=record.get('evaluation'),
+        evaluation_score=record.get('evaluation_score'),
+        execution_time=record.get('execution_time'),
+        timestamp=datetime.fromisoformat(timestamp) if timestamp else None,
+        metadata=record.get('metadata') or {}
+    )
+
+
+class JsonlResultSink:
+    """Thread-safe writer of a streaming result log.
+
+    Every record is flushed as soon as it is written, so the log on disk is
+    complete up to the last finished test case.
+    """
+
+    def __init__(self, path: Path, compression: str = RESULT_LOG_COMPRESSION_NONE):
+        """Open a result log for writing.
+
+        Args:
+            path: Path of the log file
+            compression: One of RESULT_LOG_COMPRESSIONS
+
+        Raises:
+            ReportGenerationError: If the compression is unknown or unavailable
+        """
+        if compression not in RESULT_LOG_COMPRESSIONS:
+            raise ReportGenerationError(
+                f"Unknown result log compression '{compression}', expected one of {', '.join(RESULT_LOG_COMPRESSIONS)}"
+            )
+        self.path = Path(path)
+        self.compression = compression
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._stream = open_result_log(self.path, 'w', compression)
+        self._lock = threading.Lock()
+        # run -> number of test case records written
+        self.run_counts: Dict[str, int] = {}
+
+    @property
+    def closed(self) -> bool:
+        """Whether the log has been closed."""
+        return self._stream is None
+
+    def write(self, record_type: str, **fields: Any) -> None:
+        """Append a record to the log.
+
+        Args:
+            record_type: One of the RECORD_* types
+            **fields: Record fields
+        """
+        self._write_record({"type": record_type, **fields})
+
+    def write_test_case(self, test_case: TestCaseResult, run: str = RUN_BASELINE) -> None:
+        """Append a test case result to the log.
+
+        Args:
+            test_case: Test case result
+            run: Run the result belongs to
+        """
+        self._write_record(test_case_record(test_case, run))
+        with self._lock:
+            self.run_counts[run] = self.run_counts.get(run, 0) + 1
+
+    def on_result(self, run: str = RUN_BASELINE):
+        """Get a TestRunner result callback writing to this log.
+
+        Args:
+            run: Run the results belong to
+
+        Returns:
+            Callback taking a TestCaseResult
+        """
+        return lambda test_case: self.write_test_case(test_case, run)
+
+    def close(self) -> None:
+        """Flush and close the log."""
+        with self._lock:
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+
+    def __enter__(self) -> 'JsonlResultSink':
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb) -> None:
+        self.close()
+
+    def _write_record(self, record: Dict[str, Any]) -> None:
+        """Serialize and append one record."""
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            if self._stream is None:
+                raise ReportGenerationError(f"Result log is closed: {self.path}")
+            self._stream.write(line + '\n')
+            self._stream.flush()
+
+
+def read_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """Read the records of a result log one at a time.
+
+    A log cut short by a crash is read up to its last complete record.
+
+    Args:
+        path: Path of the log
+
+    Yields:
+        Records in the order they were written
+    """
+    with open_result_log(path, 'r') as stream:
+        try:
+            for line_number, line in enumerate(stream, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping malformed record at line {line_number} of {path}")
+        except (EOFError, OSError) as e:
+            logger.warning(f"Result log {path} is truncated: {str(e)}")
+        except Exception as e:
+            # Decompressors raise their own error types on truncated input
+            logger.warning(f"Stopped reading result log {path}: {str(e)}")
+
+
+def _latest_run(run_counts: Dict[str, int]) -> Optional[str]:
+    """Get the latest run that has test case records."""
+    for run in (RUN_FINAL, RUN_CURRENT, RUN_BASELINE):
+        if run_counts.get(run):
+            return run
+    return None
+
+
+def summarize_result_log(path: Path) -> Dict[str, Any]:
+    """Build the quick-reference summary of a result log.
+
+    The log is streamed; only failed test cases of the latest run are kept.
+
+    Args:
+        path: Path of the log
+
+    Returns:
+        Summary with run metadata, test case counts per run and the failed
+        test cases of the latest run
+    """
+    start: Dict[str, Any] = {}
+    end: Dict[str, Any] = {}
+    counts: Dict[str, Dict[str, int]] = {}
+    failed: Dict[str, List[Dict[str, Any]]] = {}
+    attempts = 0
+
+    for record in read_records(path):
+        record_type = record.get('type')
+        if record_type == RECORD_TEST_CASE:
+            run = record.get('run', RUN_BASELINE)
+            status = record.get('status')
+            run_counts = counts.setdefault(run, {'total': 0, 'passed': 0, 'failed': 0, 'error': 0})
+            run_counts['total'] += 1
+            if status in run_counts:
+                run_counts[status] += 1
+            if status in ['failed', 'error']:
+                failed.setdefault(run, []).append({
+                    "name": record.get('name'),
+                    "status": status,
+                    "input": record.get('input'),
+                    "expected_output": record.get('expected_output'),
+                    "actual_output": record.get('actual_output'),
+                    "error_message": record.get('error_message'),
+                    "evaluation_score": record.get('evaluation_score')
+                })
+        elif record_type == RECORD_AUTO_FIX_ATTEMPT:
+            attempts += 1
+        elif record_type == RECORD_RUN_START:
+            start = record
+        elif record_type == RECORD_RUN_END:
+            end = record
+
+    latest = _latest_run({run: run_counts['total'] for run, run_counts in counts.items()})
+    return {
+        "test_name": start.get('test_name'),
+        "status": end.get('status', 'incomplete'),
+        "timestamp": datetime.now().isoformat(),
+        "file_path": start.get('file_path'),
+        "config_path": start.get('config_path'),
+        "start_time": start.get('start_time'),
+        "end_time": end.get('end_time'),
+        "error": end.get('error'),
+        "overall_status": end.get('overall_status', {}),
+        "results_log_file": Path(path).name,
+        "complete": bool(end),
+        "has_auto_fix_attempts": attempts > 0,
+        "auto_fix_attempts_count": attempts,
+        "runs": counts,
+        "test_cases_summary": counts.get(latest, {'total': 0, 'passed': 0, 'failed': 0, 'error': 0}),
+        "failed_test_cases": failed.get(latest, [])
+    }
+
+
+class ResultLog:
+    """Results read back from a result log, for building reports."""
+
+    def __init__(self, path: Path):
+        """Read a result log.
+
+        Args:
+            path: Path of the log
+        """
+        self.path = Path(path)
+        self.start: Dict[str, Any] = {}
+        self.end: Dict[str, Any] = {}
+        self.auto_fix_attempts: List[Any] = []
+        self._test_cases: Dict[str, List[TestCaseResult]] = {}
+
+        for record in read_records(self.path):
+            record_type = record.get('type')
+            if record_type == RECORD_TEST_CASE:
+                run = record.get('run', RUN_BASELINE)
+                self._test_cases.setdefault(run, []).append(test_case_from_record(record))
+            elif record_type == RECORD_AUTO_FIX_ATTEMPT:
+                self.auto_fix_attempts.append(record.get('attempt'))
+            elif record_type == RECORD_RUN_START:
+                self.start = record
+            elif record_type == RECORD_RUN_END:
+                self.end = record
+
+    def get_run(self, run: str) -> Optional[TestExecutionResult]:
+        """Get the results of a run.
+
+        Args:
+            run: RUN_BASELINE, RUN_CURRENT or RUN_FINAL
+
+        Returns:
+            TestExecutionResult for the run, or None if the log has no
+            results for it
+        """
+        test_cases = self._test_cases.get(run)
+        if not test_cases:
+            return None
+        result = TestExecutionResult(
+            name=self.start.get('test_name') or 'Unknown Test',
+            file_path=Path(self.start.get('file_path') or ''),
+            config_path=Path(self.start.get('config_path') or '')
+        )
+        result.add_test_cases(test_cases)
+        return result
+
+    def get_latest_run(self) -> Optional[TestExecutionResult]:
+        """Get the results of the latest run in the log."""
+        latest = _latest_run({run: len(cases) for run, cases in self._test_cases.items()})
+        return self.get_run(latest) if latest else None
@@ -0,0 +1,221 @@
+"""Content-addressed store for code snapshots.
+
+Every fix attempt records the code before and after the fix, and on a
+multi-attempt run these are near-identical copies of the same files. The
+store keeps each distinct text once, keyed by its hash. The first snapshot
+of a file becomes its base; later snapshots of the file are kept as line
+diffs against that base and rebuilt only when read.
+"""
+
+import hashlib
+import threading
+from difflib import SequenceMatcher
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+# A delta is a list of ops: [start, end] copies base lines, a string is inserted
+DeltaOp = Union[List[int], str]
+
+# A delta is kept only if its inserted text is smaller than this fraction of
+# the full text; otherwise the snapshot is stored in full
+MAX_DELTA_RATIO = 0.5
+
+
+def snapshot_key(text: str) -> str:
+    """Get the content key of a text."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def compute_delta(base: str, text: str) -> List[DeltaOp]:
+    """Express a text as line operations against a base text.
+
+    Args:
+        base: Base text
+        text: Text to express
+
+    Returns:
+        Ops that apply_delta turns back into the text
+    """
+    base_lines = base.splitlines(keepends=True)
+    lines = text.splitlines(keepends=True)
+    # Fixes are usually local; only match the region between the common
+    # prefix and suffix
+    limit = min(len(base_lines), len(lines))
+    prefix = 0
+    while prefix < limit and base_lines[prefix] == lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and base_lines[-1 - suffix] == lines[-1 - suffix]:
+        suffix += 1
+
+    ops: List[DeltaOp] = []
+    if prefix:
+        ops.append([0, prefix])
+    matcher = SequenceMatcher(
+        None,
+        base_lines[prefix:len(base_lines) - suffix],
+        lines[prefix:len(lines) - suffix],
+        autojunk=False
+    )
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            ops.append([prefix + i1, prefix + i2])
+        elif j2 > j1:
+            ops.append(''.join(lines[prefix + j1:prefix + j2]))
+    if suffix:
+        ops.append([len(base_lines) - suffix, len(base_lines)])
+    return ops
+
+
+def apply_delta(base: str, ops: Iterable[DeltaOp]) -> str:
+    """Rebuild a text from its base and delta.
+
+    Args:
+        base: Base text the delta was computed against
+        ops: Ops from compute_delta
+
+    Returns:
+        The rebuilt text
+    """
+    base_lines = base.splitlines(keepends=True)
+    return ''.join(
+        op if isinstance(op, str) else ''.join(base_lines[op[0]:op[1]])
+        for op in ops
+    )
+
+
+class SnapshotStore:
+    """Thread-safe, content-addressed store of code snapshots."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        # key -> (base key or None, full text or delta ops)
+        self._entries: Dict[str, Tuple[Optional[str], Any]] = {}
+        # lineage (usually a file path) -> key of its base snapshot
+        self._bases: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def put(self, text: Optional[str], lineage: Optional[str] = None) -> Optional[str]:
+        """Store a snapshot.
+
+        Args:
+            text: Snapshot text
+            lineage: Name grouping related snapshots, such as the file path;
+                snapshots with the same lineage are stored as diffs against
+                the first one
+
+        Returns:
+            Key to read the snapshot back with, or None for None text
+        """
+        if text is None:
+            return None
+        key = snapshot_key(text)
+        with self._lock:
+            if key in self._entries:
+                return key
+            base_key = self._bases.get(lineage) if lineage is not None else None
+            if base_key is None:
+                self._entries[key] = (None, text)
+                if lineage is not None:
+                    self._bases[lineage] = key
+                return key
+            base_text = self._entries[base_key][1]
+
+        # Diff outside the lock; the base is a full text and never changes
+        ops = compute_delta(base_text, text)
+        inserted = sum(len(op) for op in ops if isinstance(op, str))
+        with self._lock:
+            if key not in self._entries:
+                # retain() may have dropped the base while diffing
+                if base_key in self._entries and inserted < len(text) * MAX_DELTA_RATIO:
+                    self._entries[key] = (base_key, ops)
+                else:
+                    self._entries[key] = (None, text)
+        return key
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        """Read a snapshot.
+
+        Args:
+            key: Key returned by put
+
+        Returns:
+            The snapshot text, or None if unknown
+        """
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            base_key, payload = entry
+            if base_key is None:
+                return payload
+            base_text = self._entries[base_key][1]
+        return apply_delta(base_text, payload)
+
+    def retain(self, keys: Iterable[Optional[str]]) -> int:
+        """Drop every snapshot except the given ones and the bases they need.
+
+        A file whose base snapshot is dropped gets a new base with its next
+        snapshot.
+
+        Args:
+            keys: Keys of the snapshots to keep
+
+        Returns:
+            Number of snapshots dropped
+        """
+        with self._lock:
+            keep = set()
+            for key in keys:
+                entry = self._entries.get(key) if key is not None else None
+                if entry is None:
+                    continue
+                keep.add(key)
+                if entry[0] is not None:
+                    keep.add(entry[0])
+            dropped = [key for key in self._entries if key not in keep]
+            for key in dropped:
+                del self._entries[key]
+            self._bases = {
+                lineage: base_key for lineage, base_key in self._bases.items() if base_key in self._entries
+            }
+            return len(dropped)
+
+    def export(self, keys: Iterable[Optional[str]]) -> Dict[str, Dict[str, Any]]:
+        """Get the stored form of snapshots and the bases they depend on.
+
+        Args:
+            keys: Keys of the snapshots to export
+
+        Returns:
+            Mapping of key to {'text': ...} or {'base': key, 'delta': ops}
+        """
+        exported: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            pending = [key for key in keys if key is not None]
+            while pending:
+                key = pending.pop()
+                if key in exported or key not in self._entries:
+                    continue
+                base_key, payload = self._entries[key]
+                if base_key is None:
+                    exported[key] = {'text': payload}
+                else:
+                    exported[key] = {'base': base_key, 'delta': payload}
+                    pending.append(base_key)
+        return exported
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the number of stored snapshots and characters held."""
+        with self._lock:
+            full = [payload for base_key, payload in self._entries.values() if base_key is None]
+            deltas = [payload for base_key, payload in self._entries.values() if base_key is not None]
+            return {
+                'snapshots': len(self._entries),
+                'full_snapshots': len(full),
+                'delta_snapshots': len(deltas),
+                'stored_chars': sum(len(text) for text in full) + sum(
+                    len(op) for ops in deltas for op in ops if isinstance(op, str)
+                )
+            }
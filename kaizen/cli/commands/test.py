@@ -28,14 +28,28 @@ import json
 import click
 from rich.console import Console
 from rich.logging import RichHandler
-from rich.traceback import install as install_rich_traceback
 
-# Local application imports
-from .config import ConfigurationManager
-from .test_commands import TestAllCommand
+# Local application imports. The test runner, auto-fix and memory modules pull
+# in the LLM SDKs and are imported inside test_all so that loading the CLI
+# (e.g. for --help or other commands) stays fast.
 from .formatters import MarkdownTestResultFormatter, RichTestResultFormatter
 from .report_writer import TestReportWriter
-from .memory import ExecutionMemory
+from .result_sink import (
+    RECORD_AUTO_FIX_ATTEMPT,
+    RECORD_RUN_END,
+    RECORD_RUN_START,
+    RESULT_LOG_COMPRESSION_NONE,
+    RESULT_LOG_COMPRESSIONS,
+    RESULT_LOG_FORMAT_VERSION,
+    RUN_BASELINE,
+    RUN_CURRENT,
+    RUN_FINAL,
+    JsonlResultSink,
+    ResultLog,
+    result_log_path,
+    result_summary_path,
+    summarize_result_log
+)
 from .errors import (
     TestError,
     ConfigurationError,
@@ -55,9 +69,6 @@ from .types import (
 from .models import TestResult
 from kaizen.cli.commands.models.test_execution_result import TestCaseResult, TestStatus, TestExecutionResult
 
-# Configure rich traceback
-install_rich_traceback(show_locals=True)
-
 class CleanLogger:
     """A logger that provides clean, concise output by default."""
     
@@ -191,198 +202,138 @@ def _display_test_summary(console: Console, test_result: TestResult, rich_format
     except Exception as e:
         console.print(f"\n[bold red]Error displaying test results table: {str(e)}[/bold red]")
         console.print("[dim]Test results table could not be displayed due to formatting error[/dim]")
+    
+    # Display evaluation cache usage
+    unified_result = getattr(test_result, 'unified_result', None)
+    if unified_result is not None:
+        summary = unified_result.summary
+        console.print(f"\nEvaluation Cache: {summary.eval_cache_hits} hits, {summary.eval_cache_misses} misses")
 
-def _save_detailed_logs(console: Console, test_result: TestResult, config: Any) -> None:
-    """Save detailed test logs in JSON format for later analysis.
+def _start_result_log(console: Console, config: Any, compression: str) -> Optional[JsonlResultSink]:
+    """Open the streaming result log for a test run.
     
     Args:
         console: Rich console for output
-        test_result: The test result to save
         config: Test configuration
+        compression: One of RESULT_LOG_COMPRESSIONS
+        
+    Returns:
+        The open sink, or None if the log could not be created
     """
     try:
-        # Create logs directory
-        logs_dir = Path("test-logs")
-        logs_dir.mkdir(exist_ok=True)
-        
-        # Generate timestamp for unique filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_filename = f"{test_result.name}_{timestamp}_detailed_logs.json"
-        log_file_path = logs_dir / log_filename
-        
-        # Prepare detailed log data
-        detailed_logs = {
-            "metadata": {
-                "test_name": test_result.name,
-                "file_path": str(test_result.file_path),
-                "config_path": str(test_result.config_path),
-                "start_time": test_result.start_time.isoformat(),
-                "end_time": test_result.end_time.isoformat(),
-                "status": test_result.status,
-                "timestamp": datetime.now().isoformat(),
-                "config": {
-                    "auto_fix": getattr(config, 'auto_fix', False),
-                    "create_pr": getattr(config, 'create_pr', False),
-                    "max_retries": getattr(config, 'max_retries', 0),
-                    "base_branch": getattr(config, 'base_branch', 'main'),
-                    "pr_strategy": getattr(config, 'pr_strategy', 'ANY_IMPROVEMENT')
-                }
-            },
-            "test_results": test_result.results,
-            "error": test_result.error,
-            "steps": test_result.steps
-        }
-        
-        # Add unified test results if available with enhanced test case details
-        if test_result.unified_result:
-            try:
-                unified_data = test_result.unified_result.to_dict()
-                
-                # Enhance the unified results with more detailed test case information
-                enhanced_unified_data = {
-                    **unified_data,
-                    "test_cases_detailed": []
-                }
-                
-                # Add detailed information for each test case
-                for tc in test_result.unified_result.test_cases:
-                    detailed_tc = {
-                        "name": tc.name,
-                        "status": tc.status.value,
-                        "input": tc.input,
-                        "expected_output": tc.expected_output,
-                        "actual_output": tc.actual_output,
-                        "error_message": tc.error_message,
-                        "error_details": tc.error_details,
-                        "evaluation": tc.evaluation,
-                        "evaluation_score": tc.evaluation_score,
-                        "execution_time": tc.execution_time,
-                        "timestamp": tc.timestamp.isoformat() if tc.timestamp else None,
-                        "metadata": tc.metadata,
-                        # Add human-readable summary for quick scanning
-                        "summary": {
-                            "passed": tc.status.value in ['passed'],
-                            "failed": tc.status.value in ['failed', 'error'],
-                            "has_error": tc.error_message is not None,
-                            "has_evaluation": tc.evaluation is not None,
-                            "input_type": type(tc.input).__name__ if tc.input is not None else None,
-                            "output_type": type(tc.actual_output).__name__ if tc.actual_output is not None else None,
-                            "expected_type": type(tc.expected_output).__name__ if tc.expected_output is not None else None
-                        }
-                    }
-                    enhanced_unified_data["test_cases_detailed"].append(detailed_tc)
-                
-                # Add summary statistics for quick reference
-                enhanced_unified_data["test_summary"] = {
-                    "total_test_cases": len(test_result.unified_result.test_cases),
-                    "passed_test_cases": len([tc for tc in test_result.unified_result.test_cases if tc.status.value == 'passed']),
-                    "failed_test_cases": len([tc for tc in test_result.unified_result.test_cases if tc.status.value == 'failed']),
-                    "error_test_cases": len([tc for tc in test_result.unified_result.test_cases if tc.status.value == 'error']),
-                    "test_cases_with_evaluations": len([tc for tc in test_result.unified_result.test_cases if tc.evaluation is not None]),
-                    "test_cases_with_errors": len([tc for tc in test_result.unified_result.test_cases if tc.error_message is not None])
-                }
-                
-                detailed_logs["unified_test_results"] = enhanced_unified_data
-                
-            except Exception as e:
-                console.print(f"[yellow]Warning: Could not serialize unified results: {str(e)}[/yellow]")
-                detailed_logs["unified_test_results"] = {"error": f"Serialization failed: {str(e)}"}
+        log_path = result_log_path(Path("test-logs"), config.name, timestamp, compression)
+        sink = JsonlResultSink(log_path, compression)
+        sink.write(
+            RECORD_RUN_START,
+            format_version=RESULT_LOG_FORMAT_VERSION,
+            test_name=config.name,
+            file_path=str(config.file_path),
+            config_path=str(config.config_path),
+            start_time=datetime.now().isoformat(),
+            config={
+                "auto_fix": getattr(config, 'auto_fix', False),
+                "create_pr": getattr(config, 'create_pr', False),
+                "max_retries": getattr(config, 'max_retries', 0),
+                "base_branch": getattr(config, 'base_branch', 'main'),
+                "pr_strategy": getattr(config, 'pr_strategy', 'ANY_IMPROVEMENT')
+            }
+        )
+        console.print(f"[dim]Streaming test results to: {log_path}[/dim]")
+        return sink
+    except Exception as e:
+        console.print(f"[bold red]Warning: Failed to create result log: {str(e)}[/bold red]")
+        return None
+
+def _save_detailed_logs(console: Console, test_result: TestResult, config: Any, result_sink: JsonlResultSink) -> Optional[Path]:
+    """Complete the streaming result log and save a summary derived from it.
+    
+    Test case results were streamed to the log while the tests ran. This
+    appends the auto-fix attempts, the final results if auto-fix produced
+    them, and the run outcome, then writes a quick-reference summary file
+    built by reading the log back.
+    
+    Args:
+        console: Rich console for output
+        test_result: The test result to save
+        config: Test configuration
+        result_sink: Sink the test case results were streamed to
         
+    Returns:
+        Path of the result log, or None if it could not be completed
+    """
+    try:
         # Add auto-fix attempts if available
-        if test_result.test_attempts is not None:
-            detailed_logs["auto_fix_attempts"] = test_result.test_attempts
+        if test_result.test_attempts:
+            for attempt in test_result.test_attempts:
+                result_sink.write(RECORD_AUTO_FIX_ATTEMPT, attempt=attempt)
+        
+        # Add the results after auto-fix unless they were already streamed
+        unified_result = test_result.unified_result
+        if (unified_result is not None and unified_result is not test_result.baseline_result
+                and not result_sink.run_counts.get(RUN_CURRENT)):
+            for tc in unified_result.test_cases:
+                result_sink.write_test_case(tc, RUN_FINAL)
         
-        # Save to JSON file
-        with open(log_file_path, 'w', encoding='utf-8') as f:
-            json.dump(detailed_logs, f, indent=2, ensure_ascii=False, default=str)
+        result_sink.write(
+            RECORD_RUN_END,
+            status=test_result.status,
+            end_time=test_result.end_time.isoformat(),
+            error=test_result.error,
+            overall_status=test_result.results.get('overall_status', {}),
+            summary=unified_result.summary.to_dict() if unified_result is not None else None,
+            steps=test_result.steps
+        )
+        result_sink.close()
         
+        log_file_path = result_sink.path
         console.print(f"\n[bold green]✓ Detailed test logs saved to: {log_file_path}[/bold green]")
         console.print(f"[dim]File size: {log_file_path.stat().st_size / 1024:.1f} KB[/dim]")
         
-        # Also save a summary file for quick reference
-        summary_filename = f"{test_result.name}_{timestamp}_summary.json"
-        summary_file_path = logs_dir / summary_filename
-        
-        # Enhanced summary with test case details
-        summary_data = {
-            "test_name": test_result.name,
-            "status": test_result.status,
-            "timestamp": datetime.now().isoformat(),
-            "file_path": str(test_result.file_path),
-            "config_path": str(test_result.config_path),
-            "start_time": test_result.start_time.isoformat(),
-            "end_time": test_result.end_time.isoformat(),
-            "error": test_result.error,
-            "overall_status": test_result.results.get('overall_status', {}),
-            "detailed_logs_file": log_filename,
-            "has_unified_results": test_result.unified_result is not None,
-            "has_auto_fix_attempts": test_result.test_attempts is not None,
-            "auto_fix_attempts_count": len(test_result.test_attempts) if test_result.test_attempts else 0
-        }
-        
-        # Add test case summary if unified results are available
-        if test_result.unified_result:
-            summary_data["test_cases_summary"] = {
-                "total": len(test_result.unified_result.test_cases),
-                "passed": len([tc for tc in test_result.unified_result.test_cases if tc.status.value == 'passed']),
-                "failed": len([tc for tc in test_result.unified_result.test_cases if tc.status.value == 'failed']),
-                "error": len([tc for tc in test_result.unified_result.test_cases if tc.status.value == 'error'])
-            }
-            
-            # Add quick reference for failed/error test cases
-            failed_tests = []
-            for tc in test_result.unified_result.test_cases:
-                if tc.status.value in ['failed', 'error']:
-                    failed_tests.append({
-                        "name": tc.name,
-                        "status": tc.status.value,
-                        "input": tc.input,
-                        "expected_output": tc.expected_output,
-                        "actual_output": tc.actual_output,
-                        "error_message": tc.error_message,
-                        "evaluation_score": tc.evaluation_score
-                    })
-            summary_data["failed_test_cases"] = failed_tests
-        
+        # Build the summary file from the log
+        summary_data = summarize_result_log(log_file_path)
+        summary_file_path = result_summary_path(log_file_path)
         with open(summary_file_path, 'w', encoding='utf-8') as f:
             json.dump(summary_data, f, indent=2, ensure_ascii=False, default=str)
         
         console.print(f"[dim]Summary file saved to: {summary_file_path}[/dim]")
         
-        # Show what was saved with enhanced information
-        if test_result.unified_result:
-            total_tests = len(test_result.unified_result.test_cases)
-            passed_tests = len([tc for tc in test_result.unified_result.test_cases if tc.status.value == 'passed'])
-            failed_tests = len([tc for tc in test_result.unified_result.test_cases if tc.status.value in ['failed', 'error']])
-            
-            console.print(f"[dim]✓ Unified test results included ({total_tests} test cases)[/dim]")
-            console.print(f"[dim]  - Passed: {passed_tests}, Failed/Error: {failed_tests}[/dim]")
-            
-            # Show failed test cases for quick reference
-            if failed_tests > 0:
-                console.print(f"[dim]  - Failed tests: {', '.join(tc.name for tc in test_result.unified_result.test_cases if tc.status.value in ['failed', 'error'])}[/dim]")
+        # Show what was saved
+        for run, counts in summary_data["runs"].items():
+            console.print(f"[dim]✓ {run.capitalize()} test results included ({counts['total']} test cases)[/dim]")
+            console.print(f"[dim]  - Passed: {counts['passed']}, Failed/Error: {counts['failed'] + counts['error']}[/dim]")
         
-        if test_result.test_attempts:
-            console.print(f"[dim]✓ Auto-fix attempts included ({len(test_result.test_attempts)} attempts)[/dim]")
+        # Show failed test cases for quick reference
+        if summary_data["failed_test_cases"]:
+            console.print(f"[dim]  - Failed tests: {', '.join(tc['name'] for tc in summary_data['failed_test_cases'])}[/dim]")
+        
+        if summary_data["auto_fix_attempts_count"]:
+            console.print(f"[dim]✓ Auto-fix attempts included ({summary_data['auto_fix_attempts_count']} attempts)[/dim]")
         
         # Provide guidance on how to analyze the logs
         console.print(f"\n[bold]How to analyze the logs:[/bold]")
-        console.print(f"[dim]1. Open {log_filename} for complete test details[/dim]")
-        console.print(f"[dim]2. Check 'test_cases_detailed' section for individual test inputs/outputs[/dim]")
-        console.print(f"[dim]3. Use 'test_summary' for quick statistics[/dim]")
-        console.print(f"[dim]4. Review {summary_filename} for failed test cases overview[/dim]")
+        console.print(f"[dim]1. {log_file_path.name} has one JSON record per line; 'test_case' records hold individual test inputs/outputs[/dim]")
+        console.print(f"[dim]2. Each test case record's 'run' tells whether it is from the baseline run or after auto-fix[/dim]")
+        console.print(f"[dim]3. The 'run_end' record holds the final status and summary statistics[/dim]")
+        console.print(f"[dim]4. Review {summary_file_path.name} for failed test cases overview[/dim]")
+        
+        return log_file_path
         
     except Exception as e:
         console.print(f"[bold red]Warning: Failed to save detailed logs: {str(e)}[/bold red]")
-        # Note: Removed the self.verbose check since this function doesn't have access to self
+        return None
+    finally:
+        result_sink.close()
 
-def _save_summary_report(console: Console, test_result: TestResult, config: Any) -> None:
+def _save_summary_report(console: Console, test_result: TestResult, config: Any, result_log: Optional[Path] = None) -> None:
     """Save test summary report in Markdown format for later analysis.
     
     Args:
         console: Rich console for output
         test_result: The test result to save
         config: Test configuration
+        result_log: Optional streamed result log to build the report from
+            instead of the in-memory results
     """
     try:
         # Create logs directory
@@ -398,6 +349,16 @@ def _save_summary_report(console: Console, test_result: TestResult, config: Any)
         from kaizen.autofix.pr.manager import PRManager
         from kaizen.cli.commands.models import TestExecutionHistory
         
+        # Derive the results from the streamed log when there is one
+        baseline_result = test_result.baseline_result
+        test_attempts = test_result.test_attempts
+        unified_result = test_result.unified_result
+        if result_log is not None:
+            log = ResultLog(result_log)
+            baseline_result = log.get_run(RUN_BASELINE) or baseline_result
+            test_attempts = log.auto_fix_attempts or test_attempts
+            unified_result = log.get_latest_run() or unified_result
+        
         # Create PR manager instance with create_pr=False to avoid GitHub token requirement
         pr_config = config.__dict__.copy()
         pr_config['create_pr'] = False  # Disable PR creation to avoid GitHub token requirement
@@ -409,15 +370,15 @@ def _save_summary_report(console: Console, test_result: TestResult, config: Any)
         test_history = TestExecutionHistory()
         
         # Add baseline result if available
-        if test_result.baseline_result:
-            test_history.add_baseline_result(test_result.baseline_result)
-            console.print(f"[dim]✓ Baseline results included ({len(test_result.baseline_result.test_cases)} test cases)[/dim]")
+        if baseline_result:
+            test_history.add_baseline_result(baseline_result)
+            console.print(f"[dim]✓ Baseline results included ({len(baseline_result.test_cases)} test cases)[/dim]")
         
         # Convert all memory-based attempts (dicts) to TestExecutionResult objects if needed
-        if test_result.test_attempts is not None and len(test_result.test_attempts) > 0:
-            console.print(f"[dim]DEBUG: Found {len(test_result.test_attempts)} test attempts[/dim]")
+        if test_attempts is not None and len(test_attempts) > 0:
+            console.print(f"[dim]DEBUG: Found {len(test_attempts)} test attempts[/dim]")
             attempts_processed = 0
-            for i, attempt_data in enumerate(test_result.test_attempts):
+            for i, attempt_data in enumerate(test_attempts):
                 console.print(f"[dim]DEBUG: Processing attempt {i+1}, type: {type(attempt_data)}[/dim]")
                 try:
                     if isinstance(attempt_data, dict):
@@ -637,11 +598,11 @@ def _save_summary_report(console: Console, test_result: TestResult, config: Any)
             if attempts_processed > 0:
                 console.print(f"[dim]✓ Test attempts included ({attempts_processed} attempts)[/dim]")
             else:
-                console.print(f"[dim]✓ Test attempts found but not in TestExecutionResult format ({len(test_result.test_attempts)} attempts)[/dim]")
+                console.print(f"[dim]✓ Test attempts found but not in TestExecutionResult format ({len(test_attempts)} attempts)[/dim]")
         # If no test attempts, use unified_result as the only result
-        elif test_result.unified_result:
-            test_history.add_fix_attempt_result(test_result.unified_result)
-            console.print(f"[dim]✓ Test results included ({len(test_result.unified_result.test_cases)} test cases)[/dim]")
+        elif unified_result:
+            test_history.add_fix_attempt_result(unified_result)
+            console.print(f"[dim]✓ Test results included ({len(unified_result.test_cases)} test cases)[/dim]")
         # If no test history available, skip report generation
         if not test_history.get_all_results():
             console.print(f"[dim]No valid test results found, skipping summary report generation[/dim]")
@@ -745,10 +706,10 @@ def _save_summary_report(console: Console, test_result: TestResult, config: Any)
             console.print(f"[dim]  - Total test cases: {total_test_cases}[/dim]")
             
             # Show breakdown of attempts
-            if test_result.baseline_result:
-                console.print(f"[dim]  - Baseline: {len(test_result.baseline_result.test_cases)} test cases[/dim]")
-            if test_result.test_attempts:
-                console.print(f"[dim]  - Auto-fix attempts: {len(test_result.test_attempts)} attempts[/dim]")
+            if baseline_result:
+                console.print(f"[dim]  - Baseline: {len(baseline_result.test_cases)} test cases[/dim]")
+            if test_attempts:
+                console.print(f"[dim]  - Auto-fix attempts: {len(test_attempts)} attempts[/dim]")
         
         # Provide guidance on how to use the report
         console.print(f"\n[bold]Summary Report Information:[/bold]")
@@ -778,11 +739,17 @@ def _save_summary_report(console: Console, test_result: TestResult, config: Any)
               default=DEFAULT_LANGUAGE.value, help=f'Programming language for test execution (default: {DEFAULT_LANGUAGE.value})')
 @click.option('--test-github-access', is_flag=True, help='Test GitHub access and permissions before running tests')
 @click.option('--save-logs', is_flag=True, help='Save detailed test logs in JSON format and summary report in Markdown format for later analysis')
+@click.option('--log-compression', type=click.Choice(list(RESULT_LOG_COMPRESSIONS)), default=RESULT_LOG_COMPRESSION_NONE,
+              help='Compression of the streamed result log written with --save-logs (zstd requires the zstandard package)')
 @click.option('--verbose', '-v', is_flag=True, help='Show detailed debug information and verbose logging')
 @click.option('--clear-ts-cache', is_flag=True, help='Clear TypeScript compilation cache before running tests')
 @click.option('--show-cache-stats', is_flag=True, help='Show TypeScript cache statistics')
 @click.option('--no-confirm', is_flag=True, help='Skip confirmation prompts (useful for non-interactive use)')
 @click.option('--better-ai', is_flag=True, help='Use enhanced AI model for improved code fixing and analysis')
+@click.option('--no-eval-cache', is_flag=True, help='Disable the on-disk cache of LLM evaluation results')
+@click.option('--fail-fast', is_flag=True, help='Stop the test run at the first failing step (same as --max-failures 1)')
+@click.option('--max-failures', type=click.IntRange(min=1), default=None,
+              help='Stop the test run once this many steps have failed; remaining steps are skipped')
 def test_all(
     config: str,
     auto_fix: bool,
@@ -793,11 +760,15 @@ def test_all(
     language: str,
     test_github_access: bool,
     save_logs: bool,
+    log_compression: str,
     verbose: bool,
     clear_ts_cache: bool,
     show_cache_stats: bool,
     no_confirm: bool,
-    better_ai: bool
+    better_ai: bool,
+    no_eval_cache: bool,
+    fail_fast: bool,
+    max_failures: Optional[int]
 ) -> None:
     """Run all tests specified in the configuration file.
     
@@ -827,16 +798,22 @@ def test_all(
         language: Programming language for test execution
         test_github_access: Whether to test GitHub access and permissions before running tests
         save_logs: Whether to save detailed test logs in JSON format for later analysis
+        log_compression: Compression of the streamed result log ('none', 'gzip' or 'zstd')
         verbose: Whether to show detailed debug information and verbose logging
         clear_ts_cache: Whether to clear TypeScript compilation cache before running tests
         show_cache_stats: Whether to show TypeScript cache statistics
         no_confirm: Whether to skip confirmation prompts (useful for non-interactive use)
         better_ai: Whether to use enhanced AI model for improved code fixing and analysis
+        no_eval_cache: Whether to disable the on-disk cache of LLM evaluation results
+        fail_fast: Whether to stop the test run at the first failing step
+        max_failures: Number of failing steps after which the test run stops
         
     When --save-logs is enabled, the following files are created in the test-logs/ directory:
-    - {test_name}_{timestamp}_detailed_logs.json: Complete test results including inputs, outputs, 
-      evaluations, and auto-fix attempts
-    - {test_name}_{timestamp}_summary.json: Quick reference summary with key metrics
+    - {test_name}_{timestamp}_results.jsonl: Complete test results including inputs, outputs,
+      evaluations, and auto-fix attempts, one JSON record per line. Test case results are
+      appended as soon as each test finishes (.jsonl.gz or .jsonl.zst with --log-compression)
+    - {test_name}_{timestamp}_summary.json: Quick reference summary with key metrics, derived
+      from the results log
     - test_report_{timestamp}.md: Detailed test summary report in Markdown format (same as PR descriptions)
     
     The detailed logs include:
@@ -868,8 +845,18 @@ def test_all(
         ...     better_ai=True
         ... )
     """
+    from rich.traceback import install as install_rich_traceback
+    from .config import ConfigurationManager
+    from .memory import ExecutionMemory
+    from .memory_store import MEMORY_BACKEND_SQLITE, create_memory_store
+    from .test_commands import TestAllCommand
+
+    # Configure rich traceback
+    install_rich_traceback(show_locals=True)
+
     # Initialize clean logger
     logger = CleanLogger(verbose=verbose)
+    result_sink = None
     
     try:
         # Load configuration
@@ -882,7 +869,9 @@ def test_all(
             max_retries=max_retries,
             base_branch=base_branch,
             pr_strategy=pr_strategy,
-            better_ai=better_ai
+            better_ai=better_ai,
+            no_eval_cache=no_eval_cache,
+            max_failures=1 if fail_fast else max_failures
         )
         
         if not config_result.is_success:
@@ -943,7 +932,16 @@ def test_all(
         # Initialize memory system for execution tracking
         from datetime import datetime
         execution_id = f"kaizen_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        memory = ExecutionMemory()
+        settings = getattr(config, 'settings', None)
+        try:
+            memory_store = create_memory_store(
+                getattr(settings, 'memory_backend', None) or MEMORY_BACKEND_SQLITE,
+                getattr(settings, 'memory_path', None)
+            )
+        except ValueError as e:
+            logger.warning(f"{str(e)}; keeping execution memory in process only")
+            memory_store = None
+        memory = ExecutionMemory(store=memory_store)
         memory.start_execution(execution_id, config, config_manager)
         
         # Save original code before any modifications
@@ -975,7 +973,16 @@ def test_all(
         
         # Execute tests with memory tracking
         logger.print_progress("Running tests...")
-        command = TestAllCommand(config, logger.logger if verbose else logger, verbose=verbose, memory=memory, config_manager=config_manager)
+        if save_logs:
+            result_sink = _start_result_log(logger.console, config, log_compression)
+        command = TestAllCommand(
+            config,
+            logger.logger if verbose else logger,
+            verbose=verbose,
+            memory=memory,
+            config_manager=config_manager,
+            result_sink=result_sink
+        )
         test_result = command.execute()
         
         if not test_result.is_success:
@@ -1007,9 +1014,11 @@ def test_all(
         
         # Save detailed logs if requested
         if save_logs:
-            _save_detailed_logs(logger.console, test_result_value, config)
+            result_log = None
+            if result_sink is not None:
+                result_log = _save_detailed_logs(logger.console, test_result_value, config, result_sink)
             # Also save summary report in Markdown format
-            _save_summary_report(logger.console, test_result_value, config)
+            _save_summary_report(logger.console, test_result_value, config, result_log)
         
         # Show detailed results in verbose mode
         if verbose:
@@ -1028,5 +1037,9 @@ def test_all(
         
     except Exception as e:
         _handle_error(e, "Unexpected error", logger)
+    finally:
+        # Keep whatever was streamed if the run stopped early
+        if result_sink is not None:
+            result_sink.close()
 
 
@@ -0,0 +1,87 @@
+"""Test script for CLI startup time.
+
+This script imports the CLI in a fresh interpreter with `python -X importtime`
+and checks that the heavy SDKs are not loaded at startup and that the import
+stays within the startup budget for non-test commands.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+# Repository root, so the subprocess imports this checkout of kaizen
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+# Cumulative import time budget for `import kaizen.cli`, in microseconds
+STARTUP_BUDGET_US = 150_000
+
+# Best of this many runs is compared against the budget to smooth out noise
+STARTUP_RUNS = 5
+
+# Modules that must only be imported when a command actually needs them
+DEFERRED_MODULES = (
+    'google.generativeai',
+    'github',
+    'kaizen.autofix.main',
+    'kaizen.autofix.test.runner',
+    'kaizen.autofix.test.code_region',
+    'kaizen.autofix.pr.manager',
+    'rich.traceback',
+)
+
+
+def measure_import(module: str = 'kaizen.cli') -> Dict[str, int]:
+    """Import a module in a fresh interpreter and collect import times.
+
+    Args:
+        module: Module to import
+
+    Returns:
+        Mapping of each imported module to its cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_heavy_modules_deferred():
+    """Test that importing the CLI does not load the SDKs and fixing stack."""
+    print("🧪 Testing deferred imports")
+    times = measure_import()
+    loaded = [name for name in DEFERRED_MODULES if name in times]
+    assert not loaded, f"Loaded at CLI startup: {loaded}"
+    print("✅ Heavy modules are deferred")
+
+
+def test_cli_import_time():
+    """Test that importing the CLI stays within the startup budget."""
+    print("🧪 Testing CLI import time")
+    best = min(measure_import()['kaizen.cli'] for _ in range(STARTUP_RUNS))
+    print(f"   import kaizen.cli: {best / 1000:.1f} ms (budget {STARTUP_BUDGET_US / 1000:.0f} ms)")
+    assert best < STARTUP_BUDGET_US, f"CLI import took {best / 1000:.1f} ms"
+    print("✅ CLI import is within budget")
+
+
+def main():
+    """Run all tests."""
+    print("🚀 Testing CLI Startup")
+    print("=" * 60)
+    test_heavy_modules_deferred()
+    test_cli_import_time()
+    print("\n🎉 All tests completed!")
+
+
+if __name__ == "__main__":
+    main()
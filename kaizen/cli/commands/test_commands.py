@@ -8,18 +8,19 @@ and auto-fix functionality.
 
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Protocol, runtime_checkable
+from typing import Callable, Dict, Any, Optional, List, Protocol, runtime_checkable
 from abc import ABC, abstractmethod
 from datetime import datetime
 
 from kaizen.autofix.test.runner import TestRunner
 from ...utils.test_utils import get_failed_tests_dict_from_unified
-from .models import TestConfiguration, TestResult, Result, TestExecutionResult, TestStatus
+from .models import TestConfiguration, TestResult, Result, TestExecutionResult, TestCaseResult, TestStatus
 from .errors import TestExecutionError, AutoFixError, DependencyError
 from .types import TestStatus as LegacyTestStatus, PRStrategy
 from .dependency_manager import DependencyManager, ImportResult
 from kaizen.cli.utils.env_setup import check_environment_setup, get_missing_variables
 from .memory import ExecutionMemory, LLMInteraction
+from .result_sink import RUN_BASELINE, RUN_CURRENT, JsonlResultSink
 
 @runtime_checkable
 class TestCommand(Protocol):
@@ -56,7 +57,7 @@ class BaseTestCommand(ABC):
 class TestAllCommand(BaseTestCommand):
     """Command to run all tests."""
     
-    def __init__(self, config: TestConfiguration, logger, verbose: bool = False, memory: ExecutionMemory = None, config_manager=None):
+    def __init__(self, config: TestConfiguration, logger, verbose: bool = False, memory: ExecutionMemory = None, config_manager=None, result_sink: Optional[JsonlResultSink] = None):
         """Initialize test all command.
         
         Args:
@@ -65,12 +66,15 @@ class TestAllCommand(BaseTestCommand):
             verbose: Whether to show detailed debug information
             memory: ExecutionMemory instance for tracking execution context
             config_manager: ConfigurationManager instance (optional)
+            result_sink: Optional JsonlResultSink that test case results are
+                streamed to as they finish
         """
         super().__init__(logger)
         self.config = config
         self.verbose = verbose
         self.memory = memory
         self.config_manager = config_manager
+        self.result_sink = result_sink
         self.dependency_manager = DependencyManager()
         # Store the original logger for clean output methods
         self.clean_logger = logger if hasattr(logger, 'print_progress') else None
@@ -115,7 +119,11 @@ class TestAllCommand(BaseTestCommand):
             # Execute tests - now returns unified TestExecutionResult
             self.logger.info(f"Starting test execution for: {self.config.name}")
             runner = TestRunner(runner_config, verbose=self.verbose)
-            test_execution_result = runner.run_tests(self.config.file_path)
+            test_execution_result = runner.run_tests(
+                self.config.file_path,
+                max_failures=self.config.max_failures,
+                on_result=self._result_callback(RUN_BASELINE)
+            )
             
             if not test_execution_result:
                 return Result.failure(TestExecutionError("No test results returned from runner"))
@@ -162,7 +170,11 @@ class TestAllCommand(BaseTestCommand):
                         self.logger.info("No test results found in auto-fix results, running tests again to get current state")
                         try:
                             fallback_runner = TestRunner(runner_config)
-                            best_test_execution_result = fallback_runner.run_tests(self.config.file_path)
+                            best_test_execution_result = fallback_runner.run_tests(
+                                self.config.file_path,
+                                max_failures=self.config.max_failures,
+                                on_result=self._result_callback(RUN_CURRENT)
+                            )
                             self.logger.info(f"Current test run results: {best_test_execution_result.get_failure_count()}/{best_test_execution_result.summary.total_tests} tests failed")
                         except Exception as e:
                             self.logger.warning(f"Failed to run current tests: {str(e)}, using original results")
@@ -205,6 +217,36 @@ class TestAllCommand(BaseTestCommand):
             # Clean up dependency manager
             self.dependency_manager.cleanup()
     
+    def _result_callback(self, run: str) -> Callable[[TestCaseResult], None]:
+        """Build the TestRunner callback for each finished test case.
+        
+        The callback streams the result to the result sink, if any, and
+        shows live progress.
+        
+        Args:
+            run: Run the results belong to (RUN_BASELINE or RUN_CURRENT)
+            
+        Returns:
+            Callback taking a TestCaseResult
+        """
+        write_result = self.result_sink.on_result(run) if self.result_sink else None
+        counts = {'passed': 0, 'failed': 0}
+        
+        def on_result(test_case: TestCaseResult) -> None:
+            if write_result:
+                write_result(test_case)
+            if test_case.is_failed():
+                counts['failed'] += 1
+            elif test_case.is_passed():
+                counts['passed'] += 1
+            if self.clean_logger:
+                self.clean_logger.print_progress(
+                    f"{test_case.name}: {test_case.status.value} "
+                    f"({counts['passed']} passed, {counts['failed']} failed so far)"
+                )
+        
+        return on_result
+    
     def _validate_environment(self) -> None:
         """Validate environment setup before proceeding.
         
@@ -279,6 +321,10 @@ class TestAllCommand(BaseTestCommand):
             'language': self.config.language.value,
             'framework': self.config.framework.value,
             'lifecycle': self.config.lifecycle,
+            'settings': self.config.settings.__dict__ if self.config.settings else None,
+            'better_ai': self.config.better_ai,
+            'no_eval_cache': self.config.no_eval_cache,
+            'auto_fix': self.config.auto_fix,
         }
         
         if self.verbose:
@@ -298,7 +344,9 @@ class TestAllCommand(BaseTestCommand):
                 'module': self.config.agent.module,
                 'class': self.config.agent.class_name,
                 'method': self.config.agent.method,
-                'fallback_to_function': self.config.agent.fallback_to_function
+                'fallback_to_function': self.config.agent.fallback_to_function,
+                'cache_results': self.config.agent.cache_results,
+                'lifecycle': self.config.agent.lifecycle.value
             }
             if self.verbose:
                 self.logger.info(f"Added agent entry point to runner config: {self.config.agent}")
@@ -322,6 +370,7 @@ class TestAllCommand(BaseTestCommand):
                                 'input': step.input  # This now supports multiple inputs
                             },
                             'expected_output': step.expected_output,
+                            'assertions': step.assertions,
                             'evaluation': self.config.evaluation.__dict__ if self.config.evaluation else None
                         }
                         for step in self.config.steps
@@ -348,6 +397,7 @@ class TestAllCommand(BaseTestCommand):
                         'description': step.description,
                         'input': step.input,  # Use step input directly
                         'expected_output': step.expected_output,
+                        'assertions': step.assertions,
                         'evaluation': self.config.evaluation.__dict__ if self.config.evaluation else None
                     }
                     for step in self.config.steps
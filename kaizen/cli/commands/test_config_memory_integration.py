@@ -6,13 +6,9 @@ in the memory system and can be retrieved for analysis.
 
 import sys
 import os
-from pathlib import Path
 from datetime import datetime
 
-# Add the parent directory to the path so we can import the memory system
-sys.path.insert(0, str(Path(__file__).parent))
-
-from memory import ExecutionMemory
+from kaizen.cli.commands.memory import ExecutionMemory
 
 
 def test_config_memory_integration():
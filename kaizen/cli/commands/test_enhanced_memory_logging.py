@@ -7,14 +7,10 @@ detailed summaries, timing information, and metadata.
 
 import sys
 import os
-from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any
 
-# Add the parent directory to the path so we can import the modules
-sys.path.insert(0, str(Path(__file__).parent))
-
-from memory import ExecutionMemory
+from kaizen.cli.commands.memory import ExecutionMemory
 
 
 def create_mock_test_results() -> Dict[str, Any]:
@@ -6,13 +6,9 @@ it works correctly and can be integrated with the existing test system.
 
 import sys
 import os
-from pathlib import Path
 
-# Add the parent directory to the path so we can import the memory system
-sys.path.insert(0, str(Path(__file__).parent))
-
-from memory import ExecutionMemory, LLMInteraction, TestCase, FixAttempt
-from utils.code_extractor import extract_relevant_functions, create_surgical_context
+from kaizen.cli.commands.memory import ExecutionMemory, LLMInteraction, TestCase, FixAttempt
+from kaizen.cli.commands.utils.code_extractor import extract_relevant_functions, create_surgical_context
 
 
 def test_memory_basic_functionality():
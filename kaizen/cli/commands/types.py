@@ -7,6 +7,7 @@ The module provides:
 - Language: Enum for supported programming languages
 - Framework: Enum for supported agent frameworks
 - PRStrategy: Enum for pull request creation strategies
+- AgentLifecycle: Enum for how long agent instances are reused
 - TestStatus: Enum for test execution statuses
 - STATUS_EMOJI: Mapping of status values to emoji representations
 - Default configuration values
@@ -189,6 +190,46 @@ class PRStrategy(str, Enum):
                 f"Must be one of {valid_values}"
             )
 
+class AgentLifecycle(str, Enum):
+    """How long an agent instance is reused during test execution.
+    
+    Attributes:
+        PER_STEP: Create a new agent instance for every test step
+        PER_RUN: Share one agent instance across all steps of a test run
+        PER_WORKER: Share one agent instance per worker thread, for agents
+            that are expensive to build but not thread-safe
+    
+    Example:
+        >>> lifecycle = AgentLifecycle.from_str("per-run")
+        >>> print(lifecycle.value)  # "per-run"
+    """
+    
+    PER_STEP = 'per-step'
+    PER_RUN = 'per-run'
+    PER_WORKER = 'per-worker'
+
+    @classmethod
+    def from_str(cls, value: str) -> 'AgentLifecycle':
+        """Convert string to AgentLifecycle enum.
+        
+        Args:
+            value: String value to convert (case-insensitive, '_' or '-')
+            
+        Returns:
+            AgentLifecycle enum value
+            
+        Raises:
+            ValueError: If value is not a valid agent lifecycle
+        """
+        try:
+            return cls(str(value).lower().strip().replace('_', '-'))
+        except ValueError:
+            valid_values = [l.value for l in cls]
+            raise ValueError(
+                f"Invalid agent lifecycle: {value}. "
+                f"Must be one of {valid_values}"
+            )
+
 class TestStatus(str, Enum):
     """Enum for test status values.
     
@@ -230,4 +271,5 @@ STATUS_EMOJI: Final[Dict[str, str]] = {
 DEFAULT_MAX_RETRIES: Final[int] = 2
 DEFAULT_BASE_BRANCH: Final[str] = 'main'
 DEFAULT_LANGUAGE: Final[Language] = Language.PYTHON
-DEFAULT_FRAMEWORK: Final[Framework] = Framework.CUSTOM 
\ No newline at end of file
+DEFAULT_FRAMEWORK: Final[Framework] = Framework.CUSTOM
+DEFAULT_AGENT_LIFECYCLE: Final[AgentLifecycle] = AgentLifecycle.PER_STEP 
\ No newline at end of file
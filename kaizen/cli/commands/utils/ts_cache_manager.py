@@ -21,7 +21,7 @@ class TypeScriptCacheManager:
         self.console = console
     
     def clear_cache(self) -> None:
-        """Clear the TypeScript compilation cache."""
+        """Clear the persistent TypeScript execution and type check caches."""
         from kaizen.autofix.test.code_region import CodeRegionExecutor
         
         temp_executor = CodeRegionExecutor(Path.cwd())
@@ -44,9 +44,21 @@ class TypeScriptCacheManager:
         Args:
             stats: Cache statistics dictionary
         """
+        lookups = stats['execution_cache_hits'] + stats['execution_cache_misses']
+        hit_rate = f"{stats['execution_cache_hits'] / lookups:.0%}" if lookups else "n/a"
+        size_kb = stats['execution_cache_bytes'] / 1024
+        
         self.console.print("\n[bold]TypeScript Cache Statistics:[/bold]")
-        self.console.print(f"  • Execution cache entries: {stats['execution_cache_size']}")
-        self.console.print(f"  • Compiled modules: {stats['compiled_modules_size']}")
+        self.console.print(
+            f"  • Execution cache entries: {stats['execution_cache_size']}"
+            f"/{stats['execution_cache_max_entries']} ({size_kb:.1f} KB)"
+        )
+        self.console.print(
+            f"  • Execution cache hits: {stats['execution_cache_hits']}, "
+            f"misses: {stats['execution_cache_misses']} (hit rate: {hit_rate})"
+        )
+        self.console.print(f"  • Execution cache evictions: {stats['execution_cache_evictions']}")
+        self.console.print(f"  • Type check results: {stats['typecheck_cache_size']}")
         self.console.print(f"  • Cache directory: {stats['ts_cache_directory']}")
         self.console.print("")
     